@@ -33,6 +33,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/cfg", tags=["control-flow", "analytics"])
 
+# Stored analysis results, keyed by source hash (bump on builder change)
+CFG_ARTIFACT_KIND = "cfg"
+CFG_ARTIFACT_VERSION = 1
+
 # Issue #380: Module-level tuples for AST type checking
 _EXIT_STMT_TYPES = (ast.Return, ast.Raise)
 _BREAK_CONTINUE_TYPES = (ast.Break, ast.Continue)
@@ -1138,6 +1142,28 @@ def _calculate_cfg_summary(
     }
 
 
+def _analyze_source(source_code: str, file_path: str) -> Dict[str, Any]:
+    """Build CFGs and issues, reusing stored results for unchanged content."""
+    from api.codebase_analytics.artifact_store import get_artifact_store
+
+    def _compute() -> Dict[str, Any]:
+        graphs = CFGBuilder(source_code, file_path).build()
+        all_issues = _aggregate_cfg_issues(graphs)
+        return {
+            "graphs": [g.to_dict() for g in graphs],
+            "summary": _calculate_cfg_summary(graphs, all_issues),
+            "issues": all_issues,
+        }
+
+    return get_artifact_store().get_or_compute(
+        CFG_ARTIFACT_KIND,
+        CFG_ARTIFACT_VERSION,
+        source_code,
+        _compute,
+        variant=file_path,
+    )
+
+
 @with_error_handling(
     category=ErrorCategory.SERVER_ERROR,
     operation="analyze_cfg",
@@ -1162,19 +1188,14 @@ async def analyze_control_flow(
     start_time = time.time()
 
     try:
-        builder = CFGBuilder(request.source_code, request.file_path)
-        graphs = builder.build()
-        all_issues = _aggregate_cfg_issues(graphs)
-        summary = _calculate_cfg_summary(graphs, all_issues)
+        result = _analyze_source(request.source_code, request.file_path)
         analysis_time = (time.time() - start_time) * 1000
 
         return JSONResponse(
             status_code=200,
             content={
                 "success": True,
-                "graphs": [g.to_dict() for g in graphs],
-                "summary": summary,
-                "issues": all_issues,
+                **result,
                 "analysis_time_ms": round(analysis_time, 2),
             },
         )
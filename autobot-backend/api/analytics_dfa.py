@@ -31,6 +31,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/dfa", tags=["data-flow-analysis", "analytics"])
 
+# Stored analysis results, keyed by source hash (bump on analyzer change)
+DFA_ARTIFACT_KIND = "dfa"
+DFA_ARTIFACT_VERSION = 1
+
 
 # =============================================================================
 # Enums and Data Classes
@@ -1119,6 +1123,24 @@ def _build_analysis_response(
     )
 
 
+def _analyze_source(source_code: str, file_path: str) -> AnalysisResponse:
+    """Run data flow analysis, reusing stored results for unchanged content."""
+    from api.codebase_analytics.artifact_store import get_artifact_store
+
+    def _compute() -> Dict:
+        graphs = DataFlowAnalyzer(source_code, file_path).analyze()
+        return _build_analysis_response(graphs, file_path).model_dump()
+
+    stored = get_artifact_store().get_or_compute(
+        DFA_ARTIFACT_KIND,
+        DFA_ARTIFACT_VERSION,
+        source_code,
+        _compute,
+        variant=file_path,
+    )
+    return AnalysisResponse(**{**stored, "analyzed_at": datetime.now().isoformat()})
+
+
 @router.post("/analyze", response_model=AnalysisResponse)
 async def analyze_code(
     request: AnalyzeRequest, admin_check: bool = Depends(check_admin_permission)
@@ -1134,9 +1156,7 @@ async def analyze_code(
     - Security vulnerability detection
     """
     try:
-        analyzer = DataFlowAnalyzer(request.source_code, request.file_path)
-        graphs = analyzer.analyze()
-        return _build_analysis_response(graphs, request.file_path)
+        return _analyze_source(request.source_code, request.file_path)
 
     except SyntaxError as e:
         raise HTTPException(status_code=400, detail=f"Syntax error in code: {str(e)}")
@@ -1160,9 +1180,7 @@ async def analyze_file(
         async with aiofiles.open(request.file_path, "r", encoding="utf-8") as f:
             source_code = await f.read()
 
-        analyzer = DataFlowAnalyzer(source_code, request.file_path)
-        graphs = analyzer.analyze()
-        return _build_analysis_response(graphs, request.file_path)
+        return _analyze_source(source_code, request.file_path)
 
     except FileNotFoundError:
         raise HTTPException(
@@ -245,40 +245,6 @@ def _validate_pagination_params(page: int, per_page: int) -> None:
         raise ValidationError("Invalid pagination parameters")
 
 
-async def _fetch_session_messages_or_raise(
-    chat_history_manager, session_id: str, limit: int
-) -> List:
-    """
-    Fetch session messages and raise ResourceNotFoundError if session not found.
-
-    Issue #620.
-
-    Args:
-        chat_history_manager: Chat history manager instance
-        session_id: Session ID to fetch messages for
-        limit: Maximum messages to return
-
-    Returns:
-        List of messages
-
-    Raises:
-        ResourceNotFoundError: If session does not exist
-    """
-    messages = await chat_history_manager.get_session_messages(session_id, limit=limit)
-
-    if messages is None:
-        (
-            AutoBotError,
-            InternalError,
-            ResourceNotFoundError,
-            ValidationError,
-            get_error_code,
-        ) = get_exceptions_lazy()
-        raise ResourceNotFoundError(f"Session {session_id} not found")
-
-    return messages
-
-
 def _validate_export_format_or_raise(export_format: str) -> None:
     """
     Validate export format and raise ValidationError if invalid.
@@ -363,10 +329,16 @@ async def get_session_messages(
     ),  # SECURITY: Validate ownership
     page: int = 1,
     per_page: int = 50,
+    before_seq: Optional[int] = None,
 ):
     """
     Get messages for a specific chat session.
 
+    Returns the newest ``per_page`` messages; pass the returned
+    ``next_before_seq`` as ``before_seq`` to page further back. Pages are
+    read from the tail of the session log, so opening a long session does
+    not load its full history.
+
     Issue #620: Refactored using Extract Method pattern.
     """
     request_id = generate_request_id()
@@ -378,16 +350,16 @@ async def get_session_messages(
 
     chat_history_manager = get_chat_history_manager(request)
 
-    messages = await _fetch_session_messages_or_raise(
-        chat_history_manager, session_id, per_page
+    tail = await chat_history_manager.load_session_tail(
+        session_id, limit=per_page, before_seq=before_seq
     )
-    total_count = await chat_history_manager.get_session_message_count(session_id)
 
     return create_success_response(
         data={
-            "messages": messages,
+            "messages": tail["messages"],
             "session_id": session_id,
-            "total_count": total_count,
+            "total_count": tail["total_count"],
+            "next_before_seq": tail["next_before_seq"],
             "page": page,
             "per_page": per_page,
         },
@@ -406,12 +378,15 @@ async def list_sessions(
     request: Request,
     scope: Optional[str] = None,
     team_id: Optional[str] = None,
+    offset: int = 0,
+    limit: Optional[int] = None,
 ):
     """List chat sessions with optional org/team/shared scope filtering (#684, #689).
 
     Query params:
         scope: "user" (default) | "org" | "team" | "shared"
         team_id: required when scope=team
+        offset, limit: page of the default (user) listing, most recent first
     """
     request_id = generate_request_id()
     chat_history_manager = get_chat_history_manager(request)
@@ -439,26 +414,59 @@ async def list_sessions(
             request, request_id, chat_history_manager, scope, team_id
         )
 
-    # Default: list all sessions (fast mode, no decryption)
-    sessions = await chat_history_manager.list_sessions_fast()
+    if offset < 0 or (limit is not None and limit < 1):
+        (
+            AutoBotError,
+            InternalError,
+            ResourceNotFoundError,
+            ValidationError,
+            get_error_code,
+        ) = get_exceptions_lazy()
+        raise ValidationError("offset must be >= 0 and limit must be >= 1")
 
+    # Default: page of the session catalog (no file access or decryption)
     # Issue #684: Filter to user's own sessions when authenticated
     user_data = auth_middleware.get_user_from_request(request)
-    if user_data and user_data.get("username"):
-        sessions = await _filter_user_sessions(sessions, user_data["username"])
+    username = user_data.get("username") if user_data else None
+    page = await _list_user_sessions_page(chat_history_manager, username, offset, limit)
 
     return create_success_response(
-        data={"sessions": sessions, "count": len(sessions)},
+        data={
+            "sessions": page["sessions"],
+            "count": len(page["sessions"]),
+            "total": page["total"],
+            "offset": offset,
+        },
         message="Sessions retrieved successfully",
         request_id=request_id,
     )
 
 
-async def _filter_user_sessions(sessions: list, username: str) -> list:
-    """Filter sessions to those owned by the user.
+async def _list_user_sessions_page(
+    chat_history_manager, username: Optional[str], offset: int, limit: Optional[int]
+) -> dict:
+    """Page of sessions owned by the user.
+
+    Sessions whose snapshot predates owner metadata are attributed from
+    SessionOwnershipValidator first. A user never sees sessions owned by
+    someone else, even when they own none.
+
+    Helper for list_sessions (#684).
+    """
+    if not username:
+        return await chat_history_manager.list_sessions_page(offset=offset, limit=limit)
+
+    owned_ids = await _get_owned_session_ids(username)
+    await chat_history_manager.catalog_assign_owner(username, owned_ids)
+    return await chat_history_manager.list_sessions_page(
+        owner=username, offset=offset, limit=limit
+    )
+
+
+async def _get_owned_session_ids(username: str) -> list:
+    """Session IDs recorded for the user by SessionOwnershipValidator.
 
-    Uses Redis ownership data. Falls back to all sessions
-    if Redis is unavailable.
+    Returns an empty list if Redis is unavailable.
 
     Helper for list_sessions (#684).
     """
@@ -467,13 +475,10 @@ async def _filter_user_sessions(sessions: list, username: str) -> list:
     try:
         redis = await get_redis_mgr(async_client=True, database="main")
         validator = _build_ownership_validator(redis)
-        user_session_ids = set(await validator.get_user_sessions(username))
-        if not user_session_ids:
-            return sessions  # No ownership data yet; return all
-        return [s for s in sessions if s.get("id") in user_session_ids]
+        return await validator.get_user_sessions(username)
     except Exception as e:
-        logger.debug("Could not filter by user ownership: %s", e)
-        return sessions
+        logger.debug("Could not read user session ownership: %s", e)
+        return []
 
 
 def _build_ownership_validator(redis):
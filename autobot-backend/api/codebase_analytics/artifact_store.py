@@ -0,0 +1,413 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Content-hash keyed store of per-file analysis artifacts
+
+Analytics endpoints (call graph, import tree, dependencies, CFG, DFA) used to
+re-read and re-parse every file on every request. This store persists the
+per-file facts each analyzer extracts (symbols, imports, call sites, CFG
+summaries, problems) on disk, keyed by the SHA-256 of the file content:
+
+    data/codebase_artifacts/<kind>/v<version>/<hh>/<sha256>[-<variant>].json
+
+- Unchanged files are recognised by (mtime, size) from a persisted
+  fingerprint index, so a warm request neither reads nor parses them.
+- Identical content (copies, renames, reverted edits) shares one artifact.
+- Bumping an extractor's version orphans its old artifacts.
+- Artifacts not written or read from disk within the retention period
+  (AUTOBOT_CODEBASE_ARTIFACT_RETENTION_DAYS, default 30) are pruned, which
+  also removes orphaned versions and content that no longer exists.
+- Repo-level views merged from per-file artifacts are memoised on the set
+  of (path, content hash) pairs and recomputed only when a file changes.
+
+Extractors must return JSON-serialisable data that does not depend on the
+file's location; repo-level merges attach paths.
+"""
+
+import ast
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Module-level project root constant (Issue #380 - avoid repeated Path computation)
+_PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+
+ARTIFACT_STORE_DIR = Path(
+    os.getenv(
+        "AUTOBOT_CODEBASE_ARTIFACT_DIR",
+        str(_PROJECT_ROOT / "data" / "codebase_artifacts"),
+    )
+)
+
+ARTIFACT_RETENTION_SECONDS = (
+    float(os.getenv("AUTOBOT_CODEBASE_ARTIFACT_RETENTION_DAYS", "30")) * 86400
+)
+
+_FINGERPRINT_FILE = "fingerprints.json"
+_HASH_CHUNK_SIZE = 65536
+_MEMORY_CACHE_ENTRIES = 8192
+_MERGED_VIEW_ENTRIES = 32
+_PRUNE_INTERVAL_SECONDS = 6 * 3600
+
+# extract(tree, content) -> JSON-serialisable per-file artifact
+Extractor = Callable[[ast.AST, str], Any]
+
+
+def compute_content_hash(content: str) -> str:
+    """SHA-256 of source text, matching the on-disk file hash for UTF-8."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class AnalysisArtifactStore:
+    """
+    On-disk, content-addressed per-file artifact store with a memory LRU.
+
+    Thread-safe; all methods are blocking and meant for the analytics
+    executor (see utils.io_executor.run_in_analytics_executor).
+    """
+
+    def __init__(
+        self,
+        root: Path = ARTIFACT_STORE_DIR,
+        retention_seconds: float = ARTIFACT_RETENTION_SECONDS,
+    ):
+        """Initialize store rooted at ``root`` (created lazily)."""
+        self._root = Path(root)
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._fingerprints: Optional[Dict[str, List]] = None
+        self._fingerprints_dirty = False
+        self._views: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._retention_seconds = retention_seconds
+        self._last_prune: Optional[float] = None
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "files_hashed": 0,
+            "view_hits": 0,
+            "pruned": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Artifacts
+    # ------------------------------------------------------------------
+
+    def _artifact_path(
+        self, kind: str, version: int, content_hash: str, variant: str
+    ) -> Path:
+        """Location of one artifact on disk."""
+        name = content_hash
+        if variant:
+            name += "-" + hashlib.sha256(variant.encode("utf-8")).hexdigest()[:12]
+        return self._root / kind / f"v{version}" / content_hash[:2] / f"{name}.json"
+
+    def get(
+        self, kind: str, version: int, content_hash: str, variant: str = ""
+    ) -> Optional[Any]:
+        """Load an artifact, or None if it was never stored."""
+        path = self._artifact_path(kind, version, content_hash, variant)
+        key = str(path)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self._stats["hits"] += 1
+                return self._memory[key]
+
+        try:
+            artifact = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            with self._lock:
+                self._stats["misses"] += 1
+            return None
+        try:
+            os.utime(path)  # mark as recently used for pruning
+        except OSError:
+            pass
+
+        self._remember(key, artifact)
+        with self._lock:
+            self._stats["hits"] += 1
+        return artifact
+
+    def put(
+        self,
+        kind: str,
+        version: int,
+        content_hash: str,
+        artifact: Any,
+        variant: str = "",
+    ) -> None:
+        """Persist an artifact (atomic replace; failures are non-fatal)."""
+        path = self._artifact_path(kind, version, content_hash, variant)
+        self._remember(str(path), artifact)
+        try:
+            _atomic_write_json(path, artifact)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("Could not persist artifact %s: %s", path, e)
+
+    def get_or_compute(
+        self,
+        kind: str,
+        version: int,
+        content: str,
+        compute: Callable[[], Any],
+        variant: str = "",
+    ) -> Any:
+        """Artifact for ``content``, computing and storing it on a miss."""
+        content_hash = compute_content_hash(content)
+        artifact = self.get(kind, version, content_hash, variant)
+        if artifact is None:
+            artifact = compute()
+            self.put(kind, version, content_hash, artifact, variant)
+        return artifact
+
+    def _remember(self, key: str, artifact: Any) -> None:
+        """Add to the memory LRU."""
+        with self._lock:
+            self._memory[key] = artifact
+            self._memory.move_to_end(key)
+            while len(self._memory) > _MEMORY_CACHE_ENTRIES:
+                self._memory.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------------
+
+    def prune(self, max_age_seconds: Optional[float] = None) -> int:
+        """Delete artifacts unused for ``max_age_seconds`` (default: retention).
+
+        Also drops fingerprints of files that no longer exist and removes
+        emptied directories.
+
+        Returns:
+            Number of artifacts deleted
+        """
+        max_age = (
+            self._retention_seconds if max_age_seconds is None else max_age_seconds
+        )
+        cutoff = time.time() - max_age
+        removed = 0
+        for path in self._root.glob("*/v*/*/*.json"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        for directory in sorted(self._root.glob("*/v*/*"), reverse=True) + sorted(
+            self._root.glob("*/v*"), reverse=True
+        ):
+            try:
+                directory.rmdir()  # only succeeds once empty
+            except OSError:
+                pass
+
+        with self._lock:
+            tracked = list(self._load_fingerprints())
+        missing = [path for path in tracked if not os.path.exists(path)]
+        with self._lock:
+            for path in missing:
+                self._fingerprints.pop(path, None)
+            if missing:
+                self._fingerprints_dirty = True
+            self._stats["pruned"] += removed
+        self.save_fingerprints()
+        return removed
+
+    def _maybe_prune(self) -> None:
+        """Prune at most once per interval per process."""
+        now = time.monotonic()
+        with self._lock:
+            if (
+                self._last_prune is not None
+                and now - self._last_prune < _PRUNE_INTERVAL_SECONDS
+            ):
+                return
+            self._last_prune = now
+        removed = self.prune()
+        if removed:
+            logger.info("Pruned %d unused analysis artifacts", removed)
+
+    # ------------------------------------------------------------------
+    # File fingerprints
+    # ------------------------------------------------------------------
+
+    def _load_fingerprints(self) -> Dict[str, List]:
+        """Lazily load the persisted path -> [mtime_ns, size, hash] index."""
+        if self._fingerprints is None:
+            try:
+                data = json.loads(
+                    (self._root / _FINGERPRINT_FILE).read_text(encoding="utf-8")
+                )
+                self._fingerprints = data if isinstance(data, dict) else {}
+            except (OSError, ValueError):
+                self._fingerprints = {}
+        return self._fingerprints
+
+    def file_hash(self, file_path: Path) -> Optional[str]:
+        """Content hash of a file, reusing the stored one if mtime/size match."""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+
+        key = str(file_path)
+        with self._lock:
+            cached = self._load_fingerprints().get(key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        try:
+            hasher = hashlib.sha256()
+            with open(file_path, "rb") as f:
+                while chunk := f.read(_HASH_CHUNK_SIZE):
+                    hasher.update(chunk)
+        except OSError:
+            return None
+        digest = hasher.hexdigest()
+
+        with self._lock:
+            self._load_fingerprints()[key] = [stat.st_mtime_ns, stat.st_size, digest]
+            self._fingerprints_dirty = True
+            self._stats["files_hashed"] += 1
+        return digest
+
+    def save_fingerprints(self) -> None:
+        """Persist the fingerprint index if it changed."""
+        with self._lock:
+            if not self._fingerprints_dirty or self._fingerprints is None:
+                return
+            snapshot = dict(self._fingerprints)
+            self._fingerprints_dirty = False
+        try:
+            _atomic_write_json(self._root / _FINGERPRINT_FILE, snapshot)
+        except OSError as e:
+            logger.debug("Could not persist artifact fingerprints: %s", e)
+
+    # ------------------------------------------------------------------
+    # Repository views
+    # ------------------------------------------------------------------
+
+    def load_file_artifacts(
+        self,
+        files: Iterable[Path],
+        project_root: Path,
+        kind: str,
+        version: int,
+        extract: Extractor,
+    ) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """Per-file artifacts for ``files``, analysing only changed files.
+
+        Files that cannot be read or parsed are left out.
+
+        Returns:
+            Tuple of (relative path -> artifact, relative path -> content hash)
+        """
+        artifacts: Dict[str, Any] = {}
+        hashes: Dict[str, str] = {}
+        for file_path in files:
+            try:
+                rel_path = str(file_path.relative_to(project_root))
+            except ValueError:
+                continue
+            content_hash = self.file_hash(file_path)
+            if content_hash is None:
+                continue
+
+            artifact = self.get(kind, version, content_hash)
+            if artifact is None:
+                artifact = _extract_file(file_path, extract)
+                if artifact is None:
+                    continue
+                self.put(kind, version, content_hash, artifact)
+
+            artifacts[rel_path] = artifact
+            hashes[rel_path] = content_hash
+
+        self.save_fingerprints()
+        self._maybe_prune()
+        return artifacts, hashes
+
+    def merged_view(
+        self,
+        kind: str,
+        hashes: Dict[str, str],
+        merge: Callable[[], Any],
+    ) -> Any:
+        """Repo-level view memoised on the exact set of file versions."""
+        digest = hashlib.sha256(
+            json.dumps(sorted(hashes.items())).encode("utf-8")
+        ).hexdigest()
+        key = (kind, digest)
+        with self._lock:
+            if key in self._views:
+                self._views.move_to_end(key)
+                self._stats["view_hits"] += 1
+                return self._views[key]
+
+        view = merge()
+        with self._lock:
+            self._views[key] = view
+            while len(self._views) > _MERGED_VIEW_ENTRIES:
+                self._views.popitem(last=False)
+        return view
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and memory usage."""
+        with self._lock:
+            return {
+                **self._stats,
+                "memory_entries": len(self._memory),
+                "merged_views": len(self._views),
+            }
+
+
+def _extract_file(file_path: Path, extract: Extractor) -> Optional[Any]:
+    """Read, parse and extract one file; None if unreadable or invalid."""
+    try:
+        content = file_path.read_text(encoding="utf-8")
+        tree = ast.parse(content)
+    except (OSError, UnicodeDecodeError, SyntaxError, ValueError) as e:
+        logger.debug("Could not analyze %s: %s", file_path, e)
+        return None
+    return extract(tree, content)
+
+
+def _atomic_write_json(path: Path, data: Any) -> None:
+    """Write JSON via a temp file and rename so readers never see partials."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+_artifact_store: Optional[AnalysisArtifactStore] = None
+_artifact_store_lock = threading.Lock()
+
+
+def get_artifact_store() -> AnalysisArtifactStore:
+    """Get the shared artifact store (thread-safe)."""
+    global _artifact_store
+    if _artifact_store is None:
+        with _artifact_store_lock:
+            if _artifact_store is None:
+                _artifact_store = AnalysisArtifactStore()
+    return _artifact_store
@@ -0,0 +1,148 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Unit tests for the content-hash keyed analysis artifact store
+
+Tests the following functionality:
+- Artifact round-trips through disk and the memory LRU
+- Unchanged files are neither re-hashed nor re-parsed
+- Changed files are re-extracted
+- Merged views are memoised on file versions
+- Unused artifacts and fingerprints of deleted files are pruned
+"""
+
+import os
+import time
+
+from api.codebase_analytics.artifact_store import (
+    AnalysisArtifactStore,
+    compute_content_hash,
+)
+
+
+def _function_names(tree, content):
+    return sorted(
+        node.name for node in tree.body if node.__class__.__name__ == "FunctionDef"
+    )
+
+
+class _CountingExtractor:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, tree, content):
+        self.calls += 1
+        return _function_names(tree, content)
+
+
+def _write_project(root):
+    (root / "a.py").write_text("def alpha():\n    pass\n")
+    (root / "b.py").write_text("def beta():\n    pass\n")
+    (root / "broken.py").write_text("def oops(:\n")
+    return sorted(root.glob("*.py"))
+
+
+def test_put_get_round_trip_survives_new_instance(tmp_path):
+    store = AnalysisArtifactStore(tmp_path / "store")
+    content_hash = compute_content_hash("x = 1\n")
+    store.put("kind", 1, content_hash, {"names": ["x"]})
+
+    fresh = AnalysisArtifactStore(tmp_path / "store")
+    assert fresh.get("kind", 1, content_hash) == {"names": ["x"]}
+    assert fresh.get("kind", 2, content_hash) is None
+
+
+def test_variant_keys_are_separate(tmp_path):
+    store = AnalysisArtifactStore(tmp_path)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert store.get_or_compute("cfg", 1, "pass\n", compute, variant="a.py") == 1
+    assert store.get_or_compute("cfg", 1, "pass\n", compute, variant="a.py") == 1
+    assert store.get_or_compute("cfg", 1, "pass\n", compute, variant="b.py") == 2
+
+
+def test_load_file_artifacts_only_extracts_changed_files(tmp_path):
+    project = tmp_path / "project"
+    project.mkdir()
+    files = _write_project(project)
+    extractor = _CountingExtractor()
+    store = AnalysisArtifactStore(tmp_path / "store")
+
+    artifacts, hashes = store.load_file_artifacts(files, project, "names", 1, extractor)
+    assert artifacts == {"a.py": ["alpha"], "b.py": ["beta"]}
+    assert set(hashes) == {"a.py", "b.py"}
+    assert extractor.calls == 2
+
+    # Warm run from a fresh process: fingerprints skip hashing and parsing
+    warm = AnalysisArtifactStore(tmp_path / "store")
+    artifacts, _ = warm.load_file_artifacts(files, project, "names", 1, extractor)
+    assert artifacts["a.py"] == ["alpha"]
+    assert extractor.calls == 2
+    assert warm.get_stats()["files_hashed"] == 0
+
+    (project / "b.py").write_text("def beta():\n    pass\n\ndef gamma():\n    pass\n")
+    stat = (project / "b.py").stat()
+    os.utime(project / "b.py", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    artifacts, _ = warm.load_file_artifacts(files, project, "names", 1, extractor)
+    assert artifacts["b.py"] == ["beta", "gamma"]
+    assert extractor.calls == 3
+
+
+def test_identical_content_shares_one_artifact(tmp_path):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "one.py").write_text("def same():\n    pass\n")
+    (project / "two.py").write_text("def same():\n    pass\n")
+    extractor = _CountingExtractor()
+    store = AnalysisArtifactStore(tmp_path / "store")
+
+    artifacts, hashes = store.load_file_artifacts(
+        sorted(project.glob("*.py")), project, "names", 1, extractor
+    )
+
+    assert artifacts == {"one.py": ["same"], "two.py": ["same"]}
+    assert hashes["one.py"] == hashes["two.py"]
+    assert extractor.calls == 1
+
+
+def test_merged_view_memoised_on_file_versions(tmp_path):
+    store = AnalysisArtifactStore(tmp_path)
+    merges = []
+
+    def merge():
+        merges.append(1)
+        return len(merges)
+
+    assert store.merged_view("tree", {"a.py": "h1", "b.py": "h2"}, merge) == 1
+    assert store.merged_view("tree", {"b.py": "h2", "a.py": "h1"}, merge) == 1
+    assert store.merged_view("tree", {"a.py": "h1", "b.py": "h3"}, merge) == 2
+    assert store.get_stats()["view_hits"] == 1
+
+
+def test_prune_removes_unused_artifacts_and_deleted_files(tmp_path):
+    project = tmp_path / "project"
+    project.mkdir()
+    files = _write_project(project)
+    store = AnalysisArtifactStore(tmp_path / "store")
+    _, hashes = store.load_file_artifacts(
+        files, project, "names", 1, _CountingExtractor()
+    )
+
+    old = time.time() - 3600
+    for path in (tmp_path / "store").glob("names/v1/*/*.json"):
+        os.utime(path, (old, old))
+    # A disk read marks b.py's artifact as used again
+    fresh = AnalysisArtifactStore(tmp_path / "store")
+    assert fresh.get("names", 1, hashes["b.py"]) == ["beta"]
+    (project / "a.py").unlink()
+
+    assert fresh.prune(max_age_seconds=60) == 1
+    assert fresh.get("names", 1, hashes["a.py"]) is None
+    assert fresh.get("names", 1, hashes["b.py"]) == ["beta"]
+    reloaded = AnalysisArtifactStore(tmp_path / "store")
+    assert str(project / "a.py") not in reloaded._load_fingerprints()
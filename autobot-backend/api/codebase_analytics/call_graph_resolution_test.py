@@ -14,7 +14,9 @@ Tests the following functionality:
 import ast
 
 from api.codebase_analytics.endpoints.call_graph import (
+    _extract_call_graph_facts,
     _extract_import_context,
+    _merge_call_graph_facts,
     _resolve_callee_id,
 )
 from api.codebase_analytics.endpoints.shared import (
@@ -302,6 +304,56 @@ class TestResolveCalleeId:
         assert is_external is False
 
 
+class TestCallGraphFactsMerge:
+    """Tests for merging per-file call graph facts."""
+
+    @staticmethod
+    def _facts(source):
+        return _extract_call_graph_facts(ast.parse(source), source)
+
+    def test_resolution_independent_of_file_order(self):
+        """Calls into files merged later still resolve."""
+        file_facts = {
+            "pkg/app.py": self._facts(
+                "from pkg.helpers import build\n"
+                "def main():\n"
+                "    build()\n"
+                "    later()\n"
+                "def later():\n"
+                "    pass\n"
+            ),
+            "pkg/helpers.py": self._facts("def build():\n    pass\n"),
+        }
+        functions, edges = {}, []
+
+        _merge_call_graph_facts(file_facts, functions, edges)
+
+        assert set(functions) == {
+            "pkg.app.main",
+            "pkg.app.later",
+            "pkg.helpers.build",
+        }
+        targets = {e["to"]: e["resolved"] for e in edges}
+        assert targets["pkg.helpers.build"] is True
+        assert targets["pkg.app.later"] is True
+
+    def test_method_calls_keep_class_context(self):
+        """Methods are registered and attributed with their class."""
+        facts = self._facts(
+            "class Service:\n"
+            "    def run(self):\n"
+            "        self.step()\n"
+            "    def step(self):\n"
+            "        pass\n"
+        )
+        functions, edges = {}, []
+
+        _merge_call_graph_facts({"svc.py": facts}, functions, edges)
+
+        assert functions["svc.Service.run"]["class"] == "Service"
+        assert edges[0]["from"] == "svc.Service.run"
+
+
 class TestStdlibAndThirdPartyConstants:
     """Tests for stdlib and third-party module constants."""
 
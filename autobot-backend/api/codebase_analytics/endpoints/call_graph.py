@@ -10,9 +10,8 @@ import asyncio
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-import aiofiles
 from fastapi import APIRouter, Query
 from fastapi.responses import JSONResponse
 from utils.io_executor import get_analytics_executor
@@ -20,6 +19,7 @@ from utils.io_executor import get_analytics_executor
 from autobot_shared.error_boundaries import ErrorCategory, with_error_handling
 from autobot_shared.redis_client import get_redis_client
 
+from ..artifact_store import get_artifact_store
 from .shared import COMMON_THIRD_PARTY, STDLIB_MODULES, ImportContext, get_project_root
 
 logger = logging.getLogger(__name__)
@@ -28,6 +28,10 @@ logger = logging.getLogger(__name__)
 CALL_GRAPH_CACHE_PREFIX = "codebase:call_graph:cache"
 CALL_GRAPH_CACHE_TTL = 300  # 5 minutes cache
 
+# Per-file call graph facts in the artifact store (bump on extractor change)
+CALL_GRAPH_ARTIFACT_KIND = "call_graph"
+CALL_GRAPH_ARTIFACT_VERSION = 1
+
 
 def _get_cache_key(project_root: str) -> str:
     """
@@ -407,40 +411,38 @@ def _resolve_callee_id(
 
 
 def _build_function_info(
-    node,
+    fact: Dict,
     func_id: str,
     full_name: str,
     file_path: str,
     module_path: str,
-    current_class: str,
 ) -> Dict:
     """
-    Build function information dictionary from AST node.
+    Build function information dictionary from an extracted function fact.
 
     Issue #665: Extracted from _create_function_visitor to reduce function length.
 
     Args:
-        node: AST function definition node
+        fact: Per-file function fact (see _extract_call_graph_facts)
         func_id: Full function identifier
         full_name: Display name of the function
         file_path: Source file path
         module_path: Module path
-        current_class: Current class context (or None)
 
     Returns:
         Dictionary containing function metadata
     """
     return {
         "id": func_id,
-        "name": node.name,
+        "name": fact["name"],
         "full_name": full_name,
         "file": file_path,
         "module": module_path,
-        "class": current_class,
-        "line": node.lineno,
-        "is_async": isinstance(node, ast.AsyncFunctionDef),
-        "args": len(node.args.args),
-        "decorators": [_get_decorator_name(d) for d in node.decorator_list],
+        "class": fact["class"],
+        "line": fact["line"],
+        "is_async": fact["is_async"],
+        "args": fact["args"],
+        "decorators": fact["decorators"],
     }
 
 
@@ -470,6 +472,32 @@ def _compute_func_identity(
     return func_id, full_name
 
 
+def _extract_import_entries(tree: ast.AST) -> List[List[Optional[str]]]:
+    """
+    Extract [module, name, alias] entries for every import in an AST tree.
+
+    Star imports are skipped since specific names cannot be tracked.
+    """
+    entries: List[List[Optional[str]]] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                entries.append([alias.name, None, alias.asname])
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            for alias in node.names:
+                if alias.name != "*":
+                    entries.append([node.module, alias.name, alias.asname])
+    return entries
+
+
+def _build_import_context(entries: List[List[Optional[str]]]) -> ImportContext:
+    """Build an ImportContext from [module, name, alias] entries."""
+    ctx = ImportContext()
+    for module, name, alias in entries:
+        ctx.add_import(module=module, name=name, alias=alias)
+    return ctx
+
+
 def _extract_import_context(tree: ast.AST) -> ImportContext:
     """
     Extract import context from an AST tree.
@@ -482,49 +510,24 @@ def _extract_import_context(tree: ast.AST) -> ImportContext:
     Returns:
         ImportContext with all imports from the file
     """
-    ctx = ImportContext()
-
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                ctx.add_import(module=alias.name, name=None, alias=alias.asname)
-        elif isinstance(node, ast.ImportFrom) and node.module:
-            for alias in node.names:
-                if alias.name == "*":
-                    # Star import - can't track specific names
-                    continue
-                ctx.add_import(module=node.module, name=alias.name, alias=alias.asname)
-
-    return ctx
+    return _build_import_context(_extract_import_entries(tree))
 
 
-class FunctionCallVisitor(ast.NodeVisitor):
+class CallGraphFactsVisitor(ast.NodeVisitor):
     """
-    AST visitor to extract function definitions and calls.
+    AST visitor to extract function definitions and raw call sites.
 
     Issue #713: Refactored to module level for reduced function length.
-    Uses constructor injection for data collections instead of closure.
-    """
-
-    def __init__(
-        self,
-        file_path: str,
-        module_path: str,
-        functions: Dict,
-        call_edges: List,
-        external_calls: Optional[List] = None,
-        import_context: Optional[ImportContext] = None,
-    ):
-        """Initialize visitor with file path, module context, and data stores."""
-        self.file_path = file_path
-        self.module_path = module_path
-        self.functions = functions
-        self.call_edges = call_edges
-        self.external_calls = external_calls
-        self.import_context = import_context
+    Facts are location-independent so they can be stored per content hash;
+    call resolution happens when files are merged into the repo-level graph.
+    """
+
+    def __init__(self):
+        """Initialize visitor with empty fact collections."""
+        self.functions: List[Dict] = []
+        self.calls: List[Dict] = []
         self.current_class = None
-        self.current_function = None
-        self.function_stack = []
+        self.function_stack: List[Tuple[str, Optional[str]]] = []
 
     def visit_ClassDef(self, node):
         """Visit class definition and track current class context."""
@@ -542,60 +545,91 @@ class FunctionCallVisitor(ast.NodeVisitor):
         self._process_function(node)
 
     def _process_function(self, node):
-        """Process function node and register it with its call relationships."""
-        func_id, full_name = _compute_func_identity(
-            node.name, self.module_path, self.current_class
+        """Record function definition and visit its body."""
+        self.functions.append(
+            {
+                "name": node.name,
+                "class": self.current_class,
+                "line": node.lineno,
+                "is_async": isinstance(node, ast.AsyncFunctionDef),
+                "args": len(node.args.args),
+                "decorators": [_get_decorator_name(d) for d in node.decorator_list],
+            }
         )
-        self.functions[func_id] = _build_function_info(
-            node,
-            func_id,
-            full_name,
-            self.file_path,
-            self.module_path,
-            self.current_class,
-        )
-
-        old_function = self.current_function
-        self.current_function = func_id
-        self.function_stack.append(func_id)
+        self.function_stack.append((node.name, self.current_class))
         self.generic_visit(node)
-        self.function_stack.pop() if self.function_stack else None
-        self.current_function = old_function
+        self.function_stack.pop()
 
     def visit_Call(self, node):
-        """Visit function call and record caller-callee relationship."""
-        if not self.current_function:
-            self.generic_visit(node)
-            return
+        """Record a call site made from inside a function."""
+        if self.function_stack:
+            callee_name = _extract_callee_name(node)
+            if callee_name and callee_name not in BUILTIN_FUNCS:
+                caller_name, caller_class = self.function_stack[-1]
+                self.calls.append(
+                    {
+                        "caller": caller_name,
+                        "caller_class": caller_class,
+                        "class": self.current_class,
+                        "callee": callee_name,
+                        "line": node.lineno,
+                    }
+                )
+        self.generic_visit(node)
 
-        callee_name = _extract_callee_name(node)
-        if callee_name and callee_name not in BUILTIN_FUNCS:
-            self._record_call(callee_name, node.lineno)
 
-        self.generic_visit(node)
+def _extract_call_graph_facts(tree: ast.AST, content: str) -> Dict:
+    """Per-file call graph artifact: functions, call sites and imports."""
+    visitor = CallGraphFactsVisitor()
+    visitor.visit(tree)
 
-    def _record_call(self, callee_name: str, line: int):
-        """Record a function call edge. Issue #713: Extracted for brevity."""
-        callee_id, is_external = _resolve_callee_id(
-            callee_name,
-            self.module_path,
-            self.current_class,
-            self.functions,
-            self.import_context,
-        )
+    return {
+        "functions": visitor.functions,
+        "calls": visitor.calls,
+        "imports": _extract_import_entries(tree),
+    }
 
-        if is_external and self.external_calls is not None:
-            self.external_calls.append(
-                {
-                    "from": self.current_function,
-                    "to_name": callee_name,
-                    "line": line,
-                }
+
+def _merge_call_graph_facts(
+    file_facts: Dict[str, Dict],
+    functions: Dict[str, Dict],
+    call_edges: List[Dict],
+    external_calls: Optional[List[Dict]] = None,
+) -> None:
+    """Merge per-file facts into functions/call_edges.
+
+    Every file's functions are registered before any call is resolved, so
+    resolution does not depend on file or definition order.
+    """
+    for rel_path, facts in file_facts.items():
+        module_path = rel_path.replace("/", ".").replace(".py", "")
+        for fact in facts["functions"]:
+            func_id, full_name = _compute_func_identity(
+                fact["name"], module_path, fact["class"]
+            )
+            functions[func_id] = _build_function_info(
+                fact, func_id, full_name, rel_path, module_path
             )
-        else:
-            self.call_edges.append(
-                _build_call_edge(self.current_function, callee_name, callee_id, line)
+
+    for rel_path, facts in file_facts.items():
+        module_path = rel_path.replace("/", ".").replace(".py", "")
+        import_context = _build_import_context(facts["imports"])
+
+        for call in facts["calls"]:
+            caller_id, _ = _compute_func_identity(
+                call["caller"], module_path, call["caller_class"]
+            )
+            callee_id, is_external = _resolve_callee_id(
+                call["callee"], module_path, call["class"], functions, import_context
             )
+            if is_external and external_calls is not None:
+                external_calls.append(
+                    {"from": caller_id, "to_name": call["callee"], "line": call["line"]}
+                )
+            else:
+                call_edges.append(
+                    _build_call_edge(caller_id, call["callee"], callee_id, call["line"])
+                )
 
 
 # =============================================================================
@@ -663,31 +697,20 @@ async def _analyze_python_files(
 
     Issue #665: Extracted from get_call_graph to reduce function length.
     Issue #713: Added import context extraction for cross-module resolution.
+    Per-file facts come from the content-hash artifact store, so only files
+    changed since the last request are parsed.
     """
-    for py_file in python_files[:300]:
-        try:
-            rel_path = str(py_file.relative_to(project_root))
-            module_path = rel_path.replace("/", ".").replace(".py", "")
-            try:
-                async with aiofiles.open(py_file, "r", encoding="utf-8") as f:
-                    content = await f.read()
-            except OSError as e:
-                logger.debug("Failed to read file for call graph %s: %s", py_file, e)
-                continue
-            tree = ast.parse(content)
-            # Issue #713: Extract import context for cross-module resolution
-            import_context = _extract_import_context(tree)
-            visitor = FunctionCallVisitor(
-                file_path=rel_path,
-                module_path=module_path,
-                functions=functions,
-                call_edges=call_edges,
-                external_calls=external_calls,
-                import_context=import_context,
-            )
-            visitor.visit(tree)
-        except Exception as e:
-            logger.debug("Could not analyze %s: %s", py_file, e)
+    store = get_artifact_store()
+    file_facts, _ = await asyncio.get_running_loop().run_in_executor(
+        get_analytics_executor(),
+        store.load_file_artifacts,
+        python_files[:300],
+        project_root,
+        CALL_GRAPH_ARTIFACT_KIND,
+        CALL_GRAPH_ARTIFACT_VERSION,
+        _extract_call_graph_facts,
+    )
+    _merge_call_graph_facts(file_facts, functions, call_edges, external_calls)
 
 
 def _build_call_graph_response(
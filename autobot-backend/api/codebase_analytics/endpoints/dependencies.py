@@ -11,14 +11,15 @@ import logging
 from pathlib import Path
 from typing import Dict, List, Set
 
-import aiofiles
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
 from fastapi.responses import JSONResponse
 from utils.background_task_manager import BackgroundTaskManager
 from utils.chromadb_client import get_all_paginated
+from utils.io_executor import run_in_analytics_executor
 
 from autobot_shared.error_boundaries import ErrorCategory, with_error_handling
 
+from ..artifact_store import get_artifact_store
 from ..storage import get_code_collection
 from .shared import COMMON_THIRD_PARTY, STDLIB_MODULES, get_project_root
 
@@ -32,6 +33,10 @@ _manager = BackgroundTaskManager(redis_prefix="dep_task:")
 # Combined set for fast lookup during import extraction (#1197)
 _EXTERNAL_MODULES = STDLIB_MODULES | COMMON_THIRD_PARTY
 
+# Per-file dependency facts in the artifact store (bump on extractor change)
+DEPENDENCY_ARTIFACT_KIND = "dependencies"
+DEPENDENCY_ARTIFACT_VERSION = 1
+
 
 def _extract_imports_from_ast(tree: ast.AST, stdlib_modules: set) -> tuple:
     """Extract import names and external dependencies from AST (Issue #315)."""
@@ -234,16 +239,6 @@ def _process_chromadb_metadata(
         modules[file_path]["classes"] += 1
 
 
-async def _read_file_content(py_file: Path) -> str | None:
-    """Read file content safely with aiofiles (Issue #315)."""
-    try:
-        async with aiofiles.open(py_file, "r", encoding="utf-8") as f:
-            return await f.read()
-    except OSError as e:
-        logger.debug("Failed to read file %s: %s", py_file, e)
-        return None
-
-
 def _detect_circular_deps(
     runtime_rels: List[Dict], module_index: Dict[str, str]
 ) -> List[Dict]:
@@ -265,54 +260,57 @@ def _detect_circular_deps(
     return _find_cycles_dfs(graph, max_length=5)
 
 
-async def _analyze_file_imports(
-    py_file: Path,
-    project_root: Path,
+def _extract_dependency_facts(tree: ast.AST, content: str) -> Dict:
+    """Per-file artifact: imports, external dependency counts, runtime imports."""
+    file_imports, file_ext_deps = _extract_imports_from_ast(tree, STDLIB_MODULES)
+    return {
+        "imports": file_imports,
+        "external_deps": file_ext_deps,
+        "runtime_imports": _extract_runtime_imports(tree),
+    }
+
+
+def _register_module(py_file: Path, project_root: Path, modules: Dict[str, Dict]):
+    """Add a filesystem module entry unless ChromaDB already provided one."""
+    rel_path = str(py_file.relative_to(project_root))
+    if rel_path not in modules:
+        modules[rel_path] = {
+            "path": rel_path,
+            "name": py_file.stem,
+            "package": str(py_file.parent.relative_to(project_root)),
+            "functions": 0,
+            "classes": 0,
+            "imports": [],
+        }
+
+
+def _apply_dependency_facts(
+    rel_path: str,
+    facts: Dict,
     modules: Dict[str, Dict],
     import_relationships: List[Dict],
     external_deps: Dict[str, int],
     runtime_rels: List[Dict],
 ) -> None:
     """
-    Analyze imports from a single Python file and update data structures.
+    Merge one file's dependency facts into the repo-level data structures.
 
     Issue #281: Extracted helper for file import analysis.
     Issue #1197: Also collects runtime-only imports for circular detection.
 
     Args:
-        py_file: Python file to analyze
-        project_root: Root directory of the project
+        rel_path: File path relative to the project root
+        facts: Artifact from _extract_dependency_facts
         modules: Dict to update with module info
         import_relationships: List to update with import relationships
         external_deps: Dict to update with external dependency counts
         runtime_rels: List to update with runtime-only import edges
     """
-    rel_path = str(py_file.relative_to(project_root))
-    if rel_path not in modules:
-        modules[rel_path] = {
-            "path": rel_path,
-            "name": py_file.stem,
-            "package": str(py_file.parent.relative_to(project_root)),
-            "functions": 0,
-            "classes": 0,
-            "imports": [],
-        }
-
-    content = await _read_file_content(py_file)
-    if content is None:
-        return
-
-    try:
-        tree = ast.parse(content)
-    except SyntaxError:
-        logger.debug("Syntax error parsing %s", py_file)
-        return
-
-    file_imports, file_ext_deps = _extract_imports_from_ast(tree, STDLIB_MODULES)
+    file_imports = facts["imports"]
     modules[rel_path]["imports"] = file_imports
 
     # Merge external dependencies
-    for pkg, count in file_ext_deps.items():
+    for pkg, count in facts["external_deps"].items():
         external_deps[pkg] = external_deps.get(pkg, 0) + count
 
     # Create import relationships for graph visualization
@@ -322,7 +320,7 @@ async def _analyze_file_imports(
         )
 
     # Runtime-only imports for circular detection (#1197)
-    for imp in _extract_runtime_imports(tree):
+    for imp in facts["runtime_imports"]:
         runtime_rels.append({"source": rel_path, "target": imp})
 
 
@@ -443,10 +441,23 @@ async def _scan_filesystem_imports(
     # Prioritize source directories over infrastructure/tooling (#1197)
     _priority = {"autobot-backend", "autobot-shared"}
     python_files.sort(key=lambda f: 0 if _priority & set(f.parts) else 1)
-    for py_file in python_files[:1500]:  # Cover all backend+shared files
-        await _analyze_file_imports(
-            py_file,
-            project_root,
+    python_files = python_files[:1500]  # Cover all backend+shared files
+    for py_file in python_files:
+        _register_module(py_file, project_root, modules)
+
+    # Only files changed since the last scan are re-read and re-parsed
+    file_facts, _ = await run_in_analytics_executor(
+        get_artifact_store().load_file_artifacts,
+        python_files,
+        project_root,
+        DEPENDENCY_ARTIFACT_KIND,
+        DEPENDENCY_ARTIFACT_VERSION,
+        _extract_dependency_facts,
+    )
+    for rel_path, facts in file_facts.items():
+        _apply_dependency_facts(
+            rel_path,
+            facts,
             modules,
             import_relationships,
             external_deps,
@@ -11,13 +11,14 @@ import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-import aiofiles
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
 from fastapi.responses import JSONResponse
 from utils.background_task_manager import BackgroundTaskManager
+from utils.io_executor import run_in_analytics_executor
 
 from autobot_shared.error_boundaries import ErrorCategory, with_error_handling
 
+from ..artifact_store import get_artifact_store
 from .shared import INTERNAL_MODULE_PREFIXES, STDLIB_MODULES, get_project_root
 
 logger = logging.getLogger(__name__)
@@ -27,6 +28,10 @@ router = APIRouter()
 # Background task manager for import tree analysis (#1304)
 _manager = BackgroundTaskManager(redis_prefix="import_task:")
 
+# Per-file imported modules in the artifact store (bump on extractor change)
+IMPORT_TREE_ARTIFACT_KIND = "import_tree"
+IMPORT_TREE_ARTIFACT_VERSION = 1
+
 
 def _build_module_to_file_mapping(
     python_files: List[Path], project_root: Path
@@ -88,26 +93,29 @@ def _add_imported_by_relation(
         )
 
 
-def _extract_imports_from_ast(
-    node: ast.AST,
-    module_to_file: Dict[str, str],
+def _extract_imported_modules(tree: ast.AST, content: str) -> List[str]:
+    """Per-file artifact: imported module names in AST walk order."""
+    modules: List[str] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            modules.append(node.module)
+    return modules
+
+
+def _record_file_imports(
     rel_path: str,
+    modules: List[str],
+    module_to_file: Dict[str, str],
     file_imports: Dict[str, List[Dict]],
     file_imported_by: Dict[str, List[Dict]],
 ) -> None:
-    """Extract import info from AST node (Issue #315)."""
-    if isinstance(node, ast.Import):
-        for alias in node.names:
-            import_info, target_file = _process_import_node(alias.name, module_to_file)
-            file_imports[rel_path].append(import_info)
-            _add_imported_by_relation(
-                file_imported_by, target_file, rel_path, alias.name
-            )
-
-    elif isinstance(node, ast.ImportFrom) and node.module:
-        import_info, target_file = _process_import_node(node.module, module_to_file)
+    """Record import info for one file's imported modules (Issue #315)."""
+    for module_name in modules:
+        import_info, target_file = _process_import_node(module_name, module_to_file)
         file_imports[rel_path].append(import_info)
-        _add_imported_by_relation(file_imported_by, target_file, rel_path, node.module)
+        _add_imported_by_relation(file_imported_by, target_file, rel_path, module_name)
 
 
 def _deduplicate_imports(imports: List[Dict]) -> List[Dict]:
@@ -161,21 +169,7 @@ async def get_import_tree():
         if not any(excluded in f.parts for excluded in excluded_dirs)
     ]
 
-    # Data structures
-    file_imports: Dict[str, List[Dict]] = {}
-    file_imported_by: Dict[str, List[Dict]] = {}
-
-    # Build module to file mapping (Issue #315 - extracted)
-    module_to_file = _build_module_to_file_mapping(python_files, project_root)
-
-    # Analyze imports (Issue #315 - simplified loop)
-    for py_file in python_files[:500]:
-        await _analyze_file_imports(
-            py_file, project_root, module_to_file, file_imports, file_imported_by
-        )
-
-    # Build result with bidirectional relationships
-    import_tree = _build_import_tree(file_imports, file_imported_by)
+    import_tree = await _compute_import_tree(python_files, project_root)
 
     return JSONResponse(
         {
@@ -186,34 +180,70 @@ async def get_import_tree():
     )
 
 
-async def _analyze_file_imports(
-    py_file: Path,
+def _merge_import_tree(
+    analyzed_files: List[Path],
     project_root: Path,
     module_to_file: Dict[str, str],
-    file_imports: Dict[str, List[Dict]],
-    file_imported_by: Dict[str, List[Dict]],
-) -> None:
-    """Analyze imports for a single file (Issue #315)."""
-    try:
-        rel_path = str(py_file.relative_to(project_root))
-        file_imports[rel_path] = []
+    file_modules: Dict[str, List[str]],
+) -> List[Dict]:
+    """Build the import tree from per-file imported modules."""
+    file_imports: Dict[str, List[Dict]] = {}
+    file_imported_by: Dict[str, List[Dict]] = {}
 
+    for py_file in analyzed_files:
         try:
-            async with aiofiles.open(py_file, "r", encoding="utf-8") as f:
-                content = await f.read()
-        except OSError as e:
-            logger.debug("Failed to read file for import analysis %s: %s", py_file, e)
-            return
+            rel_path = str(py_file.relative_to(project_root))
+        except ValueError:
+            continue
+        file_imports[rel_path] = []
+        modules = file_modules.get(rel_path)
+        if modules:
+            _record_file_imports(
+                rel_path, modules, module_to_file, file_imports, file_imported_by
+            )
 
-        tree = ast.parse(content)
+    return _build_import_tree(file_imports, file_imported_by)
 
-        for node in ast.walk(tree):
-            _extract_imports_from_ast(
-                node, module_to_file, rel_path, file_imports, file_imported_by
-            )
 
-    except Exception as e:
-        logger.debug("Could not analyze %s: %s", py_file, e)
+async def _compute_import_tree(
+    python_files: List[Path], project_root: Path, task_id: Optional[str] = None
+) -> List[Dict]:
+    """Import tree for ``python_files``, re-parsing only changed files.
+
+    Per-file imports come from the content-hash artifact store; the merged
+    tree is memoised on the exact set of file versions. With ``task_id``,
+    progress is reported to the background task manager.
+    """
+    if task_id:
+        await _manager.update_progress(task_id, "Building module mappings", 30.0)
+    # The mapping, the per-file imports and the view key all cover this set
+    analyzed_files = python_files[:500]
+    module_to_file = _build_module_to_file_mapping(analyzed_files, project_root)
+
+    if task_id:
+        await _manager.update_progress(task_id, "Analyzing file imports", 50.0)
+    store = get_artifact_store()
+    file_modules, hashes = await run_in_analytics_executor(
+        store.load_file_artifacts,
+        analyzed_files,
+        project_root,
+        IMPORT_TREE_ARTIFACT_KIND,
+        IMPORT_TREE_ARTIFACT_VERSION,
+        _extract_imported_modules,
+    )
+
+    if task_id:
+        await _manager.update_progress(task_id, "Building import tree", 80.0)
+    # Unparseable files still shape module_to_file, so they key the view too
+    view_key = {str(f.relative_to(project_root)): "" for f in analyzed_files}
+    view_key.update(hashes)
+    return store.merged_view(
+        IMPORT_TREE_ARTIFACT_KIND,
+        view_key,
+        lambda: _merge_import_tree(
+            analyzed_files, project_root, module_to_file, file_modules
+        ),
+    )
 
 
 def _build_import_tree(
@@ -290,23 +320,7 @@ async def _run_import_analysis(task_id: str) -> None:
             f for f in python_files if not any(ex in f.parts for ex in excluded_dirs)
         ]
 
-        await _manager.update_progress(task_id, "Building module mappings", 30.0)
-        file_imports: Dict[str, List[Dict]] = {}
-        file_imported_by: Dict[str, List[Dict]] = {}
-        module_to_file = _build_module_to_file_mapping(python_files, project_root)
-
-        await _manager.update_progress(task_id, "Analyzing file imports", 50.0)
-        for py_file in python_files[:500]:
-            await _analyze_file_imports(
-                py_file,
-                project_root,
-                module_to_file,
-                file_imports,
-                file_imported_by,
-            )
-
-        await _manager.update_progress(task_id, "Building import tree", 80.0)
-        import_tree = _build_import_tree(file_imports, file_imported_by)
+        import_tree = await _compute_import_tree(python_files, project_root, task_id)
 
         result = {
             "status": "success",
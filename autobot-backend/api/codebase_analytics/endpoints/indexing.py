@@ -43,6 +43,12 @@ from ..scanner import (
     _tasks_sync_lock,
     indexing_tasks,
 )
+from ..watch_indexer import (
+    load_watch_status,
+    start_watch_subprocess,
+    stop_watch_subprocess,
+    watch_subprocess_running,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -442,3 +448,57 @@ async def cancel_indexing_job():
             )
 
         return _cancel_active_task(task_id, existing_task)
+
+
+@router.post("/index/watch")
+@with_error_handling(
+    category=ErrorCategory.SERVER_ERROR,
+    operation="start_watch_indexing",
+    error_code_prefix="CODEBASE",
+)
+async def start_watch_indexing(request: Optional[IndexCodebaseRequest] = None):
+    """
+    Start continuous incremental indexing of a path.
+
+    Runs a filesystem-watching indexer subprocess that re-indexes only the
+    files that change. Run a full index first; the watcher keeps it fresh.
+    """
+    path_or_sync = await _validate_and_get_path(request)
+    if isinstance(path_or_sync, _SyncNeeded):
+        raise HTTPException(
+            status_code=409,
+            detail="Source repository not yet cloned; sync and index it first",
+        )
+
+    started = await start_watch_subprocess(path_or_sync)
+    return JSONResponse(
+        {
+            "status": "started" if started else "already_running",
+            "root_path": path_or_sync,
+        }
+    )
+
+
+@router.post("/index/watch/stop")
+@with_error_handling(
+    category=ErrorCategory.SERVER_ERROR,
+    operation="stop_watch_indexing",
+    error_code_prefix="CODEBASE",
+)
+async def stop_watch_indexing():
+    """Stop continuous incremental indexing after flushing pending changes."""
+    stopped = await stop_watch_subprocess()
+    return JSONResponse({"status": "stopped" if stopped else "not_running"})
+
+
+@router.get("/index/watch/status")
+@with_error_handling(
+    category=ErrorCategory.SERVER_ERROR,
+    operation="get_watch_indexing_status",
+    error_code_prefix="CODEBASE",
+)
+async def get_watch_indexing_status():
+    """Get continuous indexing statistics (batches, files indexed, backend)."""
+    status = await load_watch_status() or {"status": "stopped"}
+    status["process_running"] = watch_subprocess_running()
+    return JSONResponse(status)
@@ -10,6 +10,9 @@ uvicorn worker that launched it is unaffected.
 
 Usage (internal — called by _run_indexing_subprocess):
     python indexing_worker.py <task_id> <root_path>
+
+Watch mode (continuous incremental indexing, see watch_indexer.py):
+    python indexing_worker.py --watch <root_path>
 """
 import asyncio
 import logging
@@ -26,6 +29,7 @@ for _p in [str(_BACKEND_ROOT.parent), str(_SHARED_ROOT), str(_BACKEND_ROOT)]:
         sys.path.insert(0, _p)
 
 from api.codebase_analytics.scanner import do_indexing_with_progress  # noqa: E402
+from api.codebase_analytics.watch_indexer import run_watch_mode  # noqa: E402
 
 logging.basicConfig(
     level=logging.INFO,
@@ -37,7 +41,7 @@ logger = logging.getLogger(__name__)
 def main() -> None:
     """Entry point: parse CLI args and run indexing task."""
     if len(sys.argv) < 3:
-        logger.error("Usage: indexing_worker.py <task_id> <root_path>")
+        logger.error("Usage: indexing_worker.py <task_id|--watch> <root_path>")
         sys.exit(1)
 
     # Issue #1303: Lower process priority so the embedding-heavy indexing
@@ -47,6 +51,15 @@ def main() -> None:
     except OSError:
         logger.debug("Could not set nice priority (non-root)")
 
+    if sys.argv[1] == "--watch":
+        logger.info("[Worker] Starting watch mode path=%s", sys.argv[2])
+        try:
+            asyncio.run(run_watch_mode(sys.argv[2]))
+        except KeyboardInterrupt:
+            pass
+        logger.info("[Worker] Watch mode stopped")
+        return
+
     task_id = sys.argv[1]
     root_path = sys.argv[2]
 
@@ -298,7 +298,9 @@ async def _generate_npu_embeddings(
                 logger.warning("NPU batch returned incomplete results at index %d", i)
                 return None
 
-            all_embeddings.extend(result.embeddings)
+            # Rows arrive as a float32 array; callers get plain lists, as from
+            # the fallback path
+            all_embeddings.extend(result.embeddings.tolist())
 
             # Log progress for large batches
             if total_docs > 100 and (i + batch_size) % (batch_size * 5) == 0:
@@ -0,0 +1,764 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Continuous incremental codebase indexing driven by filesystem events
+
+A full indexing run (do_indexing_with_progress) walks and hashes every file
+before it can skip unchanged ones, so its cost grows with the repository.
+Watch mode keeps the autobot_code collection fresh at a cost proportional to
+each change instead:
+
+- Filesystem events come from watchdog (inotify on Linux); if watchdog is
+  unavailable or the inotify watch limit is exhausted, an mtime/size polling
+  snapshot is used instead.
+- Events are debounced per path: a file is processed once it has been quiet
+  for ``debounce`` seconds (or after ``max_delay`` for files that never
+  settle, e.g. logs being appended to).
+- Only files the scanner indexes (its _FILE_TYPE_MAP extensions) are
+  watched, and data/, log and ChromaDB directories are never watched, so the
+  watcher's own writes cannot trigger it.
+- Touched files are re-hashed; files whose content did not change are
+  ignored. Changed files are re-analyzed and their functions, classes and
+  problems replace the file's previous vectors. Deleted files have their
+  vectors, hardcodes and stored hash removed. A directory moved or deleted
+  is expanded to the files indexed under it; one moved in is walked.
+
+Watch mode assumes the collection was built by a prior indexing run. It runs
+in the isolated indexing subprocess (indexing_worker.py --watch) for the same
+ChromaDB isolation reasons as full indexing (#1180). A host-wide lock file
+keeps it to one watcher however many API workers are running.
+"""
+
+import asyncio
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import signal
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from utils.file_categorization import SKIP_DIRS
+
+from .scanner import (
+    _FILE_TYPE_MAP,
+    CHROMADB_EMBEDDING_MODE,
+    FILE_HASH_REDIS_PREFIX,
+    _build_base_file_metadata,
+    _compute_file_hash,
+    _generate_batch_embeddings,
+    _get_stored_file_hash,
+    _prepare_class_document,
+    _prepare_function_document,
+    _prepare_problem_document,
+    _run_analysis_and_build_result,
+    _run_in_indexing_thread,
+)
+from .storage import (
+    get_code_collection_async,
+    get_redis_connection,
+    get_redis_connection_async,
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds a path must be quiet before it is re-indexed
+WATCH_DEBOUNCE_SECONDS = float(os.getenv("CODEBASE_WATCH_DEBOUNCE", "1.5"))
+# Upper bound on how long a continuously-changing path is deferred
+WATCH_MAX_DELAY_SECONDS = float(os.getenv("CODEBASE_WATCH_MAX_DELAY", "10"))
+# Polling fallback rescan interval
+WATCH_POLL_INTERVAL = float(os.getenv("CODEBASE_WATCH_POLL_INTERVAL", "5"))
+# Files processed per batch; the rest wait for the next cycle
+WATCH_MAX_BATCH_FILES = 500
+
+# Outside the codebase:* namespace so full-index cache clears keep it (#1179)
+WATCH_STATUS_REDIS_KEY = "indexing_watch:status"
+_HARDCODES_REDIS_PATTERN = "codebase:hardcodes:*"
+
+# One watcher per host: held by the watch subprocess for its lifetime
+WATCH_LOCK_FILE = Path(
+    os.getenv(
+        "CODEBASE_WATCH_LOCK_FILE",
+        os.path.join(tempfile.gettempdir(), "autobot_codebase_watch.lock"),
+    )
+)
+
+# Extensions the scanner analyzes; every other file is ignored
+_WATCHED_EXTENSIONS = frozenset(
+    ext for extensions, _, _ in _FILE_TYPE_MAP for ext in extensions
+)
+# Runtime state the backend writes (vector stores, logs) is never watched
+_WATCH_SKIP_DIRS = frozenset(
+    SKIP_DIRS | {"logs", "log", "chromadb", "chroma_db", ".chroma"}
+)
+_WATCH_SKIP_TOP_LEVEL_DIRS = frozenset({"data"})
+
+
+class ChangeDebouncer:
+    """
+    Collect changed paths and release each once it has settled.
+
+    Thread-safe: watchdog and polling threads add paths while the asyncio
+    loop drains them.
+    """
+
+    def __init__(
+        self,
+        quiet_seconds: float = WATCH_DEBOUNCE_SECONDS,
+        max_delay: float = WATCH_MAX_DELAY_SECONDS,
+    ):
+        """Initialize debouncer with quiet period and maximum deferral."""
+        self._quiet = quiet_seconds
+        self._max_delay = max(max_delay, quiet_seconds)
+        self._lock = threading.Lock()
+        # path -> (first_seen, last_seen)
+        self._pending: Dict[Path, Tuple[float, float]] = {}
+        self.events = 0
+
+    def add(self, path: Path, now: Optional[float] = None) -> None:
+        """Record an event for ``path``."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            first_seen, _ = self._pending.get(path, (now, now))
+            self._pending[path] = (first_seen, now)
+            self.events += 1
+
+    def drain_ready(
+        self, now: Optional[float] = None, limit: int = WATCH_MAX_BATCH_FILES
+    ) -> List[Path]:
+        """Remove and return up to ``limit`` settled paths."""
+        now = time.monotonic() if now is None else now
+        ready: List[Path] = []
+        with self._lock:
+            for path, (first_seen, last_seen) in self._pending.items():
+                if (
+                    now - last_seen >= self._quiet
+                    or now - first_seen >= self._max_delay
+                ):
+                    ready.append(path)
+                    if len(ready) >= limit:
+                        break
+            for path in ready:
+                del self._pending[path]
+        return ready
+
+    def seconds_until_ready(self, now: Optional[float] = None) -> Optional[float]:
+        """Time until the next path settles, or None when nothing is pending."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if not self._pending:
+                return None
+            return max(
+                0.0,
+                min(
+                    min(last + self._quiet, first + self._max_delay) - now
+                    for first, last in self._pending.values()
+                ),
+            )
+
+    def __len__(self) -> int:
+        """Number of pending paths."""
+        with self._lock:
+            return len(self._pending)
+
+
+# watchdog event types that can change file content or existence
+_CONTENT_EVENT_TYPES = frozenset({"created", "modified", "deleted", "moved"})
+
+
+def _is_watched_file(path: Path) -> bool:
+    """True for files with an extension the scanner indexes."""
+    return path.suffix.lower() in _WATCHED_EXTENSIONS
+
+
+def _in_skipped_dir(root: Path, path: Path) -> bool:
+    """True for paths outside ``root`` or inside never-watched directories."""
+    try:
+        rel = path.relative_to(root)
+    except ValueError:
+        return True
+    if rel.parts and rel.parts[0] in _WATCH_SKIP_TOP_LEVEL_DIRS:
+        return True
+    return any(part in _WATCH_SKIP_DIRS for part in rel.parts)
+
+
+def _is_skipped(root: Path, path: Path) -> bool:
+    """True for paths that are not indexable files watched under ``root``."""
+    return _in_skipped_dir(root, path) or not _is_watched_file(path)
+
+
+def _snapshot_tree(
+    root: Path, start: Optional[Path] = None
+) -> Dict[Path, Tuple[int, int]]:
+    """Map every indexable file under ``start`` (default: ``root``) to
+    (mtime_ns, size)."""
+    snapshot: Dict[Path, Tuple[int, int]] = {}
+    for dirpath, dirnames, filenames in os.walk(start or root):
+        dirnames[:] = [
+            d
+            for d in dirnames
+            if d not in _WATCH_SKIP_DIRS
+            and not (dirpath == str(root) and d in _WATCH_SKIP_TOP_LEVEL_DIRS)
+        ]
+        for name in filenames:
+            path = Path(dirpath) / name
+            if not _is_watched_file(path):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def _diff_snapshots(
+    old: Dict[Path, Tuple[int, int]], new: Dict[Path, Tuple[int, int]]
+) -> Set[Path]:
+    """Paths added, removed or modified between two snapshots."""
+    changed = {path for path, sig in new.items() if old.get(path) != sig}
+    changed.update(path for path in old if path not in new)
+    return changed
+
+
+class _PollingWatcher:
+    """Polling fallback: periodic mtime/size snapshot diff in a thread."""
+
+    def __init__(self, root: Path, debouncer: ChangeDebouncer, interval: float):
+        """Initialize poller for ``root``."""
+        self._root = root
+        self._debouncer = debouncer
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Take the baseline snapshot and start polling."""
+        baseline = _snapshot_tree(self._root)
+        self._thread = threading.Thread(
+            target=self._run, args=(baseline,), name="codebase_watch_poll", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, snapshot: Dict[Path, Tuple[int, int]]) -> None:
+        """Poll until stopped."""
+        while not self._stop.wait(self._interval):
+            current = _snapshot_tree(self._root)
+            for path in _diff_snapshots(snapshot, current):
+                if not _is_skipped(self._root, path):
+                    self._debouncer.add(path)
+            snapshot = current
+
+    def stop(self) -> None:
+        """Signal the polling thread to stop."""
+        self._stop.set()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Wait for the polling thread to exit."""
+        if self._thread:
+            self._thread.join(timeout=timeout)
+
+
+def _stop_watcher(watcher) -> None:
+    """Stop a watchdog observer or polling watcher and wait for it."""
+    watcher.stop()
+    watcher.join(timeout=WATCH_POLL_INTERVAL + 1)
+
+
+def _create_event_watcher(root: Path, debouncer: ChangeDebouncer):
+    """Start a watchdog observer for ``root``; None if unavailable."""
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        logger.info("watchdog not installed, using polling watcher")
+        return None
+
+    class _Handler(FileSystemEventHandler):
+        def on_any_event(self, event) -> None:
+            if event.event_type not in _CONTENT_EVENT_TYPES:
+                return
+            if event.is_directory:
+                # Directory mtime changes say nothing about file content
+                if event.event_type != "modified":
+                    _add_directory_event(root, debouncer, event)
+                return
+            for attr in ("src_path", "dest_path"):
+                path = getattr(event, attr, None)
+                if path:
+                    path = Path(os.fsdecode(path))
+                    if not _is_skipped(root, path):
+                        debouncer.add(path)
+
+    observer = Observer()
+    try:
+        observer.schedule(_Handler(), str(root), recursive=True)
+        observer.start()
+    except OSError as e:
+        # inotify watch/instance limits exhausted on very large trees
+        logger.warning("Filesystem events unavailable (%s), using polling", e)
+        return None
+    return observer
+
+
+def _add_directory_event(root: Path, debouncer: ChangeDebouncer, event) -> None:
+    """Queue the paths affected by a directory create, delete or move.
+
+    A directory that left its place is queued as-is and expanded to its
+    indexed files when processed; one that appeared is walked now, since
+    watchdog reports no events for the files it brought along.
+    """
+    for attr in ("src_path", "dest_path"):
+        path = getattr(event, attr, None)
+        if not path:
+            continue
+        path = Path(os.fsdecode(path))
+        if _in_skipped_dir(root, path):
+            continue
+        if attr == "src_path" and event.event_type in ("deleted", "moved"):
+            debouncer.add(path)
+        else:
+            for file_path in _snapshot_tree(root, path):
+                debouncer.add(file_path)
+
+
+def _acquire_watch_lock() -> Optional[int]:
+    """Take the host-wide watcher lock; its fd, or None if already held."""
+    fd = os.open(WATCH_LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return None
+    os.ftruncate(fd, 0)
+    os.write(fd, str(os.getpid()).encode("ascii"))
+    return fd
+
+
+def _watch_lock_holder() -> Optional[int]:
+    """PID of the watcher holding the lock (0 if unreadable), None if free."""
+    fd = _acquire_watch_lock()
+    if fd is not None:
+        os.close(fd)
+        return None
+    try:
+        return int(WATCH_LOCK_FILE.read_text(encoding="ascii").strip())
+    except (OSError, ValueError):
+        return 0
+
+
+def _file_doc_id(kind: str, relative_path: str, idx: int, name: str) -> str:
+    """Stable per-file document ID, disjoint from full-index positional IDs."""
+    path_digest = hashlib.sha1(relative_path.encode("utf-8")).hexdigest()[:12]
+    return f"{kind}_{path_digest}_{idx}_{name}"
+
+
+def _prepare_file_documents(result) -> Tuple[List[str], List[str], List[Dict]]:
+    """Build ChromaDB documents for one re-analyzed file."""
+    ids: List[str] = []
+    documents: List[str] = []
+    metadatas: List[Dict] = []
+    rel = result.relative_path
+
+    for idx, func in enumerate(result.functions):
+        _, doc, meta = _prepare_function_document(func, idx)
+        ids.append(_file_doc_id("function", rel, idx, func["name"]))
+        documents.append(doc)
+        metadatas.append(meta)
+    for idx, cls in enumerate(result.classes):
+        _, doc, meta = _prepare_class_document(cls, idx)
+        ids.append(_file_doc_id("class", rel, idx, cls["name"]))
+        documents.append(doc)
+        metadatas.append(meta)
+    for idx, problem in enumerate(result.problems):
+        _, doc, meta = _prepare_problem_document(problem, idx)
+        ids.append(_file_doc_id("problem", rel, idx, problem.get("type", "unknown")))
+        documents.append(doc)
+        metadatas.append(meta)
+
+    return ids, documents, metadatas
+
+
+def _replace_file_hardcodes(
+    redis_client, touched_paths: Set[str], new_hardcodes: List[Dict]
+) -> None:
+    """Swap the touched files' entries in the per-type hardcode lists."""
+    grouped: Dict[str, List[Dict]] = {}
+    for key in redis_client.scan_iter(match=_HARDCODES_REDIS_PATTERN, count=100):
+        key = key.decode("utf-8") if isinstance(key, bytes) else key
+        raw = redis_client.get(key)
+        items = json.loads(raw) if raw else []
+        grouped[key] = [h for h in items if h.get("file_path") not in touched_paths]
+
+    for hardcode in new_hardcodes:
+        key = f"codebase:hardcodes:{hardcode.get('type', 'unknown')}"
+        grouped.setdefault(key, []).append(hardcode)
+
+    pipe = redis_client.pipeline()
+    for key, items in grouped.items():
+        if items:
+            pipe.set(key, json.dumps(items))
+        else:
+            pipe.delete(key)
+    pipe.execute()
+
+
+class CodebaseWatchIndexer:
+    """
+    Keep the code collection in sync with a directory tree as files change.
+
+    Usage:
+        indexer = CodebaseWatchIndexer("/path/to/repo")
+        await indexer.run()  # until cancelled
+    """
+
+    def __init__(
+        self,
+        root_path: str,
+        debounce: float = WATCH_DEBOUNCE_SECONDS,
+        poll_interval: float = WATCH_POLL_INTERVAL,
+        collection=None,
+        redis_client=None,
+    ):
+        """Initialize watcher for ``root_path`` (storage resolved on start)."""
+        self.root = Path(root_path).resolve()
+        self.debouncer = ChangeDebouncer(debounce)
+        self._poll_interval = poll_interval
+        self._collection = collection
+        self._redis = redis_client
+        self._watcher = None
+        self.stats: Dict[str, Any] = {
+            "root_path": str(self.root),
+            "backend": None,
+            "status": "stopped",
+            "batches": 0,
+            "files_indexed": 0,
+            "files_removed": 0,
+            "files_unchanged": 0,
+            "items_stored": 0,
+            "errors": 0,
+            "last_batch_at": None,
+            "started_at": None,
+        }
+
+    async def start(self) -> None:
+        """Connect storage and start the filesystem watcher."""
+        if self._collection is None:
+            self._collection = await get_code_collection_async()
+        if self._redis is None:
+            self._redis = await get_redis_connection()
+
+        backend = "inotify"
+        self._watcher = await asyncio.to_thread(
+            _create_event_watcher, self.root, self.debouncer
+        )
+        if self._watcher is None:
+            backend = "polling"
+            self._watcher = _PollingWatcher(
+                self.root, self.debouncer, self._poll_interval
+            )
+            await asyncio.to_thread(self._watcher.start)
+
+        self.stats.update(
+            backend=backend,
+            status="watching",
+            started_at=datetime.now().isoformat(),
+        )
+        logger.info("Watching %s for changes (backend=%s)", self.root, backend)
+        await self._save_status()
+
+    async def stop(self) -> None:
+        """Stop the watcher and flush pending changes."""
+        if self._watcher is not None:
+            await asyncio.to_thread(_stop_watcher, self._watcher)
+            self._watcher = None
+        pending = self.debouncer.drain_ready(
+            now=float("inf"), limit=max(len(self.debouncer), 1)
+        )
+        if pending:
+            await self.process_changes(pending)
+        self.stats["status"] = "stopped"
+        await self._save_status()
+
+    async def run(self) -> None:
+        """Start watching and index settled changes until cancelled."""
+        await self.start()
+        try:
+            while True:
+                wait = self.debouncer.seconds_until_ready()
+                await asyncio.sleep(0.5 if wait is None else min(max(wait, 0.05), 0.5))
+                ready = self.debouncer.drain_ready()
+                if ready:
+                    await self.process_changes(ready)
+        finally:
+            await self.stop()
+
+    # ------------------------------------------------------------------
+    # Change processing
+    # ------------------------------------------------------------------
+
+    async def process_changes(self, paths: List[Path]) -> Dict[str, int]:
+        """Re-index changed files and purge removed ones.
+
+        Returns:
+            Counts of indexed, removed and unchanged files
+        """
+        changed: List[Path] = []
+        removed: List[str] = []
+        for path in paths:
+            path = Path(path)
+            try:
+                rel = str(path.relative_to(self.root))
+            except ValueError:
+                continue
+            if _in_skipped_dir(self.root, path):
+                continue
+            if await _run_in_indexing_thread(path.is_file):
+                if _is_watched_file(path):
+                    changed.append(path)
+            elif await _run_in_indexing_thread(path.is_dir):
+                continue  # directory events are expanded to files when queued
+            elif _is_watched_file(path):
+                removed.append(rel)
+            else:
+                # A moved or deleted directory: purge the files indexed in it
+                removed.extend(await self._indexed_files_under(rel))
+        # A file can arrive both on its own and inside a moved directory
+        removed = list(dict.fromkeys(removed))
+
+        results = []
+        unchanged = 0
+        for path in changed:
+            result = await self._reanalyze(path)
+            if result is None:
+                unchanged += 1
+            else:
+                results.append(result)
+
+        touched = [r.relative_path for r in results] + removed
+        if touched:
+            try:
+                await self._replace_vectors(touched, results)
+                await self._update_redis(set(touched), results, removed)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error("Watch indexing batch failed: %s", e, exc_info=True)
+
+        self.stats["batches"] += 1
+        self.stats["files_indexed"] += len(results)
+        self.stats["files_removed"] += len(removed)
+        self.stats["files_unchanged"] += unchanged
+        self.stats["last_batch_at"] = datetime.now().isoformat()
+        if touched:
+            logger.info(
+                "Watch batch: %d indexed, %d removed, %d unchanged",
+                len(results),
+                len(removed),
+                unchanged,
+            )
+            await self._save_status()
+        return {
+            "indexed": len(results),
+            "removed": len(removed),
+            "unchanged": unchanged,
+        }
+
+    async def _indexed_files_under(self, rel_dir: str) -> List[str]:
+        """Relative paths of indexed files below ``rel_dir`` (by stored hash)."""
+        if not self._redis:
+            return []
+        prefix = f"{FILE_HASH_REDIS_PREFIX}{rel_dir}/"
+        keys = await asyncio.to_thread(
+            lambda: list(self._redis.scan_iter(match=f"{prefix}*", count=500))
+        )
+        return [
+            (key.decode("utf-8") if isinstance(key, bytes) else key)[
+                len(FILE_HASH_REDIS_PREFIX) :
+            ]
+            for key in keys
+        ]
+
+    async def _reanalyze(self, path: Path):
+        """Analyze a file if its content changed; None when unchanged."""
+        extension, rel, category, _ = _build_base_file_metadata(path, self.root)
+        current_hash, stored_hash = await asyncio.gather(
+            _run_in_indexing_thread(_compute_file_hash, path),
+            _get_stored_file_hash(self._redis, rel),
+        )
+        if current_hash and current_hash == stored_hash:
+            return None
+        return await _run_analysis_and_build_result(
+            path, rel, extension, category, current_hash, self._redis
+        )
+
+    async def _replace_vectors(self, touched: List[str], results: List) -> None:
+        """Delete the touched files' vectors and store fresh ones."""
+        ids: List[str] = []
+        documents: List[str] = []
+        metadatas: List[Dict] = []
+        for result in results:
+            file_ids, file_docs, file_metas = _prepare_file_documents(result)
+            ids.extend(file_ids)
+            documents.extend(file_docs)
+            metadatas.extend(file_metas)
+
+        embeddings = None
+        if documents and CHROMADB_EMBEDDING_MODE == "precompute":
+            embeddings = await _generate_batch_embeddings(documents)
+            if len(embeddings) != len(documents):
+                embeddings = None
+
+        try:
+            await self._write_vectors(touched, ids, documents, metadatas, embeddings)
+        except Exception as e:
+            # A full re-index may have dropped and recreated the collection
+            logger.warning("Collection write failed (%s), reconnecting", e)
+            self._collection = await get_code_collection_async()
+            await self._write_vectors(touched, ids, documents, metadatas, embeddings)
+        self.stats["items_stored"] += len(ids)
+
+    async def _write_vectors(self, touched, ids, documents, metadatas, embeddings):
+        """Delete-then-upsert against the current collection."""
+        if self._collection is None:
+            raise RuntimeError("ChromaDB code collection unavailable")
+        await self._collection.delete(where={"file_path": {"$in": touched}})
+        if ids:
+            await self._collection.upsert(
+                ids=ids,
+                documents=documents,
+                metadatas=metadatas,
+                embeddings=embeddings,
+            )
+
+    async def _update_redis(
+        self, touched: Set[str], results: List, removed: List[str]
+    ) -> None:
+        """Refresh hardcodes for touched files and drop removed files' hashes."""
+        if not self._redis:
+            return
+        new_hardcodes = [h for r in results for h in r.hardcodes]
+        await asyncio.to_thread(
+            _replace_file_hardcodes, self._redis, touched, new_hardcodes
+        )
+        if removed:
+            await asyncio.to_thread(
+                self._redis.delete,
+                *[f"{FILE_HASH_REDIS_PREFIX}{rel}" for rel in removed],
+            )
+
+    async def _save_status(self) -> None:
+        """Publish watcher stats for the status endpoint (non-fatal)."""
+        try:
+            redis = await get_redis_connection_async()
+            if redis:
+                status = dict(self.stats, pending=len(self.debouncer))
+                await redis.set(WATCH_STATUS_REDIS_KEY, json.dumps(status))
+        except Exception as e:
+            logger.debug("Watch status save failed (non-fatal): %s", e)
+
+
+async def run_watch_mode(root_path: str) -> None:
+    """Entry point for the indexing subprocess: watch ``root_path`` until
+    SIGTERM, flushing pending changes before exiting."""
+    lock_fd = _acquire_watch_lock()
+    if lock_fd is None:
+        logger.info("Another watch-mode indexer is running, exiting")
+        return
+    task = asyncio.current_task()
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, task.cancel)
+    except (NotImplementedError, RuntimeError):
+        pass  # Not supported on this platform / not in main thread
+    try:
+        await CodebaseWatchIndexer(root_path).run()
+    except asyncio.CancelledError:
+        logger.info("Watch mode for %s stopped", root_path)
+    finally:
+        os.close(lock_fd)
+
+
+# Watch subprocess launched by this API worker (one per worker process)
+_watch_process: Optional[asyncio.subprocess.Process] = None
+_watch_root: Optional[str] = None
+
+
+def _own_watch_process_running() -> bool:
+    """True if this worker's watch subprocess is alive."""
+    return _watch_process is not None and _watch_process.returncode is None
+
+
+def watch_subprocess_running() -> bool:
+    """True if a watch subprocess is alive on this host (any API worker)."""
+    return _own_watch_process_running() or _watch_lock_holder() is not None
+
+
+async def start_watch_subprocess(root_path: str) -> bool:
+    """Launch the isolated watch-mode indexer for ``root_path``.
+
+    Returns:
+        False if a watcher is already running, in this or another worker
+    """
+    global _watch_process, _watch_root
+    if watch_subprocess_running():
+        return False
+    worker_script = Path(__file__).parent / "indexing_worker.py"
+    _watch_process = await asyncio.create_subprocess_exec(
+        sys.executable, str(worker_script), "--watch", root_path
+    )
+    _watch_root = root_path
+    logger.info(
+        "Started watch-mode indexer (pid %d) for %s", _watch_process.pid, root_path
+    )
+    return True
+
+
+async def stop_watch_subprocess(timeout: float = 30.0) -> bool:
+    """Stop the watch subprocess, letting it flush pending changes.
+
+    A watcher started by another API worker is sent SIGTERM by PID.
+
+    Returns:
+        False if no watcher was running
+    """
+    global _watch_process, _watch_root
+    if not _own_watch_process_running():
+        pid = _watch_lock_holder()
+        if not pid:
+            return False
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except OSError as e:
+            logger.warning("Could not stop watch-mode indexer pid %d: %s", pid, e)
+            return False
+        return True
+    proc = _watch_process
+    proc.terminate()
+    try:
+        await asyncio.wait_for(proc.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning("Watch-mode indexer did not exit, killing")
+        proc.kill()
+        await proc.wait()
+    _watch_process = None
+    _watch_root = None
+    return True
+
+
+async def load_watch_status() -> Optional[Dict]:
+    """Last published watcher stats, or None if never started."""
+    try:
+        redis = await get_redis_connection_async()
+        if redis:
+            data = await redis.get(WATCH_STATUS_REDIS_KEY)
+            if data:
+                return json.loads(data)
+    except Exception as e:
+        logger.debug("Watch status load failed (non-fatal): %s", e)
+    return None
@@ -0,0 +1,264 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Unit tests for watch-mode incremental indexing
+
+Tests the following functionality:
+- Per-path debouncing with a maximum deferral
+- Polling snapshot diffs (add, modify, delete, skipped directories)
+- Only indexable files outside data/log/vector-store directories are watched
+- Host-wide single-watcher lock
+- Per-file document IDs and hardcode replacement
+- Change batches: unchanged files skipped, removed files purged
+"""
+
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from api.codebase_analytics import watch_indexer
+from api.codebase_analytics.watch_indexer import (
+    ChangeDebouncer,
+    CodebaseWatchIndexer,
+    _acquire_watch_lock,
+    _diff_snapshots,
+    _is_skipped,
+    _prepare_file_documents,
+    _replace_file_hardcodes,
+    _snapshot_tree,
+    _watch_lock_holder,
+)
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._ops = []
+
+    def set(self, key, value):
+        self._ops.append(("set", key, value))
+
+    def delete(self, key):
+        self._ops.append(("delete", key))
+
+    def execute(self):
+        for op in self._ops:
+            if op[0] == "set":
+                self._redis.data[op[1]] = op[2]
+            else:
+                self._redis.data.pop(op[1], None)
+
+
+class _FakeRedis:
+    def __init__(self, data=None):
+        self.data = dict(data or {})
+
+    def scan_iter(self, match, count=None):
+        prefix = match.rstrip("*")
+        return [k for k in list(self.data) if k.startswith(prefix)]
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def pipeline(self):
+        return _FakePipeline(self)
+
+
+class TestChangeDebouncer:
+    """Tests for ChangeDebouncer."""
+
+    def test_releases_path_after_quiet_period(self):
+        debouncer = ChangeDebouncer(quiet_seconds=1.0, max_delay=10.0)
+        debouncer.add(Path("a.py"), now=0.0)
+        debouncer.add(Path("a.py"), now=0.8)
+
+        assert debouncer.drain_ready(now=1.5) == []
+        assert debouncer.seconds_until_ready(now=1.5) == pytest.approx(0.3)
+        assert debouncer.drain_ready(now=1.8) == [Path("a.py")]
+        assert len(debouncer) == 0
+
+    def test_max_delay_bounds_continuous_changes(self):
+        debouncer = ChangeDebouncer(quiet_seconds=1.0, max_delay=3.0)
+        for tick in range(7):
+            debouncer.add(Path("app.log"), now=tick * 0.5)
+
+        assert debouncer.drain_ready(now=3.0) == [Path("app.log")]
+
+    def test_drain_respects_limit(self):
+        debouncer = ChangeDebouncer(quiet_seconds=0.0)
+        for i in range(5):
+            debouncer.add(Path(f"f{i}.py"), now=0.0)
+
+        assert len(debouncer.drain_ready(now=1.0, limit=2)) == 2
+        assert len(debouncer) == 3
+
+
+def test_snapshot_diff_detects_add_modify_delete(tmp_path):
+    (tmp_path / "keep.py").write_text("x = 1\n")
+    (tmp_path / "edit.py").write_text("x = 1\n")
+    (tmp_path / "gone.py").write_text("x = 1\n")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "dep.js").write_text("")
+    before = _snapshot_tree(tmp_path)
+
+    edit = tmp_path / "edit.py"
+    edit.write_text("x = 22\n")
+    stat = edit.stat()
+    os.utime(edit, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    (tmp_path / "gone.py").unlink()
+    (tmp_path / "new.py").write_text("")
+    (tmp_path / "node_modules" / "other.js").write_text("")
+
+    changed = _diff_snapshots(before, _snapshot_tree(tmp_path))
+
+    assert changed == {tmp_path / "edit.py", tmp_path / "gone.py", tmp_path / "new.py"}
+
+
+def test_runtime_state_and_unindexed_files_are_not_watched(tmp_path):
+    (tmp_path / "app.py").write_text("")
+    (tmp_path / "server.log").write_text("")
+    (tmp_path / "data" / "chromadb").mkdir(parents=True)
+    (tmp_path / "data" / "chromadb" / "index.py").write_text("")
+    (tmp_path / "logs").mkdir()
+    (tmp_path / "logs" / "trace.json").write_text("")
+    (tmp_path / "pkg" / "data").mkdir(parents=True)
+    (tmp_path / "pkg" / "data" / "fixtures.py").write_text("")
+
+    assert set(_snapshot_tree(tmp_path)) == {
+        tmp_path / "app.py",
+        tmp_path / "pkg" / "data" / "fixtures.py",
+    }
+    assert _is_skipped(tmp_path, tmp_path / "data" / "chromadb" / "index.py")
+    assert _is_skipped(tmp_path, tmp_path / "server.log")
+    assert not _is_skipped(tmp_path, tmp_path / "pkg" / "data" / "fixtures.py")
+
+
+def test_watch_lock_admits_one_watcher(tmp_path):
+    with patch.object(watch_indexer, "WATCH_LOCK_FILE", tmp_path / "watch.lock"):
+        assert _watch_lock_holder() is None
+        fd = _acquire_watch_lock()
+        try:
+            assert fd is not None
+            assert _acquire_watch_lock() is None
+            assert _watch_lock_holder() == os.getpid()
+        finally:
+            os.close(fd)
+        assert _watch_lock_holder() is None
+
+
+def test_file_documents_use_stable_per_file_ids():
+    result = SimpleNamespace(
+        relative_path="pkg/mod.py",
+        functions=[{"name": "run", "file_path": "pkg/mod.py", "args": []}],
+        classes=[{"name": "Job", "file_path": "pkg/mod.py", "methods": []}],
+        problems=[{"type": "long_function", "file_path": "pkg/mod.py"}],
+    )
+
+    ids, documents, metadatas = _prepare_file_documents(result)
+    again, _, _ = _prepare_file_documents(result)
+
+    assert ids == again
+    assert len(set(ids)) == 3
+    assert ids[0].startswith("function_") and ids[0].endswith("_0_run")
+    assert [m["type"] for m in metadatas] == ["function", "class", "problem"]
+
+
+def test_replace_file_hardcodes_swaps_only_touched_files():
+    redis = _FakeRedis(
+        {
+            "codebase:hardcodes:url": json.dumps(
+                [
+                    {"type": "url", "file_path": "a.py", "value": "http://old"},
+                    {"type": "url", "file_path": "b.py", "value": "http://b"},
+                ]
+            ),
+            "codebase:hardcodes:ip": json.dumps(
+                [{"type": "ip", "file_path": "gone.py", "value": "10.0.0.1"}]
+            ),
+        }
+    )
+
+    _replace_file_hardcodes(
+        redis,
+        {"a.py", "gone.py"},
+        [{"type": "port", "file_path": "a.py", "value": "8080"}],
+    )
+
+    urls = json.loads(redis.data["codebase:hardcodes:url"])
+    assert [h["file_path"] for h in urls] == ["b.py"]
+    assert "codebase:hardcodes:ip" not in redis.data
+    assert json.loads(redis.data["codebase:hardcodes:port"])[0]["value"] == "8080"
+
+
+@pytest.mark.asyncio
+async def test_process_changes_reindexes_changed_and_purges_removed(tmp_path):
+    (tmp_path / "changed.py").write_text("def f():\n    pass\n")
+    (tmp_path / "same.py").write_text("x = 1\n")
+    collection = SimpleNamespace(delete=AsyncMock(), upsert=AsyncMock())
+    redis = _FakeRedis({"codebase:file_hash:removed.py": "abc"})
+    indexer = CodebaseWatchIndexer(
+        str(tmp_path), collection=collection, redis_client=redis
+    )
+
+    same_hash = watch_indexer._compute_file_hash(tmp_path / "same.py")
+    analyzed = SimpleNamespace(
+        relative_path="changed.py",
+        functions=[{"name": "f", "file_path": "changed.py", "args": []}],
+        classes=[],
+        problems=[],
+        hardcodes=[],
+    )
+
+    async def stored_hash(_redis, rel):
+        return same_hash if rel == "same.py" else None
+
+    with patch.object(
+        watch_indexer, "_get_stored_file_hash", stored_hash
+    ), patch.object(
+        watch_indexer,
+        "_run_analysis_and_build_result",
+        AsyncMock(return_value=analyzed),
+    ), patch.object(
+        watch_indexer, "CHROMADB_EMBEDDING_MODE", "auto"
+    ):
+        counts = await indexer.process_changes(
+            [tmp_path / "changed.py", tmp_path / "same.py", tmp_path / "removed.py"]
+        )
+
+    assert counts == {"indexed": 1, "removed": 1, "unchanged": 1}
+    collection.delete.assert_awaited_once_with(
+        where={"file_path": {"$in": ["changed.py", "removed.py"]}}
+    )
+    assert collection.upsert.await_args.kwargs["metadatas"][0]["name"] == "f"
+    assert "codebase:file_hash:removed.py" not in redis.data
+
+
+@pytest.mark.asyncio
+async def test_moved_directory_purges_files_indexed_under_it(tmp_path):
+    collection = SimpleNamespace(delete=AsyncMock(), upsert=AsyncMock())
+    redis = _FakeRedis(
+        {
+            "codebase:file_hash:pkg/a.py": "1",
+            "codebase:file_hash:pkg/sub/b.py": "2",
+            "codebase:file_hash:pkg2/c.py": "3",
+        }
+    )
+    indexer = CodebaseWatchIndexer(
+        str(tmp_path), collection=collection, redis_client=redis
+    )
+
+    counts = await indexer.process_changes([tmp_path / "pkg", tmp_path / "pkg/a.py"])
+
+    assert counts["removed"] == 2
+    collection.delete.assert_awaited_once_with(
+        where={"file_path": {"$in": ["pkg/a.py", "pkg/sub/b.py"]}}
+    )
+    assert list(redis.data) == ["codebase:file_hash:pkg2/c.py"]
@@ -556,7 +556,12 @@ async def delete_conversation(
                 errors.append(f"Error deleting transcript: {str(e)}")
 
         chats_dir = DATA_DIR / "chats"
-        for suffix in ["_chat.json", "_terminal_transcript.txt"]:
+        for suffix in [
+            "_chat.json",
+            "_chat.log",
+            "_chat.lock",
+            "_terminal_transcript.txt",
+        ]:
             chat_file = chats_dir / f"{conversation_id}{suffix}"
             if chat_file.exists():
                 try:
@@ -1543,6 +1543,10 @@ async def _clear_kb_via_redis(kb) -> int:
     index_keys = await kb.redis.keys("index:*")
     if index_keys:
         await kb.redis.delete(*index_keys)
+    if hasattr(kb, "reset_facets_after_clear"):
+        await kb.reset_facets_after_clear()
+    if hasattr(kb, "reset_keyword_index"):
+        await kb.reset_keyword_index()
     return len(keys) if keys else 0
 
 
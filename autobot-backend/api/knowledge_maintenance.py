@@ -38,6 +38,7 @@ from api.knowledge_models import (
 from auth_middleware import check_admin_permission
 from constants.threshold_constants import QueryDefaults
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request
+from fastapi.responses import StreamingResponse
 from knowledge_factory import get_or_create_knowledge_base
 
 from autobot_shared.error_boundaries import ErrorCategory, with_error_handling
@@ -165,14 +166,19 @@ async def _delete_facts_in_batches(
 ) -> int:
     """Delete facts in batches (Issue #398: extracted).
 
+    Each fact goes through delete_fact_record so its facet counters and
+    category fact_count are released along with the hash, and is removed
+    from the keyword index.
+
     Returns:
         Number of facts deleted
     """
     deleted_count = 0
     for i in range(0, len(facts_to_delete), batch_size):
-        batch = facts_to_delete[i : i + batch_size]
-        await asyncio.to_thread(kb.redis_client.delete, *batch)
-        deleted_count += len(batch)
+        fact_ids = [key[len("fact:") :] for key in facts_to_delete[i : i + batch_size]]
+        await asyncio.gather(*[kb.delete_fact_record(fact_id) for fact_id in fact_ids])
+        await kb.remove_facts_from_keyword_index(fact_ids)
+        deleted_count += len(fact_ids)
     return deleted_count
 
 
@@ -288,6 +294,45 @@ async def find_duplicates(
     return result
 
 
+@with_error_handling(
+    category=ErrorCategory.SERVER_ERROR,
+    operation="stream_duplicates",
+    error_code_prefix="KB",
+)
+@router.post("/deduplicate/advanced/stream")
+async def stream_duplicates(
+    admin_check: bool = Depends(check_admin_permission),
+    request: DeduplicationRequest = None,
+    req: Request = None,
+):
+    """
+    Stream embedding-based near-duplicate groups as NDJSON.
+
+    Scans the full knowledge base with the blocked dedup engine and emits
+    one JSON line per duplicate group as soon as it is found, followed by a
+    final summary line. Requires admin authentication.
+    """
+    kb = await get_or_create_knowledge_base(req.app, force_refresh=False)
+    if kb is None:
+        raise HTTPException(
+            status_code=500,
+            detail="Knowledge base not initialized",
+        )
+
+    async def generate():
+        """Yield duplicate groups as NDJSON lines."""
+        found = 0
+        async for group in kb.iter_duplicate_groups(
+            similarity_threshold=request.similarity_threshold,
+            category=request.category,
+        ):
+            found += 1
+            yield json.dumps({"type": "group", "group": group}) + "\n"
+        yield json.dumps({"type": "summary", "duplicates_found": found}) + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 # ===== DATA QUALITY METRICS (Issue #418) =====
 
 
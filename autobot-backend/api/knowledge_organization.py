@@ -332,7 +332,7 @@ async def _delete_expired_facts(kb, fact_ids: list, cutoff_date) -> int:
             created_at = datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
             if created_at < cutoff_date:
                 await kb.ownership_manager.cleanup_ownership_indexes(fact_id, metadata)
-                await kb.aioredis_client.delete(f"fact:{fact_id}")
+                await kb.delete_fact_record(fact_id)
                 deleted_count += 1
         except (ValueError, TypeError):
             # Skip if date parsing fails
@@ -13,6 +13,7 @@ import asyncio
 import json
 import logging
 import os
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Set
@@ -20,11 +21,13 @@ from typing import List, Optional, Set
 import aiofiles
 from auth_middleware import check_admin_permission
 from constants.path_constants import PATH
-from constants.threshold_constants import TimingConstants
 from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket
 from fastapi.responses import StreamingResponse
 from type_defs.common import Metadata
 from utils.io_executor import run_in_log_executor
+from utils.log_reader import read_log_window, read_tail_lines
+from utils.log_search import LogSearchQuery, search_log_files
+from utils.log_tail_hub import get_log_tail_hub
 
 from autobot_shared.error_boundaries import ErrorCategory, with_error_handling
 
@@ -89,12 +92,12 @@ def _parse_docker_log_line_for_unified(line: str, service: str) -> Metadata:
 
 
 def _parse_file_content_lines(
-    content: str, file_name: str, level: Optional[str]
+    lines: List[str], file_name: str, level: Optional[str]
 ) -> List[Metadata]:
-    """Parse file log content lines with optional level filter (Issue #315: extracted).
+    """Parse file log lines with optional level filter (Issue #315: extracted).
 
     Args:
-        content: File content as string
+        lines: Raw log lines (typically the file's tail)
         file_name: Source file name for log entries
         level: Optional log level filter
 
@@ -102,7 +105,7 @@ def _parse_file_content_lines(
         List of parsed log entries
     """
     logs = []
-    for line in content.splitlines()[-50:]:
+    for line in lines:
         if not line.strip():
             continue
         parsed = parse_file_log_line(line.strip(), file_name)
@@ -116,24 +119,20 @@ def _parse_file_content_lines(
 async def _tail_file_to_websocket(file_path: Path, websocket: WebSocket) -> None:
     """Tail a log file and send lines to WebSocket (Issue #315: extracted).
 
-    Sends last 50 lines initially, then watches for new lines.
+    Sends last 50 lines initially, then frames of newly appended lines from
+    the shared tail hub, which runs one tailer per file no matter how many
+    viewers are connected. Every message is JSON: {"lines": [...]}, plus a
+    warning and "dropped_lines" when the viewer fell behind and missed lines.
     """
-    async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
-        # Send last 50 lines initially
-        content = await f.read()
-        lines = content.splitlines()
-        for line in lines[-50:]:
-            await websocket.send_text(line)
-
-        # Continue watching for new lines
-        await f.seek(0, 2)  # Go to end of file
-        while True:
-            line = await f.readline()
-            if line:
-                await websocket.send_text(line.rstrip())
-            else:
-                # Brief delay while polling for new log lines
-                await asyncio.sleep(TimingConstants.MICRO_DELAY)
+    async with get_log_tail_hub().subscribe(file_path, backlog=50) as subscription:
+        await websocket.send_json({"lines": subscription.backlog})
+
+        async for frame in subscription.frames():
+            message = {"lines": frame.lines}
+            if frame.dropped:
+                message["warning"] = "Viewer fell behind, lines were skipped"
+                message["dropped_lines"] = frame.dropped
+            await websocket.send_json(message)
 
 
 async def _read_log_lines_from_file(
@@ -141,6 +140,9 @@ async def _read_log_lines_from_file(
 ) -> tuple:
     """Read lines from log file with offset/tail support (Issue #315: extracted).
 
+    Tails are read backwards from EOF and offset reads seek through a
+    sparse line index, so memory use does not grow with the file.
+
     Args:
         file_path: Path to log file
         lines: Number of lines to read
@@ -150,20 +152,7 @@ async def _read_log_lines_from_file(
     Returns:
         Tuple of (selected_lines, total_lines)
     """
-    async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
-        if tail:
-            content = await f.read()
-            all_lines = content.splitlines()
-            start_idx = max(0, len(all_lines) - lines - offset)
-            end_idx = len(all_lines) - offset
-            return all_lines[start_idx:end_idx], len(all_lines)
-        else:
-            all_lines = []
-            async for line in f:
-                all_lines.append(line.rstrip())
-            start_idx = offset
-            end_idx = min(offset + lines, len(all_lines))
-            return all_lines[start_idx:end_idx], len(all_lines)
+    return await run_in_log_executor(read_log_window, file_path, lines, offset, tail)
 
 
 async def _collect_file_logs(
@@ -201,9 +190,8 @@ async def _collect_file_logs(
     async def read_file_logs(file_path, file_name):
         """Read and parse log entries from a single file."""
         try:
-            async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
-                content = await f.read()
-                return _parse_file_content_lines(content, file_name, level)
+            lines, _ = await run_in_log_executor(read_tail_lines, file_path, 50)
+            return _parse_file_content_lines(lines, file_name, level)
         except OSError as e:
             logger.debug("Error reading file log %s: %s", file_path, e)
             return []
@@ -439,10 +427,8 @@ async def _get_most_recent_log_file(log_dir: str) -> Optional[str]:
 async def _read_recent_log_lines(log_path: str, limit: int) -> List[str]:
     """Read recent lines from a log file (Issue #315 - extracted helper)."""
     try:
-        async with aiofiles.open(log_path, "r", encoding="utf-8") as f:
-            content = await f.read()
-            lines = content.splitlines(keepends=True)
-            return lines[-limit:] if len(lines) > limit else lines
+        lines, _ = await run_in_log_executor(read_tail_lines, log_path, limit)
+        return [line + "\n" for line in lines]
     except Exception as e:
         logger.error("Error reading log file %s: %s", log_path, e)
         return []
@@ -911,13 +897,6 @@ async def tail_log(websocket: WebSocket, filename: str):
             logger.debug("Failed to close WebSocket: %s", close_err)
 
 
-def _line_matches_query(line_content: str, query: str, case_sensitive: bool) -> bool:
-    """Check if a line matches the search query with optional case sensitivity."""
-    if case_sensitive:
-        return query in line_content
-    return query.lower() in line_content.lower()
-
-
 def _create_search_result(file_name: str, line_num: int, line_content: str) -> dict:
     """Create a search result entry with file, line number, and timestamp."""
     return {
@@ -928,28 +907,28 @@ def _create_search_result(file_name: str, line_num: int, line_content: str) -> d
     }
 
 
-async def _search_single_log_file(
-    file_path, query: str, case_sensitive: bool, max_results: int, current_count: int
-) -> list:
-    """Search a single log file for matching lines."""
-    results = []
-    async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
-        line_num = 0
-        async for line in f:
-            line_num += 1
-            line_content = line.rstrip()
-
-            if not _line_matches_query(line_content, query, case_sensitive):
-                continue
-
-            results.append(
-                _create_search_result(file_path.name, line_num, line_content)
-            )
+async def _resolve_search_files(filename: Optional[str]) -> List[Path]:
+    """Log files covered by a search request."""
+    if filename:
+        file_path = LOG_DIR / filename
+        file_exists = await run_in_log_executor(file_path.exists)
+        return [file_path] if file_exists else []
+    # Issue #358 - use lambda for proper glob() execution in thread
+    return await run_in_log_executor(lambda: sorted(LOG_DIR.glob("*.log")))
 
-            if current_count + len(results) >= max_results:
-                break
 
-    return results
+async def _stream_search_results(
+    files: List[Path], search_query: LogSearchQuery, max_results: int
+):
+    """Yield NDJSON search results per file, then a summary line."""
+    count = 0
+    async for file_path, hits in search_log_files(files, search_query, max_results):
+        for line_num, content in hits:
+            result = _create_search_result(file_path.name, line_num, content)
+            yield json.dumps(result) + "\n"
+        count += len(hits)
+    summary = {"done": True, "count": count, "truncated": count >= max_results}
+    yield json.dumps(summary) + "\n"
 
 
 @with_error_handling(
@@ -964,38 +943,50 @@ async def search_logs(
     filename: Optional[str] = Query(None, description="Specific file to search"),
     case_sensitive: bool = Query(False, description="Case sensitive search"),
     max_results: int = Query(100, description="Maximum results"),
+    regex: bool = Query(False, description="Treat query as a regular expression"),
+    level: Optional[str] = Query(None, description="Only lines with this level"),
+    start_time: Optional[str] = Query(None, description="Earliest line timestamp"),
+    end_time: Optional[str] = Query(None, description="Latest line timestamp"),
+    stream: bool = Query(False, description="Stream results as NDJSON"),
 ):
     """Search across log files.
 
     Issue #744: Requires admin authentication.
+
+    Files are searched in parallel through per-file block indexes (see
+    utils/log_search.py); level and time filters skip whole blocks.
     """
     try:
-        results = []
-        files_to_search = []
-
-        if filename:
-            file_path = LOG_DIR / filename
-            file_exists = await run_in_log_executor(file_path.exists)
-            if file_exists:
-                files_to_search.append(file_path)
-        else:
-            # Issue #358 - use lambda for proper glob() execution in thread
-            files_to_search = await run_in_log_executor(
-                lambda: list(LOG_DIR.glob("*.log"))
+        search_query = LogSearchQuery(
+            text=query,
+            regex=regex,
+            case_sensitive=case_sensitive,
+            level=level,
+            start_time=start_time,
+            end_time=end_time,
+        )
+        try:
+            search_query.compile()
+        except re.error as e:
+            raise HTTPException(status_code=400, detail=f"Invalid regex: {e}")
+
+        files_to_search = await _resolve_search_files(filename)
+        if stream:
+            return StreamingResponse(
+                _stream_search_results(files_to_search, search_query, max_results),
+                media_type="application/x-ndjson",
             )
 
-        for file_path in files_to_search:
-            if len(results) >= max_results:
-                break
-
-            try:
-                file_results = await _search_single_log_file(
-                    file_path, query, case_sensitive, max_results, len(results)
-                )
-                results.extend(file_results)
-            except OSError as e:
-                logger.error("Failed to search log file %s: %s", file_path, e)
-                continue
+        results = []
+        async for file_path, hits in search_log_files(
+            files_to_search, search_query, max_results
+        ):
+            results.extend(
+                _create_search_result(file_path.name, line_num, content)
+                for line_num, content in hits
+            )
+        # Files finish in any order; report them in a stable file/line order
+        results.sort(key=lambda r: (r["file"], r["line"]))
 
         return {
             "query": query,
@@ -1004,6 +995,8 @@ async def search_logs(
             "truncated": len(results) >= max_results,
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("Error searching logs: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
@@ -14,6 +14,7 @@ Package Structure:
 - core.py: Core graph operations and initialization
 - entities.py: Entity management (create, get, update, delete)
 - relations.py: Relationship management and traversal
+- adjacency.py: Optional in-process CSR relation snapshot
 - queries.py: Search and query operations
 - user_session.py: User-centric session tracking (Issue #608)
 
@@ -30,6 +31,7 @@ Backward Compatibility:
   `from autobot_memory_graph import AutoBotMemoryGraph`
 """
 
+from .adjacency import AdjacencySnapshot, AdjacencySnapshotMixin
 from .core import (  # noqa: F401 - re-exports for package API
     ENTITY_TYPES,
     INCOMING_DIRECTIONS,
@@ -49,6 +51,7 @@ from .user_session import UserSessionMixin
 class AutoBotMemoryGraph(
     EntityOperationsMixin,
     RelationOperationsMixin,
+    AdjacencySnapshotMixin,
     QueryOperationsMixin,
     UserSessionMixin,
     SecretManagementMixin,
@@ -62,6 +65,7 @@ class AutoBotMemoryGraph(
     - Core initialization and configuration (AutoBotMemoryGraphCore)
     - Entity operations (EntityOperationsMixin)
     - Relation operations (RelationOperationsMixin)
+    - Optional CSR relation snapshot (AdjacencySnapshotMixin)
     - Query operations (QueryOperationsMixin)
     - User-centric session tracking (UserSessionMixin)
 
@@ -112,6 +116,7 @@ __all__ = [
     "AutoBotMemoryGraph",
     # Core class (for advanced usage)
     "AutoBotMemoryGraphCore",
+    "AdjacencySnapshot",
     # Constants
     "ENTITY_TYPES",
     "RELATION_TYPES",
@@ -121,6 +126,7 @@ __all__ = [
     # Mixins (for extension)
     "EntityOperationsMixin",
     "RelationOperationsMixin",
+    "AdjacencySnapshotMixin",
     "QueryOperationsMixin",
     "UserSessionMixin",
     "SecretManagementMixin",
@@ -0,0 +1,748 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+AutoBot Memory Graph - Adjacency Snapshot Module
+
+This module contains an optional in-process snapshot of the relation graph:
+- Compressed sparse row (CSR) adjacency for outgoing and incoming edges
+- A relation-type column and a strength (weight) column per edge
+- Incremental patches from a Redis change stream written by
+  create_relation, delete_relation and delete_entity
+- Multi-hop neighbourhoods, shortest paths and personalized PageRank
+
+The snapshot is enabled with AUTOBOT_GRAPH_ADJACENCY_SNAPSHOT=true. It is
+built in the background at startup (and again if it falls behind the
+trimmed change stream); until it is ready every traversal keeps using the
+Redis-backed paths. Changes are published by every process regardless of
+the setting.
+
+Part of the modular autobot_memory_graph package (Issue #716).
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .core import INCOMING_DIRECTIONS, OUTGOING_DIRECTIONS, AutoBotMemoryGraphCore
+
+logger = logging.getLogger(__name__)
+
+RELATION_CHANGE_STREAM = "memory:relations:changes"
+# Approximate stream length kept in Redis for snapshot catch-up
+RELATION_CHANGE_STREAM_MAXLEN = 100_000
+# Overlay edges tolerated before the CSR arrays are rebuilt
+OVERLAY_COMPACT_THRESHOLD = 10_000
+# Relation documents fetched per JSON.MGET while building
+SNAPSHOT_BUILD_BATCH_SIZE = 500
+
+EdgeKey = Tuple[int, int, int]
+# (neighbour_id, relation_type, strength, direction) as seen from a node
+Neighbour = Tuple[str, str, float, str]
+
+
+class _CSR:
+    """Immutable compressed sparse row adjacency with per-edge columns."""
+
+    __slots__ = ("indptr", "indices", "types", "weights")
+
+    def __init__(
+        self,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        types: np.ndarray,
+        weights: np.ndarray,
+    ):
+        self.indptr = indptr
+        self.indices = indices
+        self.types = types
+        self.weights = weights
+
+    @classmethod
+    def from_edges(
+        cls,
+        node_count: int,
+        rows: np.ndarray,
+        cols: np.ndarray,
+        types: np.ndarray,
+        weights: np.ndarray,
+    ) -> "_CSR":
+        """Build a CSR matrix from parallel edge arrays keyed by ``rows``."""
+        order = np.argsort(rows, kind="stable")
+        counts = np.bincount(rows, minlength=node_count)
+        indptr = np.zeros(node_count + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return cls(
+            indptr,
+            cols[order].astype(np.int32),
+            types[order].astype(np.int16),
+            weights[order].astype(np.float32),
+        )
+
+    def row(self, node: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (neighbours, types, weights) slices for a node."""
+        if node + 1 >= len(self.indptr):
+            empty = self.indices[:0]
+            return empty, self.types[:0], self.weights[:0]
+        start, end = self.indptr[node], self.indptr[node + 1]
+        return (
+            self.indices[start:end],
+            self.types[start:end],
+            self.weights[start:end],
+        )
+
+
+class AdjacencySnapshot:
+    """
+    In-process CSR snapshot of memory graph relations.
+
+    Edges are de-duplicated by (source, target, relation type). Patches
+    are kept in a small overlay (added edges, removed base edges, dropped
+    entities) and folded into fresh CSR arrays once the overlay grows past
+    OVERLAY_COMPACT_THRESHOLD or before PageRank runs.
+    """
+
+    def __init__(self):
+        """Initialize an empty snapshot."""
+        self._ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._type_names: List[str] = []
+        self._type_codes: Dict[str, int] = {}
+        self._out = self._empty_csr()
+        self._in = self._empty_csr()
+        self._added: Dict[EdgeKey, float] = {}
+        self._added_out: Dict[int, Set[EdgeKey]] = {}
+        self._added_in: Dict[int, Set[EdgeKey]] = {}
+        self._removed: Set[EdgeKey] = set()
+        self._dropped: Set[int] = set()
+        self.last_stream_id = "0-0"
+        self.ready = False
+
+    @staticmethod
+    def _empty_csr() -> _CSR:
+        return _CSR(
+            np.zeros(1, dtype=np.int64),
+            np.zeros(0, dtype=np.int32),
+            np.zeros(0, dtype=np.int16),
+            np.zeros(0, dtype=np.float32),
+        )
+
+    # ------------------------------------------------------------------
+    # Interning
+    # ------------------------------------------------------------------
+
+    def _node(self, entity_id: str) -> int:
+        node = self._index.get(entity_id)
+        if node is None:
+            node = len(self._ids)
+            self._ids.append(entity_id)
+            self._index[entity_id] = node
+        return node
+
+    def _type(self, relation_type: str) -> int:
+        code = self._type_codes.get(relation_type)
+        if code is None:
+            code = len(self._type_names)
+            self._type_names.append(relation_type)
+            self._type_codes[relation_type] = code
+        return code
+
+    @property
+    def node_count(self) -> int:
+        """Number of interned entities (including dropped ones)."""
+        return len(self._ids)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of live edges in the snapshot."""
+        return len(self._out.indices) - len(self._removed) + len(self._added)
+
+    # ------------------------------------------------------------------
+    # Building and patching
+    # ------------------------------------------------------------------
+
+    def load_edges(self, edges: Iterable[Tuple[str, str, str, float]]) -> None:
+        """Replace the snapshot with (source, target, type, strength) edges."""
+        self._ids, self._index = [], {}
+        self._type_names, self._type_codes = [], {}
+        unique: Dict[EdgeKey, float] = {}
+        for source, target, relation_type, strength in edges:
+            key = (self._node(source), self._node(target), self._type(relation_type))
+            unique[key] = float(strength)
+        self._rebuild(unique)
+
+    def _rebuild(self, edges: Dict[EdgeKey, float]) -> None:
+        """Rebuild both CSR matrices from a de-duplicated edge dict."""
+        count = len(edges)
+        rows = np.fromiter((k[0] for k in edges), dtype=np.int64, count=count)
+        cols = np.fromiter((k[1] for k in edges), dtype=np.int64, count=count)
+        types = np.fromiter((k[2] for k in edges), dtype=np.int16, count=count)
+        weights = np.fromiter(edges.values(), dtype=np.float32, count=count)
+        node_count = self.node_count
+        self._out = _CSR.from_edges(node_count, rows, cols, types, weights)
+        self._in = _CSR.from_edges(node_count, cols, rows, types, weights)
+        self._added, self._added_out, self._added_in = {}, {}, {}
+        self._removed = set()
+        # Edges of dropped entities are gone from the rebuilt arrays
+        self._dropped = set()
+
+    def _live_edges(self) -> Dict[EdgeKey, float]:
+        """Materialize all live edges (base minus removals plus overlay)."""
+        edges: Dict[EdgeKey, float] = {}
+        for source in range(len(self._out.indptr) - 1):
+            if source in self._dropped:
+                continue
+            targets, types, weights = self._out.row(source)
+            for target, code, weight in zip(
+                targets.tolist(), types.tolist(), weights.tolist()
+            ):
+                key = (source, target, code)
+                if target not in self._dropped and key not in self._removed:
+                    edges[key] = weight
+        edges.update(self._added)
+        return edges
+
+    def compact(self) -> None:
+        """Fold the overlay into fresh CSR arrays."""
+        if self._added or self._removed or self._dropped:
+            self._rebuild(self._live_edges())
+
+    def _base_has(self, key: EdgeKey) -> bool:
+        source, target, code = key
+        targets, types, _ = self._out.row(source)
+        return bool(np.any((targets == target) & (types == code)))
+
+    def add_edge(
+        self, source: str, target: str, relation_type: str, strength: float = 1.0
+    ) -> None:
+        """Patch in a created relation (idempotent)."""
+        key = (self._node(source), self._node(target), self._type(relation_type))
+        self._dropped.discard(key[0])
+        self._dropped.discard(key[1])
+        if self._base_has(key) and key not in self._removed:
+            return
+        self._added[key] = float(strength)
+        self._added_out.setdefault(key[0], set()).add(key)
+        self._added_in.setdefault(key[1], set()).add(key)
+        self._maybe_compact()
+
+    def remove_edge(self, source: str, target: str, relation_type: str) -> None:
+        """Patch out a deleted relation (all parallel copies)."""
+        if source not in self._index or target not in self._index:
+            return
+        if relation_type not in self._type_codes:
+            return
+        key = (
+            self._index[source],
+            self._index[target],
+            self._type_codes[relation_type],
+        )
+        if self._added.pop(key, None) is not None:
+            self._added_out[key[0]].discard(key)
+            self._added_in[key[1]].discard(key)
+        if self._base_has(key):
+            self._removed.add(key)
+        self._maybe_compact()
+
+    def drop_entity(self, entity_id: str) -> None:
+        """Patch out every edge touching a deleted entity."""
+        node = self._index.get(entity_id)
+        if node is None:
+            return
+        self._dropped.add(node)
+        for key in list(self._added_out.pop(node, ())) + list(
+            self._added_in.pop(node, ())
+        ):
+            self._added.pop(key, None)
+            self._added_out.get(key[0], set()).discard(key)
+            self._added_in.get(key[1], set()).discard(key)
+        self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        overlay = len(self._added) + len(self._removed) + len(self._dropped)
+        if overlay > OVERLAY_COMPACT_THRESHOLD:
+            self.compact()
+
+    def apply_change(self, change: Dict[str, Any]) -> None:
+        """Apply one change stream entry to the snapshot."""
+        op = change.get("op")
+        if op == "add":
+            self.add_edge(
+                change["from"],
+                change["to"],
+                change["type"],
+                float(change.get("strength", 1.0)),
+            )
+        elif op == "remove":
+            self.remove_edge(change["from"], change["to"], change["type"])
+        elif op == "drop_entity":
+            self.drop_entity(change["entity_id"])
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _node_neighbours(
+        self, node: int, direction: str, type_codes: Optional[Set[int]]
+    ) -> List[Tuple[int, int, float, str]]:
+        """Neighbours of an interned node as (node, type, weight, direction)."""
+        result = []
+        if node in self._dropped:
+            return result
+        views = []
+        if direction in OUTGOING_DIRECTIONS:
+            views.append((self._out, self._added_out, "outgoing", False))
+        if direction in INCOMING_DIRECTIONS:
+            views.append((self._in, self._added_in, "incoming", True))
+
+        for csr, overlay, label, reverse in views:
+            others, types, weights = csr.row(node)
+            for other, code, weight in zip(
+                others.tolist(), types.tolist(), weights.tolist()
+            ):
+                key = (other, node, code) if reverse else (node, other, code)
+                if key in self._removed or other in self._dropped:
+                    continue
+                if type_codes is None or code in type_codes:
+                    result.append((other, code, weight, label))
+            for key in overlay.get(node, ()):
+                other = key[0] if reverse else key[1]
+                if other in self._dropped:
+                    continue
+                if type_codes is None or key[2] in type_codes:
+                    result.append((other, key[2], self._added[key], label))
+        return result
+
+    def _type_filter(
+        self, relation_types: Optional[Iterable[str]]
+    ) -> Optional[Set[int]]:
+        if relation_types is None:
+            return None
+        return {self._type_codes[t] for t in relation_types if t in self._type_codes}
+
+    def neighbours(
+        self,
+        entity_id: str,
+        direction: str = "both",
+        relation_types: Optional[Iterable[str]] = None,
+    ) -> List[Neighbour]:
+        """Direct neighbours of an entity."""
+        node = self._index.get(entity_id)
+        if node is None:
+            return []
+        return [
+            (self._ids[other], self._type_names[code], weight, label)
+            for other, code, weight, label in self._node_neighbours(
+                node, direction, self._type_filter(relation_types)
+            )
+        ]
+
+    def neighbourhood(
+        self,
+        entity_id: str,
+        max_depth: int = 1,
+        direction: str = "both",
+        relation_types: Optional[Iterable[str]] = None,
+        max_per_level: Optional[int] = None,
+    ) -> List[Tuple[str, int, Neighbour]]:
+        """Multi-hop BFS neighbourhood of an entity.
+
+        Returns:
+            List of (entity_id, depth, edge) where edge is the
+            (from_entity_id, relation_type, strength, direction) that first
+            reached the entity
+        """
+        start = self._index.get(entity_id)
+        if start is None:
+            return []
+        type_codes = self._type_filter(relation_types)
+        visited = {start}
+        frontier = [start]
+        found = []
+        for depth in range(1, max_depth + 1):
+            next_frontier = []
+            for node in frontier:
+                for other, code, weight, label in self._node_neighbours(
+                    node, direction, type_codes
+                ):
+                    if other in visited:
+                        continue
+                    if (
+                        max_per_level is not None
+                        and len(next_frontier) >= max_per_level
+                    ):
+                        break
+                    visited.add(other)
+                    next_frontier.append(other)
+                    edge = (self._ids[node], self._type_names[code], weight, label)
+                    found.append((self._ids[other], depth, edge))
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return found
+
+    def shortest_path(
+        self,
+        source_id: str,
+        target_id: str,
+        direction: str = "both",
+        relation_types: Optional[Iterable[str]] = None,
+        max_depth: int = 6,
+    ) -> Optional[List[str]]:
+        """Unweighted shortest path between two entities (BFS).
+
+        Returns:
+            Entity IDs from source to target inclusive, or None if the
+            target is not reachable within max_depth hops
+        """
+        start = self._index.get(source_id)
+        goal = self._index.get(target_id)
+        if start is None or goal is None:
+            return None
+        if start == goal:
+            return [source_id]
+        type_codes = self._type_filter(relation_types)
+        parents = {start: start}
+        frontier = [start]
+        for _ in range(max_depth):
+            next_frontier = []
+            for node in frontier:
+                for other, _, _, _ in self._node_neighbours(
+                    node, direction, type_codes
+                ):
+                    if other in parents:
+                        continue
+                    parents[other] = node
+                    if other == goal:
+                        path = [goal]
+                        while path[-1] != start:
+                            path.append(parents[path[-1]])
+                        return [self._ids[n] for n in reversed(path)]
+                    next_frontier.append(other)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return None
+
+    def personalized_pagerank(
+        self,
+        seeds: Dict[str, float],
+        damping: float = 0.85,
+        max_iterations: int = 50,
+        tolerance: float = 1e-6,
+        direction: str = "both",
+        top_k: Optional[int] = None,
+    ) -> List[Tuple[str, float]]:
+        """Personalized PageRank from weighted seed entities.
+
+        Edge strengths weight the random walk; with direction="both" every
+        relation is walked in either direction. Dangling mass returns to
+        the seeds.
+
+        Returns:
+            (entity_id, score) pairs sorted by score, seeds excluded
+        """
+        return self.pagerank_task(seeds, direction)(
+            damping=damping,
+            max_iterations=max_iterations,
+            tolerance=tolerance,
+            top_k=top_k,
+        )
+
+    def pagerank_task(
+        self, seeds: Dict[str, float], direction: str = "both"
+    ) -> Callable[..., List[Tuple[str, float]]]:
+        """Compact and capture the arrays personalized PageRank reads.
+
+        Must be called on the thread that applies patches. The returned
+        callable only reads the captured (immutable) CSR arrays, so it can
+        run in a worker thread while later patches and compactions replace
+        them.
+        """
+        self.compact()
+        seed_nodes = {self._index[s]: w for s, w in seeds.items() if s in self._index}
+        # Interned ids are append-only, so the list can be shared
+        return functools.partial(
+            _personalized_pagerank,
+            self._ids,
+            self._out,
+            self._in,
+            seed_nodes,
+            direction,
+        )
+
+
+def _personalized_pagerank(
+    ids: List[str],
+    out_csr: _CSR,
+    in_csr: _CSR,
+    seed_nodes: Dict[int, float],
+    direction: str,
+    damping: float = 0.85,
+    max_iterations: int = 50,
+    tolerance: float = 1e-6,
+    top_k: Optional[int] = None,
+) -> List[Tuple[str, float]]:
+    """Power iteration over compacted CSR arrays (see pagerank_task)."""
+    n = len(out_csr.indptr) - 1
+    seed_nodes = {node: w for node, w in seed_nodes.items() if node < n}
+    if n == 0 or not seed_nodes:
+        return []
+
+    sources, targets, weights = [], [], []
+    if direction in OUTGOING_DIRECTIONS:
+        sources.append(np.repeat(np.arange(n), np.diff(out_csr.indptr)))
+        targets.append(out_csr.indices)
+        weights.append(out_csr.weights)
+    if direction in INCOMING_DIRECTIONS:
+        sources.append(np.repeat(np.arange(n), np.diff(in_csr.indptr)))
+        targets.append(in_csr.indices)
+        weights.append(in_csr.weights)
+    src = np.concatenate(sources)
+    dst = np.concatenate(targets)
+    w = np.concatenate(weights).astype(np.float64)
+    w[w <= 0] = 1e-6
+    out_weight = np.bincount(src, weights=w, minlength=n)
+    edge_share = w / out_weight[src]
+    dangling = out_weight == 0
+
+    personalization = np.zeros(n)
+    for node, weight in seed_nodes.items():
+        personalization[node] = max(weight, 0.0)
+    total = personalization.sum()
+    if total <= 0:
+        return []
+    personalization /= total
+
+    rank = personalization.copy()
+    for _ in range(max_iterations):
+        spread = np.bincount(dst, weights=rank[src] * edge_share, minlength=n)
+        spread += rank[dangling].sum() * personalization
+        updated = (1 - damping) * personalization + damping * spread
+        delta = np.abs(updated - rank).sum()
+        rank = updated
+        if delta < tolerance:
+            break
+
+    order = np.argsort(-rank)
+    ranked = []
+    for node in order.tolist():
+        if rank[node] <= 0 or node in seed_nodes:
+            continue
+        ranked.append((ids[node], float(rank[node])))
+        if top_k is not None and len(ranked) >= top_k:
+            break
+    return ranked
+
+
+class AdjacencySnapshotMixin:
+    """
+    Mixin class maintaining an optional AdjacencySnapshot.
+
+    Relation writes always publish to RELATION_CHANGE_STREAM, whether or
+    not this process keeps a snapshot; readers catch up from the stream
+    before each query, so every worker process sees the same graph. A
+    reader that fell behind the trimmed stream rebuilds its snapshot.
+    """
+
+    async def build_adjacency_snapshot(self: AutoBotMemoryGraphCore) -> Dict[str, Any]:
+        """Build the adjacency snapshot from the outgoing relation documents."""
+        start = time.perf_counter()
+        snapshot = AdjacencySnapshot()
+        try:
+            # Remember the stream position first so no patch is missed
+            latest = await self.redis_client.xrevrange(RELATION_CHANGE_STREAM, count=1)
+            if latest:
+                snapshot.last_stream_id = _decode(latest[0][0])
+
+            edges = []
+            batch: List[str] = []
+            async for key in self.redis_client.scan_iter(
+                match="memory:relations:out:*", count=SNAPSHOT_BUILD_BATCH_SIZE
+            ):
+                batch.append(_decode(key))
+                if len(batch) >= SNAPSHOT_BUILD_BATCH_SIZE:
+                    edges.extend(await self._collect_snapshot_edges(batch))
+                    batch = []
+            if batch:
+                edges.extend(await self._collect_snapshot_edges(batch))
+
+            snapshot.load_edges(edges)
+            self.adjacency = snapshot
+            await self._sync_adjacency()
+            snapshot.ready = True
+        except Exception as e:
+            logger.error("Failed to build adjacency snapshot: %s", e)
+            return {"status": "error", "message": str(e)}
+
+        elapsed = time.perf_counter() - start
+        logger.info(
+            "Adjacency snapshot built: %d entities, %d edges in %.2fs",
+            snapshot.node_count,
+            snapshot.edge_count,
+            elapsed,
+        )
+        return {
+            "status": "success",
+            "entities": snapshot.node_count,
+            "edges": snapshot.edge_count,
+            "duration_s": elapsed,
+        }
+
+    async def _collect_snapshot_edges(
+        self: AutoBotMemoryGraphCore, keys: List[str]
+    ) -> List[Tuple[str, str, str, float]]:
+        """Turn a batch of outgoing relation documents into edges."""
+        edges = []
+        docs = await self._mget_json_documents(keys)
+        for key, doc in zip(keys, docs):
+            source = key.rsplit(":", 1)[-1]
+            for rel in (doc or {}).get("relations", []):
+                if rel.get("to") and rel.get("type"):
+                    strength = (rel.get("metadata") or {}).get("strength", 1.0)
+                    edges.append((source, rel["to"], rel["type"], strength))
+        return edges
+
+    def start_adjacency_snapshot(self: AutoBotMemoryGraphCore) -> None:
+        """Build the adjacency snapshot in the background (once at a time)."""
+        task = getattr(self, "_adjacency_build_task", None)
+        if task is not None and not task.done():
+            return
+        self._adjacency_build_task = asyncio.create_task(
+            self.build_adjacency_snapshot()
+        )
+
+    @property
+    def adjacency_ready(self: AutoBotMemoryGraphCore) -> bool:
+        """True when a built adjacency snapshot is available."""
+        return self.adjacency is not None and self.adjacency.ready
+
+    async def _publish_relation_change(
+        self: AutoBotMemoryGraphCore, op: str, fields: Dict[str, Any]
+    ) -> None:
+        """Append a relation change to the stream.
+
+        Published even when this process keeps no snapshot, so snapshots in
+        other worker processes stay current.
+        """
+        try:
+            await self.redis_client.xadd(
+                RELATION_CHANGE_STREAM,
+                {"op": op, **{k: str(v) for k, v in fields.items()}},
+                maxlen=RELATION_CHANGE_STREAM_MAXLEN,
+                approximate=True,
+            )
+        except Exception as e:
+            logger.warning("Failed to publish relation change: %s", e)
+
+    async def _sync_adjacency(self: AutoBotMemoryGraphCore) -> None:
+        """Apply change stream entries newer than the snapshot position."""
+        snapshot = self.adjacency
+        if snapshot is None:
+            return
+        try:
+            while True:
+                response = await self.redis_client.xread(
+                    {RELATION_CHANGE_STREAM: snapshot.last_stream_id}, count=1000
+                )
+                if not response:
+                    return
+                if snapshot.ready and await self._adjacency_stream_gap(
+                    snapshot.last_stream_id
+                ):
+                    logger.warning(
+                        "Adjacency snapshot fell behind the trimmed change "
+                        "stream, rebuilding"
+                    )
+                    snapshot.ready = False
+                    self.start_adjacency_snapshot()
+                    return
+                entries = response[0][1]
+                for entry_id, fields in entries:
+                    snapshot.apply_change(
+                        {_decode(k): _decode(v) for k, v in fields.items()}
+                    )
+                    snapshot.last_stream_id = _decode(entry_id)
+                if len(entries) < 1000:
+                    return
+        except Exception as e:
+            logger.warning("Adjacency snapshot sync failed: %s", e)
+
+    async def _adjacency_stream_gap(self: AutoBotMemoryGraphCore, last_id: str) -> bool:
+        """True if entries after ``last_id`` were trimmed from the stream.
+
+        Uses XINFO's max-deleted-entry-id where the server reports it
+        (Redis 7+), otherwise the first entry still in the stream.
+        """
+        info = await self.redis_client.xinfo_stream(RELATION_CHANGE_STREAM)
+        max_deleted = info.get("max-deleted-entry-id")
+        if max_deleted is not None:
+            return _stream_id(max_deleted) > _stream_id(last_id)
+        first = info.get("first-entry")
+        if not first or last_id == "0-0":
+            return False
+        return _stream_id(first[0]) > _stream_id(last_id)
+
+    async def find_shortest_path(
+        self: AutoBotMemoryGraphCore,
+        from_entity_id: str,
+        to_entity_id: str,
+        direction: str = "both",
+        relation_types: Optional[List[str]] = None,
+        max_depth: int = 6,
+    ) -> Optional[List[str]]:
+        """Shortest relation path between two entities (snapshot required).
+
+        Returns:
+            Entity IDs along the path, or None if unreachable or the
+            snapshot is not available
+        """
+        if not self.adjacency_ready:
+            return None
+        await self._sync_adjacency()
+        return self.adjacency.shortest_path(
+            from_entity_id, to_entity_id, direction, relation_types, max_depth
+        )
+
+    async def personalized_pagerank(
+        self: AutoBotMemoryGraphCore,
+        seeds: Dict[str, float],
+        top_k: int = 20,
+        direction: str = "both",
+    ) -> List[Tuple[str, float]]:
+        """Rank entities by personalized PageRank around weighted seeds.
+
+        Returns:
+            (entity_id, score) pairs, empty if the snapshot is not available
+        """
+        if not self.adjacency_ready:
+            return []
+        await self._sync_adjacency()
+        if not self.adjacency_ready:
+            return []
+        # Compact and capture here; patches applied by later syncs on this
+        # loop must not race with the thread reading the arrays
+        task = self.adjacency.pagerank_task(seeds, direction)
+        return await asyncio.to_thread(task, top_k=top_k)
+
+
+def _decode(value: Any) -> Any:
+    """Decode bytes returned by non-decoding Redis clients."""
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def _stream_id(value: Any) -> Tuple[int, int]:
+    """Parse a "<ms>-<seq>" stream entry ID for ordering."""
+    ms, _, seq = _decode(value).partition("-")
+    return int(ms), int(seq or 0)
+
+
+__all__ = [
+    "AdjacencySnapshot",
+    "AdjacencySnapshotMixin",
+    "RELATION_CHANGE_STREAM",
+]
@@ -0,0 +1,157 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Unit tests for the memory graph adjacency snapshot
+
+Tests cover:
+- CSR neighbourhoods in both directions with relation-type filters
+- Patching via add/remove/drop change entries and compaction
+- Shortest paths and personalized PageRank
+- Rebuilding when the change stream was trimmed past the snapshot
+"""
+
+import pytest
+from autobot_memory_graph.adjacency import AdjacencySnapshot, AdjacencySnapshotMixin
+
+
+@pytest.fixture
+def snapshot():
+    graph = AdjacencySnapshot()
+    graph.load_edges(
+        [
+            ("a", "b", "depends_on", 1.0),
+            ("a", "c", "references", 1.0),
+            ("b", "d", "depends_on", 1.0),
+            ("c", "d", "depends_on", 0.5),
+            ("d", "e", "leads_to", 1.0),
+            ("a", "b", "depends_on", 1.0),  # duplicate relation
+        ]
+    )
+    return graph
+
+
+def test_neighbours_and_type_filter(snapshot):
+    assert snapshot.edge_count == 5
+    assert sorted(n[0] for n in snapshot.neighbours("d")) == ["b", "c", "e"]
+    assert (
+        snapshot.neighbours("d", direction="incoming", relation_types=["leads_to"])
+        == []
+    )
+    assert snapshot.neighbours("a", relation_types=["references"]) == [
+        ("c", "references", 1.0, "outgoing")
+    ]
+
+
+def test_neighbourhood_depths(snapshot):
+    found = snapshot.neighbourhood("a", max_depth=2, direction="outgoing")
+    assert [(entity_id, depth) for entity_id, depth, _ in found] == [
+        ("b", 1),
+        ("c", 1),
+        ("d", 2),
+    ]
+    assert found[2][2] == ("b", "depends_on", 1.0, "outgoing")
+
+
+def test_patches_match_rebuild(snapshot):
+    snapshot.apply_change({"op": "add", "from": "e", "to": "f", "type": "blocks"})
+    snapshot.apply_change(
+        {"op": "remove", "from": "a", "to": "c", "type": "references"}
+    )
+    snapshot.apply_change({"op": "drop_entity", "entity_id": "b"})
+
+    def view():
+        return {
+            node: sorted(n[:2] for n in snapshot.neighbours(node)) for node in "abcdef"
+        }
+
+    patched = view()
+    assert patched["a"] == []
+    assert patched["f"] == [("e", "blocks")]
+    snapshot.compact()
+    assert view() == patched
+
+
+def test_removed_base_edge_can_be_recreated(snapshot):
+    snapshot.remove_edge("a", "c", "references")
+    snapshot.add_edge("a", "c", "references", 0.3)
+    assert ("c", "references", pytest.approx(0.3), "outgoing") in snapshot.neighbours(
+        "a"
+    )
+
+
+def test_shortest_path(snapshot):
+    assert snapshot.shortest_path("a", "e", direction="outgoing") in (
+        ["a", "b", "d", "e"],
+        ["a", "c", "d", "e"],
+    )
+    assert snapshot.shortest_path("e", "a", direction="outgoing") is None
+    assert snapshot.shortest_path("e", "a") is not None
+    assert snapshot.shortest_path("a", "e", max_depth=2) is None
+
+
+def test_personalized_pagerank(snapshot):
+    ranked = snapshot.personalized_pagerank({"a": 1.0}, direction="outgoing")
+    scores = dict(ranked)
+    assert "a" not in scores
+    assert scores["b"] == pytest.approx(scores["c"])
+    assert scores["d"] > scores["e"] > 0
+    assert ranked[0][0] == "d"
+    assert sum(scores.values()) < 1.0
+    assert snapshot.personalized_pagerank({"missing": 1.0}) == []
+
+
+def test_pagerank_task_is_isolated_from_later_patches(snapshot):
+    snapshot.add_edge("e", "f", "leads_to")
+    task = snapshot.pagerank_task({"a": 1.0}, direction="outgoing")
+    expected = task()
+
+    for i in range(50):
+        snapshot.add_edge("b", f"new{i}", "depends_on")
+    snapshot.compact()
+
+    assert task() == expected
+    assert "f" in dict(expected)
+
+
+class _StreamRedis:
+    """Redis stub serving one change stream entry and XINFO output."""
+
+    def __init__(self, info):
+        self.info = info
+
+    async def xread(self, streams, count):
+        return [["memory:relations:changes", [("9-0", {"op": "noop"})]]]
+
+    async def xinfo_stream(self, name):
+        return self.info
+
+
+class _Graph(AdjacencySnapshotMixin):
+    def __init__(self, info, last_id):
+        self.redis_client = _StreamRedis(info)
+        self.adjacency = AdjacencySnapshot()
+        self.adjacency.ready = True
+        self.adjacency.last_stream_id = last_id
+        self.rebuilds = 0
+
+    def start_adjacency_snapshot(self):
+        self.rebuilds += 1
+
+
+@pytest.mark.parametrize(
+    "info,last_id,behind",
+    [
+        ({"max-deleted-entry-id": "7-0"}, "5-0", True),
+        ({"max-deleted-entry-id": "7-0"}, "8-0", False),
+        ({"first-entry": ("6-0", {})}, "5-3", True),
+        ({"first-entry": ("5-0", {})}, "5-3", False),
+    ],
+)
+async def test_trimmed_stream_triggers_rebuild(info, last_id, behind):
+    graph = _Graph(info, last_id)
+    await graph._sync_adjacency()
+
+    assert graph.rebuilds == int(behind)
+    assert graph.adjacency_ready is not behind
+    assert graph.adjacency.last_stream_id == (last_id if behind else "9-0")
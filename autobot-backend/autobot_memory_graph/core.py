@@ -12,6 +12,7 @@ Part of Issue #716 - Refactored from monolithic autobot_memory_graph.py
 
 import asyncio
 import logging
+import os
 from typing import Any, Dict, List, Optional, Set
 
 from autobot_shared.redis_client import get_redis_client
@@ -85,6 +86,10 @@ class Config:
         self.relations_prefix = "autobot:relations"
         self.embedding_model = "nomic-embed-text"
         self.embedding_dimensions = 768
+        # Optional in-process CSR relation snapshot (see adjacency.py)
+        self.adjacency_snapshot = (
+            os.getenv("AUTOBOT_GRAPH_ADJACENCY_SNAPSHOT", "false").lower() == "true"
+        )
 
 
 config = Config()
@@ -116,6 +121,8 @@ class AutoBotMemoryGraphCore:
         self._initialized: bool = False
         self._lock: asyncio.Lock = asyncio.Lock()
         self.index_name: str = f"{config.index_prefix}:idx"
+        self.adjacency_snapshot_enabled: bool = config.adjacency_snapshot
+        self.adjacency: Optional[Any] = None
 
     async def initialize(self) -> None:
         """
@@ -138,6 +145,9 @@ class AutoBotMemoryGraphCore:
                 await self._create_search_indexes()
 
                 self._initialized = True
+
+                if self.adjacency_snapshot_enabled:
+                    self.start_adjacency_snapshot()
                 logger.info("AutoBotMemoryGraph initialized successfully")
 
             except Exception as e:
@@ -106,6 +106,7 @@ class EntityOperationsMixin:
         """
         entity_key = f"memory:entity:{entity_id}"
         await self.redis_client.json().set(entity_key, "$", entity)
+        await self._index_entity(entity)
 
         if self.knowledge_base:
             await self._generate_entity_embedding(entity_id, entity)
@@ -289,6 +290,7 @@ class EntityOperationsMixin:
             entity_key = f"memory:entity:{entity_id}"
 
             await self._append_observations_to_entity(entity_key, observations)
+            await self._index_entity(entity, observations=observations)
             await self._refresh_entity_embedding(entity_id, entity_key)
 
             self.search_cache.clear()
@@ -324,6 +326,7 @@ class EntityOperationsMixin:
                 return False
 
             entity_id = entity["id"]
+            await self._unindex_entity(entity)
 
             # Delete relations if cascade
             if cascade_relations:
@@ -336,6 +339,7 @@ class EntityOperationsMixin:
             # Delete entity
             entity_key = f"memory:entity:{entity_id}"
             deleted = await self.redis_client.delete(entity_key)
+            await self._publish_relation_change("drop_entity", {"entity_id": entity_id})
 
             # Clear cache
             self.search_cache.clear()
@@ -6,19 +6,60 @@ AutoBot Memory Graph - Query Operations Module
 
 This module contains search and query operations:
 - search_entities with RediSearch
-- Fallback search when RediSearch unavailable
+- Indexed fallback search when RediSearch unavailable
+- Token, entity-type and exact-name postings maintenance
 - Query building helpers
 
 Part of the modular autobot_memory_graph package (Issue #716).
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import re
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
 
 from .core import AutoBotMemoryGraphCore
 
 logger = logging.getLogger(__name__)
 
+# Postings for the fallback search: token -> entity IDs, type -> entity IDs,
+# lowercased full name -> entity IDs
+ENTITY_TOKEN_PREFIX = "memory:idx:token:"
+ENTITY_TYPE_PREFIX = "memory:idx:type:"
+ENTITY_NAME_PREFIX = "memory:idx:name:"
+ENTITY_ALL_KEY = "memory:idx:all"
+ENTITY_INDEX_META_KEY = "memory:idx:meta"
+# Held by the worker rebuilding the postings (outside memory:idx:*, which a
+# rebuild deletes)
+ENTITY_INDEX_LOCK_KEY = "memory:lock:idx_rebuild"
+ENTITY_INDEX_LOCK_TTL = 600
+# Candidates fetched per requested result before ranking
+FALLBACK_CANDIDATE_MULTIPLIER = 10
+ENTITY_INDEX_BUILD_BATCH_SIZE = 200
+
+_TOKEN_RE = re.compile(r"[a-z0-9_]{2,}")
+
+
+def tokenize_entity_text(text: str) -> Set[str]:
+    """Split text into lowercase word tokens used by the fallback index."""
+    return set(_TOKEN_RE.findall(text.lower())) if text else set()
+
+
+def entity_name_key(name: str) -> str:
+    """Name postings key for an entity name or exact-name query."""
+    return f"{ENTITY_NAME_PREFIX}{name.lower().strip()}"
+
+
+def entity_tokens(entity: Dict[str, Any]) -> Set[str]:
+    """Collect the index tokens of an entity's name and observations."""
+    tokens = tokenize_entity_text(entity.get("name", ""))
+    for observation in entity.get("observations", []):
+        tokens |= tokenize_entity_text(observation)
+    return tokens
+
 
 class QueryOperationsMixin:
     """
@@ -141,6 +182,240 @@ class QueryOperationsMixin:
 
         return any(query_lower in obs.lower() for obs in entity.get("observations", []))
 
+    # =========================================================================
+    # FALLBACK INDEX MAINTENANCE
+    # =========================================================================
+
+    async def _index_entity(
+        self: AutoBotMemoryGraphCore,
+        entity: Dict[str, Any],
+        observations: Optional[List[str]] = None,
+    ) -> None:
+        """Add an entity (or just new observations) to the fallback postings.
+
+        Args:
+            entity: Entity document (needs id and type)
+            observations: Only index these observations instead of the
+                whole entity (used by add_observations)
+        """
+        entity_id = entity["id"]
+        if observations is None:
+            tokens = entity_tokens(entity)
+        else:
+            tokens = set().union(*(tokenize_entity_text(o) for o in observations))
+
+        pipe = self.redis_client.pipeline()
+        for token in tokens:
+            pipe.sadd(f"{ENTITY_TOKEN_PREFIX}{token}", entity_id)
+        if observations is None:
+            pipe.sadd(f"{ENTITY_TYPE_PREFIX}{entity.get('type')}", entity_id)
+            pipe.sadd(entity_name_key(entity.get("name", "")), entity_id)
+            pipe.sadd(ENTITY_ALL_KEY, entity_id)
+        await pipe.execute()
+
+    async def _unindex_entity(
+        self: AutoBotMemoryGraphCore,
+        entity: Dict[str, Any],
+    ) -> None:
+        """Remove an entity from all of its fallback postings."""
+        entity_id = entity["id"]
+        pipe = self.redis_client.pipeline()
+        for token in entity_tokens(entity):
+            pipe.srem(f"{ENTITY_TOKEN_PREFIX}{token}", entity_id)
+        pipe.srem(f"{ENTITY_TYPE_PREFIX}{entity.get('type')}", entity_id)
+        pipe.srem(entity_name_key(entity.get("name", "")), entity_id)
+        pipe.srem(ENTITY_ALL_KEY, entity_id)
+        await pipe.execute()
+
+    async def rebuild_entity_index(self: AutoBotMemoryGraphCore) -> Dict[str, Any]:
+        """Rebuild the fallback postings from all stored entities.
+
+        Only one worker rebuilds at a time: a second rebuild would delete
+        the postings the first one already wrote. Others return "skipped".
+        """
+        lock_token = uuid.uuid4().hex
+        if not await self.redis_client.set(
+            ENTITY_INDEX_LOCK_KEY, lock_token, nx=True, ex=ENTITY_INDEX_LOCK_TTL
+        ):
+            logger.info("Entity index rebuild already running in another worker")
+            return {"status": "skipped", "indexed": 0}
+
+        start = time.perf_counter()
+        indexed = 0
+        try:
+            stale = [
+                key async for key in self.redis_client.scan_iter(match="memory:idx:*")
+            ]
+            for i in range(0, len(stale), ENTITY_INDEX_BUILD_BATCH_SIZE):
+                await self.redis_client.delete(
+                    *stale[i : i + ENTITY_INDEX_BUILD_BATCH_SIZE]
+                )
+
+            batch: List[str] = []
+            async for key in self.redis_client.scan_iter(match="memory:entity:*"):
+                batch.append(key.decode() if isinstance(key, bytes) else key)
+                if len(batch) >= ENTITY_INDEX_BUILD_BATCH_SIZE:
+                    indexed += await self._index_entity_batch(batch)
+                    batch = []
+            if batch:
+                indexed += await self._index_entity_batch(batch)
+
+            await self.redis_client.hset(
+                ENTITY_INDEX_META_KEY,
+                mapping={"built_at": datetime.now().isoformat(), "entities": indexed},
+            )
+        except Exception as e:
+            logger.error("Entity index rebuild failed: %s", e)
+            return {"status": "error", "message": str(e), "indexed": indexed}
+        finally:
+            await self._release_entity_index_lock(lock_token)
+
+        elapsed = time.perf_counter() - start
+        logger.info("Entity index rebuilt: %d entities in %.1fs", indexed, elapsed)
+        return {"status": "success", "indexed": indexed, "duration_s": elapsed}
+
+    async def _release_entity_index_lock(
+        self: AutoBotMemoryGraphCore,
+        lock_token: str,
+    ) -> None:
+        """Release the rebuild lock unless it expired and another worker holds it."""
+        try:
+            holder = await self.redis_client.get(ENTITY_INDEX_LOCK_KEY)
+            if isinstance(holder, bytes):
+                holder = holder.decode()
+            if holder == lock_token:
+                await self.redis_client.delete(ENTITY_INDEX_LOCK_KEY)
+        except Exception as e:
+            logger.debug("Could not release entity index lock: %s", e)
+
+    async def _index_entity_batch(
+        self: AutoBotMemoryGraphCore,
+        keys: List[str],
+    ) -> int:
+        """Index a batch of entity documents fetched with one JSON.MGET."""
+        docs = await self._mget_json_documents(keys)
+        entities = [doc for doc in docs if doc and doc.get("id")]
+        await asyncio.gather(*[self._index_entity(entity) for entity in entities])
+        return len(entities)
+
+    async def _entity_index_ready(self: AutoBotMemoryGraphCore) -> bool:
+        """True once the fallback postings have been fully built."""
+        try:
+            return bool(
+                await self.redis_client.hexists(ENTITY_INDEX_META_KEY, "built_at")
+            )
+        except Exception as e:
+            logger.debug("Could not check entity index: %s", e)
+            return False
+
+    def _ensure_entity_index_build(self: AutoBotMemoryGraphCore) -> None:
+        """Start a background postings build unless one is already running."""
+        task = getattr(self, "_entity_index_build_task", None)
+        if task is None or task.done():
+            logger.info("Entity index not built yet, building in background")
+            self._entity_index_build_task = asyncio.create_task(
+                self.rebuild_entity_index()
+            )
+
+    # =========================================================================
+    # FALLBACK SEARCH
+    # =========================================================================
+
+    def _score_entity_match(
+        self: AutoBotMemoryGraphCore,
+        entity: Dict[str, Any],
+        query_lower: str,
+        query_tokens: Set[str],
+    ) -> float:
+        """Rank a candidate: exact name, then substring, then token overlap."""
+        name = entity.get("name", "").lower()
+        score = 0.0
+        if query_lower and query_lower != "*":
+            if name == query_lower:
+                score += 4.0
+            elif query_lower in name:
+                score += 2.0
+            elif any(
+                query_lower in obs.lower() for obs in entity.get("observations", [])
+            ):
+                score += 1.0
+        if query_tokens:
+            score += len(query_tokens & tokenize_entity_text(name)) / len(query_tokens)
+        return score
+
+    async def _collect_candidate_ids(
+        self: AutoBotMemoryGraphCore,
+        query_tokens: Set[str],
+        entity_type: Optional[str],
+        cap: int,
+    ) -> List[str]:
+        """Intersect postings to find candidate entity IDs.
+
+        Truncated to cap in ID order, so callers must add exact-name
+        matches separately (see _exact_name_ids).
+        """
+        keys = [f"{ENTITY_TOKEN_PREFIX}{token}" for token in sorted(query_tokens)]
+        if entity_type:
+            keys.append(f"{ENTITY_TYPE_PREFIX}{entity_type}")
+
+        if len(keys) > 1:
+            members = await self.redis_client.sinter(keys)
+        else:
+            members = []
+            async for member in self.redis_client.sscan_iter(
+                keys[0] if keys else ENTITY_ALL_KEY
+            ):
+                members.append(member)
+                if len(members) >= cap:
+                    break
+
+        ids = sorted(m.decode() if isinstance(m, bytes) else m for m in members)
+        return ids[:cap]
+
+    async def _exact_name_ids(
+        self: AutoBotMemoryGraphCore,
+        query_lower: str,
+    ) -> List[str]:
+        """IDs of entities whose whole name equals the query."""
+        members = await self.redis_client.smembers(entity_name_key(query_lower))
+        return sorted(m.decode() if isinstance(m, bytes) else m for m in members)
+
+    async def _indexed_search(
+        self: AutoBotMemoryGraphCore,
+        query: str,
+        entity_type: Optional[str],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """Search via token and type postings instead of scanning entities.
+
+        Every word of the query must occur in the entity's name or
+        observations; results are ranked by _score_entity_match. Exact
+        name matches are always among the candidates, so get_entity's
+        limit=1 lookup finds them however many entities share the tokens.
+        """
+        query_lower = query.lower().strip() if query else ""
+        query_tokens = (
+            set() if query_lower in ("", "*") else tokenize_entity_text(query_lower)
+        )
+        if query_lower not in ("", "*") and not query_tokens:
+            return []
+
+        exact_ids = await self._exact_name_ids(query_lower) if query_tokens else []
+        candidate_ids = await self._collect_candidate_ids(
+            query_tokens, entity_type, limit * FALLBACK_CANDIDATE_MULTIPLIER
+        )
+        candidate_ids = exact_ids + [i for i in candidate_ids if i not in exact_ids]
+        docs = await self._mget_json_documents(
+            [f"memory:entity:{entity_id}" for entity_id in candidate_ids]
+        )
+        scored = [
+            (self._score_entity_match(doc, query_lower, query_tokens), doc)
+            for doc in docs
+            if doc and (not entity_type or doc.get("type") == entity_type)
+        ]
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [doc for _, doc in scored[:limit]]
+
     async def _collect_entity_keys(
         self: AutoBotMemoryGraphCore,
         limit: int,
@@ -217,6 +492,9 @@ class QueryOperationsMixin:
         Issue #315: Original refactoring.
         Issue #620: Further refactored using Extract Method pattern.
 
+        Uses the token/type postings once built; until then the postings
+        are built in the background and a bounded key scan is used.
+
         Args:
             query: Search query string
             entity_type: Optional entity type filter
@@ -226,6 +504,10 @@ class QueryOperationsMixin:
             List of matching entities
         """
         try:
+            if await self._entity_index_ready():
+                return await self._indexed_search(query, entity_type, limit)
+            self._ensure_entity_index_build()
+
             query_lower = query.lower() if query else ""
             keys = await self._collect_entity_keys(limit)
 
@@ -0,0 +1,229 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Unit tests for the memory graph fallback search index
+
+Tests cover:
+- Token extraction from entity names and observations
+- Postings maintenance on create, add_observations and delete
+- Indexed fallback search with type filters and ranking
+- Exact-name matches surviving the candidate cap
+- Legacy scan until the postings are built
+- One rebuild at a time across workers
+"""
+
+import asyncio
+import fnmatch
+
+from autobot_memory_graph.queries import (
+    ENTITY_ALL_KEY,
+    ENTITY_INDEX_LOCK_KEY,
+    QueryOperationsMixin,
+    entity_tokens,
+    tokenize_entity_text,
+)
+from autobot_memory_graph.relations import RelationOperationsMixin
+
+
+class _FakeJSON:
+    def __init__(self, store):
+        self.store = store
+        self.mget_calls = 0
+
+    async def mget(self, keys, path):
+        self.mget_calls += 1
+        return [[self.store[k]] if k in self.store else None for k in keys]
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def sadd(self, key, member):
+        self.ops.append((self.redis.sets.setdefault(key, set()).add, member))
+
+    def srem(self, key, member):
+        self.ops.append((self.redis.sets.setdefault(key, set()).discard, member))
+
+    def json(self):
+        return self
+
+    def get(self, key):
+        self.ops.append((self.redis.docs.get, key))
+
+    async def execute(self):
+        return [op(arg) for op, arg in self.ops]
+
+
+class _FakeRedis:
+    """In-memory Redis with just the set, hash and JSON calls used here."""
+
+    def __init__(self):
+        self.docs = {}
+        self.sets = {}
+        self.hashes = {}
+        self.strings = {}
+        self._json = _FakeJSON(self.docs)
+
+    def json(self):
+        return self._json
+
+    def pipeline(self):
+        return _FakePipeline(self)
+
+    async def sinter(self, keys):
+        sets = [self.sets.get(k, set()) for k in keys]
+        return set.intersection(*sets)
+
+    async def smembers(self, key):
+        return set(self.sets.get(key, ()))
+
+    async def sscan_iter(self, key):
+        for member in sorted(self.sets.get(key, ())):
+            yield member
+
+    async def scan_iter(self, match):
+        for key in list(self.docs) + list(self.sets) + list(self.hashes):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.sets.pop(key, None)
+            self.hashes.pop(key, None)
+            self.strings.pop(key, None)
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.strings:
+            return None
+        self.strings[key] = value
+        return True
+
+    async def get(self, key):
+        return self.strings.get(key)
+
+    async def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(mapping)
+
+    async def hexists(self, key, field):
+        return field in self.hashes.get(key, {})
+
+
+class _Graph(QueryOperationsMixin, RelationOperationsMixin):
+    def __init__(self):
+        self.redis_client = _FakeRedis()
+
+    async def add(self, entity_id, entity_type, name, observations):
+        entity = {
+            "id": entity_id,
+            "type": entity_type,
+            "name": name,
+            "observations": observations,
+        }
+        self.redis_client.docs[f"memory:entity:{entity_id}"] = entity
+        await self._index_entity(entity)
+        return entity
+
+
+async def _populated_graph():
+    graph = _Graph()
+    await graph.add("1", "bug_fix", "Redis timeout fix", ["Raised socket timeout"])
+    await graph.add("2", "feature", "Redis cache", ["Adds LRU cache for redis"])
+    await graph.add("3", "feature", "Redis", ["Connection pool"])
+    await graph.add("4", "task", "Write docs", ["Mention redis timeout"])
+    return graph
+
+
+def test_tokens_from_name_and_observations():
+    assert tokenize_entity_text("Fix: Redis-timeout (v2)!") == {
+        "fix",
+        "redis",
+        "timeout",
+        "v2",
+    }
+    entity = {"name": "A cache", "observations": ["LRU policy"]}
+    assert entity_tokens(entity) == {"cache", "lru", "policy"}
+
+
+async def test_search_intersects_postings_and_ranks_name_matches():
+    graph = await _populated_graph()
+
+    results = await graph._indexed_search("redis timeout", None, limit=10)
+    assert [r["id"] for r in results] == ["1", "4"]
+
+    results = await graph._indexed_search("Redis", None, limit=2)
+    # Exact name first, then substring name matches
+    assert [r["id"] for r in results] == ["3", "1"]
+    assert graph.redis_client.json().mget_calls == 2
+
+
+async def test_type_filter_and_wildcard_use_type_postings():
+    graph = await _populated_graph()
+
+    results = await graph._indexed_search("redis", "feature", limit=10)
+    assert {r["id"] for r in results} == {"2", "3"}
+
+    results = await graph._indexed_search("*", "task", limit=10)
+    assert [r["id"] for r in results] == ["4"]
+
+    assert await graph._indexed_search("nomatch", None, limit=10) == []
+
+
+async def test_observation_and_delete_maintenance():
+    graph = await _populated_graph()
+    entity = graph.redis_client.docs["memory:entity:3"]
+
+    entity["observations"].append("Tuned keepalive")
+    await graph._index_entity(entity, observations=["Tuned keepalive"])
+    results = await graph._indexed_search("keepalive", None, limit=10)
+    assert [r["id"] for r in results] == ["3"]
+
+    await graph._unindex_entity(entity)
+    assert "3" not in graph.redis_client.sets[ENTITY_ALL_KEY]
+    assert all("3" not in members for members in graph.redis_client.sets.values())
+
+
+async def test_fallback_scans_until_index_is_built():
+    graph = await _populated_graph()
+    graph.redis_client.sets.clear()
+
+    results = await graph._fallback_search("timeout", None, limit=10)
+    assert {r["id"] for r in results} == {"1", "4"}
+
+    await asyncio.wait_for(graph._entity_index_build_task, timeout=1)
+    assert await graph._entity_index_ready()
+    assert len(graph.redis_client.sets[ENTITY_ALL_KEY]) == 4
+
+    results = await graph._fallback_search("timeout", None, limit=10)
+    assert [r["id"] for r in results] == ["1", "4"]
+
+
+async def test_exact_name_match_survives_candidate_cap():
+    graph = _Graph()
+    for i in range(30):
+        await graph.add(f"{i:02d}", "feature", f"Redis cache {i}", [])
+    await graph.add("zz", "feature", "Redis cache", ["Adds LRU cache"])
+
+    # limit=1 caps the token intersection at 10 IDs, all sorting before "zz"
+    results = await graph._indexed_search("Redis cache", None, limit=1)
+    assert [r["id"] for r in results] == ["zz"]
+
+    await graph._unindex_entity(graph.redis_client.docs["memory:entity:zz"])
+    results = await graph._indexed_search("Redis cache", None, limit=1)
+    assert results[0]["id"] != "zz"
+
+
+async def test_rebuild_is_skipped_while_another_worker_holds_the_lock():
+    graph = await _populated_graph()
+    graph.redis_client.strings[ENTITY_INDEX_LOCK_KEY] = "other-worker"
+
+    result = await graph.rebuild_entity_index()
+    assert result["status"] == "skipped"
+    assert len(graph.redis_client.sets[ENTITY_ALL_KEY]) == 4
+
+    del graph.redis_client.strings[ENTITY_INDEX_LOCK_KEY]
+    result = await graph.rebuild_entity_index()
+    assert result["status"] == "success" and result["indexed"] == 4
+    assert ENTITY_INDEX_LOCK_KEY not in graph.redis_client.strings
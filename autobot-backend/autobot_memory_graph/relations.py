@@ -7,7 +7,7 @@ AutoBot Memory Graph - Relation Operations Module
 This module contains relationship management operations:
 - create_relation, get_related_entities, delete_relation
 - Bidirectional relationship tracking
-- Relation traversal with BFS
+- Relation traversal with level-synchronous, batched BFS
 
 Part of the modular autobot_memory_graph package (Issue #716).
 """
@@ -15,7 +15,7 @@ Part of the modular autobot_memory_graph package (Issue #716).
 import asyncio
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from .core import (
     INCOMING_DIRECTIONS,
@@ -26,6 +26,9 @@ from .core import (
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on new entities admitted per BFS level in get_related_entities
+DEFAULT_MAX_NEIGHBOURS_PER_LEVEL = 200
+
 
 class RelationOperationsMixin:
     """
@@ -121,6 +124,15 @@ class RelationOperationsMixin:
             )
             await self._store_outgoing_relation(from_id, relation)
             await self._store_incoming_relation(to_id, reverse_rel)
+            await self._publish_relation_change(
+                "add",
+                {
+                    "from": from_id,
+                    "to": to_id,
+                    "type": relation_type,
+                    "strength": strength,
+                },
+            )
 
             logger.info(
                 "Created relation: %s --[%s]--> %s",
@@ -175,6 +187,15 @@ class RelationOperationsMixin:
             )
             await self._store_outgoing_relation(from_entity_id, relation)
             await self._store_incoming_relation(to_entity_id, reverse_rel)
+            await self._publish_relation_change(
+                "add",
+                {
+                    "from": from_entity_id,
+                    "to": to_entity_id,
+                    "type": relation_type,
+                    "strength": (metadata or {}).get("strength", 1.0),
+                },
+            )
             logger.debug(
                 "Created relation by ID: %s --[%s]--> %s",
                 from_entity_id[:8],
@@ -300,122 +321,102 @@ class RelationOperationsMixin:
             logger.error("Failed to get relations for %s: %s", entity_id, e)
             return {"relations": []}
 
-    async def _process_outgoing(
+    async def _mget_json_documents(
         self: AutoBotMemoryGraphCore,
-        current_id: str,
-        relation_type: Optional[str],
-        depth: int,
-        max_depth: int,
-        queue: List,
-    ) -> List[Dict[str, Any]]:
-        """Process outgoing relations for BFS traversal. Issue #620."""
-        outgoing = await self._get_outgoing_relations(current_id)
-        return await self._process_direction_relations(
-            outgoing, relation_type, "outgoing", "to", depth, max_depth, queue
-        )
+        keys: List[str],
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Fetch several RedisJSON documents in one JSON.MGET round trip.
 
-    async def _process_incoming(
-        self: AutoBotMemoryGraphCore,
-        current_id: str,
-        relation_type: Optional[str],
-        depth: int,
-        max_depth: int,
-        queue: List,
-    ) -> List[Dict[str, Any]]:
-        """Process incoming relations for BFS traversal. Issue #620."""
-        incoming = await self._get_incoming_relations(current_id)
-        return await self._process_direction_relations(
-            incoming, relation_type, "incoming", "from", depth, max_depth, queue
-        )
+        Falls back to concurrent JSON.GET calls if JSON.MGET is unavailable.
+        Missing keys yield None at the matching position.
+        """
+        if not keys:
+            return []
+        try:
+            docs = await self.redis_client.json().mget(keys, "$")
+            # "$" paths return one-element lists per key (None if missing)
+            return [
+                doc[0] if isinstance(doc, list) and doc else doc or None for doc in docs
+            ]
+        except Exception as e:
+            logger.debug("JSON.MGET failed, falling back to JSON.GET: %s", e)
+            docs = await asyncio.gather(
+                *[self.redis_client.json().get(key) for key in keys],
+                return_exceptions=True,
+            )
+            return [doc if isinstance(doc, dict) else None for doc in docs]
 
-    async def _fetch_and_process_relations(
+    async def _fetch_level_relations(
         self: AutoBotMemoryGraphCore,
-        current_id: str,
+        level_ids: List[str],
         direction: str,
-        relation_type: Optional[str],
-        depth: int,
-        max_depth: int,
-        queue: List,
-    ) -> List[Dict[str, Any]]:
-        """Fetch and process relations for BFS traversal. Issue #620."""
-        need_outgoing = direction in OUTGOING_DIRECTIONS
-        need_incoming = direction in INCOMING_DIRECTIONS
-        related = []
+    ) -> List[Tuple[Dict[str, Any], str, str]]:
+        """Fetch relations of a whole BFS level with one batched read.
 
-        if need_outgoing and need_incoming:
-            outgoing, incoming = await asyncio.gather(
-                self._get_outgoing_relations(current_id),
-                self._get_incoming_relations(current_id),
-            )
-            related.extend(
-                await self._process_direction_relations(
-                    outgoing, relation_type, "outgoing", "to", depth, max_depth, queue
-                )
-            )
-            related.extend(
-                await self._process_direction_relations(
-                    incoming, relation_type, "incoming", "from", depth, max_depth, queue
-                )
-            )
-        elif need_outgoing:
-            related.extend(
-                await self._process_outgoing(
-                    current_id, relation_type, depth, max_depth, queue
-                )
-            )
-        elif need_incoming:
-            related.extend(
-                await self._process_incoming(
-                    current_id, relation_type, depth, max_depth, queue
-                )
-            )
+        Args:
+            level_ids: Entity IDs in the current BFS frontier
+            direction: "outgoing", "incoming", or "both"
 
-        return related
+        Returns:
+            List of (relation, direction, neighbour_id) in frontier order
+        """
+        keys = []
+        sources = []
+        for entity_id in level_ids:
+            if direction in OUTGOING_DIRECTIONS:
+                keys.append(f"memory:relations:out:{entity_id}")
+                sources.append(("outgoing", "to"))
+            if direction in INCOMING_DIRECTIONS:
+                keys.append(f"memory:relations:in:{entity_id}")
+                sources.append(("incoming", "from"))
+
+        docs = await self._mget_json_documents(keys)
+        edges = []
+        for (rel_direction, id_field), doc in zip(sources, docs):
+            for rel in (doc or {}).get("relations", []):
+                neighbour_id = rel.get(id_field)
+                if neighbour_id:
+                    edges.append((rel, rel_direction, neighbour_id))
+        return edges
+
+    def _select_level_neighbours(
+        self: AutoBotMemoryGraphCore,
+        edges: List[Tuple[Dict[str, Any], str, str]],
+        relation_type: Optional[str],
+        visited: Set[str],
+        max_per_level: Optional[int],
+    ) -> Dict[str, Tuple[Dict[str, Any], str]]:
+        """Pick unvisited neighbours for the next level, capped per level.
+
+        The first relation that reaches a neighbour is kept; every selected
+        neighbour is marked visited so later levels never revisit it.
+        """
+        selected: Dict[str, Tuple[Dict[str, Any], str]] = {}
+        for rel, rel_direction, neighbour_id in edges:
+            if max_per_level is not None and len(selected) >= max_per_level:
+                break
+            if relation_type is not None and rel.get("type") != relation_type:
+                continue
+            if neighbour_id in visited:
+                continue
+            visited.add(neighbour_id)
+            selected[neighbour_id] = (rel, rel_direction)
+        return selected
 
     def _build_related_entry(
         self: AutoBotMemoryGraphCore,
         rel: Dict[str, Any],
         entity: Dict[str, Any],
         direction: str,
+        depth: int = 1,
     ) -> Dict[str, Any]:
         """Build a related entity entry for BFS results. Issue #620."""
-        return {"entity": entity, "relation": rel, "direction": direction}
-
-    async def _process_direction_relations(
-        self: AutoBotMemoryGraphCore,
-        relations: List[Dict[str, Any]],
-        relation_type: Optional[str],
-        direction: str,
-        id_field: str,
-        depth: int,
-        max_depth: int,
-        queue: List,
-    ) -> List[Dict[str, Any]]:
-        """Process relations in a single direction. Issue #620."""
-        filtered = [
-            rel
-            for rel in relations
-            if relation_type is None or rel["type"] == relation_type
-        ]
-        if not filtered:
-            return []
-
-        entity_ids = [rel[id_field] for rel in filtered]
-        entities = await asyncio.gather(
-            *[self.get_entity(entity_id=eid) for eid in entity_ids],
-            return_exceptions=True,
-        )
-
-        related = []
-        for rel, related_entity in zip(filtered, entities):
-            if related_entity and not isinstance(related_entity, Exception):
-                related.append(
-                    self._build_related_entry(rel, related_entity, direction)
-                )
-                if depth + 1 <= max_depth:
-                    queue.append((rel[id_field], depth + 1))
-
-        return related
+        return {
+            "entity": entity,
+            "relation": rel,
+            "direction": direction,
+            "depth": depth,
+        }
 
     async def get_related_entities(
         self: AutoBotMemoryGraphCore,
@@ -423,17 +424,24 @@ class RelationOperationsMixin:
         relation_type: Optional[str] = None,
         direction: str = "both",
         max_depth: int = 1,
+        max_per_level: Optional[int] = DEFAULT_MAX_NEIGHBOURS_PER_LEVEL,
     ) -> List[Dict[str, Any]]:
         """Get entities related to specified entity.
 
+        Traverses level by level: each BFS level costs one JSON.MGET for the
+        frontier's relation documents and one for the neighbour entities.
+        Every entity is reported once, at the depth it is first reached.
+
         Args:
             entity_name: Name of entity
             relation_type: Filter by relation type (None = all types)
             direction: "outgoing", "incoming", or "both"
-            max_depth: Relationship traversal depth (1-3)
+            max_depth: Number of relation hops to traverse (1-3)
+            max_per_level: Maximum new entities admitted per level
+                (None = unlimited)
 
         Returns:
-            List of related entities with relation metadata
+            List of related entities with relation metadata and depth
         """
         self.ensure_initialized()
 
@@ -442,21 +450,36 @@ class RelationOperationsMixin:
             if not entity:
                 return []
 
-            entity_id = entity["id"]
-            related = []
-            visited = set()
-            queue = [(entity_id, 0)]
+            if self.adjacency_ready:
+                return await self._get_related_from_snapshot(
+                    entity["id"], relation_type, direction, max_depth, max_per_level
+                )
 
-            while queue:
-                current_id, depth = queue.pop(0)
-                if current_id in visited or depth > max_depth:
-                    continue
-                visited.add(current_id)
+            visited = {entity["id"]}
+            frontier = [entity["id"]]
+            related = []
 
-                direction_related = await self._fetch_and_process_relations(
-                    current_id, direction, relation_type, depth, max_depth, queue
+            for depth in range(1, max_depth + 1):
+                if not frontier:
+                    break
+                edges = await self._fetch_level_relations(frontier, direction)
+                neighbours = self._select_level_neighbours(
+                    edges, relation_type, visited, max_per_level
+                )
+                entities = await self._mget_json_documents(
+                    [f"memory:entity:{eid}" for eid in neighbours]
                 )
-                related.extend(direction_related)
+
+                frontier = []
+                for (neighbour_id, (rel, rel_direction)), neighbour in zip(
+                    neighbours.items(), entities
+                ):
+                    if not neighbour:
+                        continue
+                    related.append(
+                        self._build_related_entry(rel, neighbour, rel_direction, depth)
+                    )
+                    frontier.append(neighbour_id)
 
             return related
 
@@ -464,6 +487,47 @@ class RelationOperationsMixin:
             logger.error("Failed to get related entities: %s", e)
             return []
 
+    async def _get_related_from_snapshot(
+        self: AutoBotMemoryGraphCore,
+        entity_id: str,
+        relation_type: Optional[str],
+        direction: str,
+        max_depth: int,
+        max_per_level: Optional[int],
+    ) -> List[Dict[str, Any]]:
+        """Traverse via the in-process adjacency snapshot.
+
+        Only the neighbour entities are read from Redis (one JSON.MGET).
+        Relations are rebuilt from the snapshot's type and strength columns.
+        """
+        await self._sync_adjacency()
+        found = self.adjacency.neighbourhood(
+            entity_id,
+            max_depth=max_depth,
+            direction=direction,
+            relation_types=None if relation_type is None else [relation_type],
+            max_per_level=max_per_level,
+        )
+        entities = await self._mget_json_documents(
+            [f"memory:entity:{neighbour_id}" for neighbour_id, _, _ in found]
+        )
+
+        related = []
+        for (neighbour_id, depth, edge), neighbour in zip(found, entities):
+            if not neighbour:
+                continue
+            via_id, rel_type, strength, rel_direction = edge
+            id_field = "to" if rel_direction == "outgoing" else "from"
+            rel = {
+                id_field: neighbour_id,
+                "type": rel_type,
+                "metadata": {"strength": strength},
+            }
+            related.append(
+                self._build_related_entry(rel, neighbour, rel_direction, depth)
+            )
+        return related
+
     async def _filter_outgoing_relations(
         self: AutoBotMemoryGraphCore,
         from_id: str,
@@ -557,6 +621,9 @@ class RelationOperationsMixin:
 
             await self._filter_outgoing_relations(from_id, to_id, relation_type)
             await self._filter_incoming_relations(from_id, to_id, relation_type)
+            await self._publish_relation_change(
+                "remove", {"from": from_id, "to": to_id, "type": relation_type}
+            )
 
             logger.info(
                 "Deleted relation: %s --[%s]--> %s",
@@ -0,0 +1,130 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Unit tests for memory graph relation traversal
+
+Tests cover:
+- One batched relation read and one entity read per BFS level
+- Visited de-duplication and per-level depth reporting
+- Relation type filtering and per-level fan-out caps
+"""
+
+from unittest.mock import AsyncMock
+
+from autobot_memory_graph.adjacency import AdjacencySnapshot, AdjacencySnapshotMixin
+from autobot_memory_graph.relations import RelationOperationsMixin
+
+
+class _FakeJSON:
+    """In-memory RedisJSON stand-in recording JSON.MGET calls."""
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.mget_calls = []
+
+    async def mget(self, keys, path):
+        self.mget_calls.append(list(keys))
+        return [[self.docs[k]] if k in self.docs else None for k in keys]
+
+
+class _FakeRedis:
+    def __init__(self, docs):
+        self._json = _FakeJSON(docs)
+
+    def json(self):
+        return self._json
+
+    async def xread(self, streams, count=None):
+        return []
+
+
+class _Graph(RelationOperationsMixin, AdjacencySnapshotMixin):
+    def __init__(self, edges, names):
+        docs = {}
+        for entity_id, name in names.items():
+            docs[f"memory:entity:{entity_id}"] = {"id": entity_id, "name": name}
+        for src, dst, rel_type in edges:
+            docs.setdefault(
+                f"memory:relations:out:{src}", {"entity_id": src, "relations": []}
+            )["relations"].append({"to": dst, "type": rel_type})
+            docs.setdefault(
+                f"memory:relations:in:{dst}", {"entity_id": dst, "relations": []}
+            )["relations"].append({"from": src, "type": rel_type})
+        self.redis_client = _FakeRedis(docs)
+        self.adjacency = None
+        self.adjacency_snapshot_enabled = False
+        self.get_entity = AsyncMock(return_value=docs["memory:entity:a"])
+
+    def ensure_initialized(self):
+        pass
+
+
+_EDGES = [
+    ("a", "b", "depends_on"),
+    ("a", "c", "references"),
+    ("b", "d", "depends_on"),
+    ("c", "d", "depends_on"),
+    ("c", "a", "related_to"),
+]
+
+
+def _graph():
+    #   a -> b -> d
+    #   a -> c -> d,  c -> a (cycle)
+    return _Graph(edges=_EDGES, names={k: k.upper() for k in "abcd"})
+
+
+async def test_level_batched_reads_and_dedup():
+    graph = _graph()
+    related = await graph.get_related_entities("A", max_depth=3)
+
+    assert [(r["entity"]["id"], r["depth"]) for r in related] == [
+        ("b", 1),
+        ("c", 1),
+        ("d", 2),
+    ]
+    # Levels 1 and 2 each: one relation MGET and one entity MGET; level 3
+    # reads d's relations, finds only visited nodes and fetches no entities
+    assert len(graph.redis_client.json().mget_calls) == 5
+
+
+async def test_max_depth_counts_hops():
+    related = await _graph().get_related_entities("A", max_depth=1)
+    assert {r["entity"]["id"] for r in related} == {"b", "c"}
+
+
+async def test_direction_and_type_filters():
+    graph = _graph()
+    related = await graph.get_related_entities(
+        "A", relation_type="depends_on", direction="outgoing", max_depth=2
+    )
+    assert [(r["entity"]["id"], r["direction"]) for r in related] == [
+        ("b", "outgoing"),
+        ("d", "outgoing"),
+    ]
+
+
+async def test_fan_out_cap_per_level():
+    related = await _graph().get_related_entities("A", max_depth=1, max_per_level=1)
+    assert len(related) == 1
+
+
+async def test_snapshot_traversal_matches_redis_traversal():
+    expected = await _graph().get_related_entities("A", max_depth=3)
+
+    graph = _graph()
+    graph.adjacency = AdjacencySnapshot()
+    graph.adjacency.load_edges((src, dst, t, 1.0) for src, dst, t in _EDGES)
+    graph.adjacency.ready = True
+    related = await graph.get_related_entities("A", max_depth=3)
+
+    def summary(items):
+        return [
+            (r["entity"]["id"], r["depth"], r["direction"], r["relation"]["type"])
+            for r in items
+        ]
+
+    assert summary(related) == summary(expected)
+    # Only the neighbour entities are read from Redis
+    assert len(graph.redis_client.json().mget_calls) == 1
@@ -146,15 +146,14 @@ class BackgroundVectorizer:
         content, metadata = self._extract_fact_content(fact_data)
         fact_id = fact_key.split(":")[-1] if ":" in fact_key else fact_key
 
-        if not kb.vector_index:
-            logger.warning("Vector index not available")
+        if not kb.vector_store:
+            logger.warning("Vector store not available")
             return result
 
         try:
-            from llama_index.core import Document
-
-            document = Document(text=content, metadata=metadata, doc_id=fact_id)
-            await asyncio.to_thread(kb.vector_index.insert, document)
+            # Embeds through the persistent embedding store, so unchanged
+            # facts re-vectorized after a restart or rebuild are not re-embedded
+            await kb.vectorize_fact(fact_id, content, metadata)
             result["success"] = True
             result["tokens"] = int(len(content.split()) * 1.3)
             logger.debug("Vectorized fact %s", fact_id)
@@ -17,6 +17,8 @@ Architecture:
     ├── CacheMixin (Redis caching)
     ├── DeduplicationMixin (streaming message dedup)
     ├── SessionMixin (session CRUD operations)
+    ├── SessionLogMixin (append-only per-session message log)
+    ├── SessionCatalogMixin (Redis session catalog for indexed listing)
     ├── SessionListingMixin (session listing, orphan recovery)
     └── MessagesMixin (message operations)
 
@@ -39,7 +41,9 @@ from chat_history.memory import MemoryMixin
 from chat_history.messages import MessagesMixin
 from chat_history.security import SecurityMixin
 from chat_history.session import SessionMixin
+from chat_history.session_catalog import SessionCatalogMixin
 from chat_history.session_listing import SessionListingMixin
+from chat_history.session_log import SessionLogMixin
 
 
 class ChatHistoryManager(
@@ -51,6 +55,8 @@ class ChatHistoryManager(
     CacheMixin,
     DeduplicationMixin,
     SessionMixin,
+    SessionLogMixin,
+    SessionCatalogMixin,
     SessionListingMixin,
     MessagesMixin,
 ):
@@ -68,6 +74,8 @@ class ChatHistoryManager(
     - CacheMixin: Redis caching for session data
     - DeduplicationMixin: Streaming message consolidation (Issue #259)
     - SessionMixin: Session CRUD operations (create, load, save, delete, update)
+    - SessionLogMixin: Append-only message log, compaction, tail pagination
+    - SessionCatalogMixin: Indexed, paginated session listing and rebuild
     - SessionListingMixin: Session listing and orphaned file recovery
     - MessagesMixin: Message operations (add, get, update metadata, tool markers)
 
@@ -137,6 +145,8 @@ __all__ = [
     "CacheMixin",
     "DeduplicationMixin",
     "SessionMixin",
+    "SessionLogMixin",
+    "SessionCatalogMixin",
     "SessionListingMixin",
     "MessagesMixin",
 ]
@@ -99,6 +99,11 @@ class ChatHistoryBase:
         self._counter_lock = threading.Lock()
         self._session_save_counter = 0
 
+        # Append-only session logs (SessionLogMixin): cached header state
+        # and per-session locks serializing appends with compaction
+        self._session_log_states: dict = {}
+        self._session_log_locks: dict = {}
+
         # Memory Graph integration
         self.memory_graph: Optional[AutoBotMemoryGraph] = None
         self.memory_graph_enabled = False
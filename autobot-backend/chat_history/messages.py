@@ -32,6 +32,7 @@ class MessagesMixin:
     - self.context_manager: ContextWindowManager
     - self.load_session(): method
     - self.save_session(): method
+    - self.append_session_messages(): method
     - self._save_history(): method
     - self._periodic_memory_check(): method
     """
@@ -86,15 +87,10 @@ class MessagesMixin:
 
         Issue #620.
         """
-        try:
-            messages = await self.load_session(session_id)
-            messages.append(message)
-            await self.save_session(session_id, messages=messages)
+        if await self.append_session_messages(session_id, [message]):
             logger.debug("Added message to session %s", session_id)
             return True
-        except Exception as e:
-            logger.error("Error adding message to session %s: %s", session_id, e)
-            return False
+        return False
 
     async def add_messages_batch(
         self,
@@ -102,7 +98,7 @@ class MessagesMixin:
         messages: List[Dict[str, Any]],
     ) -> bool:
         """
-        Add multiple messages in a single load/save cycle.
+        Add multiple messages with a single append to the session log.
 
         Issue #1316: Eliminates N separate file reads/writes when
         persisting workflow messages after streaming completes.
@@ -116,23 +112,15 @@ class MessagesMixin:
         """
         if not messages:
             return True
-        try:
-            existing = await self.load_session(session_id)
-            existing.extend(messages)
-            await self.save_session(session_id, messages=existing)
-            logger.debug(
-                "Batch-added %d messages to session %s",
-                len(messages),
-                session_id,
-            )
-            return True
-        except Exception as e:
-            logger.error(
-                "Batch add to session %s failed: %s",
-                session_id,
-                e,
-            )
+        if not await self.append_session_messages(session_id, messages):
+            logger.error("Batch add to session %s failed", session_id)
             return False
+        logger.debug(
+            "Batch-added %d messages to session %s",
+            len(messages),
+            session_id,
+        )
+        return True
 
     async def add_message(
         self,
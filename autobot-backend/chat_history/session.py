@@ -7,7 +7,7 @@ Chat History Session Mixin - Session CRUD operations.
 Provides session management for chat history:
 - Session creation with metadata
 - Session loading with caching
-- Session saving with atomic writes
+- Session saving with atomic writes (snapshot + append-only log reset)
 - Session deletion with cleanup
 - Session listing and updates
 """
@@ -46,6 +46,12 @@ class SessionMixin:
     - self._cleanup_old_session_files(): method
     - self._init_memory_graph(): method
     - self._extract_conversation_metadata(): method
+    - self._session_log_lock(): method (SessionLogMixin)
+    - self._merge_session_log(): method (SessionLogMixin)
+    - self._peek_session_log_state(): method (SessionLogMixin)
+    - self._write_session_log(): method (SessionLogMixin)
+    - self._catalog_upsert_session(): method (SessionCatalogMixin)
+    - self._catalog_remove_session(): method (SessionCatalogMixin)
     """
 
     def _try_get_from_cache(self, session_id: str) -> Optional[List[Dict[str, Any]]]:
@@ -210,7 +216,12 @@ class SessionMixin:
             session_id, session_title, current_time, metadata
         )
 
-        await self.save_session(session_id=session_id, messages=[], name=session_title)
+        await self.save_session(
+            session_id=session_id,
+            messages=[],
+            name=session_title,
+            metadata=metadata,
+        )
         await self._create_memory_graph_entity(
             session_id, session_title, current_time, metadata
         )
@@ -221,16 +232,28 @@ class SessionMixin:
     async def _load_session_from_file(
         self, session_id: str
     ) -> Optional[Dict[str, Any]]:
-        """Load and decrypt session data from file. Issue #620."""
+        """Load and decrypt session data from file. Issue #620.
+
+        Messages appended to the session log after the snapshot are merged
+        in. If the log was reset by a concurrent compaction after the
+        snapshot was read, the snapshot is read again.
+        """
         chats_directory = self._get_chats_directory()
         chat_file = await self._resolve_session_file_path(session_id, chats_directory)
         if not chat_file:
             return None
 
-        async with aiofiles.open(chat_file, "r", encoding="utf-8") as f:
-            file_content = await f.read()
+        for _ in range(2):
+            async with aiofiles.open(chat_file, "r", encoding="utf-8") as f:
+                file_content = await f.read()
+            chat_data = self._decrypt_data(file_content)
 
-        return self._decrypt_data(file_content)
+            state = await self._merge_session_log(session_id, chat_data)
+            if state is None or state.base_seq <= int(
+                chat_data.get("log_seq", state.base_seq)
+            ):
+                break
+        return chat_data
 
     async def _process_loaded_messages(
         self, session_id: str, chat_data: Dict[str, Any]
@@ -447,17 +470,45 @@ class SessionMixin:
         session_id: str,
         messages: Optional[List[Dict[str, Any]]] = None,
         name: str = "",
+        metadata: Optional[Dict[str, Any]] = None,
     ):
         """
         Save a chat session with messages and metadata.
 
+        Rewrites the snapshot with the full message list and restarts the
+        session's append-only log. For adding messages use
+        append_session_messages(), which does not rewrite the snapshot.
+
         Args:
             session_id: The identifier for the session to save.
             messages: The messages to save (defaults to empty list).
             name: Optional name for the chat session.
+            metadata: Optional session metadata (e.g. owner); kept as-is
+                when omitted.
 
         Issue #665, #620: Refactored to use extracted helper methods.
         """
+        async with self._session_log_lock(session_id):
+            await self._save_session_locked(session_id, messages, name, metadata)
+
+    async def _next_snapshot_log_seq(self, session_id: str, message_count: int) -> int:
+        """Sequence number of the last message in a new snapshot.
+
+        Never moves backwards, so records already in the old log are not
+        mistaken for messages newer than the snapshot.
+        """
+        state = await self._peek_session_log_state(session_id)
+        last_seq = state.last_seq if state else 0
+        return max(last_seq, message_count)
+
+    async def _save_session_locked(
+        self,
+        session_id: str,
+        messages: Optional[List[Dict[str, Any]]] = None,
+        name: str = "",
+        metadata: Optional[Dict[str, Any]] = None,
+    ):
+        """Save snapshot and reset the session log (caller holds the log lock)."""
         try:
             chats_directory = self._get_chats_directory()
             await self._ensure_chats_directory_exists(chats_directory)
@@ -472,8 +523,17 @@ class SessionMixin:
             chat_data = self._build_session_chat_data(
                 chat_data, session_id, name, session_messages, current_time
             )
+            if metadata:
+                chat_data["metadata"] = {**chat_data.get("metadata", {}), **metadata}
+            chat_data["log_seq"] = await self._next_snapshot_log_seq(
+                session_id, len(session_messages)
+            )
 
             await self._write_session_to_storage(chat_file, chat_data)
+            await self._write_session_log(
+                session_id, session_messages, chat_data["log_seq"]
+            )
+            await self._catalog_upsert_session(session_id, chat_file, chat_data)
             await self._update_redis_cache_on_save(session_id, chat_data)
             logger.info("Chat session '%s' saved successfully", session_id)
 
@@ -618,6 +678,13 @@ class SessionMixin:
             await run_in_chat_io_executor(os.remove, chat_file_old)
             deleted = True
 
+        # Delete append-only message log and its lock file
+        for suffix in ("_chat.log", "_chat.lock"):
+            log_file = f"{chats_directory}/{session_id}{suffix}"
+            if await run_in_chat_io_executor(os.path.exists, log_file):
+                await run_in_chat_io_executor(os.remove, log_file)
+        self._session_log_states.pop(session_id, None)
+
         return deleted
 
     async def _delete_companion_files(
@@ -689,6 +756,7 @@ class SessionMixin:
             deleted = await self._delete_session_files(session_id, chats_directory)
             await self._delete_companion_files(session_id, chats_directory)
             await self._clear_session_redis_cache(session_id)
+            await self._catalog_remove_session(session_id)
 
             if not deleted:
                 logger.warning("Chat session %s not found for deletion", session_id)
@@ -752,6 +820,9 @@ class SessionMixin:
                 await f.write(encrypted_data)
 
             await self._update_redis_session_cache(session_id, chat_data)
+            await self._catalog_upsert_session(
+                session_id, chat_file_new, chat_data, count_messages=False
+            )
             logger.info("Session %s updated successfully", session_id)
             return True
 
@@ -844,6 +915,9 @@ class SessionMixin:
 
         # Update Redis cache using existing helper
         await self._update_redis_session_cache(session_id, chat_data)
+        await self._catalog_upsert_session(
+            session_id, chat_file_new, chat_data, count_messages=False
+        )
 
         logger.info("Chat session '%s' name updated to '%s'", session_id, name)
 
@@ -0,0 +1,412 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Chat History Session Catalog Mixin - Indexed session listing.
+
+Keeps a Redis catalog of session metadata so listing is a range query
+instead of a stat + read of every file in the chats directory:
+
+- chat:catalog:index          ZSET  session_id -> last-modified epoch
+- chat:catalog:owner:{owner}  ZSET  same, per owner
+- chat:catalog:session:{id}   HASH  name, message_count, created, file_size, owner
+- chat:catalog:ready          flag set once a rebuild has reconciled the
+                              catalog with the filesystem
+
+Sessions saved before ownership was written to their metadata get their
+owner from the SessionOwnershipValidator's per-user session sets, both on
+rebuild and when a user lists their sessions.
+
+Session save/append/rename/delete keep the catalog up to date. If a catalog
+write fails the ready flag is cleared, so the next listing falls back to a
+directory scan that also rebuilds the catalog (as does a Redis restart).
+"""
+
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from chat_history.file_io import run_in_chat_io_executor
+from chat_history.session_listing import _generate_chat_name
+
+logger = logging.getLogger(__name__)
+
+CATALOG_INDEX_KEY = "chat:catalog:index"
+CATALOG_READY_KEY = "chat:catalog:ready"
+CATALOG_SESSION_PREFIX = "chat:catalog:session:"
+CATALOG_OWNER_PREFIX = "chat:catalog:owner:"
+
+# Per-user session sets written by SessionOwnershipValidator.set_session_owner
+OWNERSHIP_USER_SESSIONS_PREFIX = "user_chat_sessions:"
+
+
+def _decode(value: Any) -> Any:
+    """Decode a Redis bytes value (client may not use decode_responses)."""
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return value
+
+
+def _owner_from_chat_data(chat_data: Dict[str, Any]) -> str:
+    """Session owner from metadata ("" when unowned)."""
+    metadata = chat_data.get("metadata") or {}
+    return metadata.get("owner") or metadata.get("username") or ""
+
+
+def _iso_from_epoch(value: Any) -> str:
+    """Render a stored epoch as the ISO timestamp used by listings."""
+    try:
+        return datetime.fromtimestamp(float(value)).isoformat()
+    except (TypeError, ValueError):
+        return ""
+
+
+class SessionCatalogMixin:
+    """
+    Mixin providing a Redis-backed session catalog for chat history.
+
+    Requires base class to have:
+    - self.redis_client: Redis client or None
+    - self._get_chats_directory(): method
+    - self._scan_sessions_fast(): method (SessionListingMixin)
+    """
+
+    # ------------------------------------------------------------------
+    # Maintenance (called from session save/append/rename/delete)
+    # ------------------------------------------------------------------
+
+    def _catalog_upsert_sync(
+        self,
+        session_id: str,
+        fields: Dict[str, Any],
+        score: float,
+        owner: str,
+    ) -> None:
+        """Write a catalog entry and its index positions in one pipeline."""
+        entry_key = f"{CATALOG_SESSION_PREFIX}{session_id}"
+        previous_owner = _decode(self.redis_client.hget(entry_key, "owner")) or ""
+
+        pipe = self.redis_client.pipeline()
+        created = fields.pop("created", None)
+        if created is not None:
+            pipe.hsetnx(entry_key, "created", created)
+        pipe.hset(entry_key, mapping={**fields, "owner": owner})
+        pipe.zadd(CATALOG_INDEX_KEY, {session_id: score})
+        if previous_owner and previous_owner != owner:
+            pipe.zrem(f"{CATALOG_OWNER_PREFIX}{previous_owner}", session_id)
+        if owner:
+            pipe.zadd(f"{CATALOG_OWNER_PREFIX}{owner}", {session_id: score})
+        pipe.execute()
+
+    def _catalog_touch_sync(
+        self, session_id: str, added_messages: int, score: float
+    ) -> None:
+        """Bump recency and message count of an existing catalog entry."""
+        entry_key = f"{CATALOG_SESSION_PREFIX}{session_id}"
+        owner = _decode(self.redis_client.hget(entry_key, "owner"))
+        if owner is None:
+            # Unknown to the catalog; force a reconcile on next listing
+            self.redis_client.delete(CATALOG_READY_KEY)
+            return
+
+        pipe = self.redis_client.pipeline()
+        pipe.hincrby(entry_key, "message_count", added_messages)
+        pipe.zadd(CATALOG_INDEX_KEY, {session_id: score})
+        if owner:
+            pipe.zadd(f"{CATALOG_OWNER_PREFIX}{owner}", {session_id: score})
+        pipe.execute()
+
+    def _catalog_remove_sync(self, session_id: str) -> None:
+        """Drop a session from the catalog."""
+        entry_key = f"{CATALOG_SESSION_PREFIX}{session_id}"
+        owner = _decode(self.redis_client.hget(entry_key, "owner"))
+
+        pipe = self.redis_client.pipeline()
+        pipe.delete(entry_key)
+        pipe.zrem(CATALOG_INDEX_KEY, session_id)
+        if owner:
+            pipe.zrem(f"{CATALOG_OWNER_PREFIX}{owner}", session_id)
+        pipe.execute()
+
+    def _catalog_assign_owner_sync(self, owner: str, session_ids: List[str]) -> int:
+        """Record owner on catalogued sessions that have none; returns count."""
+        pipe = self.redis_client.pipeline()
+        for session_id in session_ids:
+            pipe.hget(f"{CATALOG_SESSION_PREFIX}{session_id}", "owner")
+            pipe.zscore(CATALOG_INDEX_KEY, session_id)
+        results = pipe.execute()
+
+        pipe = self.redis_client.pipeline()
+        assigned = 0
+        for session_id, current, score in zip(session_ids, results[::2], results[1::2]):
+            if score is None or _decode(current):
+                continue  # not catalogued yet, or owner already recorded
+            pipe.hset(f"{CATALOG_SESSION_PREFIX}{session_id}", mapping={"owner": owner})
+            pipe.zadd(f"{CATALOG_OWNER_PREFIX}{owner}", {session_id: score})
+            assigned += 1
+        if assigned:
+            pipe.execute()
+        return assigned
+
+    def _ownership_owners_sync(self) -> Dict[str, str]:
+        """Map session_id -> owner from the ownership validator's user sets."""
+        owners: Dict[str, str] = {}
+        for key in self.redis_client.scan_iter(
+            match=f"{OWNERSHIP_USER_SESSIONS_PREFIX}*", count=100
+        ):
+            username = _decode(key)[len(OWNERSHIP_USER_SESSIONS_PREFIX) :]
+            for session_id in self.redis_client.smembers(key):
+                owners.setdefault(_decode(session_id), username)
+        return owners
+
+    async def _invalidate_catalog(self, reason: Exception) -> None:
+        """Mark the catalog stale after a failed write."""
+        logger.error("Session catalog update failed, marking stale: %s", reason)
+        try:
+            await run_in_chat_io_executor(self.redis_client.delete, CATALOG_READY_KEY)
+        except Exception as e:
+            logger.debug("Could not clear catalog ready flag: %s", e)
+
+    async def _catalog_upsert_session(
+        self,
+        session_id: str,
+        chat_file: str,
+        chat_data: Dict[str, Any],
+        count_messages: bool = True,
+    ) -> None:
+        """Record a freshly written session snapshot in the catalog.
+
+        Pass count_messages=False for metadata-only rewrites, whose snapshot
+        may not include messages still pending in the session log.
+        """
+        if not self.redis_client:
+            return
+        try:
+            stat = await run_in_chat_io_executor(os.stat, chat_file)
+            fields = {
+                "name": chat_data.get("name", ""),
+                "created": stat.st_ctime,
+                "file_size": stat.st_size,
+            }
+            if count_messages:
+                fields["message_count"] = len(chat_data.get("messages", []))
+            await run_in_chat_io_executor(
+                self._catalog_upsert_sync,
+                session_id,
+                fields,
+                stat.st_mtime,
+                _owner_from_chat_data(chat_data),
+            )
+        except Exception as e:
+            await self._invalidate_catalog(e)
+
+    async def _catalog_touch_session(
+        self, session_id: str, added_messages: int
+    ) -> None:
+        """Record appended messages in the catalog."""
+        if not self.redis_client:
+            return
+        try:
+            await run_in_chat_io_executor(
+                self._catalog_touch_sync, session_id, added_messages, time.time()
+            )
+        except Exception as e:
+            await self._invalidate_catalog(e)
+
+    async def catalog_assign_owner(self, owner: str, session_ids: List[str]) -> None:
+        """
+        Backfill the owner of catalogued sessions that have none recorded.
+
+        Sessions saved before ownership was stored in their metadata are
+        only known to SessionOwnershipValidator; this adds them to the
+        owner's index so owner listings include them.
+        """
+        if not self.redis_client or not owner or not session_ids:
+            return
+        try:
+            assigned = await run_in_chat_io_executor(
+                self._catalog_assign_owner_sync, owner, list(session_ids)
+            )
+            if assigned:
+                logger.info("Assigned %d legacy sessions to %s", assigned, owner)
+        except Exception as e:
+            await self._invalidate_catalog(e)
+
+    async def _catalog_remove_session(self, session_id: str) -> None:
+        """Remove a deleted session from the catalog."""
+        if not self.redis_client:
+            return
+        try:
+            await run_in_chat_io_executor(self._catalog_remove_sync, session_id)
+        except Exception as e:
+            await self._invalidate_catalog(e)
+
+    # ------------------------------------------------------------------
+    # Listing
+    # ------------------------------------------------------------------
+
+    def _catalog_entry_to_session(
+        self, session_id: str, fields: Dict[str, Any], score: float
+    ) -> Dict[str, Any]:
+        """Build a listing entry with the same shape as the directory scan."""
+        fields = {_decode(k): _decode(v) for k, v in fields.items()}
+        name = fields.get("name") or _generate_chat_name(session_id)
+        created = _iso_from_epoch(fields.get("created"))
+        last_modified = _iso_from_epoch(score)
+        return {
+            "id": session_id,
+            "chatId": session_id,
+            "title": name,
+            "name": name,
+            "messages": [],
+            "messageCount": int(fields.get("message_count") or 0),
+            "createdAt": created,
+            "createdTime": created,
+            "updatedAt": last_modified,
+            "lastModified": last_modified,
+            "isActive": False,
+            "fileSize": int(fields.get("file_size") or 0),
+            "fast_mode": True,
+            "owner": fields.get("owner") or None,
+        }
+
+    def _query_catalog_sync(
+        self, owner: Optional[str], offset: int, limit: Optional[int]
+    ) -> Optional[Dict[str, Any]]:
+        """Range query over the catalog; None if it is not ready."""
+        if not self.redis_client.exists(CATALOG_READY_KEY):
+            return None
+
+        index_key = f"{CATALOG_OWNER_PREFIX}{owner}" if owner else CATALOG_INDEX_KEY
+        stop = offset + limit - 1 if limit else -1
+        pipe = self.redis_client.pipeline()
+        pipe.zcard(index_key)
+        pipe.zrevrange(index_key, offset, stop, withscores=True)
+        total, members = pipe.execute()
+
+        session_ids = [_decode(member) for member, _ in members]
+        pipe = self.redis_client.pipeline()
+        for session_id in session_ids:
+            pipe.hgetall(f"{CATALOG_SESSION_PREFIX}{session_id}")
+        entries = pipe.execute()
+
+        sessions = [
+            self._catalog_entry_to_session(session_id, fields, score)
+            for session_id, fields, (_, score) in zip(session_ids, entries, members)
+            if fields
+        ]
+        return {"sessions": sessions, "total": int(total)}
+
+    async def list_sessions_page(
+        self,
+        owner: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        List sessions most recently modified first.
+
+        Served from the catalog when it is ready; otherwise scans the chats
+        directory once (rebuilding the catalog on the way when Redis is
+        available).
+
+        Args:
+            owner: Only return sessions owned by this username
+            offset: Number of sessions to skip
+            limit: Maximum number of sessions to return (None for all)
+
+        Returns:
+            Dict with "sessions" (page of listing entries) and "total"
+            (number of sessions matching the owner filter)
+        """
+        if self.redis_client:
+            try:
+                page = await run_in_chat_io_executor(
+                    self._query_catalog_sync, owner, offset, limit
+                )
+                if page is not None:
+                    return page
+                sessions = await self.rebuild_session_catalog()
+            except Exception as e:
+                logger.error("Session catalog query failed, scanning: %s", e)
+                sessions = await self._scan_sessions_fast()
+        else:
+            sessions = await self._scan_sessions_fast()
+
+        if owner:
+            sessions = [s for s in sessions if s.get("owner") == owner]
+        end = offset + limit if limit else None
+        return {"sessions": sessions[offset:end], "total": len(sessions)}
+
+    # ------------------------------------------------------------------
+    # Rebuild
+    # ------------------------------------------------------------------
+
+    def _reconcile_catalog_sync(
+        self, sessions: List[Dict[str, Any]], scan_started: float
+    ) -> int:
+        """Replace catalog contents with scanned sessions; returns stale count."""
+        scanned_ids = {s["id"] for s in sessions}
+        # Entries written after the scan started belong to sessions created
+        # concurrently and are kept even though the scan missed them.
+        indexed = self.redis_client.zrangebyscore(
+            CATALOG_INDEX_KEY, "-inf", scan_started
+        )
+        stale = [
+            session_id
+            for session_id in (_decode(m) for m in indexed)
+            if session_id not in scanned_ids
+        ]
+        for session_id in stale:
+            self._catalog_remove_sync(session_id)
+
+        legacy_owners = None
+        for session in sessions:
+            if not session.get("owner"):
+                if legacy_owners is None:
+                    legacy_owners = self._ownership_owners_sync()
+                session["owner"] = legacy_owners.get(session["id"])
+            score = datetime.fromisoformat(session["lastModified"]).timestamp()
+            created = datetime.fromisoformat(session["createdTime"]).timestamp()
+            self._catalog_upsert_sync(
+                session["id"],
+                {
+                    "name": session["name"],
+                    "message_count": session["messageCount"],
+                    "created": created,
+                    "file_size": session["fileSize"],
+                },
+                score,
+                session.get("owner") or "",
+            )
+        self.redis_client.set(CATALOG_READY_KEY, str(time.time()))
+        return len(stale)
+
+    async def rebuild_session_catalog(self) -> List[Dict[str, Any]]:
+        """
+        Reconcile the catalog with the chats directory.
+
+        Scans the directory (recovering orphaned terminal sessions), upserts
+        every session, removes entries whose files no longer exist and marks
+        the catalog ready. Sessions without an owner in their metadata get
+        the owner recorded by SessionOwnershipValidator, if any.
+
+        Returns:
+            Scanned session entries, most recently modified first
+        """
+        scan_started = time.time()
+        sessions = await self._scan_sessions_fast()
+        if not self.redis_client:
+            return sessions
+
+        stale = await run_in_chat_io_executor(
+            self._reconcile_catalog_sync, sessions, scan_started
+        )
+        logger.info(
+            "Rebuilt session catalog: %d sessions, %d stale entries removed",
+            len(sessions),
+            stale,
+        )
+        return sessions
@@ -0,0 +1,256 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Unit tests for the Redis session catalog (SessionCatalogMixin).
+
+Uses a minimal in-memory stand-in for the synchronous Redis client that
+implements only the commands the catalog issues.
+"""
+
+import os
+import threading
+
+import pytest
+from chat_history.deduplication import DeduplicationMixin
+from chat_history.file_io import FileIOMixin
+from chat_history.security import SecurityMixin
+from chat_history.session import SessionMixin
+from chat_history.session_catalog import CATALOG_READY_KEY, SessionCatalogMixin
+from chat_history.session_listing import SessionListingMixin
+from chat_history.session_log import SessionLogMixin
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._calls.append((name, args, kwargs))
+
+        return queue
+
+    def execute(self):
+        return [getattr(self._redis, n)(*a, **kw) for n, a, kw in self._calls]
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    def pipeline(self):
+        return _FakePipeline(self)
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value):
+        self.data[key] = value
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def delete(self, *keys):
+        return sum(1 for k in keys if self.data.pop(k, None) is not None)
+
+    def hget(self, key, field):
+        return self.data.get(key, {}).get(field)
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def hset(self, key, mapping):
+        self.data.setdefault(key, {}).update({k: str(v) for k, v in mapping.items()})
+
+    def hsetnx(self, key, field, value):
+        self.data.setdefault(key, {}).setdefault(field, str(value))
+
+    def hincrby(self, key, field, amount):
+        entry = self.data.setdefault(key, {})
+        entry[field] = str(int(entry.get(field, 0)) + amount)
+
+    def zadd(self, key, mapping):
+        self.data.setdefault(key, {}).update(mapping)
+
+    def zrem(self, key, member):
+        self.data.get(key, {}).pop(member, None)
+
+    def zcard(self, key):
+        return len(self.data.get(key, {}))
+
+    def zrevrange(self, key, start, stop, withscores=False):
+        items = sorted(self.data.get(key, {}).items(), key=lambda i: -i[1])
+        items = items[start:] if stop == -1 else items[start : stop + 1]
+        return items if withscores else [m for m, _ in items]
+
+    def zrangebyscore(self, key, low, high):
+        return [m for m, s in self.data.get(key, {}).items() if s <= float(high)]
+
+    def zscore(self, key, member):
+        return self.data.get(key, {}).get(member)
+
+    def smembers(self, key):
+        return set(self.data.get(key, ()))
+
+    def scan_iter(self, match, count=None):
+        prefix = match.rstrip("*")
+        return [k for k in list(self.data) if k.startswith(prefix)]
+
+
+class _Manager(
+    SecurityMixin,
+    FileIOMixin,
+    DeduplicationMixin,
+    SessionMixin,
+    SessionLogMixin,
+    SessionCatalogMixin,
+    SessionListingMixin,
+):
+    def __init__(self, chats_dir, redis_client):
+        self._chats_dir = str(chats_dir)
+        self.redis_client = redis_client
+        self.encryption_enabled = False
+        self.max_messages = 10000
+        self._counter_lock = threading.Lock()
+        self._session_save_counter = 0
+        self.memory_graph = None
+        self.memory_graph_enabled = False
+        self._session_log_states = {}
+        self._session_log_locks = {}
+
+    def _get_chats_directory(self):
+        return self._chats_dir
+
+    async def _cleanup_old_session_files(self):
+        return None
+
+    async def _async_cache_session(self, key, chat_data):
+        return None
+
+    async def _init_memory_graph(self):
+        return None
+
+
+def _msg(i):
+    return {"id": f"m{i}", "sender": "user", "text": f"message {i}"}
+
+
+@pytest.fixture
+def redis():
+    return _FakeRedis()
+
+
+@pytest.fixture
+def manager(tmp_path, redis):
+    return _Manager(tmp_path, redis)
+
+
+async def _create(manager, session_id, owner=None):
+    metadata = {"owner": owner} if owner else {}
+    await manager.create_session(session_id=session_id, metadata=metadata)
+
+
+@pytest.mark.asyncio
+async def test_first_listing_rebuilds_then_serves_from_catalog(manager, tmp_path):
+    await manager.save_session("s1", messages=[_msg(0)], name="One")
+    assert not manager.redis_client.exists(CATALOG_READY_KEY)
+
+    sessions = await manager.list_sessions_fast()
+    assert [s["id"] for s in sessions] == ["s1"]
+    assert manager.redis_client.exists(CATALOG_READY_KEY)
+
+    # Served from the catalog: files are no longer consulted
+    (tmp_path / "s1_chat.json").unlink()
+    sessions = await manager.list_sessions_fast()
+    assert [s["name"] for s in sessions] == ["One"]
+    assert sessions[0]["messageCount"] == 1
+
+
+@pytest.mark.asyncio
+async def test_catalog_tracks_append_rename_delete(manager):
+    await manager.list_sessions_fast()  # mark catalog ready
+    await manager.save_session("s1", messages=[_msg(0)], name="One")
+    await manager.append_session_messages("s1", [_msg(1), _msg(2)])
+    await manager.update_session_name("s1", "Renamed")
+
+    (entry,) = await manager.list_sessions_fast()
+    assert entry["name"] == "Renamed"
+    assert entry["messageCount"] == 3
+
+    await manager.delete_session("s1")
+    assert await manager.list_sessions_fast() == []
+
+
+@pytest.mark.asyncio
+async def test_pagination_and_owner_filter(manager, redis):
+    await manager.list_sessions_fast()
+    for i, owner in enumerate(["alice", "bob", "alice", "alice"]):
+        await _create(manager, f"s{i}", owner)
+        # Deterministic recency order: s3 newest
+        redis.data["chat:catalog:index"][f"s{i}"] = float(i)
+        redis.data[f"chat:catalog:owner:{owner}"][f"s{i}"] = float(i)
+
+    page = await manager.list_sessions_page(owner="alice", offset=1, limit=1)
+    assert page["total"] == 3
+    assert [s["id"] for s in page["sessions"]] == ["s2"]
+
+    page = await manager.list_sessions_page(offset=0, limit=2)
+    assert page["total"] == 4
+    assert [s["id"] for s in page["sessions"]] == ["s3", "s2"]
+
+
+@pytest.mark.asyncio
+async def test_rebuild_removes_stale_entries(manager, redis):
+    await manager.save_session("s1", messages=[], name="One")
+    await manager.save_session("gone", messages=[], name="Gone")
+    await manager.rebuild_session_catalog()
+
+    # File removed behind the catalog's back, with an old catalog score
+    os.remove(os.path.join(manager._chats_dir, "gone_chat.json"))
+    redis.data["chat:catalog:index"]["gone"] = 0.0
+
+    await manager.rebuild_session_catalog()
+    assert [s["id"] for s in await manager.list_sessions_fast()] == ["s1"]
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_scan_without_redis(tmp_path):
+    manager = _Manager(tmp_path, None)
+    await _create(manager, "s1", "alice")
+    await _create(manager, "s2", "bob")
+
+    page = await manager.list_sessions_page(owner="bob")
+    assert [s["id"] for s in page["sessions"]] == ["s2"]
+    assert page["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_rebuild_takes_owner_from_ownership_sets(manager, redis):
+    await _create(manager, "legacy")
+    await _create(manager, "mine", "bob")
+    redis.data["user_chat_sessions:alice"] = {"legacy"}
+
+    await manager.rebuild_session_catalog()
+
+    page = await manager.list_sessions_page(owner="alice")
+    assert [s["id"] for s in page["sessions"]] == ["legacy"]
+    assert page["sessions"][0]["owner"] == "alice"
+
+
+@pytest.mark.asyncio
+async def test_assign_owner_backfills_only_unowned_sessions(manager):
+    await _create(manager, "legacy")
+    await _create(manager, "bobs", "bob")
+    await manager.rebuild_session_catalog()
+    assert (await manager.list_sessions_page(owner="alice"))["total"] == 0
+
+    await manager.catalog_assign_owner("alice", ["legacy", "bobs", "unknown"])
+
+    page = await manager.list_sessions_page(owner="alice")
+    assert [s["id"] for s in page["sessions"]] == ["legacy"]
+    assert (await manager.list_sessions_page(owner="bob"))["total"] == 1
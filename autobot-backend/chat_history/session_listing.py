@@ -6,7 +6,8 @@ Chat History Session Listing Mixin - Session listing operations.
 
 Provides session listing functionality:
 - Full session listing with metadata
-- Fast session listing using file metadata only
+- Fast session listing (session catalog, falling back to a directory scan
+  using file metadata only)
 - Orphaned terminal file detection and recovery
 
 Issue #718: Uses dedicated thread pool for file I/O to prevent blocking
@@ -65,6 +66,7 @@ class SessionListingMixin:
     - self._get_chats_directory(): method
     - self._decrypt_data(): method
     - self._cleanup_old_session_files(): method
+    - self.list_sessions_page(): method (SessionCatalogMixin)
     """
 
     async def _ensure_chats_directory_exists(self, chats_directory: str) -> bool:
@@ -142,14 +144,16 @@ class SessionListingMixin:
             logger.error("Error listing chat sessions: %s", str(e))
             return []
 
-    async def _read_chat_file_metadata(self, chat_path: str) -> tuple[str | None, int]:
-        """Read chat name and message count from file (Issue #315: extracted).
+    async def _read_chat_file_metadata(
+        self, chat_path: str
+    ) -> tuple[str | None, int, str | None]:
+        """Read chat name, message count and owner from file (Issue #315).
 
         Args:
             chat_path: Path to chat JSON file
 
         Returns:
-            Tuple of (chat_name or None, message_count)
+            Tuple of (chat_name or None, message_count, owner or None)
         """
         try:
             async with aiofiles.open(chat_path, "r", encoding="utf-8") as f:
@@ -158,10 +162,12 @@ class SessionListingMixin:
                 chat_name = chat_data.get("name", "").strip() or None
                 messages = chat_data.get("messages", [])
                 message_count = len(messages) if isinstance(messages, list) else 0
-                return chat_name, message_count
+                metadata = chat_data.get("metadata") or {}
+                owner = metadata.get("owner") or metadata.get("username")
+                return chat_name, message_count, owner
         except Exception as read_err:
             logger.debug("Could not read chat file content: %s", read_err)
-            return None, 0
+            return None, 0, None
 
     async def _build_session_entry(
         self, chat_id: str, chat_path: str, filename: str
@@ -182,7 +188,9 @@ class SessionListingMixin:
             last_modified = datetime.fromtimestamp(stat.st_mtime).isoformat()
             file_size = stat.st_size
 
-            chat_name, message_count = await self._read_chat_file_metadata(chat_path)
+            chat_name, message_count, owner = await self._read_chat_file_metadata(
+                chat_path
+            )
             if not chat_name:
                 chat_name = _generate_chat_name(chat_id)
 
@@ -200,13 +208,36 @@ class SessionListingMixin:
                 "isActive": False,
                 "fileSize": file_size,
                 "fast_mode": True,
+                "owner": owner,
             }
         except Exception as e:
             logger.error("Error reading file stats for %s: %s", filename, str(e))
             return None
 
-    async def list_sessions_fast(self) -> List[Dict[str, Any]]:
-        """Fast listing of chat sessions using file metadata only (no decryption).
+    async def list_sessions_fast(
+        self,
+        owner: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> List[Dict[str, Any]]:
+        """Fast listing of chat sessions, most recently modified first.
+
+        Served from the session catalog (no file access); see
+        list_sessions_page() for the total count alongside a page.
+
+        Args:
+            owner: Only return sessions owned by this username
+            offset: Number of sessions to skip
+            limit: Maximum number of sessions to return (None for all)
+        """
+        page = await self.list_sessions_page(owner=owner, offset=offset, limit=limit)
+        return page["sessions"]
+
+    async def _scan_sessions_fast(self) -> List[Dict[str, Any]]:
+        """Directory scan using file metadata only (no decryption).
+
+        Recovers orphaned terminal sessions on the way. Used to (re)build
+        the session catalog and when Redis is unavailable.
 
         Issue #315: Refactored to use helper methods for reduced nesting.
         """
@@ -315,6 +346,7 @@ class SessionListingMixin:
             "isActive": False,
             "fileSize": stat.st_size,
             "fast_mode": True,
+            "owner": None,
             "auto_created": True,
         }
 
@@ -0,0 +1,538 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Chat History Session Log Mixin - Append-only per-session message log.
+
+Storage layout per session (chats directory):
+- {session_id}_chat.json: snapshot (session metadata + messages up to log_seq)
+- {session_id}_chat.log:  append-only JSON-lines message log
+- {session_id}_chat.lock: flock target serializing writers across processes
+
+The first log line is a plaintext header::
+
+    {"t": "base", "seq": S, "count": N, "salt": "<b64>" | null}
+
+where S is the sequence number of the last snapshot message and N the number
+of snapshot messages (so snapshot message i has seq S - N + 1 + i). Every
+following line is one message record ``{"seq": n, "m": {...}}``, stored as
+compact JSON or, when encryption is enabled, as a RecordCipher token keyed by
+the header salt.
+
+Appending costs O(new messages). Appends and compaction hold an asyncio lock
+per session within a worker and an exclusive flock on the sidecar lock file
+across workers. The cached write position is checked
+against the log file's inode and size before each append, so a log grown or
+replaced by another worker is re-read instead of appended to with stale
+sequence numbers. Once the log holds
+SESSION_LOG_COMPACT_THRESHOLD new records the session is compacted: the
+snapshot is rewritten and the log restarts with the newest
+SESSION_LOG_TAIL_RETAIN snapshot messages copied in, so tail reads are
+always served from the (bounded) log without parsing the snapshot.
+"""
+
+import asyncio
+import base64
+import contextlib
+import fcntl
+import json
+import logging
+import os
+import secrets
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import aiofiles
+from chat_history.file_io import run_in_chat_io_executor
+from encryption_service import RecordCipher, get_encryption_service
+
+logger = logging.getLogger(__name__)
+
+# New records before the snapshot is rewritten
+SESSION_LOG_COMPACT_THRESHOLD = 256
+
+# Newest snapshot messages copied into a fresh log for tail reads
+SESSION_LOG_TAIL_RETAIN = 100
+
+# Retry interval while another process holds a session's lock file
+_SESSION_FILE_LOCK_POLL_SECONDS = 0.01
+
+# (seq, message) pairs as stored in the log
+LogRecords = List[Tuple[int, Dict[str, Any]]]
+
+
+@dataclass
+class SessionLogState:
+    """In-memory view of a session log header and its write position."""
+
+    base_seq: int
+    base_count: int
+    last_seq: int
+    salt: Optional[bytes] = None
+    # Log file identity when this state was last in sync with it
+    file_ino: int = 0
+    file_size: int = 0
+
+    @property
+    def first_seq(self) -> int:
+        """Sequence number of the oldest message in the session."""
+        return self.base_seq - self.base_count + 1
+
+    @property
+    def total_count(self) -> int:
+        """Number of messages in the session (snapshot + appended)."""
+        return self.base_count + (self.last_seq - self.base_seq)
+
+
+class SessionLogMixin:
+    """
+    Mixin providing append-only message logs for chat sessions.
+
+    Requires base class to have:
+    - self.encryption_enabled: bool
+    - self.redis_client: Redis client or None
+    - self._session_log_states: Dict[str, SessionLogState]
+    - self._session_log_locks: Dict[str, list] (lock and user count)
+    - self._get_chats_directory(): method
+    - self._atomic_write(): method
+    - self._decrypt_data(): method
+    - self._load_session_from_file(): method
+    - self._process_loaded_messages(): method
+    - self._dedupe_streaming_messages(): method (DeduplicationMixin)
+    - self._save_session_locked(): method
+    - self._catalog_touch_session(): method (SessionCatalogMixin)
+    - self.load_session(): method
+    """
+
+    def _session_log_path(self, session_id: str) -> str:
+        """Return the path of a session's append-only log."""
+        return f"{self._get_chats_directory()}/{session_id}_chat.log"
+
+    def _session_lock_path(self, session_id: str) -> str:
+        """Return the path of a session's cross-process lock file."""
+        return f"{self._get_chats_directory()}/{session_id}_chat.lock"
+
+    @staticmethod
+    def _try_flock(fd: int) -> bool:
+        """Take an exclusive flock without blocking; False if held elsewhere."""
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+
+    @contextlib.asynccontextmanager
+    async def _session_file_lock(self, session_id: str) -> AsyncIterator[None]:
+        """
+        Hold an exclusive flock on the session's lock file.
+
+        Excludes writers in other worker processes. The lock is polled
+        rather than waited on so a contended session does not pin a chat
+        I/O thread; closing the descriptor releases it.
+        """
+        fd = await run_in_chat_io_executor(
+            os.open, self._session_lock_path(session_id), os.O_RDWR | os.O_CREAT, 0o600
+        )
+        try:
+            while not self._try_flock(fd):
+                await asyncio.sleep(_SESSION_FILE_LOCK_POLL_SECONDS)
+            yield
+        finally:
+            os.close(fd)
+
+    @contextlib.asynccontextmanager
+    async def _session_log_lock(self, session_id: str) -> AsyncIterator[None]:
+        """
+        Hold the per-session lock serializing log appends and compaction.
+
+        Callers in this process queue on an asyncio.Lock, which is dropped
+        from _session_log_locks once no caller holds or waits for it, so the
+        dict only tracks sessions being written. The holder then takes the
+        session's file lock to exclude other worker processes.
+        """
+        entry = self._session_log_locks.get(session_id)
+        if entry is None:
+            entry = self._session_log_locks[session_id] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                async with self._session_file_lock(session_id):
+                    yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0 and self._session_log_locks.get(session_id) is entry:
+                del self._session_log_locks[session_id]
+
+    def _new_log_salt(self) -> Optional[bytes]:
+        """Return a fresh record-cipher salt, or None when not encrypting."""
+        if not self.encryption_enabled:
+            return None
+        try:
+            get_encryption_service()
+        except Exception as e:
+            logger.warning("Session log encryption unavailable, storing plain: %s", e)
+            return None
+        return secrets.token_bytes(16)
+
+    async def _get_log_cipher(self, salt: Optional[bytes]) -> Optional[RecordCipher]:
+        """
+        Return the record cipher for a log salt (None when not encrypting).
+
+        The first lookup of a salt derives its key with PBKDF2, so it runs in
+        the chat I/O executor rather than on the event loop.
+        """
+        if salt is None:
+            return None
+        return await run_in_chat_io_executor(
+            get_encryption_service().get_record_cipher, salt
+        )
+
+    def _encode_log_record(
+        self, record: Dict[str, Any], cipher: Optional[RecordCipher]
+    ) -> str:
+        """Serialize one record to a single log line (encrypted with cipher)."""
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        if cipher is None:
+            return line
+        return cipher.encrypt(line)
+
+    def _decode_log_line(self, line: str, salt: Optional[bytes]) -> Dict[str, Any]:
+        """Parse one log line (plain JSON lines start with '{')."""
+        if line.startswith("{"):
+            return json.loads(line)
+        if salt is None:
+            raise ValueError("Encrypted session log record without header salt")
+        return json.loads(
+            get_encryption_service().get_record_cipher(salt).decrypt(line)
+        )
+
+    def _parse_session_log(
+        self, content: str
+    ) -> Optional[Tuple[SessionLogState, LogRecords]]:
+        """
+        Parse log file content into its header state and message records.
+
+        A torn final line (crash mid-append) is skipped with a warning.
+        """
+        lines = content.splitlines()
+        if not lines:
+            return None
+        header = json.loads(lines[0])
+        if header.get("t") != "base":
+            raise ValueError("Session log is missing its base header")
+
+        salt = base64.b64decode(header["salt"]) if header.get("salt") else None
+        state = SessionLogState(
+            base_seq=int(header["seq"]),
+            base_count=int(header["count"]),
+            last_seq=int(header["seq"]),
+            salt=salt,
+        )
+        records: LogRecords = []
+        for line in lines[1:]:
+            if not line:
+                continue
+            try:
+                record = self._decode_log_line(line, salt)
+            except Exception as e:
+                logger.warning("Skipping unreadable session log record: %s", e)
+                continue
+            seq = int(record["seq"])
+            records.append((seq, record["m"]))
+            state.last_seq = max(state.last_seq, seq)
+        return state, records
+
+    async def _read_session_log(
+        self, session_id: str
+    ) -> Optional[Tuple[SessionLogState, LogRecords]]:
+        """Read and parse a session log; None if the session has no log yet."""
+        log_path = self._session_log_path(session_id)
+        if not await run_in_chat_io_executor(os.path.exists, log_path):
+            return None
+        async with aiofiles.open(log_path, "rb") as f:
+            data = await f.read()
+            file_ino = os.fstat(f.fileno()).st_ino
+        parsed = await run_in_chat_io_executor(
+            self._parse_session_log, data.decode("utf-8")
+        )
+        if parsed is not None:
+            parsed[0].file_ino = file_ino
+            parsed[0].file_size = len(data)
+        return parsed
+
+    async def _session_log_changed(
+        self, session_id: str, state: SessionLogState
+    ) -> bool:
+        """
+        Check whether the log file moved on since state was last in sync.
+
+        Another worker appending grows the file; another worker compacting
+        replaces it (new inode). Either way the cached state is stale.
+        """
+        try:
+            stat = await run_in_chat_io_executor(
+                os.stat, self._session_log_path(session_id)
+            )
+        except OSError:
+            return True
+        return stat.st_ino != state.file_ino or stat.st_size != state.file_size
+
+    async def _peek_session_log_state(
+        self, session_id: str
+    ) -> Optional[SessionLogState]:
+        """Return the cached log state, reading the log header if needed."""
+        state = self._session_log_states.get(session_id)
+        if state is not None:
+            return state
+        parsed = await self._read_session_log(session_id)
+        if parsed is None:
+            return None
+        self._session_log_states[session_id] = parsed[0]
+        return parsed[0]
+
+    async def _write_session_log(
+        self,
+        session_id: str,
+        messages: List[Dict[str, Any]],
+        log_seq: int,
+    ) -> SessionLogState:
+        """
+        Start a fresh log after a snapshot write.
+
+        The log header records the snapshot position; the newest snapshot
+        messages are copied in so tail reads never need the snapshot.
+        """
+        salt = self._new_log_salt()
+        cipher = await self._get_log_cipher(salt)
+        header = {
+            "t": "base",
+            "seq": log_seq,
+            "count": len(messages),
+            "salt": base64.b64encode(salt).decode("ascii") if salt else None,
+        }
+        retained = messages[-SESSION_LOG_TAIL_RETAIN:] if messages else []
+        first_retained_seq = log_seq - len(retained) + 1
+        lines = [json.dumps(header)]
+        lines.extend(
+            self._encode_log_record({"seq": first_retained_seq + i, "m": msg}, cipher)
+            for i, msg in enumerate(retained)
+        )
+        log_path = self._session_log_path(session_id)
+        await self._atomic_write(log_path, "\n".join(lines) + "\n")
+        stat = await run_in_chat_io_executor(os.stat, log_path)
+
+        state = SessionLogState(
+            base_seq=log_seq,
+            base_count=len(messages),
+            last_seq=log_seq,
+            salt=salt,
+            file_ino=stat.st_ino,
+            file_size=stat.st_size,
+        )
+        self._session_log_states[session_id] = state
+        return state
+
+    async def _snapshot_is_ahead_of_log(
+        self, session_id: str, state: SessionLogState
+    ) -> bool:
+        """
+        Detect a snapshot written after the log (crash between the two writes).
+
+        The snapshot is only parsed when its mtime is newer than the log's.
+        """
+        chat_file = f"{self._get_chats_directory()}/{session_id}_chat.json"
+        try:
+            snapshot_mtime = await run_in_chat_io_executor(os.path.getmtime, chat_file)
+            log_mtime = await run_in_chat_io_executor(
+                os.path.getmtime, self._session_log_path(session_id)
+            )
+        except OSError:
+            return False
+        if snapshot_mtime <= log_mtime:
+            return False
+        async with aiofiles.open(chat_file, "r", encoding="utf-8") as f:
+            chat_data = self._decrypt_data(await f.read())
+        return int(chat_data.get("log_seq", 0)) > state.last_seq
+
+    async def _ensure_session_log(self, session_id: str) -> SessionLogState:
+        """
+        Return a writable log state for a session (caller holds the lock).
+
+        Legacy sessions (snapshot only), logs written before encryption was
+        enabled, and logs behind their snapshot are compacted first. A cached
+        state is only reused while the log file is unchanged since it was
+        last read or written by this worker.
+        """
+        state = self._session_log_states.get(session_id)
+        if state is not None:
+            if not await self._session_log_changed(session_id, state):
+                return state
+            self._session_log_states.pop(session_id, None)
+
+        state = await self._peek_session_log_state(session_id)
+        needs_compaction = (
+            state is None
+            or (self.encryption_enabled and state.salt is None)
+            or await self._snapshot_is_ahead_of_log(session_id, state)
+        )
+        if needs_compaction:
+            await self._compact_session_locked(session_id)
+            state = self._session_log_states[session_id]
+        return state
+
+    async def _compact_session_locked(self, session_id: str) -> None:
+        """Rewrite snapshot + log from the current full message list."""
+        chat_data = await self._load_session_from_file(session_id)
+        messages = chat_data.get("messages", []) if chat_data else []
+        await self._save_session_locked(session_id, messages=messages)
+        logger.debug("Compacted session %s (%d messages)", session_id, len(messages))
+
+    async def _invalidate_session_cache_on_append(self, session_id: str) -> None:
+        """Drop the cached full session and bump recency after an append."""
+        if not self.redis_client:
+            return
+        try:
+            await run_in_chat_io_executor(
+                self.redis_client.delete, f"chat:session:{session_id}"
+            )
+            await run_in_chat_io_executor(
+                self.redis_client.zadd,
+                "chat:recent",
+                {session_id: time.time()},
+            )
+        except Exception as e:
+            logger.error("Failed to refresh Redis cache after append: %s", e)
+
+    async def append_session_messages(
+        self, session_id: str, messages: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        Append messages to a session's log in O(len(messages)).
+
+        Args:
+            session_id: The session identifier.
+            messages: Message dictionaries to append.
+
+        Returns:
+            True if the messages were persisted, False otherwise.
+        """
+        if not messages:
+            return True
+        try:
+            async with self._session_log_lock(session_id):
+                state = await self._ensure_session_log(session_id)
+                cipher = await self._get_log_cipher(state.salt)
+                lines = []
+                next_seq = state.last_seq
+                for message in messages:
+                    next_seq += 1
+                    lines.append(
+                        self._encode_log_record({"seq": next_seq, "m": message}, cipher)
+                    )
+                data = ("\n".join(lines) + "\n").encode("utf-8")
+                async with aiofiles.open(self._session_log_path(session_id), "ab") as f:
+                    await f.write(data)
+                state.last_seq = next_seq
+                state.file_size += len(data)
+                await self._catalog_touch_session(session_id, len(messages))
+
+                if state.last_seq - state.base_seq >= SESSION_LOG_COMPACT_THRESHOLD:
+                    await self._compact_session_locked(session_id)
+
+            await self._invalidate_session_cache_on_append(session_id)
+            return True
+        except Exception as e:
+            # Position is unknown after a failed write; re-read on next append
+            self._session_log_states.pop(session_id, None)
+            logger.error("Error appending to session %s: %s", session_id, e)
+            return False
+
+    async def _merge_session_log(
+        self, session_id: str, chat_data: Dict[str, Any]
+    ) -> Optional[SessionLogState]:
+        """
+        Append log records newer than the snapshot to chat_data["messages"].
+
+        Returns the log state, or None when the session has no log.
+        """
+        parsed = await self._read_session_log(session_id)
+        if parsed is None:
+            return None
+        state, records = parsed
+        snapshot_seq = int(chat_data.get("log_seq", state.base_seq))
+        newer = [msg for seq, msg in records if seq > snapshot_seq]
+        if newer:
+            chat_data["messages"] = list(chat_data.get("messages", [])) + newer
+        return state
+
+    async def load_session_tail(
+        self,
+        session_id: str,
+        limit: int = 50,
+        before_seq: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Page backwards through a session from its newest message.
+
+        Reads only the bounded log when the requested page is covered by it
+        (always true for the first page of up to SESSION_LOG_TAIL_RETAIN
+        messages); older pages fall back to the snapshot. A page containing
+        duplicate streaming messages triggers the same cleanup as a full
+        load_session(), after which the page is read again.
+
+        Args:
+            session_id: The session identifier.
+            limit: Maximum number of messages to return.
+            before_seq: Cursor from a previous page (exclusive upper bound).
+
+        Returns:
+            Dict with "messages" (oldest first), "total_count" and
+            "next_before_seq" (None when the start of the session is reached).
+        """
+        tail = await self._read_session_tail(session_id, limit, before_seq)
+        page = tail["messages"]
+        if len(self._dedupe_streaming_messages(page)) == len(page):
+            return tail
+
+        chat_data = await self._load_session_from_file(session_id)
+        if chat_data is not None:
+            await self._process_loaded_messages(session_id, chat_data)
+        tail = await self._read_session_tail(session_id, limit, before_seq)
+        tail["messages"] = self._dedupe_streaming_messages(tail["messages"])
+        return tail
+
+    async def _read_session_tail(
+        self, session_id: str, limit: int, before_seq: Optional[int]
+    ) -> Dict[str, Any]:
+        """Read one tail page as stored, without deduplication."""
+        parsed = await self._read_session_log(session_id)
+        if parsed is None:
+            # Legacy session without a log: slice the full message list
+            messages = await self.load_session(session_id)
+            end = len(messages) if before_seq is None else max(0, before_seq - 1)
+            start = max(0, end - limit)
+            return {
+                "messages": messages[start:end],
+                "total_count": len(messages),
+                "next_before_seq": start + 1 if start > 0 else None,
+            }
+
+        state, records = parsed
+        upper = state.last_seq + 1 if before_seq is None else before_seq
+        lower = max(state.first_seq, upper - limit)
+        by_seq = dict(records)
+
+        if all(seq in by_seq for seq in range(lower, upper)):
+            page = [by_seq[seq] for seq in range(lower, upper)]
+        else:
+            chat_data = await self._load_session_from_file(session_id) or {}
+            all_messages = chat_data.get("messages", [])
+            offset = state.last_seq - len(all_messages) + 1
+            page = all_messages[max(0, lower - offset) : max(0, upper - offset)]
+
+        return {
+            "messages": page,
+            "total_count": state.total_count,
+            "next_before_seq": lower if lower > state.first_seq else None,
+        }
@@ -0,0 +1,196 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Unit tests for the append-only session log (SessionLogMixin).
+
+Composes the file-backed session mixins over a temporary chats directory
+with Redis and the Memory Graph disabled.
+"""
+
+import asyncio
+import os
+import threading
+
+import pytest
+from chat_history import session_log
+from chat_history.deduplication import DeduplicationMixin
+from chat_history.file_io import FileIOMixin
+from chat_history.security import SecurityMixin
+from chat_history.session import SessionMixin
+from chat_history.session_catalog import SessionCatalogMixin
+from chat_history.session_log import SessionLogMixin
+
+
+class _Manager(
+    SecurityMixin,
+    FileIOMixin,
+    DeduplicationMixin,
+    SessionMixin,
+    SessionLogMixin,
+    SessionCatalogMixin,
+):
+    def __init__(self, chats_dir):
+        self._chats_dir = str(chats_dir)
+        self.redis_client = None
+        self.encryption_enabled = False
+        self.max_messages = 10000
+        self._counter_lock = threading.Lock()
+        self._session_save_counter = 0
+        self.memory_graph = None
+        self.memory_graph_enabled = False
+        self._session_log_states = {}
+        self._session_log_locks = {}
+
+    def _get_chats_directory(self):
+        return self._chats_dir
+
+    async def _cleanup_old_session_files(self):
+        return None
+
+
+def _msg(i):
+    return {"id": f"m{i}", "sender": "user", "text": f"message {i}"}
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return _Manager(tmp_path)
+
+
+@pytest.mark.asyncio
+async def test_append_does_not_rewrite_snapshot(manager, tmp_path):
+    await manager.save_session("s1", messages=[_msg(0)], name="Test")
+    snapshot = tmp_path / "s1_chat.json"
+    before = snapshot.read_bytes()
+
+    assert await manager.append_session_messages("s1", [_msg(1), _msg(2)])
+
+    assert snapshot.read_bytes() == before
+    messages = await manager.load_session("s1")
+    assert [m["id"] for m in messages] == ["m0", "m1", "m2"]
+
+
+@pytest.mark.asyncio
+async def test_legacy_snapshot_is_migrated_on_first_append(manager, tmp_path):
+    await manager._write_session_to_storage(
+        str(tmp_path / "s1_chat.json"),
+        {"chatId": "s1", "name": "Old", "messages": [_msg(0)]},
+    )
+
+    assert await manager.append_session_messages("s1", [_msg(1)])
+
+    assert os.path.exists(tmp_path / "s1_chat.log")
+    assert [m["id"] for m in await manager.load_session("s1")] == ["m0", "m1"]
+
+
+@pytest.mark.asyncio
+async def test_compaction_keeps_all_messages(manager, monkeypatch, tmp_path):
+    monkeypatch.setattr(session_log, "SESSION_LOG_COMPACT_THRESHOLD", 5)
+    monkeypatch.setattr(session_log, "SESSION_LOG_TAIL_RETAIN", 3)
+
+    for i in range(12):
+        assert await manager.append_session_messages("s1", [_msg(i)])
+
+    log_lines = (tmp_path / "s1_chat.log").read_text().splitlines()
+    assert len(log_lines) < 1 + 3 + 5  # header + retained + pending
+    assert [m["id"] for m in await manager.load_session("s1")] == [
+        f"m{i}" for i in range(12)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_tail_pagination(manager, monkeypatch):
+    monkeypatch.setattr(session_log, "SESSION_LOG_COMPACT_THRESHOLD", 4)
+    monkeypatch.setattr(session_log, "SESSION_LOG_TAIL_RETAIN", 2)
+    await manager.append_session_messages("s1", [_msg(i) for i in range(10)])
+
+    seen = []
+    before = None
+    while True:
+        page = await manager.load_session_tail("s1", limit=3, before_seq=before)
+        assert page["total_count"] == 10
+        seen = [m["id"] for m in page["messages"]] + seen
+        before = page["next_before_seq"]
+        if before is None:
+            break
+
+    assert seen == [f"m{i}" for i in range(10)]
+
+
+@pytest.mark.asyncio
+async def test_delete_removes_log(manager, tmp_path):
+    await manager.append_session_messages("s1", [_msg(0)])
+    assert await manager.delete_session("s1")
+    assert not os.path.exists(tmp_path / "s1_chat.log")
+    assert not os.path.exists(tmp_path / "s1_chat.lock")
+
+
+@pytest.mark.asyncio
+async def test_records_encrypted_per_line(manager, monkeypatch, tmp_path):
+    import encryption_service
+
+    monkeypatch.setattr(
+        encryption_service,
+        "_encryption_service",
+        encryption_service.EncryptionService("k" * 32),
+    )
+    manager.encryption_enabled = True
+
+    await manager.append_session_messages("s1", [_msg(0), _msg(1)])
+
+    lines = (tmp_path / "s1_chat.log").read_text().splitlines()
+    assert all("message" not in line for line in lines[1:])
+    assert [m["id"] for m in await manager.load_session("s1")] == ["m0", "m1"]
+
+
+@pytest.mark.asyncio
+async def test_stale_state_after_other_worker_compacts(tmp_path):
+    worker_a = _Manager(tmp_path)
+    worker_b = _Manager(tmp_path)
+    await worker_a.append_session_messages("s1", [_msg(0)])
+
+    # Worker B appends and rewrites the session behind worker A's back
+    await worker_b.append_session_messages("s1", [_msg(1)])
+    await worker_b.save_session("s1", messages=await worker_b.load_session("s1"))
+
+    assert await worker_a.append_session_messages("s1", [_msg(2)])
+    assert [m["id"] for m in await worker_b.load_session("s1")] == [
+        "m0",
+        "m1",
+        "m2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_tail_dedupes_like_full_load(manager):
+    duplicate = {"id": "d", "sender": "user", "text": "same", "timestamp": "t1"}
+    await manager.append_session_messages(
+        "s1", [_msg(0), duplicate, {**duplicate, "id": "d2"}]
+    )
+
+    page = await manager.load_session_tail("s1", limit=10)
+
+    assert [m["id"] for m in page["messages"]] == ["m0", "d"]
+    assert page["total_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_log_locks_are_not_retained(manager):
+    for i in range(3):
+        await manager.append_session_messages(f"s{i}", [_msg(i)])
+    assert manager._session_log_locks == {}
+
+
+@pytest.mark.asyncio
+async def test_log_lock_excludes_other_workers(tmp_path):
+    worker_a = _Manager(tmp_path)
+    worker_b = _Manager(tmp_path)
+
+    async with worker_a._session_log_lock("s1"):
+        append = asyncio.create_task(worker_b.append_session_messages("s1", [_msg(0)]))
+        await asyncio.sleep(0.1)
+        assert not append.done()
+
+    assert await append
+    assert os.path.exists(tmp_path / "s1_chat.lock")
@@ -195,6 +195,7 @@ async def prepare_llm(state: ChatState, config: dict) -> dict:
             "selected_model": ctx.selected_model,
             "system_prompt": ctx.system_prompt,
             "initial_prompt": ctx.initial_prompt,
+            "chat_messages": ctx.chat_messages,
         },
         "used_knowledge": ctx.used_knowledge,
         "rag_citations": [c for c in (ctx.rag_citations or [])],
@@ -214,15 +215,21 @@ def _build_llm_iteration_context(state: ChatState):
     from .models import LLMIterationContext
 
     initial_prompt = state["llm_params"].get("initial_prompt") or ""
+    chat_messages = state["llm_params"].get("chat_messages")
 
     # Inject RLM refinement hint when looping back (#1373)
     hint = state.get("rlm_refinement_hint", "")
     if hint:
-        initial_prompt = (
-            f"{initial_prompt}\n\n"
-            f"[Self-reflection feedback — please improve your answer: "
-            f"{hint}]"
+        hint_text = (
+            f"\n\n[Self-reflection feedback — please improve your answer: {hint}]"
         )
+        initial_prompt = f"{initial_prompt}{hint_text}"
+        if chat_messages:
+            # Hint goes on the volatile tail so the cached prefix is untouched
+            last = chat_messages[-1]
+            chat_messages = chat_messages[:-1] + [
+                {**last, "content": last["content"] + hint_text}
+            ]
 
     return LLMIterationContext(
         ollama_endpoint=state["llm_params"]["ollama_endpoint"],
@@ -236,6 +243,7 @@ def _build_llm_iteration_context(state: ChatState):
         system_prompt=state["llm_params"].get("system_prompt"),
         initial_prompt=initial_prompt,
         message=state["user_message"],
+        chat_messages=chat_messages,
     )
 
 
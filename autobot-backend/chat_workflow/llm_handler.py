@@ -21,6 +21,13 @@ from prompt_manager import get_language_instruction, get_prompt, resolve_languag
 from autobot_shared.http_client import get_http_client
 
 from .models import WorkflowSession
+from .prompt_layout import (
+    PROMPT_LAYOUT_PREFIX_STABLE,
+    build_prefix_stable_messages,
+    flatten_messages,
+    get_prompt_layout,
+    pin_session_endpoint,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -126,6 +133,28 @@ class LLMHandlerMixin:
             logger.debug("SLM service discovery unavailable: %s", e)
         return None
 
+    async def _discover_pinned_ollama(self, session_id: str) -> str | None:
+        """Ollama instance this session is pinned to among SLM-registered ones.
+
+        Returns base URL (no /api/generate suffix) or None if SLM reports no
+        instances.
+        """
+        try:
+            from services.slm_client import discover_service_instances
+
+            instances = [
+                instance
+                for instance in await discover_service_instances("ollama")
+                if instance["url"].startswith(_VALID_URL_SCHEMES)
+            ]
+            url = pin_session_endpoint(session_id, instances)
+            if url:
+                logger.debug("Session %s pinned to Ollama at %s", session_id, url)
+                return url
+        except Exception as e:
+            logger.debug("SLM instance discovery unavailable: %s", e)
+        return None
+
     def _get_personality_preamble(self) -> str:
         """Return personality block if enabled, else empty string.
 
@@ -305,9 +334,16 @@ NEVER teach commands - ALWAYS execute them."""
         Issue #1325: Accepts language for system prompt resolution.
         """
         selected_model = self._get_selected_model()
+        prefix_stable = get_prompt_layout() == PROMPT_LAYOUT_PREFIX_STABLE
         # Issue #1214: Try SLM service discovery first (fleet-managed endpoint),
         # then fall back to local config-based resolution (#1070 model routing).
-        slm_base = await self._discover_ollama_from_slm()
+        # With the prefix-stable layout the session stays on one instance so
+        # its cached prefix is actually there.
+        slm_base = None
+        if prefix_stable:
+            slm_base = await self._discover_pinned_ollama(session.session_id)
+        if not slm_base:
+            slm_base = await self._discover_ollama_from_slm()
         if slm_base:
             if not slm_base.endswith("/api/generate"):
                 slm_base = slm_base.rstrip("/") + "/api/generate"
@@ -326,9 +362,20 @@ NEVER teach commands - ALWAYS execute them."""
         else:
             session.metadata["used_knowledge"] = False
 
-        full_prompt = self._build_full_prompt(
-            system_prompt, knowledge_context, conversation_context, message
-        )
+        chat_messages = None
+        if prefix_stable:
+            # Stable-to-volatile message order for KV cache reuse
+            chat_messages = build_prefix_stable_messages(
+                system_prompt,
+                session.conversation_history,
+                knowledge_context,
+                message,
+            )
+            full_prompt = flatten_messages(chat_messages)
+        else:
+            full_prompt = self._build_full_prompt(
+                system_prompt, knowledge_context, conversation_context, message
+            )
 
         logger.info(
             "[ChatWorkflowManager] Making Ollama request to: %s", ollama_endpoint
@@ -339,6 +386,7 @@ NEVER teach commands - ALWAYS execute them."""
             "endpoint": ollama_endpoint,
             "model": selected_model,
             "prompt": full_prompt,
+            "chat_messages": chat_messages,
             "system_prompt": system_prompt,
             "citations": citations,
             "used_knowledge": bool(knowledge_context),
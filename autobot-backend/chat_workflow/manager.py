@@ -15,6 +15,7 @@ import asyncio
 import json
 import logging
 import re
+import time
 import uuid
 from typing import Any, Dict, FrozenSet, List, Optional
 
@@ -27,6 +28,14 @@ from autobot_shared.redis_client import get_redis_client as get_redis_manager
 from .conversation import ConversationHandlerMixin
 from .llm_handler import LLMHandlerMixin
 from .models import LLMIterationContext, StreamingMessage, WorkflowSession
+from .prompt_layout import (
+    PROMPT_LAYOUT_PREFIX_STABLE,
+    OllamaStreamTap,
+    get_keep_alive,
+    get_prompt_layout,
+    record_prefill_metrics,
+    to_chat_endpoint,
+)
 from .session_handler import SessionHandlerMixin
 from .tool_handler import ToolHandlerMixin
 
@@ -360,11 +369,17 @@ class ChatWorkflowManager(
             return None
 
         try:
-            return json.loads(line_str)
+            chunk = json.loads(line_str)
         except json.JSONDecodeError as e:
             logger.error("Failed to parse stream chunk: %s", e)
             return None
 
+        # /api/chat streams {"message": {"content": ...}}; normalize to the
+        # /api/generate "response" field the chunk processors read.
+        if "response" not in chunk and isinstance(chunk.get("message"), dict):
+            chunk["response"] = chunk["message"].get("content", "")
+        return chunk
+
     def _handle_type_transition(
         self,
         new_type: str,
@@ -1742,6 +1757,39 @@ before summarizing.
             "options": {"temperature": 0.7, "top_p": 0.9, "num_ctx": 2048},
         }
 
+    def _get_llm_chat_request_payload(
+        self, selected_model: str, chat_messages: List[Dict[str, str]]
+    ) -> dict:
+        """Build /api/chat payload for the prefix-stable prompt layout."""
+        return {
+            "model": selected_model,
+            "messages": chat_messages,
+            "stream": True,
+            "keep_alive": get_keep_alive(),
+            "options": {"temperature": 0.7, "top_p": 0.9, "num_ctx": 2048},
+        }
+
+    def _build_llm_request(
+        self,
+        ollama_endpoint: str,
+        selected_model: str,
+        current_prompt: str,
+        chat_messages: Optional[List[Dict[str, str]]],
+    ) -> tuple:
+        """Return (url, payload, layout) for an LLM iteration request."""
+        layout = get_prompt_layout()
+        if chat_messages:
+            return (
+                to_chat_endpoint(ollama_endpoint),
+                self._get_llm_chat_request_payload(selected_model, chat_messages),
+                layout,
+            )
+        payload = self._get_llm_request_payload(selected_model, current_prompt)
+        if layout == PROMPT_LAYOUT_PREFIX_STABLE:
+            # Continuation prompts stay on /api/generate but keep the model warm
+            payload["keep_alive"] = get_keep_alive()
+        return ollama_endpoint, payload, layout
+
     def _log_and_parse_tool_calls(
         self, llm_response: str, iteration: int
     ) -> List[Dict[str, Any]]:
@@ -1825,17 +1873,23 @@ before summarizing.
         used_knowledge: bool,
         rag_citations: List[Dict[str, Any]],
         iteration: int,
+        chat_messages: Optional[List[Dict[str, str]]] = None,
     ):
         """Process a single LLM iteration. Yields chunks, then (llm_response, tool_calls). Issue #620."""
         import aiohttp
 
-        payload = self._get_llm_request_payload(selected_model, current_prompt)
+        url, payload, layout = self._build_llm_request(
+            ollama_endpoint, selected_model, current_prompt, chat_messages
+        )
         llm_response = ""
+        tap = None
 
         try:
+            started_at = time.perf_counter()
             async with await http_client.post(
-                ollama_endpoint, json=payload, timeout=aiohttp.ClientTimeout(total=60.0)
-            ) as response:
+                url, json=payload, timeout=aiohttp.ClientTimeout(total=60.0)
+            ) as raw_response:
+                response = tap = OllamaStreamTap(raw_response, started_at)
                 logger.info(
                     "[ChatWorkflowManager] Ollama response status: %s", response.status
                 )
@@ -1864,6 +1918,9 @@ before summarizing.
         finally:
             await http_client.decrement_active()
 
+        if tap is not None and tap.final_stats:
+            record_prefill_metrics(selected_model, tap, layout)
+
         tool_calls = self._log_and_parse_tool_calls(llm_response, iteration)
         yield (llm_response, tool_calls)
 
@@ -2039,6 +2096,11 @@ before summarizing.
             ctx.used_knowledge,
             ctx.rag_citations,
             iteration,
+            # Messages only describe the initial prompt; continuation
+            # prompts are rebuilt as plain text each iteration.
+            chat_messages=(
+                ctx.chat_messages if current_prompt == ctx.initial_prompt else None
+            ),
         ):
             if isinstance(item, tuple):
                 llm_response, tool_calls = item
@@ -2713,6 +2775,7 @@ before summarizing.
             system_prompt=llm_params.get("system_prompt", ""),
             initial_prompt=llm_params["prompt"],
             message=message,
+            chat_messages=llm_params.get("chat_messages"),
         )
 
     async def _execute_llm_workflow(
@@ -352,6 +352,8 @@ class LLMIterationContext:
     initial_prompt: Optional[str] = None
     message: Optional[str] = None
     agent_context: Optional[AgentContext] = None  # Issue #657: Agent hierarchy
+    # Prefix-stable layout: /api/chat messages for the first iteration
+    chat_messages: Optional[List[Dict[str, str]]] = None
 
 
 @dataclass
@@ -0,0 +1,258 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Prefix-stable prompt layout and Ollama session pinning.
+
+The legacy layout puts per-turn RAG context right after the system prompt and
+a sliding "Recent Context" block after that, so the shared prefix changes on
+every turn and Ollama re-prefills the whole prompt. The prefix-stable layout
+orders segments from most stable to most volatile:
+
+    system prompt (personality + tool instructions + language)
+    -> conversation turns (append-only, trimmed in chunks)
+    -> retrieved knowledge context + current user message
+
+and sends them through Ollama's /api/chat with ``keep_alive`` so the model's
+KV cache for the unchanged prefix is reused. When SLM registers several
+Ollama instances, each chat session is pinned to one of them (rendezvous hash
+of the session id) so that cache is on the instance serving its next turn.
+
+Enable with ``backend.llm.ollama.prompt_layout: prefix_stable``.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+PROMPT_LAYOUT_LEGACY = "legacy"
+PROMPT_LAYOUT_PREFIX_STABLE = "prefix_stable"
+
+_DEFAULT_KEEP_ALIVE = "30m"
+
+# History window: at most MAX turns are sent; when exceeded, the oldest turns
+# are dropped DROP_CHUNK at a time so the retained prefix stays byte-identical
+# for DROP_CHUNK consecutive turns instead of shifting every turn.
+HISTORY_MAX_TURNS = 8
+HISTORY_DROP_CHUNK = 4
+
+
+def get_prompt_layout() -> str:
+    """Return configured prompt layout (legacy unless explicitly enabled)."""
+    try:
+        from dependencies import global_config_manager
+
+        layout = global_config_manager.get_nested(
+            "backend.llm.ollama.prompt_layout", PROMPT_LAYOUT_LEGACY
+        )
+    except Exception as e:
+        logger.debug("Prompt layout config unavailable: %s", e)
+        return PROMPT_LAYOUT_LEGACY
+    if layout == PROMPT_LAYOUT_PREFIX_STABLE:
+        return layout
+    return PROMPT_LAYOUT_LEGACY
+
+
+def get_keep_alive() -> str:
+    """Return Ollama keep_alive duration for chat requests."""
+    try:
+        from dependencies import global_config_manager
+
+        return str(
+            global_config_manager.get_nested(
+                "backend.llm.ollama.keep_alive", _DEFAULT_KEEP_ALIVE
+            )
+        )
+    except Exception:
+        return _DEFAULT_KEEP_ALIVE
+
+
+def to_chat_endpoint(endpoint: str) -> str:
+    """Convert an Ollama /api/generate URL (or base URL) to /api/chat."""
+    base = endpoint.rstrip("/")
+    if base.endswith("/api/generate"):
+        base = base[: -len("/api/generate")]
+    return base + "/api/chat"
+
+
+def select_stable_history(
+    turns: List[Dict[str, str]],
+    max_turns: int = HISTORY_MAX_TURNS,
+    drop_chunk: int = HISTORY_DROP_CHUNK,
+) -> List[Dict[str, str]]:
+    """
+    Trim history from the front in fixed-size chunks.
+
+    Returns at most ``max_turns`` turns; the start offset only moves in
+    multiples of ``drop_chunk`` so consecutive turns share a prefix.
+    """
+    overflow = len(turns) - max_turns
+    if overflow <= 0:
+        return list(turns)
+    drop = -(-overflow // drop_chunk) * drop_chunk
+    return list(turns[drop:])
+
+
+def build_prefix_stable_messages(
+    system_prompt: str,
+    conversation_history: List[Dict[str, str]],
+    knowledge_context: str,
+    message: str,
+) -> List[Dict[str, str]]:
+    """
+    Build Ollama chat messages ordered from most stable to most volatile.
+
+    Args:
+        system_prompt: Full system prompt (personality and tool instructions)
+        conversation_history: Session history in {"user", "assistant"} format
+        knowledge_context: Per-turn retrieved context (may be empty)
+        message: Current user message
+
+    Returns:
+        List of role/content messages for /api/chat
+    """
+    messages = [{"role": "system", "content": system_prompt}]
+
+    complete_turns = [t for t in conversation_history or [] if t.get("assistant")]
+    for turn in select_stable_history(complete_turns):
+        messages.append({"role": "user", "content": turn.get("user", "")})
+        messages.append({"role": "assistant", "content": turn["assistant"]})
+
+    if knowledge_context:
+        user_content = f"{knowledge_context}\n\n**Current user message:** {message}"
+    else:
+        user_content = message
+    messages.append({"role": "user", "content": user_content})
+    return messages
+
+
+def flatten_messages(messages: List[Dict[str, str]]) -> str:
+    """Render chat messages as a single prompt string (logging / fallbacks)."""
+    parts = []
+    for msg in messages:
+        if msg["role"] == "system":
+            parts.append(msg["content"])
+        elif msg["role"] == "user":
+            parts.append(f"User: {msg['content']}")
+        else:
+            parts.append(f"You: {msg['content']}")
+    return "\n\n".join(parts) + "\n\nAssistant:"
+
+
+def _rendezvous_weight(session_id: str, url: str) -> int:
+    """Stable per-(session, instance) weight, identical in every worker."""
+    digest = hashlib.sha256(f"{session_id}|{url}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def pin_session_endpoint(
+    session_id: str, instances: Sequence[Dict[str, Any]]
+) -> Optional[str]:
+    """
+    Pick the Ollama instance a chat session sticks to.
+
+    Instances are ranked by rendezvous hash of the session id, so every
+    worker maps a session to the same instance without shared state, and
+    adding or removing an instance only moves the sessions that ranked it
+    first. The pinned instance is passed over only while it is unhealthy.
+
+    Args:
+        session_id: Chat session ID
+        instances: Dicts with "url" and "healthy" (SLM discovery)
+
+    Returns:
+        URL of the session's instance, or None if there are none
+    """
+    if not instances:
+        return None
+    ranked = sorted(
+        instances,
+        key=lambda instance: _rendezvous_weight(session_id, instance["url"]),
+        reverse=True,
+    )
+    for instance in ranked:
+        if instance.get("healthy", True):
+            return instance["url"]
+    return ranked[0]["url"]
+
+
+class OllamaStreamTap:
+    """
+    Wrap a streaming Ollama response to capture per-turn prefill metrics.
+
+    Passes lines through unchanged; records when the first line arrived and
+    the ``prompt_eval_count`` / ``prompt_eval_duration`` of the final chunk.
+    Ollama reports only the prompt tokens it actually evaluated, so a warm
+    shared prefix shows up directly as fewer prefill tokens.
+    """
+
+    def __init__(self, response, started_at: float):
+        """Wrap response; started_at is a time.perf_counter() timestamp."""
+        self._response = response
+        self.status = response.status
+        self.started_at = started_at
+        self.first_token_at: Optional[float] = None
+        self.final_stats: Dict[str, Any] = {}
+
+    @property
+    def content(self):
+        """Async iterator over response lines (mirrors aiohttp's .content)."""
+        return self._iter_lines()
+
+    async def _iter_lines(self):
+        """Yield lines while recording first-token time and final stats."""
+        async for line in self._response.content:
+            if self.first_token_at is None and line.strip():
+                self.first_token_at = time.perf_counter()
+            if b'"done":true' in line or b'"done": true' in line:
+                try:
+                    self.final_stats = json.loads(line)
+                except ValueError:
+                    logger.debug("Unparseable final Ollama chunk")
+            yield line
+
+    @property
+    def ttft_seconds(self) -> float:
+        """Time from request send to first streamed line."""
+        if self.first_token_at is None:
+            return 0.0
+        return self.first_token_at - self.started_at
+
+    @property
+    def prefill_tokens(self) -> int:
+        """Prompt tokens Ollama had to evaluate (cache misses)."""
+        return int(self.final_stats.get("prompt_eval_count", 0) or 0)
+
+    @property
+    def prefill_seconds(self) -> float:
+        """Prompt evaluation time reported by Ollama."""
+        return (self.final_stats.get("prompt_eval_duration", 0) or 0) / 1e9
+
+
+def record_prefill_metrics(model: str, tap: OllamaStreamTap, layout: str) -> None:
+    """Log and export prefill tokens / TTFT for a completed turn."""
+    logger.info(
+        "[PromptLayout] layout=%s model=%s prefill_tokens=%d prefill=%.3fs ttft=%.3fs",
+        layout,
+        model,
+        tap.prefill_tokens,
+        tap.prefill_seconds,
+        tap.ttft_seconds,
+    )
+    try:
+        from monitoring.prometheus_metrics import get_metrics_manager
+
+        get_metrics_manager().record_llm_prefill(
+            provider="ollama",
+            model=model,
+            layout=layout,
+            prefill_tokens=tap.prefill_tokens,
+            prefill_seconds=tap.prefill_seconds,
+            time_to_first_token_seconds=tap.ttft_seconds,
+        )
+    except Exception as e:
+        logger.debug("Failed to record prefill metrics: %s", e)
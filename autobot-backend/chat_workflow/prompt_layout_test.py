@@ -0,0 +1,134 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Unit tests for the prefix-stable prompt layout and Ollama session pinning.
+"""
+
+import pytest
+from chat_workflow.prompt_layout import (
+    OllamaStreamTap,
+    build_prefix_stable_messages,
+    pin_session_endpoint,
+    select_stable_history,
+    to_chat_endpoint,
+)
+
+
+def _turns(n):
+    return [{"user": f"q{i}", "assistant": f"a{i}"} for i in range(n)]
+
+
+class TestStableHistory:
+    def test_short_history_kept(self):
+        assert select_stable_history(_turns(3), max_turns=8) == _turns(3)
+
+    def test_drops_in_chunks(self):
+        kept = select_stable_history(_turns(9), max_turns=8, drop_chunk=4)
+        assert [t["user"] for t in kept] == ["q4", "q5", "q6", "q7", "q8"]
+
+    def test_prefix_stable_between_consecutive_turns(self):
+        first = select_stable_history(_turns(9), max_turns=8, drop_chunk=4)
+        second = select_stable_history(_turns(10), max_turns=8, drop_chunk=4)
+        assert second[: len(first)] == first
+
+
+class TestPrefixStableMessages:
+    def test_order_stable_to_volatile(self):
+        history = _turns(2) + [{"user": "pending", "assistant": ""}]
+        messages = build_prefix_stable_messages("SYS", history, "KB CONTEXT", "now?")
+
+        assert messages[0] == {"role": "system", "content": "SYS"}
+        assert [m["role"] for m in messages[1:5]] == [
+            "user",
+            "assistant",
+            "user",
+            "assistant",
+        ]
+        assert messages[-1]["role"] == "user"
+        assert messages[-1]["content"].startswith("KB CONTEXT")
+        assert messages[-1]["content"].endswith("now?")
+        assert all(m["content"] != "pending" for m in messages)
+
+    def test_retrieval_does_not_change_prefix(self):
+        a = build_prefix_stable_messages("SYS", _turns(2), "ctx one", "m")
+        b = build_prefix_stable_messages("SYS", _turns(2), "ctx two", "m")
+        assert a[:-1] == b[:-1]
+
+
+class TestSessionPinning:
+    @staticmethod
+    def _instances(*urls, unhealthy=()):
+        return [{"url": url, "healthy": url not in unhealthy} for url in urls]
+
+    def test_session_stays_on_one_instance_in_any_order(self):
+        instances = self._instances("http://a", "http://b", "http://c")
+        pinned = pin_session_endpoint("s1", instances)
+        assert pin_session_endpoint("s1", list(reversed(instances))) == pinned
+
+    def test_sessions_spread_over_instances(self):
+        instances = self._instances("http://a", "http://b", "http://c")
+        pinned = {pin_session_endpoint(f"s{i}", instances) for i in range(50)}
+        assert pinned == {"http://a", "http://b", "http://c"}
+
+    def test_unhealthy_pin_falls_back_until_it_recovers(self):
+        instances = self._instances("http://a", "http://b", "http://c")
+        pinned = pin_session_endpoint("s1", instances)
+
+        degraded = self._instances(
+            "http://a", "http://b", "http://c", unhealthy={pinned}
+        )
+        fallback = pin_session_endpoint("s1", degraded)
+        assert fallback not in (None, pinned)
+        assert pin_session_endpoint("s1", instances) == pinned
+
+    def test_removing_an_instance_only_moves_its_sessions(self):
+        full = self._instances("http://a", "http://b", "http://c")
+        reduced = self._instances("http://a", "http://b")
+        for i in range(50):
+            before = pin_session_endpoint(f"s{i}", full)
+            if before != "http://c":
+                assert pin_session_endpoint(f"s{i}", reduced) == before
+
+    def test_no_instances(self):
+        assert pin_session_endpoint("s1", []) is None
+
+
+def test_to_chat_endpoint():
+    assert to_chat_endpoint("http://h:11434/api/generate") == "http://h:11434/api/chat"
+    assert to_chat_endpoint("http://h:11434/") == "http://h:11434/api/chat"
+
+
+class _FakeContent:
+    def __init__(self, lines):
+        self._lines = lines
+
+    def __aiter__(self):
+        return self._gen()
+
+    async def _gen(self):
+        for line in self._lines:
+            yield line
+
+
+class _FakeResponse:
+    status = 200
+
+    def __init__(self, lines):
+        self.content = _FakeContent(lines)
+
+
+@pytest.mark.asyncio
+async def test_stream_tap_captures_prefill_stats():
+    lines = [
+        b'{"message": {"content": "hi"}, "done": false}\n',
+        b'{"done": true, "prompt_eval_count": 42, "prompt_eval_duration": 500000000}\n',
+    ]
+    tap = OllamaStreamTap(_FakeResponse(lines), started_at=0.0)
+
+    seen = [line async for line in tap.content]
+
+    assert seen == lines
+    assert tap.prefill_tokens == 42
+    assert tap.prefill_seconds == pytest.approx(0.5)
+    assert tap.ttft_seconds > 0
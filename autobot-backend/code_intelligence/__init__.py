@@ -219,6 +219,12 @@ from .log_pattern_miner import (
     get_log_levels,
     get_pattern_types,
 )
+from .log_stream_miner import (
+    DurationSketch,
+    StreamingLogMiner,
+    TemplateClusterer,
+    analyze_logs_streaming,
+)
 from .multi_language_scanner import (
     CodebaseScanner,
     codebase_scanner,
@@ -386,6 +392,10 @@ __all__ = [
     "get_anomaly_types",
     "get_log_levels",
     "get_pattern_types",
+    "DurationSketch",
+    "StreamingLogMiner",
+    "TemplateClusterer",
+    "analyze_logs_streaming",
     # Conversation flow analysis (Issue #227)
     "AnalysisResult",
     "Bottleneck",
@@ -458,13 +458,15 @@ class AnalyticsInfrastructureMixin:
 
             _npu_worker_available = True
             result = await client.generate_embeddings(texts, self._embedding_model)
-            if result and result.embeddings:
+            if result and len(result.embeddings):
                 logger.info(
                     "Batch embeddings (%d) generated via NPU worker in %.1fms",
                     len(texts),
                     result.processing_time_ms,
                 )
-                return result.embeddings
+                # Rows stay float32 arrays; ChromaDB and the similarity
+                # computation take them as-is
+                return list(result.embeddings)
 
         except ImportError:
             _npu_worker_available = False
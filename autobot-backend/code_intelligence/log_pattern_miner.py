@@ -853,7 +853,21 @@ class LogPatternMiner:
         Issue #620.
         """
         hourly_errors, hourly_total = self._compute_hourly_error_counts()
+        self._add_error_rate_anomalies(hourly_errors, hourly_total)
 
+    def _add_error_rate_anomalies(
+        self, hourly_errors: dict[str, int], hourly_total: dict[str, int]
+    ) -> None:
+        """
+        Flag hours whose error rate deviates from the mean hourly rate.
+
+        Shared with the streaming miner, which keeps the hourly counts as
+        running counters instead of recomputing them from entries.
+
+        Args:
+            hourly_errors: Error/critical entry count per "%Y-%m-%d %H:00" hour
+            hourly_total: Total entry count per hour
+        """
         if len(hourly_errors) < 3:
             return
 
@@ -869,7 +883,7 @@ class LogPatternMiner:
             return
 
         for hour, total in hourly_total.items():
-            rate = hourly_errors[hour] / total * 100 if total > 0 else 0
+            rate = hourly_errors.get(hour, 0) / total * 100 if total > 0 else 0
             deviation = (rate - avg_rate) / std_rate
             if deviation > self.anomaly_deviation_threshold:
                 self.anomalies.append(
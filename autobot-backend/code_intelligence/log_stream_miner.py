@@ -0,0 +1,1122 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Streaming Log Pattern Mining (Issue #226)
+
+Memory-bounded variant of LogPatternMiner for multi-GB logs. Entries are
+parsed line by line and fed to single-pass aggregators instead of being
+collected into a list:
+
+- TemplateClusterer: streaming template clustering of normalized error
+  messages (tokens that differ between similar messages collapse to
+  ``<*>``), replacing the exact normalized-message grouping
+- DurationSketch: log-bucketed quantile sketch (relative error bound) for
+  request durations, overall and per slow endpoint
+- Hourly total/error counters for error-rate anomalies, and Welford
+  running mean/stdev for duration anomalies (flagged against the
+  statistics seen so far)
+- Capped per-endpoint and per-session aggregates
+
+With a checkpoint path, per-file byte offsets and the aggregator state are
+persisted after each run, so the next run only parses data appended since
+then. A rotated (new inode) or truncated file is read again from the start.
+
+Results use the same MiningResult shape as LogPatternMiner.analyze().
+"""
+
+import hashlib
+import heapq
+import json
+import logging
+import math
+import os
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from .log_pattern_miner import (
+    _ERROR_CRITICAL_LEVELS,
+    _ERROR_CRITICAL_WARNING_LEVELS,
+    Anomaly,
+    AnomalyType,
+    LogEntry,
+    LogLevel,
+    LogParser,
+    LogPattern,
+    LogPatternMiner,
+    MiningResult,
+    PatternType,
+    SessionFlow,
+)
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 1
+
+# Bounds that keep memory independent of log size
+_MAX_TEMPLATE_CLUSTERS = 2000
+_MAX_CLUSTER_COMPONENTS = 50
+_MAX_CLUSTER_MESSAGE_HASHES = 1024
+_MAX_ENDPOINTS = 5000
+_MAX_SESSIONS = 10000
+_MAX_SESSION_ENDPOINTS = 50
+_MAX_SESSION_ERRORS = 20
+_MAX_DURATION_ANOMALIES = 200
+_MIN_DURATION_SAMPLES = 10
+
+# Read size for offset-based file parsing
+_READ_BLOCK_SIZE = 1024 * 1024
+
+_WILDCARD = "<*>"
+
+
+# ============================================================================
+# Entry (de)serialization for checkpoint state
+# ============================================================================
+
+
+def _entry_state(entry: LogEntry) -> dict[str, Any]:
+    """Serialize a sample entry for the checkpoint."""
+    state = entry.to_dict()
+    state["raw_line"] = entry.raw_line
+    return state
+
+
+def _entry_from_state(state: dict[str, Any]) -> LogEntry:
+    """Rebuild a sample entry from checkpoint state."""
+    return LogEntry(
+        timestamp=datetime.fromisoformat(state["timestamp"]),
+        level=LogLevel(state["level"]),
+        logger_name=state["logger_name"],
+        message=state["message"],
+        raw_line=state.get("raw_line", ""),
+        line_number=state["line_number"],
+        file_path=state.get("file_path"),
+        session_id=state.get("session_id"),
+        duration_ms=state.get("duration_ms"),
+        endpoint=state.get("endpoint"),
+        status_code=state.get("status_code"),
+        extra_data=state.get("extra_data") or {},
+    )
+
+
+def _ts(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _from_ts(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+# ============================================================================
+# Single-pass aggregators
+# ============================================================================
+
+
+class DurationSketch:
+    """
+    Log-bucketed quantile sketch with bounded relative error.
+
+    Values are counted in buckets whose boundaries grow geometrically by
+    ``gamma = (1 + a) / (1 - a)``, so any reported quantile is within a
+    relative error ``a`` of the true value. Memory grows with the log of the
+    value range, not with the number of values.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """Initialize an empty sketch."""
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.buckets: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Record one value (negative values are clamped to zero)."""
+        value = max(0.0, value)
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if value == 0:
+            self.zero_count += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+
+    @property
+    def mean(self) -> float:
+        """Exact mean of recorded values."""
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Approximate q-quantile (0 <= q <= 1); 0 when empty."""
+        if not self.count:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                estimate = 2 * self._gamma**key / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def to_state(self) -> dict[str, Any]:
+        """Serialize for the checkpoint."""
+        return {
+            "a": self.relative_accuracy,
+            "buckets": {str(k): v for k, v in self.buckets.items()},
+            "zero": self.zero_count,
+            "count": self.count,
+            "total": self.total,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> "DurationSketch":
+        """Rebuild from checkpoint state."""
+        sketch = cls(state["a"])
+        sketch.buckets = {int(k): v for k, v in state["buckets"].items()}
+        sketch.zero_count = state["zero"]
+        sketch.count = state["count"]
+        sketch.total = state["total"]
+        if sketch.count:
+            sketch.min, sketch.max = state["min"], state["max"]
+        return sketch
+
+
+@dataclass
+class RunningStats:
+    """Welford running mean and sample standard deviation."""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def add(self, value: float) -> None:
+        """Record one value."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation (0 with fewer than two values)."""
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+
+@dataclass
+class _TemplateCluster:
+    """One error template and its running aggregates."""
+
+    tokens: list[str]
+    count: int
+    first_seen: datetime
+    last_seen: datetime
+    severity: LogLevel
+    components: set[str] = field(default_factory=set)
+    message_hashes: set[str] = field(default_factory=set)
+    samples: list[LogEntry] = field(default_factory=list)
+
+    @property
+    def template(self) -> str:
+        return " ".join(self.tokens)
+
+    def add(self, entry: LogEntry) -> None:
+        self.count += 1
+        self.first_seen = min(self.first_seen, entry.timestamp)
+        self.last_seen = max(self.last_seen, entry.timestamp)
+        if len(self.components) < _MAX_CLUSTER_COMPONENTS:
+            self.components.add(entry.logger_name)
+        if len(self.message_hashes) < _MAX_CLUSTER_MESSAGE_HASHES:
+            digest = hashlib.blake2b(entry.message.encode(), digest_size=8)
+            self.message_hashes.add(digest.hexdigest())
+        if len(self.samples) < 5:
+            self.samples.append(entry)
+
+    def to_state(self) -> dict[str, Any]:
+        return {
+            "tokens": self.tokens,
+            "count": self.count,
+            "first_seen": _ts(self.first_seen),
+            "last_seen": _ts(self.last_seen),
+            "severity": self.severity.value,
+            "components": sorted(self.components),
+            "message_hashes": sorted(self.message_hashes),
+            "samples": [_entry_state(e) for e in self.samples],
+        }
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> "_TemplateCluster":
+        return cls(
+            tokens=state["tokens"],
+            count=state["count"],
+            first_seen=_from_ts(state["first_seen"]),
+            last_seen=_from_ts(state["last_seen"]),
+            severity=LogLevel(state["severity"]),
+            components=set(state["components"]),
+            message_hashes=set(state["message_hashes"]),
+            samples=[_entry_from_state(s) for s in state["samples"]],
+        )
+
+
+class TemplateClusterer:
+    """
+    Streaming template clustering for normalized error messages.
+
+    Messages are bucketed by token count and first token. Within a bucket a
+    message joins the most similar cluster if at least
+    ``similarity_threshold`` of its tokens match the template; differing
+    positions become wildcards. Otherwise it starts a new cluster until
+    ``max_clusters`` is reached, after which it joins the closest cluster of
+    its bucket, or is only counted in ``unclustered`` if the bucket is empty.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.5,
+        max_clusters: int = _MAX_TEMPLATE_CLUSTERS,
+    ):
+        """Initialize an empty clusterer."""
+        self.similarity_threshold = similarity_threshold
+        self.max_clusters = max_clusters
+        self._buckets: dict[str, list[_TemplateCluster]] = {}
+        self.cluster_count = 0
+        self.unclustered = 0
+
+    @staticmethod
+    def _bucket_key(tokens: list[str]) -> str:
+        first = tokens[0] if tokens else ""
+        return f"{len(tokens)}:{first}"
+
+    @staticmethod
+    def _similarity(template: list[str], tokens: list[str]) -> float:
+        if not tokens:
+            return 1.0
+        same = sum(1 for t, m in zip(template, tokens) if t == m or t == _WILDCARD)
+        return same / len(tokens)
+
+    def add(
+        self, normalized_message: str, entry: LogEntry
+    ) -> Optional[_TemplateCluster]:
+        """Assign an entry to a cluster and update its aggregates."""
+        tokens = normalized_message.split()
+        key = self._bucket_key(tokens)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if self.cluster_count >= self.max_clusters:
+                self.unclustered += 1
+                return None
+            bucket = self._buckets[key] = []
+
+        best, best_score = None, -1.0
+        for cluster in bucket:
+            score = self._similarity(cluster.tokens, tokens)
+            if score > best_score:
+                best, best_score = cluster, score
+
+        if best is None or (
+            best_score < self.similarity_threshold
+            and self.cluster_count < self.max_clusters
+        ):
+            best = _TemplateCluster(
+                tokens=tokens,
+                count=0,
+                first_seen=entry.timestamp,
+                last_seen=entry.timestamp,
+                severity=entry.level,
+            )
+            bucket.append(best)
+            self.cluster_count += 1
+        else:
+            best.tokens = [
+                t if t == m else _WILDCARD for t, m in zip(best.tokens, tokens)
+            ]
+        best.add(entry)
+        return best
+
+    def clusters(self) -> Iterator[_TemplateCluster]:
+        """Iterate all clusters."""
+        for bucket in self._buckets.values():
+            yield from bucket
+
+    def to_state(self) -> dict[str, Any]:
+        return {
+            "threshold": self.similarity_threshold,
+            "max_clusters": self.max_clusters,
+            "unclustered": self.unclustered,
+            "clusters": [c.to_state() for c in self.clusters()],
+        }
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> "TemplateClusterer":
+        clusterer = cls(state["threshold"], state["max_clusters"])
+        clusterer.unclustered = state["unclustered"]
+        for cluster_state in state["clusters"]:
+            cluster = _TemplateCluster.from_state(cluster_state)
+            key = cls._bucket_key(cluster.tokens)
+            clusterer._buckets.setdefault(key, []).append(cluster)
+            clusterer.cluster_count += 1
+        return clusterer
+
+
+@dataclass
+class _EndpointAggregate:
+    """Running statistics for one endpoint (or logger for slow entries)."""
+
+    count: int = 0
+    error_count: int = 0
+    duration_count: int = 0
+    duration_total: float = 0.0
+    first_seen: Optional[datetime] = None
+    last_seen: Optional[datetime] = None
+    samples: list[LogEntry] = field(default_factory=list)
+    sketch: Optional[DurationSketch] = None
+
+    def add(self, entry: LogEntry, max_samples: int) -> None:
+        self.count += 1
+        if entry.status_code and entry.status_code >= 400:
+            self.error_count += 1
+        if entry.duration_ms:
+            self.duration_count += 1
+            self.duration_total += entry.duration_ms
+            if self.sketch is not None:
+                self.sketch.add(entry.duration_ms)
+        if self.first_seen is None:
+            self.first_seen = entry.timestamp
+        self.last_seen = entry.timestamp
+        if len(self.samples) < max_samples:
+            self.samples.append(entry)
+
+    @property
+    def avg_duration(self) -> float:
+        return self.duration_total / self.duration_count if self.duration_count else 0
+
+    def to_state(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "error_count": self.error_count,
+            "duration_count": self.duration_count,
+            "duration_total": self.duration_total,
+            "first_seen": _ts(self.first_seen),
+            "last_seen": _ts(self.last_seen),
+            "samples": [_entry_state(e) for e in self.samples],
+            "sketch": self.sketch.to_state() if self.sketch else None,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> "_EndpointAggregate":
+        return cls(
+            count=state["count"],
+            error_count=state["error_count"],
+            duration_count=state["duration_count"],
+            duration_total=state["duration_total"],
+            first_seen=_from_ts(state["first_seen"]),
+            last_seen=_from_ts(state["last_seen"]),
+            samples=[_entry_from_state(s) for s in state["samples"]],
+            sketch=(
+                DurationSketch.from_state(state["sketch"]) if state["sketch"] else None
+            ),
+        )
+
+
+def _session_from_state(state: dict[str, Any]) -> SessionFlow:
+    return SessionFlow(
+        session_id=state["session_id"],
+        start_time=datetime.fromisoformat(state["start_time"]),
+        end_time=_from_ts(state["end_time"]),
+        endpoints=state["endpoints"],
+        errors=state["errors"],
+        total_duration_ms=state["total_duration_ms"],
+        request_count=state["request_count"],
+    )
+
+
+# ============================================================================
+# Streaming miner
+# ============================================================================
+
+
+class StreamingLogMiner:
+    """
+    Memory-bounded, resumable log pattern miner.
+
+    Accepts the same thresholds as LogPatternMiner. Each analyze() call
+    folds newly read entries into the running aggregates and returns a
+    MiningResult over everything seen so far (including earlier runs when a
+    checkpoint is used).
+    """
+
+    def __init__(
+        self,
+        slow_request_threshold_ms: float = 100.0,
+        error_threshold: int = 5,
+        anomaly_deviation_threshold: float = 2.0,
+        min_pattern_occurrences: int = 3,
+        checkpoint_path: Optional[str] = None,
+        template_similarity: float = 0.5,
+    ):
+        """
+        Initialize Streaming Log Miner.
+
+        Args:
+            slow_request_threshold_ms: Threshold for slow request detection
+            error_threshold: Minimum errors to flag as pattern
+            anomaly_deviation_threshold: Standard deviations for anomaly
+            min_pattern_occurrences: Minimum occurrences for pattern detection
+            checkpoint_path: JSON file for file offsets and aggregate state
+            template_similarity: Token match ratio for joining an error template
+        """
+        self.slow_request_threshold_ms = slow_request_threshold_ms
+        self.error_threshold = error_threshold
+        self.anomaly_deviation_threshold = anomaly_deviation_threshold
+        self.min_pattern_occurrences = min_pattern_occurrences
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self.template_similarity = template_similarity
+        # Shares normalization and error-rate anomaly rules with the batch miner
+        self._base = LogPatternMiner(
+            slow_request_threshold_ms=slow_request_threshold_ms,
+            error_threshold=error_threshold,
+            anomaly_deviation_threshold=anomaly_deviation_threshold,
+            min_pattern_occurrences=min_pattern_occurrences,
+        )
+        self.reset()
+        if self.checkpoint_path:
+            self._load_checkpoint()
+
+    def reset(self) -> None:
+        """Drop all aggregates and file offsets."""
+        self.file_offsets: dict[str, dict[str, int]] = {}
+        self.total_entries = 0
+        self.first_timestamp: Optional[datetime] = None
+        self.last_timestamp: Optional[datetime] = None
+        self.level_counts: Counter = Counter()
+        self.logger_counts: Counter = Counter()
+        self.hour_of_day_counts: Counter = Counter()
+        self.hourly_total: Counter = Counter()
+        self.hourly_errors: Counter = Counter()
+        self.slow_count = 0
+        self.durations = DurationSketch()
+        self.duration_stats = RunningStats()
+        self.duration_anomalies: list[tuple[float, int, dict[str, Any]]] = []
+        self._anomaly_seq = 0
+        self.error_templates = TemplateClusterer(self.template_similarity)
+        self.slow_endpoints: dict[str, _EndpointAggregate] = {}
+        self.api_endpoints: dict[str, _EndpointAggregate] = {}
+        self.sessions: "OrderedDict[str, SessionFlow]" = OrderedDict()
+        self.evicted_sessions = 0
+        self.evicted_error_sessions = 0
+        self.error_session_components: set[str] = set()
+        self.error_session_first: Optional[datetime] = None
+        self.error_session_last: Optional[datetime] = None
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+
+    def add_entry(self, entry: LogEntry) -> None:
+        """Fold one parsed entry into every aggregator."""
+        self.total_entries += 1
+        ts = entry.timestamp
+        if self.first_timestamp is None or ts < self.first_timestamp:
+            self.first_timestamp = ts
+        if self.last_timestamp is None or ts > self.last_timestamp:
+            self.last_timestamp = ts
+
+        is_error = entry.level in _ERROR_CRITICAL_LEVELS
+        self.level_counts[entry.level.value] += 1
+        self.logger_counts[entry.logger_name] += 1
+        self.hour_of_day_counts[ts.strftime("%H:00")] += 1
+        hour_key = ts.strftime("%Y-%m-%d %H:00")
+        self.hourly_total[hour_key] += 1
+        if is_error:
+            self.hourly_errors[hour_key] += 1
+
+        if entry.level in _ERROR_CRITICAL_WARNING_LEVELS:
+            normalized = self._base._normalize_error_message(entry.message)
+            self.error_templates.add(normalized, entry)
+
+        if entry.duration_ms:
+            self._add_duration(entry)
+        if entry.endpoint:
+            self._add_to_endpoint(self.api_endpoints, entry.endpoint, entry, 3, False)
+        if entry.session_id:
+            self._add_to_session(entry, is_error)
+
+    def _add_duration(self, entry: LogEntry) -> None:
+        """Update duration sketch, running stats and slow-endpoint aggregates."""
+        duration = entry.duration_ms
+        stats = self.duration_stats
+        if stats.count >= _MIN_DURATION_SAMPLES and stats.stdev > 0:
+            deviation = (duration - stats.mean) / stats.stdev
+            if abs(deviation) > self.anomaly_deviation_threshold:
+                self._record_duration_anomaly(entry, stats.mean, deviation)
+        stats.add(duration)
+        self.durations.add(duration)
+
+        if duration > self.slow_request_threshold_ms:
+            self.slow_count += 1
+            key = entry.endpoint or entry.logger_name
+            self._add_to_endpoint(self.slow_endpoints, key, entry, 5, True)
+
+    def _record_duration_anomaly(
+        self, entry: LogEntry, expected: float, deviation: float
+    ) -> None:
+        """Keep the ``_MAX_DURATION_ANOMALIES`` largest deviations."""
+        self._anomaly_seq += 1
+        item = (
+            abs(deviation),
+            self._anomaly_seq,
+            {
+                "expected": expected,
+                "deviation": deviation,
+                "entry": _entry_state(entry),
+            },
+        )
+        if len(self.duration_anomalies) < _MAX_DURATION_ANOMALIES:
+            heapq.heappush(self.duration_anomalies, item)
+        elif item[0] > self.duration_anomalies[0][0]:
+            heapq.heapreplace(self.duration_anomalies, item)
+
+    @staticmethod
+    def _add_to_endpoint(
+        table: dict[str, _EndpointAggregate],
+        key: str,
+        entry: LogEntry,
+        max_samples: int,
+        with_sketch: bool,
+    ) -> None:
+        """Update an endpoint aggregate; new keys are ignored once full."""
+        aggregate = table.get(key)
+        if aggregate is None:
+            if len(table) >= _MAX_ENDPOINTS:
+                return
+            aggregate = table[key] = _EndpointAggregate(
+                sketch=DurationSketch() if with_sketch else None
+            )
+        aggregate.add(entry, max_samples)
+
+    def _add_to_session(self, entry: LogEntry, is_error: bool) -> None:
+        """Update the entry's session, evicting the least recent when full."""
+        session = self.sessions.get(entry.session_id)
+        if session is None:
+            session = SessionFlow(
+                session_id=entry.session_id,
+                start_time=entry.timestamp,
+                end_time=None,
+            )
+            self.sessions[entry.session_id] = session
+            if len(self.sessions) > _MAX_SESSIONS:
+                _, evicted = self.sessions.popitem(last=False)
+                self.evicted_sessions += 1
+                if evicted.errors:
+                    self.evicted_error_sessions += 1
+        else:
+            self.sessions.move_to_end(entry.session_id)
+
+        session.end_time = entry.timestamp
+        session.request_count += 1
+        if entry.endpoint and len(session.endpoints) < _MAX_SESSION_ENDPOINTS:
+            session.endpoints.append(entry.endpoint)
+        if entry.duration_ms:
+            session.total_duration_ms += entry.duration_ms
+        if is_error:
+            if len(session.errors) < _MAX_SESSION_ERRORS:
+                session.errors.append(entry.message[:100])
+            self._track_error_session(session)
+
+    def _track_error_session(self, session: SessionFlow) -> None:
+        """Running time range and components of sessions with errors."""
+        if (
+            self.error_session_first is None
+            or session.start_time < self.error_session_first
+        ):
+            self.error_session_first = session.start_time
+        end = session.end_time or session.start_time
+        if self.error_session_last is None or end > self.error_session_last:
+            self.error_session_last = end
+        for endpoint in session.endpoints[:3]:
+            if len(self.error_session_components) < _MAX_CLUSTER_COMPONENTS:
+                self.error_session_components.add(endpoint)
+
+    # ------------------------------------------------------------------
+    # Sources
+    # ------------------------------------------------------------------
+
+    def consume_file(self, file_path: str) -> int:
+        """Parse entries appended to a file since its checkpointed offset.
+
+        With a checkpoint, only complete lines are consumed and a trailing
+        partial line is left for the next run; without one, the last line
+        is parsed even if it has no trailing newline.
+
+        Returns:
+            Number of entries parsed in this call
+        """
+        path = Path(file_path)
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            logger.warning("Log file not found: %s", file_path)
+            return 0
+        except OSError as e:
+            logger.warning("Failed to parse log file %s: %s", file_path, e)
+            return 0
+
+        parsed = 0
+        with f:
+            stat = os.fstat(f.fileno())
+            state = self.file_offsets.get(str(path))
+            if (
+                state is None
+                or state["inode"] != stat.st_ino
+                or state["device"] != stat.st_dev
+                or stat.st_size < state["offset"]
+            ):
+                state = {"device": stat.st_dev, "inode": stat.st_ino}
+                state.update(offset=0, line_number=0)
+            offset, line_number = state["offset"], state["line_number"]
+
+            f.seek(offset)
+            pending = b""
+            while True:
+                block = f.read(_READ_BLOCK_SIZE)
+                if not block:
+                    break
+                data = pending + block
+                cut = data.rfind(b"\n") + 1
+                pending = data[cut:]
+                for raw in data[:cut].split(b"\n")[:-1]:
+                    line_number += 1
+                    parsed += self._consume_line(raw, line_number, file_path)
+                offset += cut
+            if pending and self.checkpoint_path is None:
+                line_number += 1
+                parsed += self._consume_line(pending, line_number, file_path)
+                offset += len(pending)
+
+            state["offset"], state["line_number"] = offset, line_number
+            self.file_offsets[str(path)] = state
+        return parsed
+
+    def _consume_line(self, raw: bytes, line_number: int, source: str) -> int:
+        """Parse one raw line; returns 1 if it produced an entry."""
+        line = raw.decode("utf-8", errors="ignore")
+        entry = LogParser.parse_line(line, line_number, source)
+        if entry is None:
+            return 0
+        self.add_entry(entry)
+        return 1
+
+    def consume_content(self, content: str, source: str = "inline") -> int:
+        """Parse an in-memory log string (not checkpointed)."""
+        parsed = 0
+        for line_number, line in enumerate(content.split("\n"), 1):
+            entry = LogParser.parse_line(line, line_number, source)
+            if entry:
+                self.add_entry(entry)
+                parsed += 1
+        return parsed
+
+    def analyze(
+        self, log_files: Optional[list[str]] = None, content: Optional[str] = None
+    ) -> MiningResult:
+        """Consume new log data and return results over all data seen.
+
+        Args:
+            log_files: List of log file paths
+            content: Direct log content string
+
+        Returns:
+            MiningResult with all findings
+        """
+        files_analyzed = 0
+        for file_path in log_files or []:
+            if self.consume_file(file_path):
+                files_analyzed += 1
+        if content and self.consume_content(content):
+            files_analyzed += 1
+
+        if self.checkpoint_path:
+            self.save_checkpoint()
+
+        if not self.total_entries:
+            return self._base._create_empty_result()
+        return self._build_result(files_analyzed)
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    def _error_patterns(self) -> list[LogPattern]:
+        patterns = []
+        for cluster in self.error_templates.clusters():
+            if cluster.count < self.min_pattern_occurrences:
+                continue
+            template = cluster.template
+            patterns.append(
+                LogPattern(
+                    id="",
+                    pattern_type=PatternType.RECURRING_ERROR,
+                    description=f"Recurring error: {template[:100]}",
+                    occurrences=cluster.count,
+                    first_seen=cluster.first_seen,
+                    last_seen=cluster.last_seen,
+                    affected_components=sorted(cluster.components),
+                    sample_entries=list(cluster.samples),
+                    severity=cluster.severity,
+                    extra_data={
+                        "normalized_message": template,
+                        "unique_messages": len(cluster.message_hashes),
+                    },
+                )
+            )
+        return patterns
+
+    def _performance_patterns(self) -> list[LogPattern]:
+        patterns = []
+        for endpoint, agg in self.slow_endpoints.items():
+            if agg.count < self.min_pattern_occurrences:
+                continue
+            sketch = agg.sketch
+            patterns.append(
+                LogPattern(
+                    id="",
+                    pattern_type=PatternType.PERFORMANCE_BOTTLENECK,
+                    description=(
+                        f"Slow endpoint: {endpoint} (avg: {agg.avg_duration:.1f}ms)"
+                    ),
+                    occurrences=agg.count,
+                    first_seen=agg.first_seen,
+                    last_seen=agg.last_seen,
+                    affected_components=[endpoint],
+                    sample_entries=list(agg.samples),
+                    severity=LogLevel.WARNING,
+                    extra_data={
+                        "avg_duration_ms": round(agg.avg_duration, 2),
+                        "max_duration_ms": sketch.max,
+                        "min_duration_ms": sketch.min,
+                        "p50_duration_ms": round(sketch.quantile(0.5), 2),
+                        "p95_duration_ms": round(sketch.quantile(0.95), 2),
+                        "threshold_ms": self.slow_request_threshold_ms,
+                    },
+                )
+            )
+        return patterns
+
+    def _api_patterns(self) -> list[LogPattern]:
+        patterns = []
+        ranked = sorted(
+            self.api_endpoints.items(), key=lambda x: x[1].count, reverse=True
+        )
+        for endpoint, agg in ranked[:10]:
+            if agg.count < self.min_pattern_occurrences:
+                continue
+            patterns.append(
+                LogPattern(
+                    id="",
+                    pattern_type=PatternType.API_USAGE,
+                    description=f"High-traffic endpoint: {endpoint}",
+                    occurrences=agg.count,
+                    first_seen=agg.first_seen,
+                    last_seen=agg.last_seen,
+                    affected_components=[
+                        endpoint.split()[1] if " " in endpoint else endpoint
+                    ],
+                    sample_entries=list(agg.samples),
+                    severity=LogLevel.WARNING if agg.error_count else LogLevel.INFO,
+                    extra_data={
+                        "avg_duration_ms": round(agg.avg_duration, 2),
+                        "error_count": agg.error_count,
+                        "success_rate": round(
+                            (agg.count - agg.error_count) / agg.count * 100, 1
+                        ),
+                    },
+                )
+            )
+        return patterns
+
+    def _session_patterns(self) -> list[LogPattern]:
+        total = len(self.sessions) + self.evicted_sessions
+        error_sessions = self.evicted_error_sessions + sum(
+            1 for s in self.sessions.values() if s.errors
+        )
+        if not total or error_sessions < self.min_pattern_occurrences:
+            return []
+        return [
+            LogPattern(
+                id="",
+                pattern_type=PatternType.SESSION_FLOW,
+                description=f"Sessions with errors: {error_sessions} sessions",
+                occurrences=error_sessions,
+                first_seen=self.error_session_first,
+                last_seen=self.error_session_last,
+                affected_components=sorted(self.error_session_components),
+                severity=LogLevel.WARNING,
+                extra_data={
+                    "total_sessions": total,
+                    "error_session_count": error_sessions,
+                    "error_rate": round(error_sessions / total * 100, 1),
+                },
+            )
+        ]
+
+    def _anomalies(self) -> list[Anomaly]:
+        anomalies = []
+        for _, _, item in sorted(self.duration_anomalies, key=lambda x: x[1]):
+            entry = _entry_from_state(item["entry"])
+            deviation = item["deviation"]
+            anomalies.append(
+                Anomaly(
+                    id="",
+                    anomaly_type=(
+                        AnomalyType.SPIKE if deviation > 0 else AnomalyType.DROP
+                    ),
+                    description=(
+                        f"Unusual duration: {entry.duration_ms:.1f}ms "
+                        f"(expected: {item['expected']:.1f}ms)"
+                    ),
+                    detected_at=entry.timestamp,
+                    severity=LogLevel.WARNING,
+                    metric_name="request_duration",
+                    expected_value=item["expected"],
+                    actual_value=entry.duration_ms,
+                    deviation_percent=abs(deviation) * 100,
+                    related_entries=[entry],
+                )
+            )
+
+        # Hourly error-rate anomalies come straight from the hourly counters
+        self._base.anomalies = anomalies
+        self._base._add_error_rate_anomalies(self.hourly_errors, self.hourly_total)
+        for idx, anomaly in enumerate(anomalies, 1):
+            anomaly.id = f"ANOM-{idx}"
+        return anomalies
+
+    def _statistics(self) -> dict[str, Any]:
+        sketch = self.durations
+        return {
+            "by_level": dict(self.level_counts),
+            "by_logger": dict(self.logger_counts.most_common(10)),
+            "by_hour": dict(sorted(self.hour_of_day_counts.items())),
+            "total_errors": self.level_counts.get("error", 0)
+            + self.level_counts.get("critical", 0),
+            "total_warnings": self.level_counts.get("warning", 0),
+            "avg_duration_ms": round(sketch.mean, 2),
+            "max_duration_ms": sketch.max if sketch.count else 0,
+            "min_duration_ms": sketch.min if sketch.count else 0,
+            "duration_percentiles_ms": {
+                f"p{int(q * 100)}": round(sketch.quantile(q), 2)
+                for q in (0.5, 0.9, 0.95, 0.99)
+            },
+            "unique_sessions": len(self.sessions) + self.evicted_sessions,
+            "unique_endpoints": len(self.api_endpoints),
+            "error_templates": self.error_templates.cluster_count,
+            "unclustered_errors": self.error_templates.unclustered,
+        }
+
+    def _health_score(self, patterns: list[LogPattern], anomalies: list) -> float:
+        """Same weighting as LogPatternMiner._calculate_health_score()."""
+        total = self.total_entries
+        errors = self.level_counts.get("error", 0) + self.level_counts.get(
+            "critical", 0
+        )
+        score = 100.0
+        score -= min(30, errors / total * 100)
+        score -= min(20, len(patterns) * 2)
+        score -= min(20, len(anomalies) * 3)
+        score -= min(15, self.slow_count / total * 100)
+        return max(0, round(score, 1))
+
+    def _build_result(self, files_analyzed: int) -> MiningResult:
+        prefixed = [
+            ("ERR", self._error_patterns()),
+            ("PERF", self._performance_patterns()),
+            ("API", self._api_patterns()),
+            ("SESS", self._session_patterns()),
+        ]
+        patterns: list[LogPattern] = []
+        for prefix, group in prefixed:
+            for pattern in group:
+                pattern.id = f"{prefix}-{len(patterns) + 1}"
+                patterns.append(pattern)
+        anomalies = self._anomalies()
+
+        critical = [p for p in patterns if p.severity in _ERROR_CRITICAL_LEVELS]
+        warning = [p for p in patterns if p.severity == LogLevel.WARNING]
+        summary = {
+            "total_patterns": len(patterns),
+            "critical_patterns": len(critical),
+            "warning_patterns": len(warning),
+            "total_anomalies": len(anomalies),
+            "sessions_analyzed": len(self.sessions) + self.evicted_sessions,
+            "top_issues": [
+                {
+                    "type": p.pattern_type.value,
+                    "description": p.description[:80],
+                    "occurrences": p.occurrences,
+                }
+                for p in sorted(patterns, key=lambda x: x.occurrences, reverse=True)[:5]
+            ],
+            "health_score": self._health_score(patterns, anomalies),
+        }
+
+        return MiningResult(
+            id=f"mining-{datetime.now().strftime('%Y%m%d%H%M%S')}",
+            timestamp=datetime.now(),
+            files_analyzed=files_analyzed,
+            total_entries=self.total_entries,
+            time_range=(self.first_timestamp, self.last_timestamp),
+            patterns=patterns,
+            anomalies=anomalies,
+            sessions=list(self.sessions.values()),
+            statistics=self._statistics(),
+            summary=summary,
+        )
+
+    # ------------------------------------------------------------------
+    # Checkpointing
+    # ------------------------------------------------------------------
+
+    def _state(self) -> dict[str, Any]:
+        return {
+            "version": CHECKPOINT_VERSION,
+            "settings": {
+                "slow_request_threshold_ms": self.slow_request_threshold_ms,
+                "error_threshold": self.error_threshold,
+                "anomaly_deviation_threshold": self.anomaly_deviation_threshold,
+                "min_pattern_occurrences": self.min_pattern_occurrences,
+                "template_similarity": self.template_similarity,
+            },
+            "files": self.file_offsets,
+            "total_entries": self.total_entries,
+            "first_timestamp": _ts(self.first_timestamp),
+            "last_timestamp": _ts(self.last_timestamp),
+            "level_counts": dict(self.level_counts),
+            "logger_counts": dict(self.logger_counts),
+            "hour_of_day_counts": dict(self.hour_of_day_counts),
+            "hourly_total": dict(self.hourly_total),
+            "hourly_errors": dict(self.hourly_errors),
+            "slow_count": self.slow_count,
+            "durations": self.durations.to_state(),
+            "duration_stats": [
+                self.duration_stats.count,
+                self.duration_stats.mean,
+                self.duration_stats.m2,
+            ],
+            "duration_anomalies": self.duration_anomalies,
+            "anomaly_seq": self._anomaly_seq,
+            "error_templates": self.error_templates.to_state(),
+            "slow_endpoints": {k: v.to_state() for k, v in self.slow_endpoints.items()},
+            "api_endpoints": {k: v.to_state() for k, v in self.api_endpoints.items()},
+            "sessions": [s.to_dict() for s in self.sessions.values()],
+            "evicted_sessions": self.evicted_sessions,
+            "evicted_error_sessions": self.evicted_error_sessions,
+            "error_session_components": sorted(self.error_session_components),
+            "error_session_first": _ts(self.error_session_first),
+            "error_session_last": _ts(self.error_session_last),
+        }
+
+    def _restore(self, state: dict[str, Any]) -> None:
+        self.file_offsets = state["files"]
+        self.total_entries = state["total_entries"]
+        self.first_timestamp = _from_ts(state["first_timestamp"])
+        self.last_timestamp = _from_ts(state["last_timestamp"])
+        self.level_counts = Counter(state["level_counts"])
+        self.logger_counts = Counter(state["logger_counts"])
+        self.hour_of_day_counts = Counter(state["hour_of_day_counts"])
+        self.hourly_total = Counter(state["hourly_total"])
+        self.hourly_errors = Counter(state["hourly_errors"])
+        self.slow_count = state["slow_count"]
+        self.durations = DurationSketch.from_state(state["durations"])
+        self.duration_stats = RunningStats(*state["duration_stats"])
+        self.duration_anomalies = [tuple(a) for a in state["duration_anomalies"]]
+        heapq.heapify(self.duration_anomalies)
+        self._anomaly_seq = state["anomaly_seq"]
+        self.error_templates = TemplateClusterer.from_state(state["error_templates"])
+        self.slow_endpoints = {
+            k: _EndpointAggregate.from_state(v)
+            for k, v in state["slow_endpoints"].items()
+        }
+        self.api_endpoints = {
+            k: _EndpointAggregate.from_state(v)
+            for k, v in state["api_endpoints"].items()
+        }
+        self.sessions = OrderedDict(
+            (s["session_id"], _session_from_state(s)) for s in state["sessions"]
+        )
+        self.evicted_sessions = state["evicted_sessions"]
+        self.evicted_error_sessions = state["evicted_error_sessions"]
+        self.error_session_components = set(state["error_session_components"])
+        self.error_session_first = _from_ts(state["error_session_first"])
+        self.error_session_last = _from_ts(state["error_session_last"])
+
+    def _load_checkpoint(self) -> None:
+        """Restore offsets and aggregates; start fresh if unusable."""
+        try:
+            with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable mining checkpoint: %s", e)
+            return
+
+        expected_settings = self._state()["settings"]
+        if (
+            state.get("version") != CHECKPOINT_VERSION
+            or state.get("settings") != expected_settings
+        ):
+            logger.info("Mining checkpoint is stale, starting from scratch")
+            return
+        try:
+            self._restore(state)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning("Ignoring corrupt mining checkpoint: %s", e)
+            self.reset()
+
+    def save_checkpoint(self) -> None:
+        """Atomically write offsets and aggregate state."""
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.checkpoint_path.with_suffix(
+            self.checkpoint_path.suffix + ".tmp"
+        )
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._state(), f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+
+def analyze_logs_streaming(
+    log_files: Optional[list[str]] = None,
+    content: Optional[str] = None,
+    slow_threshold_ms: float = 100.0,
+    checkpoint_path: Optional[str] = None,
+) -> MiningResult:
+    """
+    Analyze log files in a single streaming pass with bounded memory.
+
+    Args:
+        log_files: List of log file paths
+        content: Direct log content string
+        slow_threshold_ms: Threshold for slow request detection
+        checkpoint_path: Resume from (and update) this checkpoint file
+
+    Returns:
+        MiningResult with all findings
+    """
+    miner = StreamingLogMiner(
+        slow_request_threshold_ms=slow_threshold_ms, checkpoint_path=checkpoint_path
+    )
+    return miner.analyze(log_files, content)
@@ -0,0 +1,216 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Unit tests for the streaming log pattern miner (Issue #226).
+
+Tests the streaming mining mode including:
+- Quantile sketch accuracy
+- Streaming error template clustering
+- Parity with the batch miner on small logs
+- Checkpointed incremental runs, rotation and partial lines
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from code_intelligence.log_pattern_miner import LogPatternMiner, PatternType
+from code_intelligence.log_stream_miner import (
+    DurationSketch,
+    StreamingLogMiner,
+    TemplateClusterer,
+    analyze_logs_streaming,
+)
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+def _line(ts, level, message, logger_name="backend.api"):
+    return f"{ts:%Y-%m-%d %H:%M:%S} - {logger_name} - {level} - {message}\n"
+
+
+@pytest.fixture
+def sample_log():
+    base = datetime(2025, 1, 15, 10, 0, 0)
+    lines = []
+    for i in range(30):
+        ts = base + timedelta(minutes=i)
+        lines.append(
+            _line(
+                ts, "INFO", f"API_CALL: GET /api/users DURATION={40 + i}ms STATUS=200"
+            )
+        )
+        lines.append(
+            _line(ts, "INFO", f"Query done DURATION={150 + i}ms SESSION=s{i % 4}")
+        )
+        if i % 3 == 0:
+            lines.append(
+                _line(ts, "ERROR", f"Connection to 10.0.0.{i} failed after {i} retries")
+            )
+    return "".join(lines)
+
+
+# ============================================================================
+# Aggregators
+# ============================================================================
+
+
+class TestDurationSketch:
+    """Tests for DurationSketch."""
+
+    def test_quantiles_within_relative_error(self):
+        rng = random.Random(7)
+        values = [rng.lognormvariate(4, 1) for _ in range(20000)]
+        sketch = DurationSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        values.sort()
+        for q in (0.5, 0.9, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+        assert sketch.min == values[0]
+        assert sketch.max == values[-1]
+        assert len(sketch.buckets) < 1000
+
+    def test_state_round_trip(self):
+        sketch = DurationSketch()
+        for value in (0, 1.5, 10, 250):
+            sketch.add(value)
+        restored = DurationSketch.from_state(sketch.to_state())
+        assert restored.quantile(0.5) == sketch.quantile(0.5)
+        assert restored.count == 4
+
+
+class TestTemplateClusterer:
+    """Tests for TemplateClusterer."""
+
+    def test_variable_tokens_become_wildcards(self, miner_entry):
+        clusterer = TemplateClusterer()
+        clusterer.add("User alice not found in table users", miner_entry)
+        cluster = clusterer.add("User bob not found in table users", miner_entry)
+        clusterer.add("Disk quota exceeded for volume data", miner_entry)
+
+        assert cluster.template == "User <*> not found in table users"
+        assert cluster.count == 2
+        assert clusterer.cluster_count == 2
+
+    def test_cluster_cap(self, miner_entry):
+        clusterer = TemplateClusterer(max_clusters=2)
+        for word in ("alpha", "beta", "gamma", "delta"):
+            clusterer.add(f"{word} one two three", miner_entry)
+        assert clusterer.cluster_count == 2
+        assert clusterer.unclustered == 2
+        assert sum(c.count for c in clusterer.clusters()) == 2
+
+
+@pytest.fixture
+def miner_entry():
+    miner = LogPatternMiner()
+    return miner.parse_content(_line(datetime(2025, 1, 1), "ERROR", "boom"))[0]
+
+
+# ============================================================================
+# Streaming mining
+# ============================================================================
+
+
+class TestStreamingLogMiner:
+    """Tests for StreamingLogMiner."""
+
+    def test_matches_batch_miner(self, sample_log):
+        batch = LogPatternMiner().analyze(content=sample_log)
+        stream = StreamingLogMiner().analyze(content=sample_log)
+
+        assert stream.total_entries == batch.total_entries
+        assert stream.time_range == batch.time_range
+        assert stream.statistics["by_level"] == batch.statistics["by_level"]
+        assert (
+            stream.statistics["max_duration_ms"] == batch.statistics["max_duration_ms"]
+        )
+        assert (
+            stream.statistics["avg_duration_ms"] == batch.statistics["avg_duration_ms"]
+        )
+
+        def by_type(result):
+            return sorted(
+                (p.pattern_type.value, p.occurrences) for p in result.patterns
+            )
+
+        assert by_type(stream) == by_type(batch)
+        errors = [
+            p for p in stream.patterns if p.pattern_type == PatternType.RECURRING_ERROR
+        ]
+        assert errors[0].extra_data["unique_messages"] == 10
+
+    def test_checkpoint_only_reads_appended_data(self, tmp_path, sample_log):
+        log = tmp_path / "backend.log"
+        checkpoint = tmp_path / "mining.json"
+        log.write_text(sample_log)
+
+        first = analyze_logs_streaming([str(log)], checkpoint_path=str(checkpoint))
+        assert first.total_entries == 70
+
+        miner = StreamingLogMiner(checkpoint_path=str(checkpoint))
+        assert miner.consume_file(str(log)) == 0
+
+        with open(log, "a") as f:
+            f.write(_line(datetime(2025, 1, 15, 12), "ERROR", "late failure"))
+            f.write("2025-01-15 12:00:01 - backend.api - INFO - partial")
+        assert miner.consume_file(str(log)) == 1
+
+        with open(log, "a") as f:
+            f.write(" line\n")
+        assert miner.consume_file(str(log)) == 1
+        assert miner.total_entries == 72
+
+    def test_last_line_without_newline_is_parsed_without_checkpoint(
+        self, tmp_path, sample_log
+    ):
+        log = tmp_path / "backend.log"
+        log.write_text(sample_log + "2025-01-15 12:00:01 - backend.api - INFO - end")
+
+        assert StreamingLogMiner().consume_file(str(log)) == 71
+
+    def test_checkpoint_with_other_thresholds_is_stale(self, tmp_path, sample_log):
+        log = tmp_path / "backend.log"
+        log.write_text(sample_log)
+        checkpoint = str(tmp_path / "mining.json")
+        analyze_logs_streaming([str(log)], checkpoint_path=checkpoint)
+
+        miner = StreamingLogMiner(checkpoint_path=checkpoint, min_pattern_occurrences=5)
+        assert miner.total_entries == 0
+        assert miner.consume_file(str(log)) == 70
+
+    def test_rotated_file_is_read_from_start(self, tmp_path, sample_log):
+        log = tmp_path / "backend.log"
+        log.write_text(sample_log)
+        miner = StreamingLogMiner(checkpoint_path=str(tmp_path / "mining.json"))
+        miner.analyze([str(log)])
+
+        log.rename(tmp_path / "backend.log.1")
+        log.write_text(_line(datetime(2025, 1, 16), "INFO", "fresh file"))
+        result = miner.analyze([str(log)])
+        assert result.total_entries == 71
+        assert result.files_analyzed == 1
+
+    def test_checkpoint_restores_aggregates(self, tmp_path, sample_log):
+        log = tmp_path / "backend.log"
+        log.write_text(sample_log)
+        checkpoint = str(tmp_path / "mining.json")
+        expected = analyze_logs_streaming([str(log)], checkpoint_path=checkpoint)
+
+        resumed = StreamingLogMiner(checkpoint_path=checkpoint).analyze([str(log)])
+        assert resumed.files_analyzed == 0
+        assert resumed.statistics == expected.statistics
+        assert [p.to_dict() for p in resumed.patterns] == [
+            p.to_dict() for p in expected.patterns
+        ]
+
+    def test_empty_input(self):
+        result = StreamingLogMiner().analyze(content="")
+        assert result.total_entries == 0
+        assert result.summary["message"] == "No log entries found"
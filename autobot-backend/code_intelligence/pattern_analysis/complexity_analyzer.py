@@ -14,6 +14,12 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
+from code_intelligence.shared.fused_visitor import (
+    SKIP_CHILDREN,
+    FusedPass,
+    run_fused_passes,
+)
+
 from .types import CodeLocation, ComplexityHotspot, PatternSeverity
 
 # Issue #607: Import shared caches for performance optimization
@@ -122,7 +128,7 @@ class ModuleComplexity:
         return "F"
 
 
-class NestingDepthVisitor(ast.NodeVisitor):
+class NestingDepthVisitor(FusedPass):
     """AST visitor to calculate nesting depth."""
 
     def __init__(self):
@@ -130,39 +136,22 @@ class NestingDepthVisitor(ast.NodeVisitor):
         self.max_depth = 0
         self.current_depth = 0
 
-    def _increase_depth(self, node: ast.AST) -> None:
-        """Increase depth and visit children."""
+    def enter_If(self, node: ast.AST) -> None:
+        """Track depth of if/for/while/try/with/except blocks."""
         self.current_depth += 1
         self.max_depth = max(self.max_depth, self.current_depth)
-        self.generic_visit(node)
-        self.current_depth -= 1
-
-    def visit_If(self, node: ast.If) -> None:
-        """Track if statement depth."""
-        self._increase_depth(node)
-
-    def visit_For(self, node: ast.For) -> None:
-        """Track for loop depth."""
-        self._increase_depth(node)
-
-    def visit_While(self, node: ast.While) -> None:
-        """Track while loop depth."""
-        self._increase_depth(node)
-
-    def visit_Try(self, node: ast.Try) -> None:
-        """Track try block depth."""
-        self._increase_depth(node)
 
-    def visit_With(self, node: ast.With) -> None:
-        """Track with statement depth."""
-        self._increase_depth(node)
+    def leave_If(self, node: ast.AST) -> None:
+        """Leave a nesting block."""
+        self.current_depth -= 1
 
-    def visit_ExceptHandler(self, node: ast.ExceptHandler) -> None:
-        """Track except handler depth."""
-        self._increase_depth(node)
+    enter_For = enter_While = enter_Try = enter_With = enter_If
+    enter_ExceptHandler = enter_If
+    leave_For = leave_While = leave_Try = leave_With = leave_If
+    leave_ExceptHandler = leave_If
 
 
-class CognitiveComplexityVisitor(ast.NodeVisitor):
+class CognitiveComplexityVisitor(FusedPass):
     """AST visitor to calculate cognitive complexity.
 
     Cognitive complexity is a metric that measures how difficult code is
@@ -178,60 +167,33 @@ class CognitiveComplexityVisitor(ast.NodeVisitor):
         """Increment complexity with nesting bonus."""
         self.complexity += amount + self.nesting_level
 
-    def _with_nesting(self, node: ast.AST) -> None:
-        """Visit node with increased nesting level."""
-        self.nesting_level += 1
-        self.generic_visit(node)
-        self.nesting_level -= 1
-
-    def visit_If(self, node: ast.If) -> None:
-        """If statements add complexity."""
+    def enter_If(self, node: ast.AST) -> None:
+        """If/for/while/try add complexity and a nesting level."""
         self._increment()
-        self._with_nesting(node)
-
-    def visit_For(self, node: ast.For) -> None:
-        """For loops add complexity."""
-        self._increment()
-        self._with_nesting(node)
+        self.nesting_level += 1
 
-    def visit_While(self, node: ast.While) -> None:
-        """While loops add complexity."""
-        self._increment()
-        self._with_nesting(node)
+    def leave_If(self, node: ast.AST) -> None:
+        """Leave a nesting block."""
+        self.nesting_level -= 1
 
-    def visit_Try(self, node: ast.Try) -> None:
-        """Try blocks add complexity."""
-        self._increment()
-        self._with_nesting(node)
+    enter_For = enter_While = enter_Try = enter_If
+    leave_For = leave_While = leave_Try = leave_If
 
-    def visit_ExceptHandler(self, node: ast.ExceptHandler) -> None:
+    def enter_ExceptHandler(self, node: ast.ExceptHandler) -> None:
         """Each except handler adds complexity."""
         self._increment()
-        self.generic_visit(node)
 
-    def visit_BoolOp(self, node: ast.BoolOp) -> None:
+    def enter_BoolOp(self, node: ast.BoolOp) -> None:
         """Boolean operations add complexity for each operator."""
         # Each additional condition after the first adds 1
         self.complexity += len(node.values) - 1
-        self.generic_visit(node)
 
-    def visit_Break(self, node: ast.Break) -> None:
-        """Break statements add complexity (flow interruption)."""
+    def enter_Break(self, node: ast.AST) -> str:
+        """Break/continue/raise add complexity (flow interruption)."""
         self._increment()
+        return SKIP_CHILDREN
 
-    def visit_Continue(self, node: ast.Continue) -> None:
-        """Continue statements add complexity (flow interruption)."""
-        self._increment()
-
-    def visit_Raise(self, node: ast.Raise) -> None:
-        """Raise statements add complexity (flow interruption)."""
-        self._increment()
-
-    def visit_Return(self, node: ast.Return) -> None:
-        """Early returns add complexity (except at end of function)."""
-        # Note: We can't easily detect if it's the last statement
-        # So we'll count all returns for now
-        self.generic_visit(node)
+    enter_Continue = enter_Raise = enter_Break
 
 
 class ComplexityAnalyzer:
@@ -501,11 +463,10 @@ class ComplexityAnalyzer:
         # Calculate complexity metrics using helper methods
         cc = self._calculate_cyclomatic_complexity_fallback(node)
 
+        # One walk of the function feeds both metrics
         nesting_visitor = NestingDepthVisitor()
-        nesting_visitor.visit(node)
-
         cognitive_visitor = CognitiveComplexityVisitor()
-        cognitive_visitor.visit(node)
+        run_fused_passes(node, [nesting_visitor, cognitive_visitor])
 
         param_count = self._count_function_parameters(node)
         end_line = getattr(node, "end_lineno", node.lineno)
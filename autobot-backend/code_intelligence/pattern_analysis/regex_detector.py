@@ -15,6 +15,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
+from code_intelligence.shared.fused_visitor import FusedPass
+
 from .types import CodeLocation, PatternSeverity, RegexOpportunity
 
 # Issue #607: Import shared caches for performance optimization
@@ -95,7 +97,7 @@ class StringOperationChain:
         return False
 
 
-class StringOperationVisitor(ast.NodeVisitor):
+class StringOperationVisitor(FusedPass):
     """AST visitor to detect string operations that could use regex."""
 
     def __init__(self, source_lines: List[str], file_path: str):
@@ -106,44 +108,48 @@ class StringOperationVisitor(ast.NodeVisitor):
         self.current_class: Optional[str] = None
         self.operation_chains: List[StringOperationChain] = []
         self._chain_starts: Dict[int, StringOperationChain] = {}
+        self._class_stack: List[Optional[str]] = []
+        self._function_stack: List[Optional[str]] = []
+
+    def result(self) -> List[StringOperationChain]:
+        """Operation chains found in this file."""
+        return self.operation_chains
 
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+    def enter_ClassDef(self, node: ast.ClassDef) -> None:
         """Track current class context."""
-        old_class = self.current_class
+        self._class_stack.append(self.current_class)
         self.current_class = node.name
-        self.generic_visit(node)
-        self.current_class = old_class
-
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        """Track current function context."""
-        self._visit_function(node)
 
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
-        """Track current async function context."""
-        self._visit_function(node)
+    def leave_ClassDef(self, node: ast.ClassDef) -> None:
+        """Restore enclosing class context."""
+        self.current_class = self._class_stack.pop()
 
-    def _visit_function(self, node) -> None:
-        """Common function visiting logic."""
-        old_function = self.current_function
+    def enter_FunctionDef(self, node) -> None:
+        """Track current (async) function context."""
+        self._function_stack.append(self.current_function)
         self.current_function = node.name
-        self.generic_visit(node)
-        self.current_function = old_function
 
-    def visit_Assign(self, node: ast.Assign) -> None:
+    def leave_FunctionDef(self, node) -> None:
+        """Restore enclosing function context."""
+        self.current_function = self._function_stack.pop()
+
+    enter_AsyncFunctionDef = enter_FunctionDef
+    leave_AsyncFunctionDef = leave_FunctionDef
+
+    def enter_Assign(self, node: ast.Assign) -> None:
         """Check assignments for string operation chains."""
-        if isinstance(node.value, ast.Call):
-            chain = self._extract_call_chain(node.value)
-            if chain and len(chain) >= 2:
-                self._record_chain(node, chain)
-        self.generic_visit(node)
+        self._check_statement(node)
 
-    def visit_Expr(self, node: ast.Expr) -> None:
+    def enter_Expr(self, node: ast.Expr) -> None:
         """Check expressions for string operation chains."""
+        self._check_statement(node)
+
+    def _check_statement(self, node) -> None:
+        """Record a chain of string method calls in a statement's value."""
         if isinstance(node.value, ast.Call):
             chain = self._extract_call_chain(node.value)
             if chain and len(chain) >= 2:
                 self._record_chain(node, chain)
-        self.generic_visit(node)
 
     def _extract_call_chain(self, node: ast.Call) -> List[str]:
         """Extract a chain of method calls from a Call node."""
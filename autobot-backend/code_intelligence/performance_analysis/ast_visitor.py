@@ -10,7 +10,9 @@ Contains the AST visitor that analyzes code for performance patterns.
 
 import ast
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from code_intelligence.shared.fused_visitor import FusedPass
 
 from .patterns import (
     BLOCKING_IO_OPERATIONS,
@@ -33,8 +35,11 @@ from .types import (
 logger = logging.getLogger(__name__)
 
 
-class PerformanceASTVisitor(ast.NodeVisitor):
-    """AST visitor for performance pattern analysis."""
+class PerformanceASTVisitor(FusedPass):
+    """AST visitor for performance pattern analysis.
+
+    Runs as a FusedPass so it can share one traversal with other analyzers.
+    """
 
     def __init__(self, file_path: str, source_lines: List[str]):
         """Initialize AST visitor with file context and loop tracking state."""
@@ -47,79 +52,68 @@ class PerformanceASTVisitor(ast.NodeVisitor):
         self.loop_stack: List[ast.AST] = []
         self.function_calls_in_loop: List[tuple] = []
         self.awaits_in_function: List[ast.Await] = []
+        self._function_stack: List[Tuple[Optional[str], bool]] = []
 
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        """Analyze synchronous function definitions."""
-        old_function = self.current_function
-        old_async = self.async_context
+    def result(self) -> List[PerformanceIssue]:
+        """Findings for this file."""
+        return self.findings
+
+    def _enter_function(self, node, is_async: bool) -> None:
+        """Save enclosing function context and enter ``node``."""
+        self._function_stack.append((self.current_function, self.async_context))
         self.current_function = node.name
-        self.async_context = False
+        self.async_context = is_async
         self.awaits_in_function = []
 
+    def enter_FunctionDef(self, node: ast.FunctionDef) -> None:
+        """Analyze synchronous function definitions."""
+        self._enter_function(node, is_async=False)
         self._analyze_function(node)
-        self.generic_visit(node)
-
-        self.current_function = old_function
-        self.async_context = old_async
 
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+    def enter_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
         """Analyze async function definitions."""
-        old_function = self.current_function
-        old_async = self.async_context
-        self.current_function = node.name
-        self.async_context = True
-        self.awaits_in_function = []
-
+        self._enter_function(node, is_async=True)
         self._analyze_function(node)
         self._check_sequential_awaits(node)
-        self.generic_visit(node)
 
-        self.current_function = old_function
-        self.async_context = old_async
+    def leave_FunctionDef(self, node) -> None:
+        """Restore enclosing function context."""
+        self.current_function, self.async_context = self._function_stack.pop()
 
-    def visit_For(self, node: ast.For) -> None:
-        """Analyze for loops."""
-        self.loop_depth += 1
-        self.loop_stack.append(node)
+    leave_AsyncFunctionDef = leave_FunctionDef
 
-        self._check_loop_patterns(node)
-        self.generic_visit(node)
-
-        self.loop_stack.pop()
-        self.loop_depth -= 1
-
-    def visit_While(self, node: ast.While) -> None:
-        """Analyze while loops."""
+    def enter_For(self, node) -> None:
+        """Analyze for and while loops."""
         self.loop_depth += 1
         self.loop_stack.append(node)
-
         self._check_loop_patterns(node)
-        self.generic_visit(node)
 
+    def leave_For(self, node) -> None:
+        """Leave a loop body."""
         self.loop_stack.pop()
         self.loop_depth -= 1
 
-    def visit_ListComp(self, node: ast.ListComp) -> None:
+    enter_While = enter_For
+    leave_While = leave_For
+
+    def enter_ListComp(self, node: ast.ListComp) -> None:
         """Analyze list comprehensions."""
         # Count nested generators
         nesting = len(node.generators)
         if nesting >= 2:
             self._add_complexity_issue(node, nesting)
-        self.generic_visit(node)
 
-    def visit_Call(self, node: ast.Call) -> None:
+    def enter_Call(self, node: ast.Call) -> None:
         """Analyze function calls for performance issues."""
         self._check_call_in_loop(node)
         self._check_blocking_in_async(node)
         self._check_inefficient_operations(node)
-        self.generic_visit(node)
 
-    def visit_Await(self, node: ast.Await) -> None:
+    def enter_Await(self, node: ast.Await) -> None:
         """Track await expressions."""
         self.awaits_in_function.append(node)
-        self.generic_visit(node)
 
-    def visit_BinOp(self, node: ast.BinOp) -> None:
+    def enter_BinOp(self, node: ast.BinOp) -> None:
         """Check for inefficient string concatenation in loops."""
         if self.loop_depth > 0 and isinstance(node.op, ast.Add):
             if self._is_string_concat(node):
@@ -140,7 +134,6 @@ class PerformanceASTVisitor(ast.NodeVisitor):
                         confidence=0.8,
                     )
                 )
-        self.generic_visit(node)
 
     def _analyze_function(self, node) -> None:
         """Analyze function body for performance patterns."""
@@ -26,6 +26,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, FrozenSet, List, Optional, Set
 
+from code_intelligence.shared.fused_visitor import FusedPass
+
 # Issue #554: Import analytics infrastructure for semantic analysis
 try:
     from code_intelligence.analytics_infrastructure import (
@@ -319,8 +321,11 @@ COMMAND_INJECTION_PATTERNS = [
 ]
 
 
-class SecurityASTVisitor(ast.NodeVisitor):
-    """AST visitor for security pattern analysis."""
+class SecurityASTVisitor(FusedPass):
+    """AST visitor for security pattern analysis.
+
+    Runs as a FusedPass so it can share one traversal with other analyzers.
+    """
 
     def __init__(self, file_path: str, source_lines: List[str]):
         """Initialize AST visitor with file context and tracking state."""
@@ -331,54 +336,55 @@ class SecurityASTVisitor(ast.NodeVisitor):
         self.function_context: Optional[str] = None
         self.class_context: Optional[str] = None
         self.has_input_validation: Dict[str, bool] = {}
+        self._function_stack: List[Optional[str]] = []
+        self._class_stack: List[Optional[str]] = []
+
+    def result(self) -> List[SecurityFinding]:
+        """Findings for this file."""
+        return self.findings
 
-    def visit_Import(self, node: ast.Import) -> None:
+    def enter_Import(self, node: ast.Import) -> None:
         """Track imports for context."""
         for alias in node.names:
             self.imports.add(alias.name.split(".")[0])
-        self.generic_visit(node)
 
-    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+    def enter_ImportFrom(self, node: ast.ImportFrom) -> None:
         """Track from imports."""
         if node.module:
             self.imports.add(node.module.split(".")[0])
-        self.generic_visit(node)
 
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+    def enter_FunctionDef(self, node: ast.FunctionDef) -> None:
         """Analyze function definitions."""
-        old_context = self.function_context
+        self._function_stack.append(self.function_context)
         self.function_context = node.name
         self._check_function_security(node)
-        self.generic_visit(node)
-        self.function_context = old_context
 
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
-        """Analyze async function definitions."""
-        old_context = self.function_context
-        self.function_context = node.name
-        self._check_function_security(node)
-        self.generic_visit(node)
-        self.function_context = old_context
+    def leave_FunctionDef(self, node: ast.FunctionDef) -> None:
+        """Restore enclosing function context."""
+        self.function_context = self._function_stack.pop()
 
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+    enter_AsyncFunctionDef = enter_FunctionDef
+    leave_AsyncFunctionDef = leave_FunctionDef
+
+    def enter_ClassDef(self, node: ast.ClassDef) -> None:
         """Track class context."""
-        old_context = self.class_context
+        self._class_stack.append(self.class_context)
         self.class_context = node.name
-        self.generic_visit(node)
-        self.class_context = old_context
 
-    def visit_Call(self, node: ast.Call) -> None:
+    def leave_ClassDef(self, node: ast.ClassDef) -> None:
+        """Restore enclosing class context."""
+        self.class_context = self._class_stack.pop()
+
+    def enter_Call(self, node: ast.Call) -> None:
         """Analyze function calls for security issues."""
         self._check_dangerous_calls(node)
         self._check_crypto_usage(node)
         self._check_deserialization(node)
         self._check_subprocess_usage(node)
-        self.generic_visit(node)
 
-    def visit_Assign(self, node: ast.Assign) -> None:
+    def enter_Assign(self, node: ast.Assign) -> None:
         """Check assignments for security issues."""
         self._check_debug_settings(node)
-        self.generic_visit(node)
 
     def _check_function_security(self, node) -> None:
         """Check function for security patterns."""
@@ -11,6 +11,7 @@ Components:
     - FileListCache: Cached file discovery (eliminates 10+ rglob calls)
     - ASTCache: Cached AST parsing (eliminates 5-10x redundant parsing)
     - FileContentCache: Cached file content reading
+    - FusedWalker: One AST traversal dispatched to many analyzer passes
 
 Part of EPIC #217 - Advanced Code Intelligence Methods
 """
@@ -31,6 +32,13 @@ from code_intelligence.shared.file_cache import (
     get_python_files,
     invalidate_file_cache,
 )
+from code_intelligence.shared.fused_visitor import (
+    SKIP_CHILDREN,
+    FusedPass,
+    FusedWalker,
+    analyze_files_fused,
+    run_fused_passes,
+)
 
 # Issue #686: Scoring utilities for consistent score calculation
 from code_intelligence.shared.scoring import (
@@ -59,6 +67,12 @@ __all__ = [
     "get_ast_with_content",
     "invalidate_ast_cache",
     "get_ast_cache_stats",
+    # Fused AST traversal
+    "FusedPass",
+    "FusedWalker",
+    "SKIP_CHILDREN",
+    "run_fused_passes",
+    "analyze_files_fused",
     # Scoring utilities (Issue #686)
     "calculate_exponential_score",
     "calculate_weighted_deduction",
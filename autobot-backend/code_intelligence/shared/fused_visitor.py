@@ -0,0 +1,246 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Fused AST Visitor Framework for Code Intelligence Analyzers
+
+Issue #607 follow-up: ASTCache removed redundant parsing, but every analyzer
+still walked the full tree with its own ast.NodeVisitor. With 6-10 analyzers
+that is 6-10 walks per file.
+
+Solution:
+    - Analyzers subclass FusedPass and register per-node-type callbacks by
+      naming convention: enter_<NodeType>(node) runs before the node's
+      children, leave_<NodeType>(node) after them (the code a NodeVisitor
+      runs before and after generic_visit()). An enter callback returns
+      SKIP_CHILDREN where a NodeVisitor method would not call
+      generic_visit(); the subtree is then hidden from that pass only.
+    - FusedWalker dispatches one iterative traversal to every pass.
+    - analyze_files_fused() shards files across a process pool; each worker
+      parses a file once (through its ASTCache) and walks it once.
+
+Usage:
+    from code_intelligence.shared.fused_visitor import FusedPass, run_fused_passes
+
+    class CallCounter(FusedPass):
+        def __init__(self):
+            self.calls = 0
+
+        def enter_Call(self, node):
+            self.calls += 1
+
+    # One walk feeds every pass
+    counter = CallCounter()
+    run_fused_passes(tree, [counter, SecurityASTVisitor(path, lines)])
+
+    # Single-pass compatibility: passes keep NodeVisitor's entry point
+    CallCounter().visit(tree)
+
+    # Whole-repository sweep across a process pool
+    analyze_files_fused(paths, pass_factory)
+
+Part of EPIC #217 - Advanced Code Intelligence Methods
+"""
+
+import ast
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+ENTER_PREFIX = "enter_"
+LEAVE_PREFIX = "leave_"
+
+# Returned by an enter callback to keep its pass out of the node's children
+SKIP_CHILDREN = "skip_children"
+
+# Below this many files a process pool costs more than it saves
+_MIN_FILES_FOR_POOL = 16
+
+Callback = Callable[[ast.AST], Optional[str]]
+
+# Per-class cache of (enter handlers, leave handlers) by node type name
+_handler_names_cache: Dict[type, Tuple[Dict[str, str], Dict[str, str]]] = {}
+
+
+def _handler_names(pass_cls: type) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Map node type name -> method name for a pass class's callbacks."""
+    cached = _handler_names_cache.get(pass_cls)
+    if cached is not None:
+        return cached
+
+    enters: Dict[str, str] = {}
+    leaves: Dict[str, str] = {}
+    for attr in dir(pass_cls):
+        if attr.startswith(ENTER_PREFIX):
+            enters[attr[len(ENTER_PREFIX) :]] = attr
+        elif attr.startswith(LEAVE_PREFIX):
+            leaves[attr[len(LEAVE_PREFIX) :]] = attr
+    _handler_names_cache[pass_cls] = (enters, leaves)
+    return enters, leaves
+
+
+class FusedPass:
+    """
+    Base class for an analyzer that runs inside a fused AST traversal.
+
+    Subclasses define enter_<NodeType>/leave_<NodeType> methods for the node
+    types they care about. Children are visited unless the enter callback
+    returns SKIP_CHILDREN; there is no generic_visit() to call.
+    """
+
+    def visit(self, tree: ast.AST) -> None:
+        """Walk ``tree`` with this pass alone (NodeVisitor-compatible)."""
+        FusedWalker([self]).walk(tree)
+
+    def result(self) -> Any:
+        """Picklable result returned from process-pool workers."""
+        return None
+
+
+class FusedWalker:
+    """
+    Dispatch one depth-first traversal to many FusedPass instances.
+
+    Callbacks for a node run in pass registration order; enter callbacks
+    fire in pre-order and leave callbacks in post-order, matching the order
+    ast.NodeVisitor visits children. A pass whose enter callback returns
+    SKIP_CHILDREN gets no callbacks for that node's descendants, while the
+    other passes still see them. Traversal is iterative, so deeply nested
+    files cannot hit the recursion limit.
+    """
+
+    def __init__(self, passes: Sequence[FusedPass]):
+        """Build the node type -> (pass index, callback) dispatch table."""
+        self._enter: Dict[str, List[Tuple[int, Callback]]] = {}
+        self._leave: Dict[str, List[Tuple[int, Callback]]] = {}
+        for pass_id, fused_pass in enumerate(passes):
+            enters, leaves = _handler_names(type(fused_pass))
+            for node_type, method in enters.items():
+                self._enter.setdefault(node_type, []).append(
+                    (pass_id, getattr(fused_pass, method))
+                )
+            for node_type, method in leaves.items():
+                self._leave.setdefault(node_type, []).append(
+                    (pass_id, getattr(fused_pass, method))
+                )
+        self._pass_count = len(passes)
+        self.nodes_visited = 0
+
+    def walk(self, tree: ast.AST) -> None:
+        """Traverse ``tree`` once, dispatching to every registered pass."""
+        enter, leave = self._enter, self._leave
+        # Passes currently inside a subtree they skipped
+        muted: Set[int] = set()
+        # (node, leaving, passes to unmute): leaving entries replay leave
+        # callbacks post-order and end the skips started at that node
+        stack: List[Tuple[ast.AST, bool, Tuple[int, ...]]] = [(tree, False, ())]
+        visited = 0
+
+        while stack:
+            node, leaving, skipped = stack.pop()
+            node_type = node.__class__.__name__
+            if leaving:
+                muted.difference_update(skipped)
+                for pass_id, callback in leave.get(node_type, ()):
+                    if pass_id not in muted:
+                        callback(node)
+                continue
+
+            visited += 1
+            skipped = ()
+            for pass_id, callback in enter.get(node_type, ()):
+                if pass_id in muted:
+                    continue
+                if callback(node) == SKIP_CHILDREN:
+                    skipped += (pass_id,)
+            muted.update(skipped)
+            if skipped or node_type in leave:
+                stack.append((node, True, skipped))
+            if len(muted) == self._pass_count:
+                continue  # no pass wants this subtree
+            children = list(ast.iter_child_nodes(node))
+            stack.extend((child, False, ()) for child in reversed(children))
+
+        self.nodes_visited += visited
+
+
+def run_fused_passes(tree: ast.AST, passes: Sequence[FusedPass]) -> int:
+    """Run all ``passes`` over ``tree`` in a single walk.
+
+    Returns:
+        Number of AST nodes visited
+    """
+    walker = FusedWalker(passes)
+    walker.walk(tree)
+    return walker.nodes_visited
+
+
+PassFactory = Callable[[str, List[str]], Sequence[FusedPass]]
+
+
+def _analyze_file(
+    file_path: str, pass_factory: PassFactory
+) -> Tuple[str, Optional[List[Any]]]:
+    """Parse (cached) and walk one file; returns per-pass results.
+
+    Module-level so it can run in process-pool workers.
+    """
+    from code_intelligence.shared.ast_cache import get_ast_with_content
+
+    try:
+        tree, content = get_ast_with_content(file_path)
+    except Exception as e:
+        logger.debug("Could not read %s: %s", file_path, e)
+        return file_path, None
+    if tree is None:
+        return file_path, None
+
+    passes = pass_factory(file_path, content.split("\n") if content else [])
+    run_fused_passes(tree, passes)
+    return file_path, [p.result() for p in passes]
+
+
+def _analyze_chunk(
+    args: Tuple[List[str], PassFactory],
+) -> List[Tuple[str, Optional[List[Any]]]]:
+    """Worker entry point: analyze a shard of files in one process."""
+    file_paths, pass_factory = args
+    return [_analyze_file(path, pass_factory) for path in file_paths]
+
+
+def analyze_files_fused(
+    file_paths: Iterable[str],
+    pass_factory: PassFactory,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Optional[List[Any]]]:
+    """Run a set of passes over many files: one parse and one walk per file.
+
+    Files are sharded across a process pool (one shard per worker) so CPU-
+    bound AST work scales with cores instead of contending for the GIL.
+
+    Args:
+        file_paths: Python files to analyze
+        pass_factory: Picklable (module-level) callable returning fresh
+            passes for a (file_path, source_lines) pair
+        max_workers: Worker processes (default: CPU count; 1 runs inline)
+
+    Returns:
+        file_path -> list of pass.result() in factory order, or None when the
+        file could not be parsed
+    """
+    paths = [str(p) for p in file_paths]
+    workers = max_workers or os.cpu_count() or 1
+
+    if workers <= 1 or len(paths) < _MIN_FILES_FOR_POOL:
+        return dict(_analyze_chunk((paths, pass_factory)))
+
+    workers = min(workers, len(paths))
+    shards = [(paths[i::workers], pass_factory) for i in range(workers)]
+    results: Dict[str, Optional[List[Any]]] = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for shard_results in executor.map(_analyze_chunk, shards):
+            results.update(shard_results)
+    return results
@@ -0,0 +1,189 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Unit Tests for the Fused AST Visitor Framework
+
+Verifies that one traversal dispatches to several passes with the same
+enter/leave ordering a NodeVisitor would produce, and that the
+process-pool sweep returns per-file results in pass order.
+"""
+
+import ast
+import textwrap
+
+from code_intelligence.pattern_analysis.complexity_analyzer import (
+    CognitiveComplexityVisitor,
+    NestingDepthVisitor,
+)
+from code_intelligence.shared.fused_visitor import (
+    SKIP_CHILDREN,
+    FusedPass,
+    FusedWalker,
+    analyze_files_fused,
+    run_fused_passes,
+)
+
+SAMPLE = textwrap.dedent(
+    """
+    class Outer:
+        def method(self, items):
+            for item in items:
+                if item and item.ok:
+                    print(item)
+
+    def helper():
+        return len([1, 2])
+    """
+)
+
+
+class _ContextRecorder(FusedPass):
+    """Record the enclosing function of every call, NodeVisitor-style."""
+
+    def __init__(self):
+        self.stack = []
+        self.calls = []
+
+    def enter_FunctionDef(self, node):
+        self.stack.append(node.name)
+
+    def leave_FunctionDef(self, node):
+        self.stack.pop()
+
+    def enter_Call(self, node):
+        self.calls.append((node.func.id, self.stack[-1] if self.stack else None))
+
+    def result(self):
+        return self.calls
+
+
+class _NodeCounter(FusedPass):
+    def __init__(self):
+        self.count = 0
+
+    def enter_Name(self, node):
+        self.count += 1
+
+    def result(self):
+        return self.count
+
+
+class _ReferenceCounter(ast.NodeVisitor):
+    def __init__(self):
+        self.count = 0
+
+    def visit_Name(self, node):
+        self.count += 1
+        self.generic_visit(node)
+
+
+class _ClassSkipper(FusedPass):
+    """Count names outside class bodies, like a visit_ClassDef without
+    generic_visit()."""
+
+    def __init__(self):
+        self.count = 0
+
+    def enter_ClassDef(self, node):
+        return SKIP_CHILDREN
+
+    def enter_Name(self, node):
+        self.count += 1
+
+
+def _sweep_passes(file_path, source_lines):
+    return [_ContextRecorder(), _NodeCounter()]
+
+
+def test_one_walk_dispatches_to_all_passes():
+    tree = ast.parse(SAMPLE)
+    recorder, counter = _ContextRecorder(), _NodeCounter()
+
+    visited = run_fused_passes(tree, [recorder, counter])
+
+    assert recorder.calls == [("print", "method"), ("len", "helper")]
+    reference = _ReferenceCounter()
+    reference.visit(tree)
+    assert counter.count == reference.count
+    assert visited == sum(1 for _ in ast.walk(tree))
+
+
+def test_visit_keeps_node_visitor_entry_point():
+    counter = _NodeCounter()
+    counter.visit(ast.parse(SAMPLE))
+    assert counter.count > 0
+
+
+def test_deep_nesting_does_not_hit_recursion_limit():
+    expr = ast.Name(id="x", ctx=ast.Load())
+    for _ in range(5000):
+        expr = ast.UnaryOp(op=ast.Not(), operand=expr)
+    tree = ast.Module(body=[ast.Expr(value=expr)], type_ignores=[])
+
+    counter = _NodeCounter()
+    walker = FusedWalker([counter])
+    walker.walk(tree)
+
+    assert counter.count == 1
+    assert walker.nodes_visited > 10000
+
+
+def test_complexity_passes_match_nodevisitor_semantics():
+    func = ast.parse(SAMPLE).body[0].body[0]
+    nesting, cognitive = NestingDepthVisitor(), CognitiveComplexityVisitor()
+
+    run_fused_passes(func, [nesting, cognitive])
+
+    assert nesting.max_depth == 2
+    # for (+1), nested if (+1 +1 nesting), "and" (+1)
+    assert cognitive.complexity == 4
+
+
+def test_skip_children_hides_subtree_from_that_pass_only():
+    tree = ast.parse(SAMPLE)
+    skipper, counter = _ClassSkipper(), _NodeCounter()
+
+    run_fused_passes(tree, [skipper, counter])
+
+    # Only "len" in helper() is outside the class
+    assert skipper.count == 1
+    reference = _ReferenceCounter()
+    reference.visit(tree)
+    assert counter.count == reference.count
+
+
+def test_flow_interruptions_do_not_score_their_operands():
+    func = ast.parse(
+        textwrap.dedent(
+            """
+            def check(value, strict):
+                if not value:
+                    raise ValueError(strict and "missing" or "empty")
+            """
+        )
+    ).body[0]
+    cognitive = CognitiveComplexityVisitor()
+
+    run_fused_passes(func, [cognitive])
+
+    # if (+1), raise (+1 +1 nesting); the BoolOps inside raise are skipped
+    assert cognitive.complexity == 3
+
+
+def test_analyze_files_fused_across_processes(tmp_path):
+    paths = []
+    for i in range(20):
+        path = tmp_path / f"mod_{i}.py"
+        path.write_text(SAMPLE)
+        paths.append(str(path))
+    broken = tmp_path / "broken.py"
+    broken.write_text("def oops(:\n")
+    paths.append(str(broken))
+
+    results = analyze_files_fused(paths, _sweep_passes, max_workers=2)
+
+    assert results[str(broken)] is None
+    calls, names = results[paths[0]]
+    assert calls == [("print", "method"), ("len", "helper")]
+    assert all(results[p] == [calls, names] for p in paths[:20])
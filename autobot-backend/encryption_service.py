@@ -20,6 +20,7 @@ import hashlib
 import logging
 import os
 import secrets
+import threading
 from typing import Optional, Union
 
 from cryptography.hazmat.primitives import hashes
@@ -28,6 +29,37 @@ from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 logger = logging.getLogger(__name__)
 
+# Bound on cached per-salt record ciphers (one per active record stream)
+_MAX_RECORD_CIPHERS = 256
+
+
+class RecordCipher:
+    """
+    AES-GCM cipher for a stream of small records sharing one derived key.
+
+    EncryptionService.encrypt derives a fresh PBKDF2 key per call, which is
+    far too slow for append-only logs with one record per message. A record
+    stream instead derives its key once from a per-stream salt (stored in the
+    stream header) and uses a fresh 96-bit nonce per record.
+    """
+
+    def __init__(self, key: bytes):
+        """Initialize with a derived 32-byte key."""
+        self._aesgcm = AESGCM(key)
+
+    def encrypt(self, plaintext: str) -> str:
+        """Encrypt one record; returns base64(nonce + ciphertext), no newlines."""
+        nonce = secrets.token_bytes(12)
+        ciphertext = self._aesgcm.encrypt(nonce, plaintext.encode("utf-8"), None)
+        return base64.b64encode(nonce + ciphertext).decode("ascii")
+
+    def decrypt(self, token: str) -> str:
+        """Decrypt a record produced by encrypt()."""
+        data = base64.b64decode(token.encode("ascii"))
+        if len(data) < 12:
+            raise ValueError("Invalid encrypted record: too short")
+        return self._aesgcm.decrypt(data[:12], data[12:], None).decode("utf-8")
+
 
 class EncryptionService:
     """
@@ -51,6 +83,9 @@ class EncryptionService:
                 "environment variable."
             )
 
+        self._record_ciphers: dict = {}
+        self._record_ciphers_lock = threading.Lock()
+
         # Validate key strength
         if len(self.master_key) < 32:
             logger.warning(
@@ -187,6 +222,25 @@ class EncryptionService:
         json_str = json.dumps(data, separators=(",", ":"))  # Compact JSON
         return self.encrypt(json_str)
 
+    def get_record_cipher(self, salt: bytes) -> RecordCipher:
+        """
+        Get the record cipher for a record stream salt (key derived once).
+
+        Args:
+            salt: 16-byte salt stored in the record stream header
+
+        Returns:
+            RecordCipher keyed for this salt
+        """
+        with self._record_ciphers_lock:
+            cipher = self._record_ciphers.get(salt)
+            if cipher is None:
+                if len(self._record_ciphers) >= _MAX_RECORD_CIPHERS:
+                    self._record_ciphers.clear()
+                cipher = RecordCipher(self._derive_key(salt))
+                self._record_ciphers[salt] = cipher
+            return cipher
+
     def decrypt_json(self, encrypted_data: str) -> dict:
         """
         Decrypt JSON data.
@@ -250,8 +304,6 @@ class EncryptionService:
 
 
 # Global encryption service instance (thread-safe)
-import threading
-
 _encryption_service: Optional[EncryptionService] = None
 _encryption_service_lock = threading.Lock()
 
@@ -9,6 +9,7 @@ Modular knowledge base implementation composed of specialized mixins.
 This package provides a unified KnowledgeBase class that inherits functionality
 from multiple focused mixins:
 - KnowledgeBaseCore: Initialization, configuration, connections
+- FacetsMixin: Materialized per-category/tag/source/owner/date fact counters
 - StatsMixin: Atomic stats tracking and performance monitoring
 - IndexMixin: ChromaDB index management and rebuild operations
 - SearchMixin: Semantic, keyword, and hybrid search
@@ -46,6 +47,7 @@ from knowledge.bulk import BulkOperationsMixin
 from knowledge.categories import CategoriesMixin
 from knowledge.collections import CollectionsMixin
 from knowledge.documents import DocumentsMixin
+from knowledge.facets import FacetsMixin
 from knowledge.facts import FactsMixin
 from knowledge.index import IndexMixin
 from knowledge.metadata import MetadataMixin
@@ -61,6 +63,7 @@ logger = logging.getLogger(__name__)
 
 class KnowledgeBase(
     KnowledgeBaseCore,
+    FacetsMixin,
     StatsMixin,
     IndexMixin,
     SearchMixin,
@@ -116,7 +119,7 @@ class KnowledgeBase(
         all instance variables that are shared across mixins.
         """
         super().__init__()
-        logger.debug("KnowledgeBase instance created (composed from 14 mixins)")
+        logger.debug("KnowledgeBase instance created (composed from 15 mixins)")
 
     async def initialize(self) -> bool:
         """
@@ -145,6 +148,10 @@ class KnowledgeBase(
             # Additional initialization can go here if needed
             # For now, stats initialization is handled in KnowledgeBaseCore
             await self._initialize_stats_counters()
+            # Backfill the BM25 keyword index on first start after upgrade
+            await self.ensure_keyword_index()
+            # Build facet counters in the background on first start
+            await self.ensure_facet_counters()
 
         return success
 
@@ -16,7 +16,10 @@ import json
 import logging
 from datetime import datetime
 from io import StringIO
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional
+
+from knowledge.dedup import EmbeddingDedupEngine
+from knowledge.search_components.filtered_search import invalidate_filter_cardinalities
 
 if TYPE_CHECKING:
     import aioredis
@@ -1037,24 +1040,25 @@ class BulkOperationsMixin:
 
         Issue #417: Embedding-based similarity detection.
         Issue #398: Refactored using extracted helpers.
+        Uses the blocked EmbeddingDedupEngine instead of a pairwise loop.
         """
         if not hasattr(self, "vector_store") or self.vector_store is None:
             logger.warning("Vector store not available, falling back to hash")
             return self._find_duplicates_by_hash(facts)
 
         try:
-            fact_ids = [f.get("fact_id") for f in facts if f.get("fact_id")]
-            if len(fact_ids) < 2:
-                return []
-
-            embeddings_map = await self._fetch_embeddings_map(fact_ids)
-            if not embeddings_map:
+            engine = await self._build_dedup_engine(facts)
+            if engine is None:
                 return self._find_duplicates_by_hash(facts)
 
             fact_info = self._build_fact_info_map(facts)
-            duplicate_groups = self._find_similar_pairs(
-                fact_ids, embeddings_map, fact_info, similarity_threshold, max_results
-            )
+            duplicate_groups = []
+            async for primary_id, similar in engine.iter_groups(similarity_threshold):
+                duplicate_groups.append(
+                    self._build_similarity_group(primary_id, similar, fact_info)
+                )
+                if len(duplicate_groups) >= max_results:
+                    break
 
             duplicate_groups.sort(key=lambda x: x["max_similarity"], reverse=True)
             return duplicate_groups
@@ -1063,6 +1067,56 @@ class BulkOperationsMixin:
             logger.error("Embedding-based duplicate detection failed: %s", e)
             return self._find_duplicates_by_hash(facts)
 
+    async def iter_duplicate_groups(
+        self,
+        similarity_threshold: float = 0.95,
+        category: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream embedding-based duplicate groups as they are found.
+
+        Unlike find_duplicates, groups are yielded in scan order as soon as
+        each block of the similarity matrix is processed, so callers can
+        report progress over the full KB without waiting for the whole scan.
+
+        Args:
+            similarity_threshold: Minimum cosine similarity
+            category: Optional category filter
+
+        Yields:
+            Duplicate group dicts (same shape as find_duplicates groups)
+        """
+        facts = self._apply_category_filter(await self.get_all_facts(), category)
+        if not facts or getattr(self, "vector_store", None) is None:
+            return
+
+        engine = await self._build_dedup_engine(facts)
+        if engine is None:
+            return
+
+        fact_info = self._build_fact_info_map(facts)
+        async for primary_id, similar in engine.iter_groups(similarity_threshold):
+            yield self._build_similarity_group(primary_id, similar, fact_info)
+
+    async def _build_dedup_engine(
+        self, facts: List[Dict[str, Any]]
+    ) -> Optional[EmbeddingDedupEngine]:
+        """Fetch embeddings for facts and build the dedup engine (None if < 2)."""
+        fact_ids = [f.get("fact_id") for f in facts if f.get("fact_id")]
+        if len(fact_ids) < 2:
+            return None
+
+        embeddings_map = await self._fetch_embeddings_map(fact_ids)
+        if not embeddings_map:
+            return None
+
+        engine = await asyncio.to_thread(
+            EmbeddingDedupEngine.from_embeddings_map, fact_ids, embeddings_map
+        )
+        if engine is not None:
+            logger.info("Dedup engine built over %d embeddings", len(engine))
+        return engine
+
     async def _fetch_embeddings_map(
         self, fact_ids: List[str]
     ) -> Dict[str, List[float]]:
@@ -1077,7 +1131,7 @@ class BulkOperationsMixin:
             include=["embeddings"],
         )
 
-        if not result or not result.get("embeddings"):
+        if result is None or result.get("embeddings") is None:
             logger.warning("No embeddings found, falling back to hash")
             return {}
 
@@ -1100,119 +1154,27 @@ class BulkOperationsMixin:
             for f in facts
         }
 
-    def _find_similar_pairs(
-        self,
-        fact_ids: List[str],
-        embeddings_map: Dict[str, List[float]],
-        fact_info: Dict[str, Dict[str, Any]],
-        threshold: float,
-        max_results: int,
-    ) -> List[Dict[str, Any]]:
-        """
-        Find similar fact pairs using cosine similarity.
-
-        Issue #398: Extracted from _find_duplicates_by_embedding.
-        """
-        duplicate_groups = []
-        processed_pairs: set = set()
-
-        for i, fact_id1 in enumerate(fact_ids):
-            if fact_id1 not in embeddings_map:
-                continue
-
-            similar_facts = self._find_similar_to_fact(
-                fact_id1,
-                fact_ids[i + 1 :],
-                embeddings_map,
-                fact_info,
-                threshold,
-                processed_pairs,
-            )
-
-            if similar_facts:
-                duplicate_groups.append(
-                    {
-                        "primary_fact": fact_info.get(fact_id1, {"fact_id": fact_id1}),
-                        "similar_facts": sorted(
-                            similar_facts, key=lambda x: x["similarity"], reverse=True
-                        ),
-                        "max_similarity": max(f["similarity"] for f in similar_facts),
-                        "reason": "semantic_similarity",
-                    }
-                )
-
-                if len(duplicate_groups) >= max_results:
-                    break
-
-        return duplicate_groups
-
-    def _find_similar_to_fact(
+    def _build_similarity_group(
         self,
-        fact_id1: str,
-        other_ids: List[str],
-        embeddings_map: Dict[str, List[float]],
+        primary_id: str,
+        similar: List[tuple],
         fact_info: Dict[str, Dict[str, Any]],
-        threshold: float,
-        processed_pairs: set,
-    ) -> List[Dict[str, Any]]:
-        """
-        Find facts similar to a given fact.
-
-        Issue #398: Extracted from _find_duplicates_by_embedding.
-        """
-        similar_facts = []
-        emb1 = embeddings_map[fact_id1]
-
-        for fact_id2 in other_ids:
-            if fact_id2 not in embeddings_map:
-                continue
-
-            pair_key = tuple(sorted([fact_id1, fact_id2]))
-            if pair_key in processed_pairs:
-                continue
-            processed_pairs.add(pair_key)
-
-            similarity = self._cosine_similarity(emb1, embeddings_map[fact_id2])
-            if similarity >= threshold:
-                similar_facts.append(
-                    {
-                        "fact_id": fact_id2,
-                        "similarity": round(similarity, 4),
-                        **fact_info.get(fact_id2, {}),
-                    }
-                )
-
-        return similar_facts
-
-    def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
-        """
-        Calculate cosine similarity between two vectors.
-
-        Issue #417: Helper for embedding-based deduplication.
-        """
-        try:
-            # Convert to numpy if available, otherwise use pure Python
-            try:
-                import numpy as np
-
-                v1 = np.array(vec1)
-                v2 = np.array(vec2)
-                dot_product = np.dot(v1, v2)
-                norm1 = np.linalg.norm(v1)
-                norm2 = np.linalg.norm(v2)
-                if norm1 == 0 or norm2 == 0:
-                    return 0.0
-                return float(dot_product / (norm1 * norm2))
-            except ImportError:
-                # Pure Python fallback
-                dot_product = sum(a * b for a, b in zip(vec1, vec2))
-                norm1 = sum(a * a for a in vec1) ** 0.5
-                norm2 = sum(b * b for b in vec2) ** 0.5
-                if norm1 == 0 or norm2 == 0:
-                    return 0.0
-                return dot_product / (norm1 * norm2)
-        except Exception:
-            return 0.0
+    ) -> Dict[str, Any]:
+        """Build a duplicate group dict from engine output (sorted by similarity)."""
+        similar_facts = [
+            {
+                "fact_id": fact_id,
+                "similarity": round(similarity, 4),
+                **fact_info.get(fact_id, {}),
+            }
+            for fact_id, similarity in similar
+        ]
+        return {
+            "primary_fact": fact_info.get(primary_id, {"fact_id": primary_id}),
+            "similar_facts": similar_facts,
+            "max_similarity": similar_facts[0]["similarity"],
+            "reason": "semantic_similarity",
+        }
 
     async def bulk_delete(self, fact_ids: List[str]) -> Dict[str, Any]:
         """
@@ -1797,6 +1759,7 @@ class BulkOperationsMixin:
                 metadatas=[{"content": content[:1000]}],
                 documents=[content[:1000]],
             )
+            invalidate_filter_cardinalities()
             return {"action": "restored", "embedding": True}
         except Exception as e:
             logger.warning("Embedding restore failed: %s", e)
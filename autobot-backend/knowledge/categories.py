@@ -603,8 +603,11 @@ class CategoriesMixin:
         """Remove fact from old category if reassigning (Issue #398: extracted)."""
         old_category = await self._get_fact_category_id(fact_id)
         if old_category and old_category != new_category_id:
-            await self.aioredis_client.srem(f"category:facts:{old_category}", fact_id)
-            await self._decrement_category_count(old_category)
+            removed = await self.aioredis_client.srem(
+                f"category:facts:{old_category}", fact_id
+            )
+            if removed:
+                await self._decrement_category_count(old_category)
 
     async def assign_fact_to_category(
         self, fact_id: str, category_id: str
@@ -1010,15 +1013,20 @@ class CategoriesMixin:
                 await self._update_category_path(cid, child_old_path, child_new_path)
 
     async def _assign_fact_to_category(self, fact_id: str, category_id: str) -> None:
-        """Internal method to assign a fact to a category."""
-        # Add to category's fact set
-        await self.aioredis_client.sadd(f"category:facts:{category_id}", fact_id)
-
-        # Update fact metadata
-        await self.aioredis_client.hset(f"fact:{fact_id}", "category_id", category_id)
+        """Internal method to assign a fact to a category.
 
-        # Increment category count
-        await self.aioredis_client.hincrby(f"category:{category_id}", "fact_count", 1)
+        Membership, the fact's category_id and the category fact_count are
+        written in one transaction; the count only moves for new members.
+        """
+        already_member = await self.aioredis_client.sismember(
+            f"category:facts:{category_id}", fact_id
+        )
+        async with self.aioredis_client.pipeline(transaction=True) as pipe:
+            await pipe.sadd(f"category:facts:{category_id}", fact_id)
+            await pipe.hset(f"fact:{fact_id}", "category_id", category_id)
+            if not already_member:
+                await pipe.hincrby(f"category:{category_id}", "fact_count", 1)
+            await pipe.execute()
 
     async def _remove_fact_category(self, fact_id: str) -> None:
         """Remove category assignment from a fact."""
@@ -1032,15 +1040,9 @@ class CategoriesMixin:
         return category_id if category_id else None
 
     async def _decrement_category_count(self, category_id: str) -> None:
-        """Decrement fact count for a category."""
-        current = await self.aioredis_client.hget(
-            f"category:{category_id}", "fact_count"
+        """Atomically decrement fact count for a category (floored at zero)."""
+        count = await self.aioredis_client.hincrby(
+            f"category:{category_id}", "fact_count", -1
         )
-        if current:
-            count = int(
-                current.decode("utf-8") if isinstance(current, bytes) else current
-            )
-            if count > 0:
-                await self.aioredis_client.hset(
-                    f"category:{category_id}", "fact_count", count - 1
-                )
+        if count < 0:
+            await self.aioredis_client.hset(f"category:{category_id}", "fact_count", 0)
@@ -270,7 +270,7 @@ class CollectionsMixin:
                 fid = fid.decode("utf-8")
             await self.aioredis_client.srem(f"fact:collections:{fid}", collection_id)
             if delete_facts:
-                await self.aioredis_client.delete(f"fact:{fid}")
+                await self.delete_fact_record(fid)
                 facts_deleted += 1
         return facts_deleted
 
@@ -707,7 +707,7 @@ class CollectionsMixin:
             if isinstance(cid, bytes):
                 cid = cid.decode("utf-8")
             await self.aioredis_client.srem(f"collection:facts:{cid}", fid)
-        await self.aioredis_client.delete(f"fact:{fid}")
+        await self.delete_fact_record(fid)
         await self.aioredis_client.delete(f"fact:collections:{fid}")
 
     async def bulk_delete_collection_facts(
@@ -795,3 +795,7 @@ class CollectionsMixin:
             result[key] = val
 
         return result
+
+    async def delete_fact_record(self, fact_id: str) -> None:
+        """Delete a fact hash and its counters - implemented in facets mixin."""
+        raise NotImplementedError("Should be implemented in composed class")
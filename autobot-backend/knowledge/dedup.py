@@ -0,0 +1,143 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Knowledge Base Near-Duplicate Detection Engine
+
+Vectorized replacement for the pairwise Python loop previously used by
+BulkOperationsMixin._find_duplicates_by_embedding.
+
+All embeddings are L2-normalized once into a contiguous float32 matrix so
+cosine similarity becomes a dot product. Candidates are found with blocked
+matrix products (row block x column block), which keeps peak memory at
+``row_block * col_block * 4`` bytes regardless of corpus size, and only the
+upper triangle (j > i) is ever reported so no pair bookkeeping is needed.
+
+Groups are produced per row block and can be consumed as a stream.
+"""
+
+import asyncio
+import logging
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Default block sizes: 512 x 8192 float32 = 16 MiB similarity tile
+DEFAULT_ROW_BLOCK = 512
+DEFAULT_COL_BLOCK = 8192
+
+# (primary_id, [(similar_id, similarity), ...]) sorted by similarity desc
+DuplicateGroup = Tuple[str, List[Tuple[str, float]]]
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize rows in place; zero vectors stay zero (similarity 0)."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    matrix /= norms
+    return matrix
+
+
+class EmbeddingDedupEngine:
+    """
+    Blocked cosine-similarity scanner over a normalized embedding matrix.
+
+    Group semantics match the previous implementation: for every fact in
+    input order, report the later facts whose similarity meets the
+    threshold.
+    """
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        matrix: np.ndarray,
+        row_block: int = DEFAULT_ROW_BLOCK,
+        col_block: int = DEFAULT_COL_BLOCK,
+    ):
+        """
+        Initialize engine.
+
+        Args:
+            ids: Fact IDs, one per matrix row
+            matrix: float32 matrix of L2-normalized embeddings
+            row_block: Rows scanned per block (one streaming step)
+            col_block: Columns per similarity tile
+        """
+        self.ids = list(ids)
+        self.matrix = matrix
+        self.row_block = max(1, row_block)
+        self.col_block = max(1, col_block)
+
+    @classmethod
+    def from_embeddings_map(
+        cls,
+        fact_ids: Sequence[str],
+        embeddings_map: Dict[str, Sequence[float]],
+        **kwargs,
+    ) -> Optional["EmbeddingDedupEngine"]:
+        """
+        Build an engine from a fact_id -> embedding mapping.
+
+        Facts without an embedding are skipped; input order is preserved.
+        Returns None when fewer than two facts have embeddings.
+        """
+        ids = [fid for fid in fact_ids if embeddings_map.get(fid) is not None]
+        if len(ids) < 2:
+            return None
+
+        matrix = np.asarray([embeddings_map[fid] for fid in ids], dtype=np.float32)
+        matrix = np.ascontiguousarray(matrix)
+        return cls(ids, normalize_rows(matrix), **kwargs)
+
+    def __len__(self) -> int:
+        """Number of facts in the engine."""
+        return len(self.ids)
+
+    def scan_row_block(
+        self, start: int, threshold: float
+    ) -> List[Tuple[int, List[Tuple[int, float]]]]:
+        """
+        Find all (i, j > i) pairs at or above threshold for rows [start, start+row_block).
+
+        Returns:
+            List of (row, [(col, similarity), ...]) in row order
+        """
+        n = len(self.ids)
+        end = min(start + self.row_block, n)
+        rows = self.matrix[start:end]
+        hits: Dict[int, List[Tuple[int, float]]] = {}
+
+        for col_start in range(start, n, self.col_block):
+            col_end = min(col_start + self.col_block, n)
+            sims = rows @ self.matrix[col_start:col_end].T
+            row_idx, col_idx = np.nonzero(sims >= threshold)
+            if row_idx.size == 0:
+                continue
+            values = sims[row_idx, col_idx]
+            global_rows = row_idx + start
+            global_cols = col_idx + col_start
+            upper = global_cols > global_rows
+            for r, c, v in zip(
+                global_rows[upper].tolist(),
+                global_cols[upper].tolist(),
+                values[upper].tolist(),
+            ):
+                hits.setdefault(r, []).append((c, v))
+
+        return sorted(hits.items())
+
+    async def iter_groups(self, threshold: float) -> AsyncIterator[DuplicateGroup]:
+        """
+        Stream duplicate groups as each row block is scanned.
+
+        Each block runs in a worker thread (NumPy releases the GIL during
+        the matrix product) so the event loop stays responsive.
+        """
+        n = len(self.ids)
+        for start in range(0, n, self.row_block):
+            block = await asyncio.to_thread(self.scan_row_block, start, threshold)
+            for row, pairs in block:
+                pairs.sort(key=lambda p: p[1], reverse=True)
+                yield self.ids[row], [(self.ids[c], sim) for c, sim in pairs]
@@ -0,0 +1,71 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Unit tests for the blocked near-duplicate detection engine.
+"""
+
+import numpy as np
+import pytest
+from knowledge.dedup import EmbeddingDedupEngine
+
+
+def _brute_force_pairs(vectors, threshold):
+    """Reference O(n^2) cosine scan returning {(i, j): sim} for j > i."""
+    pairs = {}
+    for i in range(len(vectors)):
+        for j in range(i + 1, len(vectors)):
+            a, b = np.asarray(vectors[i]), np.asarray(vectors[j])
+            denom = np.linalg.norm(a) * np.linalg.norm(b)
+            sim = float(a @ b / denom) if denom else 0.0
+            if sim >= threshold:
+                pairs[(i, j)] = sim
+    return pairs
+
+
+class TestEmbeddingDedupEngine:
+    def test_requires_two_embeddings(self):
+        assert EmbeddingDedupEngine.from_embeddings_map(["a"], {"a": [1.0]}) is None
+        assert (
+            EmbeddingDedupEngine.from_embeddings_map(["a", "b"], {"a": [1.0]}) is None
+        )
+
+    @pytest.mark.asyncio
+    async def test_blocked_scan_matches_brute_force(self):
+        rng = np.random.default_rng(7)
+        base = rng.normal(size=(8, 16))
+        # Near-copies of the first rows so there are real duplicates
+        noisy = base[:4] + rng.normal(scale=0.01, size=(4, 16))
+        vectors = np.vstack([base, noisy]).tolist()
+        ids = ["f%d" % i for i in range(len(vectors))]
+
+        engine = EmbeddingDedupEngine.from_embeddings_map(
+            ids, dict(zip(ids, vectors)), row_block=3, col_block=5
+        )
+        found = {}
+        async for primary, similar in engine.iter_groups(0.9):
+            for other, sim in similar:
+                found[(ids.index(primary), ids.index(other))] = sim
+
+        expected = _brute_force_pairs(vectors, 0.9)
+        assert set(found) == set(expected)
+        for pair, sim in expected.items():
+            assert found[pair] == pytest.approx(sim, abs=1e-5)
+
+    @pytest.mark.asyncio
+    async def test_groups_sorted_and_zero_vectors_ignored(self):
+        ids = ["a", "b", "c", "z"]
+        embeddings = {
+            "a": [1.0, 0.0],
+            "b": [0.99, 0.1],
+            "c": [1.0, 0.01],
+            "z": [0.0, 0.0],
+        }
+        engine = EmbeddingDedupEngine.from_embeddings_map(ids, embeddings)
+
+        groups = [g async for g in engine.iter_groups(0.95)]
+
+        primary, similar = groups[0]
+        assert primary == "a"
+        assert [fid for fid, _ in similar] == ["c", "b"]
+        assert all(fid != "z" for _, sims in groups for fid, _ in sims)
@@ -6,15 +6,24 @@ Embedding Cache Module
 
 LRU Cache with TTL for query embeddings to avoid regenerating identical queries.
 Issue #65 P0 Optimization - 60-80% reduction in embedding computation for repeated queries.
+
+EmbeddingStore is the persistent L2 tier: embeddings keyed by
+(canonical model id, sha256(text)) in the Redis "vectors" database, shared
+across workers and restarts by query embedding, fact vectorization and
+background vectorization.
 """
 
 import asyncio
+import base64
 import hashlib
 import logging
 import time
 from collections import OrderedDict
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
 
+from autobot_shared.redis_client import get_redis_client
 from autobot_shared.ssot_config import config
 
 logger = logging.getLogger(__name__)
@@ -171,6 +180,182 @@ class EmbeddingCache:
         logger.info("Embedding cache cleared")
 
 
+def canonical_model_id(model: str) -> str:
+    """Model name as used in store keys.
+
+    Ollama resolves "nomic-embed-text" and "nomic-embed-text:latest" to the
+    same model, and the configured name, the name a backend reports and the
+    name it was asked for can differ only in that tag or in case.
+    """
+    name = model.strip().lower()
+    return name[: -len(":latest")] if name.endswith(":latest") else name
+
+
+def pack_embedding(embedding: Sequence[float]) -> str:
+    """Pack an embedding as base64 little-endian float32.
+
+    Base64 keeps values valid for clients created with decode_responses.
+    """
+    packed = np.asarray(embedding, dtype="<f4")
+    return base64.b64encode(packed.tobytes()).decode("ascii")
+
+
+def unpack_embedding_array(data: Any) -> np.ndarray:
+    """Inverse of pack_embedding as a float32 array (accepts str or bytes)."""
+    return np.frombuffer(base64.b64decode(data), dtype="<f4").astype(np.float32)
+
+
+def unpack_embedding(data: Any) -> List[float]:
+    """Inverse of pack_embedding (accepts str or bytes)."""
+    return unpack_embedding_array(data).tolist()
+
+
+class EmbeddingStore:
+    """
+    Persistent L2 embedding cache in Redis.
+
+    Keys are content-addressed as ``emb:f32:{model}:{sha256(text)}`` so the
+    same text embedded by the same model is computed once across processes
+    and restarts; changing the embedding model naturally misses. The model
+    is reduced to canonical_model_id(), so the name a caller asks for and
+    the name the producing backend reports map to the same key. Values are
+    packed float32 (about a quarter of the size of a JSON float list).
+
+    Redis errors are logged and treated as misses; the cache never fails an
+    embedding request.
+    """
+
+    KEY_PREFIX = "emb:f32:"
+
+    def __init__(self, ttl_seconds: Optional[int] = None, database: str = "vectors"):
+        """
+        Initialize embedding store.
+
+        Args:
+            ttl_seconds: Entry lifetime (default from SSOT config.cache.l2.embedding)
+            database: Named Redis database
+        """
+        self._ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None else config.cache.l2.embedding
+        )
+        self._database = database
+        self._hits = 0
+        self._misses = 0
+        self._bytes_saved = 0
+        self._errors = 0
+
+    @classmethod
+    def make_key(cls, model: str, text: str) -> str:
+        """Content-addressed key for a (model, text) pair."""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{cls.KEY_PREFIX}{canonical_model_id(model)}:{digest}"
+
+    async def _get_redis(self):
+        """Get async Redis client, or None when unavailable."""
+        try:
+            return await get_redis_client(async_client=True, database=self._database)
+        except Exception as e:
+            logger.debug("Embedding store Redis unavailable: %s", e)
+            return None
+
+    async def get_many(
+        self, model: str, texts: Sequence[str]
+    ) -> List[Optional[np.ndarray]]:
+        """
+        Look up embeddings for texts.
+
+        Returns:
+            One entry per text: the float32 embedding array, or None on a miss
+        """
+        if not texts:
+            return []
+        redis = await self._get_redis()
+        if redis is None:
+            return [None] * len(texts)
+        try:
+            values = await redis.mget([self.make_key(model, t) for t in texts])
+        except Exception as e:
+            self._errors += 1
+            logger.warning("Embedding store lookup failed: %s", e)
+            return [None] * len(texts)
+
+        results: List[Optional[np.ndarray]] = []
+        saved = 0
+        for text, value in zip(texts, values):
+            embedding = None
+            if value:
+                try:
+                    embedding = unpack_embedding_array(value)
+                except Exception as e:
+                    logger.debug("Corrupt embedding store entry: %s", e)
+            if embedding is not None:
+                saved += len(text.encode("utf-8"))
+            results.append(embedding)
+
+        hits = sum(1 for r in results if r is not None)
+        self._record(hits, len(results) - hits, saved)
+        return results
+
+    async def put_many(
+        self,
+        model: str,
+        texts: Sequence[str],
+        embeddings: Sequence[Sequence[float]],
+    ) -> None:
+        """Store embeddings for texts (one pipelined round-trip).
+
+        embeddings may be an (n, dim) array or a sequence of vectors.
+        """
+        if not texts:
+            return
+        redis = await self._get_redis()
+        if redis is None:
+            return
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                for text, embedding in zip(texts, embeddings):
+                    if embedding is not None and len(embedding):
+                        pipe.set(
+                            self.make_key(model, text),
+                            pack_embedding(embedding),
+                            ex=self._ttl_seconds,
+                        )
+                await pipe.execute()
+        except Exception as e:
+            self._errors += 1
+            logger.warning("Embedding store write failed: %s", e)
+
+    def _record(self, hits: int, misses: int, bytes_saved: int) -> None:
+        """Update counters and export Prometheus metrics."""
+        self._hits += hits
+        self._misses += misses
+        self._bytes_saved += bytes_saved
+        try:
+            from monitoring.prometheus_metrics import get_metrics_manager
+
+            metrics = get_metrics_manager()
+            if hits:
+                metrics.record_knowledge_cache_hit("embedding_l2", hits)
+                metrics.record_knowledge_cache_bytes_saved("embedding_l2", bytes_saved)
+            if misses:
+                metrics.record_knowledge_cache_miss("embedding_l2", misses)
+        except Exception as e:
+            logger.debug("Failed to record embedding store metrics: %s", e)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return store statistics."""
+        total = self._hits + self._misses
+        return {
+            "name": "embedding_l2",
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": (self._hits / total) if total > 0 else 0.0,
+            "bytes_saved": self._bytes_saved,
+            "errors": self._errors,
+            "ttl_seconds": self._ttl_seconds,
+        }
+
+
 # Global embedding cache instance
 # Issue #743: Uses SSOT config defaults (no explicit size needed)
 _embedding_cache = EmbeddingCache(ttl_seconds=3600)
@@ -179,3 +364,14 @@ _embedding_cache = EmbeddingCache(ttl_seconds=3600)
 def get_embedding_cache() -> EmbeddingCache:
     """Get the global embedding cache instance."""
     return _embedding_cache
+
+
+_embedding_store: Optional[EmbeddingStore] = None
+
+
+def get_embedding_store() -> EmbeddingStore:
+    """Get the global persistent (L2) embedding store."""
+    global _embedding_store
+    if _embedding_store is None:
+        _embedding_store = EmbeddingStore()
+    return _embedding_store
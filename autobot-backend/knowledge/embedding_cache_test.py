@@ -4,8 +4,16 @@ Tests the LRU cache with TTL for ChromaDB query embeddings.
 """
 
 import asyncio
+from unittest.mock import AsyncMock, patch
 
+import numpy as np
 import pytest
+from knowledge.embedding_cache import (
+    EmbeddingStore,
+    canonical_model_id,
+    pack_embedding,
+    unpack_embedding,
+)
 from knowledge_base import EmbeddingCache, get_embedding_cache
 
 
@@ -263,3 +271,84 @@ class TestEmbeddingCacheIntegration:
         assert "cache_size" in stats
         assert stats["hits"] == 1
         assert stats["misses"] == 1
+
+
+class _FakeAsyncRedis:
+    """Minimal async Redis with mget and pipelined set."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def mget(self, keys):
+        return [self.data.get(k) for k in keys]
+
+    def pipeline(self, transaction=True):
+        redis = self
+
+        class _Pipe:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def set(self, key, value, ex=None):
+                redis.data[key] = value
+
+            async def execute(self):
+                return []
+
+        return _Pipe()
+
+
+class TestEmbeddingStore:
+    """Test the persistent (L2) embedding store"""
+
+    def test_pack_roundtrip_is_float32(self):
+        packed = pack_embedding([0.5, -1.25, 3.0])
+        assert unpack_embedding(packed) == [0.5, -1.25, 3.0]
+        assert unpack_embedding(packed.encode("ascii")) == [0.5, -1.25, 3.0]
+
+    def test_keys_are_content_addressed_per_model(self):
+        assert EmbeddingStore.make_key("m", "text") == EmbeddingStore.make_key(
+            "m", "text"
+        )
+        assert EmbeddingStore.make_key("m", "text") != EmbeddingStore.make_key(
+            "other", "text"
+        )
+
+    def test_keys_use_canonical_model_id(self):
+        assert canonical_model_id(" Nomic-Embed-Text:latest ") == "nomic-embed-text"
+        assert canonical_model_id("bge-m3:567m") == "bge-m3:567m"
+        assert EmbeddingStore.make_key(
+            "nomic-embed-text:latest", "text"
+        ) == EmbeddingStore.make_key("nomic-embed-text", "text")
+
+    @pytest.mark.asyncio
+    async def test_put_then_get_many(self):
+        redis = _FakeAsyncRedis()
+        store = EmbeddingStore(ttl_seconds=60)
+        with patch(
+            "knowledge.embedding_cache.get_redis_client",
+            AsyncMock(return_value=redis),
+        ):
+            await store.put_many("m", ["hello"], np.array([[0.25, 0.5]]))
+            results = await store.get_many("m", ["hello", "missing"])
+
+        assert results[0].dtype == np.float32
+        assert results[0].tolist() == [0.25, 0.5]
+        assert results[1] is None
+        stats = store.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["bytes_saved"] == len("hello")
+
+    @pytest.mark.asyncio
+    async def test_redis_unavailable_is_a_miss(self):
+        store = EmbeddingStore(ttl_seconds=60)
+        with patch(
+            "knowledge.embedding_cache.get_redis_client",
+            AsyncMock(side_effect=ConnectionError("down")),
+        ):
+            assert await store.get_many("m", ["a"]) == [None]
+            await store.put_many("m", ["a"], [[1.0]])
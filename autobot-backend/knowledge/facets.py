@@ -0,0 +1,508 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Knowledge Base Facet Counters Module
+
+Contains the FacetsMixin class which keeps materialized fact counts per
+category, tag, source, owner and creation date in Redis hashes
+(kb:facets:<dimension>). Fact writes update the counters in the same
+MULTI/EXEC transaction as the fact hash, so dashboards and tag/category
+listings read O(1) counters instead of scanning every fact:* key.
+
+Counters are built once in the background from existing data and repaired
+by the consistency check that also verifies the kb:stats counters.
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from redis.exceptions import WatchError
+
+if TYPE_CHECKING:
+    import aioredis
+    import redis
+
+logger = logging.getLogger(__name__)
+
+FACET_KEY_PREFIX = "kb:facets:"
+FACET_META_KEY = "kb:facets:meta"
+FACET_DIMENSIONS = ("category", "tag", "source", "owner", "date")
+
+# Facts are read in pipelined batches while (re)building counters
+FACET_BUILD_BATCH_SIZE = 500
+# Seconds a counter hash being built may live before it is renamed in
+FACET_BUILD_KEY_TTL = 3600
+# Drift entries reported per dimension by the consistency check
+FACET_DRIFT_REPORT_LIMIT = 20
+
+FacetDeltas = Dict[Tuple[str, str], int]
+
+
+def _decode(value: Any) -> Any:
+    """Decode bytes returned by non-decoding Redis clients."""
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def _parse_metadata(raw: Any) -> Dict[str, Any]:
+    """Parse a stored metadata field, tolerating missing or invalid JSON."""
+    if isinstance(raw, dict):
+        return raw
+    if not raw:
+        return {}
+    try:
+        parsed = json.loads(_decode(raw))
+    except (json.JSONDecodeError, TypeError, UnicodeDecodeError):
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+def fact_facet_values(metadata: Optional[Dict[str, Any]]) -> Dict[str, List[str]]:
+    """Return the facet values a fact with this metadata is counted under.
+
+    Args:
+        metadata: Parsed fact metadata, or None for a fact that does not exist
+
+    Returns:
+        Dict mapping each facet dimension to the values the fact contributes
+    """
+    if metadata is None:
+        return {dimension: [] for dimension in FACET_DIMENSIONS}
+
+    tags = metadata.get("tags") or []
+    if isinstance(tags, str):
+        tags = [tags]
+    normalized_tags = sorted({str(t).lower().strip() for t in tags if str(t).strip()})
+
+    source = metadata.get("source_type") or metadata.get("source")
+    owner = metadata.get("owner_id") or metadata.get("user_id")
+    created = metadata.get("timestamp") or metadata.get("created_at")
+
+    return {
+        "category": [str(metadata.get("category") or "uncategorized")],
+        "tag": normalized_tags,
+        "source": [str(source)] if source else [],
+        "owner": [str(owner)] if owner else [],
+        "date": [str(created)[:10]] if created else [],
+    }
+
+
+def facet_deltas(
+    before: Optional[Dict[str, Any]], after: Optional[Dict[str, Any]]
+) -> FacetDeltas:
+    """Compute counter changes for a fact moving from one metadata to another.
+
+    Pass None as ``before`` for a newly stored fact and None as ``after``
+    for a deleted one. Unchanged facet values produce no delta.
+    """
+    old_values = fact_facet_values(before)
+    new_values = fact_facet_values(after)
+    deltas: FacetDeltas = {}
+    for dimension in FACET_DIMENSIONS:
+        old, new = set(old_values[dimension]), set(new_values[dimension])
+        for value in old - new:
+            deltas[(dimension, value)] = -1
+        for value in new - old:
+            deltas[(dimension, value)] = 1
+    return deltas
+
+
+def queue_facet_deltas(pipe: Any, deltas: FacetDeltas) -> None:
+    """Queue HINCRBY commands for facet deltas on a Redis pipeline."""
+    for (dimension, value), amount in deltas.items():
+        pipe.hincrby(f"{FACET_KEY_PREFIX}{dimension}", value, amount)
+
+
+def count_facets(metadata_items: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, int]]:
+    """Count facet values over a collection of parsed fact metadata."""
+    counts: Dict[str, Dict[str, int]] = {d: {} for d in FACET_DIMENSIONS}
+    for metadata in metadata_items:
+        for dimension, values in fact_facet_values(metadata).items():
+            bucket = counts[dimension]
+            for value in values:
+                bucket[value] = bucket.get(value, 0) + 1
+    return counts
+
+
+def _sorted_counts(raw: Dict[Any, Any]) -> Dict[str, int]:
+    """Decode a counter hash, drop non-positive entries and sort descending."""
+    counts = {}
+    for key, value in (raw or {}).items():
+        try:
+            count = int(_decode(value))
+        except (TypeError, ValueError):
+            continue
+        if count > 0:
+            counts[_decode(key)] = count
+    return dict(sorted(counts.items(), key=lambda item: (-item[1], item[0])))
+
+
+class FacetsMixin:
+    """
+    Materialized facet counter mixin for knowledge base.
+
+    Provides:
+    - Transactional fact writes that update facet counters atomically
+    - O(1) facet count reads for stats, tag and category views
+    - Background counter build on first start
+    - Drift detection and repair of facet and category tree counters
+
+    Counter reads return None until the first build has completed so
+    callers can fall back to their scan-based paths.
+    """
+
+    # Type hints for attributes from base class
+    redis_client: "redis.Redis"
+    aioredis_client: "aioredis.Redis"
+
+    # =========================================================================
+    # TRANSACTIONAL WRITES
+    # =========================================================================
+
+    def _execute_fact_write(
+        self,
+        fact_key: str,
+        after: Optional[Dict[str, Any]],
+        mapping: Optional[Dict[str, Any]],
+    ) -> None:
+        """Run a fact write and its counter updates in one MULTI/EXEC block.
+
+        The stored metadata and category assignment are read under WATCH, so
+        the counter deltas always describe the transition actually applied.
+        """
+        fact_id = fact_key.split(":", 1)[1]
+        with self.redis_client.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    pipe.watch(fact_key)
+                    exists = pipe.exists(fact_key)
+                    raw_metadata, raw_category = pipe.hmget(
+                        fact_key, "metadata", "category_id"
+                    )
+                    before = _parse_metadata(raw_metadata) if exists else None
+                    category_id = _decode(raw_category)
+                    in_category = False
+                    if after is None and category_id:
+                        members_key = f"category:facts:{category_id}"
+                        pipe.watch(members_key)
+                        in_category = bool(pipe.sismember(members_key, fact_id))
+
+                    pipe.multi()
+                    if after is None:
+                        pipe.delete(fact_key)
+                        if in_category:
+                            pipe.srem(f"category:facts:{category_id}", fact_id)
+                            pipe.hincrby(f"category:{category_id}", "fact_count", -1)
+                    else:
+                        pipe.hset(fact_key, mapping=mapping)
+                    queue_facet_deltas(pipe, facet_deltas(before, after))
+                    pipe.execute()
+                    return
+                except WatchError:
+                    logger.debug("Concurrent write to %s, retrying", fact_key)
+
+    async def _write_fact_with_facets(
+        self,
+        fact_key: str,
+        after: Optional[Dict[str, Any]],
+        mapping: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Write (or delete) a fact hash and update facet counters atomically.
+
+        Deleting also releases the fact's category tree membership.
+
+        Args:
+            fact_key: Redis key of the fact hash
+            after: Metadata after the write, None to delete the fact
+            mapping: Hash fields to write; ignored when deleting
+        """
+        await asyncio.to_thread(self._execute_fact_write, fact_key, after, mapping)
+
+    async def delete_fact_record(self, fact_id: str) -> None:
+        """Delete a fact hash, releasing its facet counts and category."""
+        await self._write_fact_with_facets(f"fact:{fact_id}", None)
+
+    # =========================================================================
+    # READS
+    # =========================================================================
+
+    async def get_facet_counts(
+        self, dimensions: Optional[Iterable[str]] = None
+    ) -> Optional[Dict[str, Dict[str, int]]]:
+        """Get materialized fact counts per facet value (O(1) per dimension).
+
+        Args:
+            dimensions: Facet dimensions to read (default: all)
+
+        Returns:
+            Dict of dimension -> {value: count} sorted by count descending,
+            or None if the counters have not been built yet
+        """
+        if not self.aioredis_client:
+            return None
+        dims = list(dimensions or FACET_DIMENSIONS)
+        try:
+            async with self.aioredis_client.pipeline() as pipe:
+                await pipe.hget(FACET_META_KEY, "built_at")
+                for dimension in dims:
+                    await pipe.hgetall(f"{FACET_KEY_PREFIX}{dimension}")
+                results = await pipe.execute()
+        except Exception as e:
+            logger.warning("Failed to read facet counters: %s", e)
+            return None
+
+        if not results or not results[0]:
+            return None
+        return {
+            dimension: _sorted_counts(raw) for dimension, raw in zip(dims, results[1:])
+        }
+
+    # =========================================================================
+    # BUILD AND REPAIR
+    # =========================================================================
+
+    async def _count_facets_from_facts(self) -> Tuple[Dict[str, Dict[str, int]], int]:
+        """Recompute facet counts by scanning all facts (slow path).
+
+        Returns:
+            Tuple of (counts per dimension, number of facts scanned)
+        """
+        counts: Dict[str, Dict[str, int]] = {d: {} for d in FACET_DIMENSIONS}
+        scanned = 0
+        batch: List[Any] = []
+
+        async def _flush() -> None:
+            nonlocal scanned
+            async with self.aioredis_client.pipeline() as pipe:
+                for key in batch:
+                    await pipe.hget(key, "metadata")
+                raw_items = await pipe.execute(raise_on_error=False)
+            # Non-hash keys under fact:* (e.g. fact:origin:session:*) error out
+            parsed = [
+                _parse_metadata(raw)
+                for raw in raw_items
+                if raw is not None and not isinstance(raw, Exception)
+            ]
+            for dimension, values in count_facets(parsed).items():
+                bucket = counts[dimension]
+                for value, count in values.items():
+                    bucket[value] = bucket.get(value, 0) + count
+            scanned += len(parsed)
+            batch.clear()
+
+        async for key in self.aioredis_client.scan_iter(
+            match="fact:*", count=FACET_BUILD_BATCH_SIZE
+        ):
+            batch.append(key)
+            if len(batch) >= FACET_BUILD_BATCH_SIZE:
+                await _flush()
+        if batch:
+            await _flush()
+        return counts, scanned
+
+    async def _replace_facet_counters(
+        self, counts: Dict[str, Dict[str, int]], fact_count: int
+    ) -> None:
+        """Replace all facet counter hashes with fresh counts.
+
+        Counts are written to temporary keys first and renamed over the live
+        hashes in one transaction, so readers never see a partial build.
+        """
+        build_id = uuid.uuid4().hex
+        temp_keys: Dict[str, str] = {}
+        async with self.aioredis_client.pipeline(transaction=False) as pipe:
+            for dimension in FACET_DIMENSIONS:
+                if not counts.get(dimension):
+                    continue
+                temp_key = f"{FACET_KEY_PREFIX}{dimension}:build:{build_id}"
+                temp_keys[dimension] = temp_key
+                await pipe.hset(temp_key, mapping=counts[dimension])
+                # Interrupted builds must not leave temporary hashes behind
+                await pipe.expire(temp_key, FACET_BUILD_KEY_TTL)
+            await pipe.execute()
+
+        async with self.aioredis_client.pipeline(transaction=True) as pipe:
+            for dimension in FACET_DIMENSIONS:
+                key = f"{FACET_KEY_PREFIX}{dimension}"
+                if dimension in temp_keys:
+                    await pipe.rename(temp_keys[dimension], key)
+                    await pipe.persist(key)
+                else:
+                    await pipe.delete(key)
+            await pipe.hset(
+                FACET_META_KEY,
+                mapping={
+                    "built_at": datetime.now().isoformat(),
+                    "fact_count": fact_count,
+                },
+            )
+            await pipe.execute()
+
+    async def rebuild_facet_counters(self) -> Dict[str, Any]:
+        """Rebuild all facet counters from the stored facts."""
+        if not self.aioredis_client:
+            return {"status": "error", "message": "Redis not available"}
+
+        start = time.perf_counter()
+        try:
+            counts, scanned = await self._count_facets_from_facts()
+            await self._replace_facet_counters(counts, scanned)
+        except Exception as e:
+            logger.error("Facet counter rebuild failed: %s", e)
+            return {"status": "error", "message": str(e)}
+
+        elapsed = time.perf_counter() - start
+        logger.info("Facet counters rebuilt: %d facts in %.1fs", scanned, elapsed)
+        return {"status": "success", "facts": scanned, "duration_s": elapsed}
+
+    async def reset_facets_after_clear(self) -> Dict[str, Any]:
+        """Reset facet state after fact hashes were deleted in bulk.
+
+        Empties every category's membership set and fact_count, then
+        rebuilds the facet counters from whatever facts remain.
+        """
+        if not self.aioredis_client:
+            return {"status": "error", "message": "Redis not available"}
+
+        category_ids = await self._collect_category_ids()
+        if category_ids:
+            async with self.aioredis_client.pipeline(transaction=True) as pipe:
+                for category_id in category_ids:
+                    await pipe.delete(f"category:facts:{category_id}")
+                    await pipe.hset(f"category:{category_id}", "fact_count", 0)
+                await pipe.execute()
+        return await self.rebuild_facet_counters()
+
+    async def ensure_facet_counters(self) -> None:
+        """Start a background facet counter build if none has completed yet."""
+        if not self.aioredis_client:
+            return
+        try:
+            if await self.aioredis_client.hexists(FACET_META_KEY, "built_at"):
+                return
+        except Exception as e:
+            logger.warning("Could not check facet counters: %s", e)
+            return
+        logger.info("Facet counters not built yet, building in background")
+        self._facet_build_task = asyncio.create_task(self.rebuild_facet_counters())
+
+    @staticmethod
+    def _diff_facet_counts(
+        stored: Dict[str, Dict[str, int]], actual: Dict[str, Dict[str, int]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """List per-value differences between stored and actual counts."""
+        drift: Dict[str, List[Dict[str, Any]]] = {}
+        for dimension in FACET_DIMENSIONS:
+            have, want = stored.get(dimension, {}), actual.get(dimension, {})
+            entries = [
+                {"value": value, "stored": have.get(value, 0), "actual": count}
+                for value, count in want.items()
+                if have.get(value, 0) != count
+            ]
+            entries.extend(
+                {"value": value, "stored": count, "actual": 0}
+                for value, count in have.items()
+                if value not in want
+            )
+            if entries:
+                drift[dimension] = entries
+        return drift
+
+    async def _collect_category_ids(self) -> List[str]:
+        """Collect all category tree IDs reachable from the roots."""
+        pending = [
+            _decode(c) for c in await self.aioredis_client.smembers("category:root")
+        ]
+        seen: List[str] = []
+        while pending:
+            category_id = pending.pop()
+            if category_id in seen:
+                continue
+            seen.append(category_id)
+            children = await self.aioredis_client.smembers(
+                f"category:children:{category_id}"
+            )
+            pending.extend(_decode(c) for c in children)
+        return seen
+
+    async def _verify_category_counts(self, auto_correct: bool) -> List[Dict[str, Any]]:
+        """Compare category tree fact_count fields against membership sets."""
+        category_ids = await self._collect_category_ids()
+        if not category_ids:
+            return []
+
+        async with self.aioredis_client.pipeline() as pipe:
+            for category_id in category_ids:
+                await pipe.hget(f"category:{category_id}", "fact_count")
+                await pipe.scard(f"category:facts:{category_id}")
+            results = await pipe.execute()
+
+        drift = []
+        for i, category_id in enumerate(category_ids):
+            stored = int(_decode(results[2 * i]) or 0)
+            actual = int(results[2 * i + 1] or 0)
+            if stored != actual:
+                drift.append(
+                    {"category_id": category_id, "stored": stored, "actual": actual}
+                )
+
+        if drift and auto_correct:
+            async with self.aioredis_client.pipeline(transaction=True) as pipe:
+                for entry in drift:
+                    await pipe.hset(
+                        f"category:{entry['category_id']}",
+                        "fact_count",
+                        entry["actual"],
+                    )
+                await pipe.execute()
+        return drift
+
+    async def _verify_facet_consistency(self, auto_correct: bool = True) -> dict:
+        """Verify facet and category counters against the stored facts.
+
+        Recomputes the counts with a full scan, reports drift per dimension
+        and, when ``auto_correct`` is set, replaces the drifted counters.
+        """
+        if not self.aioredis_client:
+            return {"status": "error", "message": "Redis not available"}
+
+        try:
+            stored = await self.get_facet_counts()
+            actual, scanned = await self._count_facets_from_facts()
+            drift = self._diff_facet_counts(stored or {}, actual)
+            category_drift = await self._verify_category_counts(auto_correct)
+
+            consistent = stored is not None and not drift and not category_drift
+            result = {
+                "status": "consistent" if consistent else "drift_detected",
+                "built": stored is not None,
+                "facts_scanned": scanned,
+                "drifted_values": sum(len(v) for v in drift.values()),
+                "drift": {
+                    dimension: entries[:FACET_DRIFT_REPORT_LIMIT]
+                    for dimension, entries in drift.items()
+                },
+                "category_count_drift": category_drift[:FACET_DRIFT_REPORT_LIMIT],
+                "checked_at": datetime.now().isoformat(),
+            }
+
+            if not consistent:
+                logger.warning(
+                    "Facet counter drift detected: %d values, %d categories",
+                    result["drifted_values"],
+                    len(category_drift),
+                )
+                if auto_correct:
+                    if stored is None or drift:
+                        await self._replace_facet_counters(actual, scanned)
+                    result["corrected"] = True
+            return result
+
+        except Exception as e:
+            logger.error("Facet consistency check failed: %s", e)
+            return {"status": "error", "message": str(e)}
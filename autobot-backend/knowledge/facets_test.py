@@ -0,0 +1,234 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Unit tests for materialized knowledge base facet counters
+
+Tests cover:
+- Facet value extraction from fact metadata
+- Counter deltas for store, update and delete
+- Transactional fact writes queue counter updates with the fact hash
+- Counter reads before and after the first build
+- Resetting counters and category membership after a bulk clear
+- Drift detection between stored and recomputed counts
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import fakeredis
+import pytest
+from knowledge.facets import (
+    FACET_META_KEY,
+    FacetsMixin,
+    count_facets,
+    facet_deltas,
+    fact_facet_values,
+)
+
+
+class _FakeAsyncPipeline:
+    """Minimal async pipeline returning canned results."""
+
+    def __init__(self, results):
+        self.results = results
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        async def _queue(*args, **kwargs):
+            self.commands.append((name, args))
+
+        return _queue
+
+    async def execute(self, raise_on_error=True):
+        return self.results
+
+
+def _mixin(sync_client=None, async_results=None):
+    mixin = FacetsMixin()
+    mixin.redis_client = sync_client or MagicMock()
+    mixin.aioredis_client = MagicMock()
+    mixin.aioredis_client.pipeline.return_value = _FakeAsyncPipeline(async_results)
+    return mixin
+
+
+class TestFacetValues:
+    """Tests for fact_facet_values and facet_deltas."""
+
+    def test_values_from_metadata(self):
+        values = fact_facet_values(
+            {
+                "category": "security",
+                "tags": ["Python", " python ", "CVE"],
+                "source_type": "web_crawl",
+                "user_id": "alice",
+                "timestamp": "2025-03-04T10:11:12",
+            }
+        )
+        assert values == {
+            "category": ["security"],
+            "tag": ["cve", "python"],
+            "source": ["web_crawl"],
+            "owner": ["alice"],
+            "date": ["2025-03-04"],
+        }
+
+    def test_missing_category_is_uncategorized(self):
+        values = fact_facet_values({})
+        assert values["category"] == ["uncategorized"]
+        assert values["tag"] == [] and values["date"] == []
+
+    def test_store_update_delete_deltas(self):
+        before = {"category": "a", "tags": ["x", "y"], "timestamp": "2025-01-01"}
+        after = {"category": "b", "tags": ["y", "z"], "timestamp": "2025-01-01"}
+
+        assert facet_deltas(None, before)[("tag", "x")] == 1
+        assert facet_deltas(before, after) == {
+            ("category", "a"): -1,
+            ("category", "b"): 1,
+            ("tag", "x"): -1,
+            ("tag", "z"): 1,
+        }
+        assert facet_deltas(after, None)[("date", "2025-01-01")] == -1
+        assert facet_deltas(after, dict(after)) == {}
+
+    def test_count_facets(self):
+        counts = count_facets([{"category": "a", "tags": ["t"]}, {"category": "a"}])
+        assert counts["category"] == {"a": 2}
+        assert counts["tag"] == {"t": 1}
+
+
+class TestTransactionalWrites:
+    """Tests for _write_fact_with_facets."""
+
+    @staticmethod
+    def _facets(client, dimension):
+        return {
+            k.decode(): int(v)
+            for k, v in client.hgetall(f"kb:facets:{dimension}").items()
+        }
+
+    async def test_store_and_update_use_stored_metadata(self):
+        client = fakeredis.FakeRedis()
+        mixin = _mixin(sync_client=client)
+
+        await mixin._write_fact_with_facets(
+            "fact:1",
+            {"category": "a", "tags": ["x"]},
+            mapping={"content": "c", "metadata": json.dumps({"category": "a"})},
+        )
+        assert self._facets(client, "category") == {"a": 1}
+        assert client.hget("fact:1", "content") == b"c"
+
+        # The delta is taken from the stored metadata, not a caller's copy
+        await mixin._write_fact_with_facets(
+            "fact:1",
+            {"category": "b"},
+            mapping={"metadata": json.dumps({"category": "b"})},
+        )
+        assert self._facets(client, "category") == {"a": 0, "b": 1}
+        assert self._facets(client, "tag") == {"x": 1}
+
+    async def test_delete_releases_category_membership(self):
+        client = fakeredis.FakeRedis()
+        client.hset(
+            "fact:1",
+            mapping={"metadata": json.dumps({"category": "a"}), "category_id": "c9"},
+        )
+        client.sadd("category:facts:c9", "1")
+        client.hset("category:c9", "fact_count", 1)
+        mixin = _mixin(sync_client=client)
+
+        await mixin.delete_fact_record("1")
+
+        assert not client.exists("fact:1")
+        assert client.smembers("category:facts:c9") == set()
+        assert client.hget("category:c9", "fact_count") == b"0"
+        assert self._facets(client, "category") == {"a": -1}
+
+    async def test_delete_without_category_leaves_tree_counts(self):
+        client = fakeredis.FakeRedis()
+        client.hset("fact:1", "metadata", json.dumps({"category": "a"}))
+        client.hset("category:c9", "fact_count", 3)
+        mixin = _mixin(sync_client=client)
+
+        await mixin.delete_fact_record("1")
+        await mixin.delete_fact_record("missing")
+
+        assert client.hget("category:c9", "fact_count") == b"3"
+        assert self._facets(client, "category") == {"a": -1}
+
+
+class TestRebuild:
+    """Tests for rebuilding the counters from stored facts."""
+
+    async def test_rebuild_renames_fresh_counters_in(self):
+        client = fakeredis.aioredis.FakeRedis()
+        await client.hset("fact:1", "metadata", json.dumps({"tags": ["t"]}))
+        await client.hset("kb:facets:tag", "stale", 4)
+        await client.hset("kb:facets:owner", "gone", 1)
+        mixin = FacetsMixin()
+        mixin.aioredis_client = client
+
+        result = await mixin.rebuild_facet_counters()
+
+        assert result["facts"] == 1
+        assert await client.hgetall("kb:facets:tag") == {b"t": b"1"}
+        assert not await client.exists("kb:facets:owner")
+        assert await client.ttl("kb:facets:tag") == -1
+        assert await client.keys("kb:facets:*:build:*") == []
+
+    async def test_reset_after_clear_empties_categories_and_counters(self):
+        client = fakeredis.aioredis.FakeRedis()
+        await client.sadd("category:root", "c1")
+        await client.sadd("category:children:c1", "c2")
+        await client.sadd("category:facts:c2", "1", "2")
+        await client.hset("category:c2", "fact_count", 2)
+        await client.hset("kb:facets:category", "a", 2)
+        mixin = FacetsMixin()
+        mixin.aioredis_client = client
+
+        # fact:1 and fact:2 were already deleted by the bulk clear
+        result = await mixin.reset_facets_after_clear()
+
+        assert result["facts"] == 0
+        assert not await client.exists("category:facts:c2")
+        assert await client.hget("category:c2", "fact_count") == b"0"
+        assert await client.hget("category:c1", "fact_count") == b"0"
+        assert not await client.exists("kb:facets:category")
+
+
+class TestReadsAndDrift:
+    """Tests for get_facet_counts and drift detection."""
+
+    async def test_counts_unavailable_until_built(self):
+        mixin = _mixin(async_results=[None, {}])
+        assert await mixin.get_facet_counts(("tag",)) is None
+
+    async def test_counts_sorted_and_filtered(self):
+        mixin = _mixin(async_results=["2025-01-01", {"a": "2", "b": "5", "c": "0"}])
+        counts = await mixin.get_facet_counts(("tag",))
+        assert counts == {"tag": {"b": 5, "a": 2}}
+        pipe = mixin.aioredis_client.pipeline.return_value
+        assert pipe.commands[0] == ("hget", (FACET_META_KEY, "built_at"))
+
+    def test_diff_reports_missing_and_stale_values(self):
+        drift = FacetsMixin._diff_facet_counts(
+            {"tag": {"a": 2, "stale": 1}}, {"tag": {"a": 3}, "category": {"x": 1}}
+        )
+        assert drift["tag"] == [
+            {"value": "a", "stored": 2, "actual": 3},
+            {"value": "stale", "stored": 1, "actual": 0},
+        ]
+        assert drift["category"] == [{"value": "x", "stored": 0, "actual": 1}]
+
+
+@pytest.mark.parametrize("raw_tags", ["single", ["single"]])
+def test_string_tags_are_accepted(raw_tags):
+    assert fact_facet_values({"tags": raw_tags})["tag"] == ["single"]
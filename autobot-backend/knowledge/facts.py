@@ -13,9 +13,12 @@ import hashlib
 import json
 import logging
 import uuid
+import weakref
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
+import numpy as np
+from knowledge.search_components.filtered_search import invalidate_filter_cardinalities
 from llama_index.core import Document
 
 if TYPE_CHECKING:
@@ -41,7 +44,8 @@ _npu_embedding_count: int = 0
 _fallback_embedding_count: int = 0
 
 # Bounded concurrency for fallback to prevent overwhelming Ollama
-_FALLBACK_MAX_CONCURRENT: int = 5
+# (multi-text batches in flight when the embed model is Ollama)
+_FALLBACK_MAX_CONCURRENT: int = 3
 
 # Warmup state tracking
 _npu_warmup_complete: bool = False
@@ -266,21 +270,26 @@ async def _generate_embedding_with_npu_fallback(text: str) -> List[float]:
 
 
 async def _try_npu_batch_embeddings(
-    texts: List[str], client: Any
-) -> Optional[List[List[float]]]:
+    texts: List[str], client: Any, model: Optional[str] = None
+) -> Optional[Any]:
     """Try to generate batch embeddings via NPU worker. Issue #620.
 
     Args:
         texts: List of text contents to embed
         client: NPU client instance
+        model: Embedding model to request (default: the client's default)
 
     Returns:
-        List of embeddings if successful, None otherwise
+        EmbeddingResult with a (n, dim) float32 array if successful,
+        None otherwise
     """
     global _npu_embedding_count
 
     try:
-        result = await client.generate_embeddings(texts)
+        if model:
+            result = await client.generate_embeddings(texts, model_name=model)
+        else:
+            result = await client.generate_embeddings(texts)
         if result and len(result.embeddings) == len(texts):
             _npu_embedding_count += len(texts)
             logger.info(
@@ -288,61 +297,329 @@ async def _try_npu_batch_embeddings(
                 len(texts),
                 result.processing_time_ms,
             )
-            return result.embeddings
+            return result
         logger.warning("NPU batch returned incomplete results, falling back")
     except Exception as e:
         logger.debug("NPU batch failed, falling back: %s", e)
     return None
 
 
-async def _generate_embeddings_fallback(texts: List[str]) -> List[List[float]]:
+async def _embed_with_ollama_batches(texts: List[str], embed_model: Any) -> np.ndarray:
+    """Embed texts through Ollama's multi-input endpoint in adaptive batches.
+
+    Texts are formatted the way the embed model formats them itself (newer
+    llama-index-embeddings-ollama versions prepend text_instruction), so the
+    vectors match those LlamaIndex produces for the same model.
+
+    Args:
+        texts: List of text contents to embed
+        embed_model: LlamaIndex OllamaEmbedding supplying URL, model, options,
+            keep_alive and text formatting
+
+    Returns:
+        (n, dim) float32 embedding array
+
+    Raises:
+        RuntimeError: If any text could not be embedded
+    """
+    from services.ollama_embeddings import get_ollama_batch_embedder
+
+    format_text = getattr(embed_model, "_format_text", None)
+    if format_text is not None:
+        texts = [format_text(text) for text in texts]
+
+    embedder = get_ollama_batch_embedder(embed_model.base_url)
+    rows = await embedder.embed(
+        texts,
+        embed_model.model_name,
+        max_in_flight=_FALLBACK_MAX_CONCURRENT,
+        options=embed_model.ollama_additional_kwargs,
+        keep_alive=getattr(embed_model, "keep_alive", None),
+    )
+    failed = sum(1 for row in rows if row is None)
+    if failed:
+        raise RuntimeError(f"Ollama failed to embed {failed}/{len(texts)} texts")
+    return np.vstack(rows)
+
+
+async def _generate_embeddings_fallback(texts: List[str]) -> np.ndarray:
     """Generate embeddings via LlamaIndex fallback. Issue #620.
 
+    Ollama embed models are called with multi-text batches; other embed
+    models use LlamaIndex's own batch API.
+
     Args:
         texts: List of text contents to embed
 
     Returns:
-        List of embedding vectors
+        (n, dim) float32 embedding array
     """
     global _fallback_embedding_count
     from llama_index.core import Settings
+    from llama_index.embeddings.ollama import OllamaEmbedding
 
-    semaphore = asyncio.Semaphore(_FALLBACK_MAX_CONCURRENT)
-
-    async def embed_one(text: str) -> List[float]:
-        async with semaphore:
-            return await asyncio.to_thread(
-                Settings.embed_model.get_text_embedding, text
-            )
-
-    embeddings = await asyncio.gather(*[embed_one(t) for t in texts])
+    embed_model = Settings.embed_model
+    if isinstance(embed_model, OllamaEmbedding):
+        embeddings = await _embed_with_ollama_batches(texts, embed_model)
+    else:
+        embeddings = await asyncio.to_thread(
+            embed_model.get_text_embedding_batch, texts
+        )
     _fallback_embedding_count += len(texts)
     logger.debug("Generated %d embeddings via LlamaIndex fallback", len(texts))
-    return list(embeddings)
+    return np.asarray(embeddings, dtype=np.float32)
+
+
+def _fallback_embedding_model_name() -> str:
+    """Name of the model behind the LlamaIndex fallback embed_model."""
+    from llama_index.core import Settings
+
+    embed_model = Settings.embed_model
+    return getattr(embed_model, "model_name", None) or type(embed_model).__name__
+
+
+async def _generate_embeddings_batch_with_model(
+    texts: List[str], model: Optional[str] = None
+) -> Tuple[np.ndarray, str]:
+    """Generate batch embeddings and report which model produced them.
+
+    Args:
+        texts: List of text contents to embed
+        model: Embedding model to request from the NPU worker
+
+    Returns:
+        Tuple of ((n, dim) float32 embedding array, producing model name)
+    """
+    client, is_available = await _get_npu_client_cached()
+
+    if is_available and client:
+        result = await _try_npu_batch_embeddings(texts, client, model)
+        if result is not None:
+            return result.embeddings, result.model_used or model
+
+    embeddings = await _generate_embeddings_fallback(texts)
+    return embeddings, _fallback_embedding_model_name()
 
 
 async def _generate_embeddings_batch_with_npu_fallback(
     texts: List[str],
-) -> List[List[float]]:
+) -> np.ndarray:
     """Generate batch embeddings with NPU worker and fallback. Issue #620.
 
     Args:
         texts: List of text contents to embed
 
     Returns:
-        List of embedding vectors
+        (n, dim) float32 embedding array
     """
     if not texts:
-        return []
+        return np.empty((0, 0), dtype=np.float32)
+    embeddings, _ = await _generate_embeddings_batch_with_model(texts)
+    return embeddings
 
-    client, is_available = await _get_npu_client_cached()
 
-    if is_available and client:
-        embeddings = await _try_npu_batch_embeddings(texts, client)
-        if embeddings:
-            return embeddings
+def _default_embedding_model() -> str:
+    """Embedding model name used to key cached embeddings by default."""
+    from autobot_shared.ssot_config import config
+
+    return config.llm.embedding_model
+
+
+async def _generate_embeddings_cached(
+    texts: List[str], model: Optional[str] = None
+) -> np.ndarray:
+    """Generate embeddings through the persistent (L2) embedding store.
+
+    Texts already embedded by ``model`` (in any process, before any restart)
+    are served from the store; the rest go through
+    _generate_embeddings_batch_with_model() and are stored under the model
+    that actually produced them, so a fallback model's vectors are never
+    served as ``model``'s.
+
+    Args:
+        texts: List of text contents to embed
+        model: Embedding model name (default: SSOT config.llm.embedding_model)
+
+    Returns:
+        (n, dim) float32 embedding array, one row per text
+    """
+    if not texts:
+        return np.empty((0, 0), dtype=np.float32)
+    from knowledge.embedding_cache import get_embedding_store
+
+    model = model or _default_embedding_model()
+    store = get_embedding_store()
+    embeddings = await store.get_many(model, texts)
+
+    missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+    if missing:
+        missing_texts = [texts[i] for i in missing]
+        computed, produced_by = await _generate_embeddings_batch_with_model(
+            missing_texts, model
+        )
+        await store.put_many(produced_by, missing_texts, computed)
+        if len(missing) == len(texts):
+            return computed
+        for i, embedding in zip(missing, computed):
+            embeddings[i] = embedding
+    return np.asarray(embeddings, dtype=np.float32)
+
+
+async def _generate_embedding_cached(
+    text: str, model: Optional[str] = None
+) -> List[float]:
+    """Single-text form of _generate_embeddings_cached()."""
+    return (await _generate_embeddings_cached([text], model))[0].tolist()
+
+
+# =============================================================================
+# QUERY EMBEDDING MICRO-BATCHING
+# =============================================================================
+# Concurrent query-time embedding requests are held for up to
+# _EMBED_BATCH_MAX_WAIT_S (or until _EMBED_BATCH_MAX_SIZE are queued) and sent
+# as one batch call, instead of one NPU/Ollama round-trip per query.
+_EMBED_BATCH_MAX_SIZE: int = 32
+_EMBED_BATCH_MAX_WAIT_S: float = 0.005
+
+
+class EmbeddingBatcher:
+    """
+    Coalesce concurrent single-text embedding requests into batch calls.
+
+    Requests are queued with a future; the first request of a batch starts a
+    short timer and the batch is flushed when the timer fires or the batch is
+    full. Identical texts within a batch are embedded once. A failed batch
+    fails every request in it.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = _EMBED_BATCH_MAX_SIZE,
+        max_wait_seconds: float = _EMBED_BATCH_MAX_WAIT_S,
+    ):
+        """Initialize batcher with batch size and wait window limits."""
+        self._max_batch_size = max_batch_size
+        self._max_wait_seconds = max_wait_seconds
+        self._pending: List[tuple] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batches = 0
+        self._requests = 0
+
+    async def embed(self, text: str, model: Optional[str] = None) -> List[float]:
+        """Queue text for the next batch and wait for its embedding."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, model, future, loop.time()))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._max_wait_seconds, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Hand the pending requests to a batch task."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            asyncio.get_running_loop().create_task(self._run_batch(batch))
+
+    async def _run_batch(self, batch: List[tuple]) -> None:
+        """Embed a batch and resolve each request's future."""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        texts_by_model: Dict[Optional[str], Dict[str, None]] = {}
+        for text, model, _, _ in batch:
+            texts_by_model.setdefault(model, {})[text] = None
+        self._batches += 1
+        self._requests += len(batch)
+        _record_embedding_batch(
+            sum(len(texts) for texts in texts_by_model.values()),
+            [started - queued for _, _, _, queued in batch],
+        )
+
+        try:
+            results = {}
+            for model, texts in texts_by_model.items():
+                unique_texts = list(texts)
+                embeddings = await _generate_embeddings_cached(unique_texts, model)
+                results.update(
+                    ((model, t), e) for t, e in zip(unique_texts, embeddings)
+                )
+        except Exception as e:
+            logger.warning("Batched embedding of %d texts failed: %s", len(batch), e)
+            for _, _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        try:
+            for text, model, future, _ in batch:
+                if not future.done():
+                    future.set_result(results[(model, text)].tolist())
+        except Exception as e:
+            logger.warning("Resolving batched embeddings failed: %s", e)
+            for _, _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Batching statistics for observability."""
+        return {
+            "batches": self._batches,
+            "requests": self._requests,
+            "avg_batch_size": (
+                round(self._requests / self._batches, 2) if self._batches else 0.0
+            ),
+            "pending": len(self._pending),
+        }
+
+
+def _record_embedding_batch(batch_size: int, queue_waits: List[float]) -> None:
+    """Export batch size and queue wait metrics (best effort)."""
+    try:
+        from monitoring.prometheus_metrics import get_metrics_manager
+
+        get_metrics_manager().record_embedding_batch(batch_size, queue_waits)
+    except Exception as e:
+        logger.debug("Failed to record embedding batch metrics: %s", e)
+
+
+# One batcher per event loop: futures and timers are loop-bound
+_embedding_batchers: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
 
-    return await _generate_embeddings_fallback(texts)
+
+def get_embedding_batcher() -> EmbeddingBatcher:
+    """Get the query embedding batcher for the running event loop."""
+    loop = asyncio.get_running_loop()
+    batcher = _embedding_batchers.get(loop)
+    if batcher is None:
+        batcher = EmbeddingBatcher()
+        _embedding_batchers[loop] = batcher
+    return batcher
+
+
+async def _generate_query_embedding_batched(
+    text: str, model: Optional[str] = None
+) -> List[float]:
+    """
+    Generate a query-time embedding through the shared micro-batcher.
+
+    Same result as _generate_embedding_with_npu_fallback(), but concurrent
+    callers share NPU/Ollama round-trips and previously embedded texts are
+    served from the persistent embedding store.
+
+    Args:
+        text: Text content to embed
+        model: Embedding model name (default: SSOT config.llm.embedding_model)
+
+    Returns:
+        Embedding vector as list of floats
+    """
+    return await get_embedding_batcher().embed(text, model)
 
 
 def _decode_redis_hash(fact_data: Dict[bytes, bytes]) -> Dict[str, Any]:
@@ -565,11 +842,11 @@ class FactsMixin:
             content: Fact content text
             metadata: Fact metadata dict
         """
-        # Store in Redis
+        # Store in Redis together with the facet counter updates
         fact_key = "fact:%s" % fact_id
-        await asyncio.to_thread(
-            self.redis_client.hset,
+        await self._write_fact_with_facets(
             fact_key,
+            metadata,
             mapping={
                 "content": content,
                 "metadata": json.dumps(metadata),
@@ -637,7 +914,7 @@ class FactsMixin:
 
         # Issue #165: Generate embedding using NPU worker with fallback
         # ChromaVectorStore.add() expects nodes with embeddings already set
-        embedding = await _generate_embedding_with_npu_fallback(content)
+        embedding = await _generate_embedding_cached(content, self.embedding_model_name)
 
         # Create Document for LlamaIndex with embedding
         doc = Document(text=content, doc_id=fact_id, metadata=sanitized_metadata)
@@ -645,6 +922,7 @@ class FactsMixin:
 
         # Add to vector store
         await asyncio.to_thread(self.vector_store.add, [doc])
+        invalidate_filter_cardinalities()
 
         logger.info("Vectorized fact %s in ChromaDB", fact_id)
 
@@ -677,6 +955,7 @@ class FactsMixin:
     ) -> Dict[str, Any]:
         """Store fact in Redis, vectorize, and update stats (Issue #398: extracted)."""
         await self._store_fact_in_redis(fact_id, content, metadata)
+        await self._index_fact_keywords(fact_id, content)
         await self._vectorize_fact_in_chromadb(fact_id, content, metadata)
         await asyncio.gather(
             self._increment_stat("total_facts"),
@@ -758,6 +1037,23 @@ class FactsMixin:
             logger.error("Failed to vectorize fact %s: %s", fact_id, e)
             return {"status": "error", "message": str(e)}
 
+    async def vectorize_fact(
+        self, fact_id: str, content: str, metadata: Dict[str, Any]
+    ) -> None:
+        """
+        Vectorize fact content the caller has already loaded.
+
+        Unlike vectorize_existing_fact() this does not re-read the fact from
+        Redis, and failures are raised rather than returned. Embeddings go
+        through the persistent embedding store.
+
+        Args:
+            fact_id: Fact identifier
+            content: Fact content text
+            metadata: Fact metadata dict
+        """
+        await self._vectorize_fact_in_chromadb(fact_id, content, metadata)
+
     def get_fact(self, fact_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve a single fact by ID (synchronous).
@@ -916,11 +1212,12 @@ class FactsMixin:
         await asyncio.to_thread(self.vector_store.delete, fact_id)
 
         # Issue #165: Generate embedding using NPU worker with fallback
-        embedding = await _generate_embedding_with_npu_fallback(content)
+        embedding = await _generate_embedding_cached(content, self.embedding_model_name)
         doc = Document(text=content, doc_id=fact_id, metadata=sanitized_metadata)
         doc.embedding = embedding
 
         await asyncio.to_thread(self.vector_store.add, [doc])
+        invalidate_filter_cardinalities()
         logger.info("Re-vectorized updated fact %s", fact_id)
 
     async def _refresh_content_hash(
@@ -973,9 +1270,9 @@ class FactsMixin:
                 current_metadata.update(metadata)
             current_metadata["updated_at"] = datetime.now().isoformat()
 
-            await asyncio.to_thread(
-                self.redis_client.hset,
+            await self._write_fact_with_facets(
                 fact_key,
+                current_metadata,
                 mapping={
                     "content": decoded["content"],
                     "metadata": json.dumps(current_metadata),
@@ -983,6 +1280,9 @@ class FactsMixin:
                 },
             )
 
+            if content is not None:
+                await self._index_fact_keywords(fact_id, decoded["content"])
+
             if content is not None and self.vector_store:
                 await self._revectorize_fact(
                     fact_id, decoded["content"], current_metadata
@@ -1036,6 +1336,7 @@ class FactsMixin:
         if self.vector_store:
             try:
                 await asyncio.to_thread(self.vector_store.delete, fact_id)
+                invalidate_filter_cardinalities()
             except Exception as e:
                 logger.warning("Could not delete vector for fact %s: %s", fact_id, e)
 
@@ -1060,8 +1361,9 @@ class FactsMixin:
             content = decoded.get("content", "")
             metadata = decoded.get("_parsed_metadata", {})
 
-            await asyncio.to_thread(self.redis_client.delete, fact_key)
+            await self._write_fact_with_facets(fact_key, None)
             await self._cleanup_fact_mappings(fact_id, content, metadata)
+            await self._unindex_fact_keywords(fact_id)
             await self._delete_fact_from_vector_store(fact_id)
 
             await asyncio.gather(
@@ -1085,10 +1387,27 @@ class FactsMixin:
         """Increment stats counter - implemented in stats mixin"""
         raise NotImplementedError("Should be implemented in composed class")
 
+    async def _index_fact_keywords(self, fact_id: str, content: str) -> None:
+        """Update keyword index - implemented in search mixin"""
+        raise NotImplementedError("Should be implemented in composed class")
+
+    async def _unindex_fact_keywords(self, fact_id: str) -> None:
+        """Remove from keyword index - implemented in search mixin"""
+        raise NotImplementedError("Should be implemented in composed class")
+
     async def _decrement_stat(self, field: str, amount: int = 1):
         """Decrement stats counter - implemented in stats mixin"""
         raise NotImplementedError("Should be implemented in composed class")
 
+    async def _write_fact_with_facets(
+        self,
+        fact_key: str,
+        after: Optional[Dict[str, Any]],
+        mapping: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Write fact and facet counters - implemented in facets mixin"""
+        raise NotImplementedError("Should be implemented in composed class")
+
     def ensure_initialized(self):
         """Ensure initialized - implemented in base class"""
         raise NotImplementedError("Should be implemented in composed class")
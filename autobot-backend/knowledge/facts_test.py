@@ -0,0 +1,279 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Unit tests for query embedding micro-batching (EmbeddingBatcher) and the
+store-backed embedding helpers.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+from knowledge.embedding_cache import EmbeddingStore
+from knowledge.facts import (
+    EmbeddingBatcher,
+    _embed_with_ollama_batches,
+    _generate_embeddings_cached,
+)
+
+
+def _fake_batch(calls):
+    async def generate(texts, model=None):
+        calls.append(list(texts))
+        return np.array([[float(len(t))] for t in texts], dtype=np.float32)
+
+    return generate
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_batch():
+    calls = []
+    batcher = EmbeddingBatcher(max_batch_size=32, max_wait_seconds=0.01)
+    with patch("knowledge.facts._generate_embeddings_cached", _fake_batch(calls)):
+        results = await asyncio.gather(*(batcher.embed("x" * n) for n in (1, 2, 3, 2)))
+
+    assert results == [[1.0], [2.0], [3.0], [2.0]]
+    # Duplicate text embedded once
+    assert calls == [["x", "xx", "xxx"]]
+    assert batcher.get_stats()["batches"] == 1
+
+
+@pytest.mark.asyncio
+async def test_full_batch_flushes_without_waiting():
+    calls = []
+    batcher = EmbeddingBatcher(max_batch_size=2, max_wait_seconds=60)
+    with patch("knowledge.facts._generate_embeddings_cached", _fake_batch(calls)):
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.embed("a"), batcher.embed("bb")), timeout=1
+        )
+
+    assert results == [[1.0], [2.0]]
+    assert calls == [["a", "bb"]]
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_propagates_to_every_caller():
+    async def failing(texts, model=None):
+        raise RuntimeError("embedding backend down")
+
+    batcher = EmbeddingBatcher(max_wait_seconds=0.001)
+    with patch("knowledge.facts._generate_embeddings_cached", failing):
+        results = await asyncio.gather(
+            batcher.embed("a"), batcher.embed("b"), return_exceptions=True
+        )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_break_batch():
+    calls = []
+    batcher = EmbeddingBatcher(max_wait_seconds=0.01)
+    with patch("knowledge.facts._generate_embeddings_cached", _fake_batch(calls)):
+        doomed = asyncio.create_task(batcher.embed("a"))
+        kept = asyncio.create_task(batcher.embed("bb"))
+        await asyncio.sleep(0)
+        doomed.cancel()
+
+        assert await kept == [2.0]
+
+
+@pytest.mark.asyncio
+async def test_cached_embeddings_only_compute_misses():
+    class _Store:
+        def __init__(self):
+            self.saved = {}
+
+        async def get_many(self, model, texts):
+            return [self.saved.get((model, t)) for t in texts]
+
+        async def put_many(self, model, texts, embeddings):
+            self.saved.update(((model, t), e) for t, e in zip(texts, embeddings))
+
+    store = _Store()
+    store.saved[("m", "known")] = np.array([9.0], dtype=np.float32)
+    calls = []
+
+    async def generate(texts, model=None):
+        calls.append(list(texts))
+        return np.array([[float(len(t))] for t in texts], dtype=np.float32), "m"
+
+    with patch(
+        "knowledge.embedding_cache.get_embedding_store", return_value=store
+    ), patch("knowledge.facts._generate_embeddings_batch_with_model", generate):
+        first = await _generate_embeddings_cached(["known", "new"], "m")
+        second = await _generate_embeddings_cached(["new"], "m")
+
+    assert first.dtype == np.float32
+    assert first.tolist() == [[9.0], [3.0]]
+    assert second.tolist() == [[3.0]]
+    assert calls == [["new"]]
+
+
+@pytest.mark.asyncio
+async def test_embeddings_are_stored_under_producing_model():
+    saved = {}
+
+    class _Store:
+        async def get_many(self, model, texts):
+            return [saved.get((model, t)) for t in texts]
+
+        async def put_many(self, model, texts, embeddings):
+            saved.update(((model, t), e) for t, e in zip(texts, embeddings))
+
+    async def generate(texts, model=None):
+        return np.ones((len(texts), 2), dtype=np.float32), "fallback-model"
+
+    with patch(
+        "knowledge.embedding_cache.get_embedding_store", return_value=_Store()
+    ), patch("knowledge.facts._generate_embeddings_batch_with_model", generate):
+        await _generate_embeddings_cached(["a"], "configured-model")
+
+    assert list(saved) == [("fallback-model", "a")]
+
+
+class _DictStore:
+    def __init__(self):
+        self.saved = {}
+
+    async def get_many(self, model, texts):
+        return [self.saved.get((model, t)) for t in texts]
+
+    async def put_many(self, model, texts, embeddings):
+        self.saved.update(((model, t), e) for t, e in zip(texts, embeddings))
+
+
+class _NPUClient:
+    """NPU client that embeds with whichever model it is asked for."""
+
+    def __init__(self, reported_model=None):
+        self.reported_model = reported_model
+        self.calls = []
+
+    async def generate_embeddings(self, texts, model_name="nomic-embed-text"):
+        self.calls.append((list(texts), model_name))
+        return SimpleNamespace(
+            embeddings=np.ones((len(texts), 2), dtype=np.float32),
+            model_used=self.reported_model or model_name,
+            processing_time_ms=1.0,
+        )
+
+
+@pytest.mark.asyncio
+async def test_npu_embeddings_are_served_from_store_on_next_request():
+    store = _DictStore()
+    client = _NPUClient()
+
+    async def npu_available():
+        return client, True
+
+    with patch(
+        "knowledge.embedding_cache.get_embedding_store", return_value=store
+    ), patch("knowledge.facts._get_npu_client_cached", npu_available):
+        await _generate_embeddings_cached(["a"], "nomic-embed-text:latest")
+        second = await _generate_embeddings_cached(["a"], "nomic-embed-text:latest")
+
+    assert client.calls == [(["a"], "nomic-embed-text:latest")]
+    assert second.tolist() == [[1.0, 1.0]]
+
+
+class _FakeAsyncRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def mget(self, keys):
+        return [self.data.get(k) for k in keys]
+
+    def pipeline(self, transaction=True):
+        redis = self
+
+        class _Pipe:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def set(self, key, value, ex=None):
+                redis.data[key] = value
+
+            async def execute(self):
+                return []
+
+        return _Pipe()
+
+
+@pytest.mark.asyncio
+async def test_store_hits_when_producer_reports_another_model_spelling():
+    redis = _FakeAsyncRedis()
+    store = EmbeddingStore(ttl_seconds=60)
+    # The worker reports the untagged name for the ":latest" model it was asked for
+    client = _NPUClient(reported_model="nomic-embed-text")
+
+    async def npu_available():
+        return client, True
+
+    with patch(
+        "knowledge.embedding_cache.get_embedding_store", return_value=store
+    ), patch("knowledge.facts._get_npu_client_cached", npu_available), patch(
+        "knowledge.embedding_cache.get_redis_client", AsyncMock(return_value=redis)
+    ):
+        await _generate_embeddings_cached(["a", "b"], "nomic-embed-text:latest")
+        second = await _generate_embeddings_cached(
+            ["a", "b"], "nomic-embed-text:latest"
+        )
+
+    assert len(client.calls) == 1
+    assert second.tolist() == [[1.0, 1.0], [1.0, 1.0]]
+    assert all(key.startswith("emb:f32:nomic-embed-text:") for key in redis.data)
+
+
+@pytest.mark.asyncio
+async def test_unresolvable_result_fails_callers_instead_of_hanging():
+    async def short(texts, model=None):
+        return np.ones((0, 1), dtype=np.float32)  # fewer rows than texts
+
+    batcher = EmbeddingBatcher(max_wait_seconds=0.001)
+    with patch("knowledge.facts._generate_embeddings_cached", short):
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                batcher.embed("a"), batcher.embed("b"), return_exceptions=True
+            ),
+            timeout=1,
+        )
+
+    assert all(isinstance(r, KeyError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_ollama_batches_use_model_formatting_and_keep_alive():
+    class _EmbedModel:
+        base_url = "http://ollama:11434"
+        model_name = "nomic-embed-text"
+        ollama_additional_kwargs = {"num_ctx": 2048}
+        keep_alive = "10m"
+
+        def _format_text(self, text):
+            return f"search_document: {text}"
+
+    calls = []
+
+    class _Embedder:
+        async def embed(self, texts, model_name, **kwargs):
+            calls.append((list(texts), model_name, kwargs))
+            return [np.ones(2, dtype=np.float32) for _ in texts]
+
+    with patch(
+        "services.ollama_embeddings.get_ollama_batch_embedder",
+        return_value=_Embedder(),
+    ):
+        embeddings = await _embed_with_ollama_batches(["a"], _EmbedModel())
+
+    assert embeddings.shape == (1, 2)
+    texts, model_name, kwargs = calls[0]
+    assert texts == ["search_document: a"]
+    assert kwargs["options"] == {"num_ctx": 2048}
+    assert kwargs["keep_alive"] == "10m"
@@ -14,6 +14,8 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
+from knowledge.search_components.filtered_search import invalidate_filter_cardinalities
+
 if TYPE_CHECKING:
     from llama_index.vector_stores.chroma import ChromaVectorStore
 
@@ -118,6 +120,7 @@ class IndexMixin:
             if migrated % 10000 == 0:
                 logger.info("Migration progress: %d/%d vectors", migrated, old_count)
 
+        invalidate_filter_cardinalities()
         return migrated
 
     def _build_success_result(
@@ -14,6 +14,7 @@ from knowledge.pipeline.base import BaseLoader, PipelineContext
 from knowledge.pipeline.models.chunk import ProcessedChunk
 from knowledge.pipeline.models.summary import Summary
 from knowledge.pipeline.registry import TaskRegistry
+from knowledge.search_components.filtered_search import invalidate_filter_cardinalities
 from utils.async_chromadb_client import get_async_chromadb_client
 
 logger = logging.getLogger(__name__)
@@ -100,6 +101,7 @@ class ChromaDBLoader(BaseLoader):
         ]
 
         await collection.upsert(ids=ids, documents=documents, metadatas=metadatas)
+        invalidate_filter_cardinalities()
 
     async def _load_summaries(self, summaries: List[Summary]) -> None:
         """Load summaries to ChromaDB collection."""
@@ -136,3 +138,4 @@ class ChromaDBLoader(BaseLoader):
         ]
 
         await collection.upsert(ids=ids, documents=documents, metadatas=metadatas)
+        invalidate_filter_cardinalities()
@@ -26,10 +26,11 @@ semantic search, keyword search, hybrid search, and query preprocessing.
 import asyncio
 import logging
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set
 
 # Import components from the search_components package
 from knowledge.search_components import (
+    KeywordIndex,
     KeywordSearcher,
     QueryProcessor,
     ResponseBuilder,
@@ -37,6 +38,7 @@ from knowledge.search_components import (
     get_analytics,
     get_reranker,
 )
+from knowledge.search_components.filtered_search import get_filtered_searcher
 from knowledge.search_components.helpers import (
     build_search_result,
     decode_redis_hash,
@@ -44,6 +46,7 @@ from knowledge.search_components.helpers import (
     score_fact_by_terms,
 )
 from knowledge.search_components.hybrid_search import HybridSearcher
+from knowledge.search_components.reranking import DEFAULT_RERANK_BUDGET_S
 from models.task_context import EnhancedSearchContext
 
 from autobot_shared.error_boundaries import error_boundary
@@ -89,6 +92,7 @@ class SearchMixin:
     aioredis_client: "aioredis.Redis"
     redis_client: "redis.Redis"
     initialized: bool
+    embedding_model_name: Optional[str]
 
     def __init__(self, *args, **kwargs):
         """Initialize search mixin components."""
@@ -97,6 +101,8 @@ class SearchMixin:
         self._response_builder = ResponseBuilder()
         self._tag_filter = None
         self._keyword_searcher = None
+        self._keyword_index = None
+        self._keyword_index_build_task: Optional[asyncio.Task] = None
         self._hybrid_searcher = None
 
     def _get_tag_filter(self) -> TagFilter:
@@ -105,11 +111,18 @@ class SearchMixin:
             self._tag_filter = TagFilter(getattr(self, "aioredis_client", None))
         return self._tag_filter
 
+    def _get_keyword_index(self) -> KeywordIndex:
+        """Lazy initialization of the persistent BM25 keyword index."""
+        if self._keyword_index is None:
+            self._keyword_index = KeywordIndex(getattr(self, "aioredis_client", None))
+        return self._keyword_index
+
     def _get_keyword_searcher(self) -> KeywordSearcher:
         """Lazy initialization of keyword searcher."""
         if self._keyword_searcher is None:
             self._keyword_searcher = KeywordSearcher(
-                getattr(self, "aioredis_client", None)
+                getattr(self, "aioredis_client", None),
+                self._get_keyword_index(),
             )
         return self._keyword_searcher
 
@@ -143,6 +156,8 @@ class SearchMixin:
             query_embedding, similarity_top_k, where=filters
         )
         results = self._deduplicate_results(results_data, similarity_top_k)
+        if filters:
+            self._observe_filtered_dedup(results_data)
         logger.info(
             "ChromaDB search returned %d unique documents for query: %s...",
             len(results),
@@ -150,6 +165,15 @@ class SearchMixin:
         )
         return results
 
+    def _observe_filtered_dedup(self, results_data: Dict[str, Any]) -> None:
+        """Feed chunk-to-document collapse back into filtered over-fetch."""
+        metadatas = (results_data or {}).get("metadatas") or [[]]
+        fetched = len(metadatas[0])
+        unique = len(
+            {self._get_document_key(m or {}, i) for i, m in enumerate(metadatas[0])}
+        )
+        get_filtered_searcher().observe_dedup(fetched, unique)
+
     async def search(
         self,
         query: str,
@@ -182,16 +206,19 @@ class SearchMixin:
 
         Issue #281: Extracted helper.
         Issue #165: Uses NPU worker for hardware-accelerated embedding generation.
+        Concurrent cache misses are coalesced into batch embedding calls.
         """
         from knowledge.embedding_cache import get_embedding_cache
-        from knowledge.facts import _generate_embedding_with_npu_fallback
+        from knowledge.facts import _generate_query_embedding_batched
 
         _embedding_cache = get_embedding_cache()
         query_embedding = await _embedding_cache.get(query)
 
         if query_embedding is None:
             # Cache miss - compute embedding using NPU worker with fallback
-            query_embedding = await _generate_embedding_with_npu_fallback(query)
+            query_embedding = await _generate_query_embedding_batched(
+                query, self.embedding_model_name
+            )
             await _embedding_cache.put(query, query_embedding)
 
         return query_embedding
@@ -205,25 +232,26 @@ class SearchMixin:
         """Query ChromaDB directly with embedding. Issue #281: Extracted helper.
 
         Issue #934: Accepts optional where filter for permission-based pre-filtering.
+        Filtered queries are planned from the filter's cardinality (exact scan
+        for small subsets, clamped ANN otherwise) instead of falling back to
+        an unfiltered search that would leak out-of-scope documents.
         """
         chroma_collection = self.vector_store._collection
-        kwargs: Dict[str, Any] = {
-            "query_embeddings": [query_embedding],
-            "n_results": similarity_top_k,
-            "include": ["documents", "metadatas", "distances"],
-        }
         if where:
-            kwargs["where"] = where
-        try:
-            return await asyncio.to_thread(chroma_collection.query, **kwargs)
-        except (ValueError, Exception) as exc:
-            # ChromaDB raises ValueError when where filter matches fewer docs
-            # than n_results. Fall back to unfiltered search.
-            logger.warning(
-                "ChromaDB where filter failed (%s), retrying without filter", exc
+            # Filter-correct single pass: never retried without the filter
+            return await asyncio.to_thread(
+                get_filtered_searcher().query,
+                chroma_collection,
+                query_embedding,
+                similarity_top_k,
+                where,
             )
-            kwargs.pop("where", None)
-            return await asyncio.to_thread(chroma_collection.query, **kwargs)
+        return await asyncio.to_thread(
+            chroma_collection.query,
+            query_embeddings=[query_embedding],
+            n_results=similarity_top_k,
+            include=["documents", "metadatas", "distances"],
+        )
 
     def _deduplicate_results(
         self, results_data: Dict[str, Any], similarity_top_k: int
@@ -498,6 +526,98 @@ class SearchMixin:
         """Perform keyword-based search using Redis (Issue #281 refactor)."""
         return await self._get_keyword_searcher().search(query, limit, category)
 
+    async def _index_fact_keywords(self, fact_id: str, content: str) -> None:
+        """Add or replace a fact in the keyword index (never fails the write)."""
+        try:
+            await self._get_keyword_index().index_document(fact_id, content)
+        except Exception as e:
+            logger.warning("Keyword index update failed for fact %s: %s", fact_id, e)
+
+    async def _unindex_fact_keywords(self, fact_id: str) -> None:
+        """Remove a fact from the keyword index (never fails the delete)."""
+        try:
+            await self._get_keyword_index().remove_document(fact_id)
+        except Exception as e:
+            logger.warning("Keyword index removal failed for fact %s: %s", fact_id, e)
+
+    async def remove_facts_from_keyword_index(self, fact_ids: Iterable[str]) -> None:
+        """Remove facts deleted in bulk (outside delete_fact) from the index."""
+        for fact_id in fact_ids:
+            await self._unindex_fact_keywords(fact_id)
+
+    async def reset_keyword_index(self) -> Dict[str, Any]:
+        """Drop the keyword index and rebuild it from the facts that remain.
+
+        Used after fact hashes were deleted in bulk, so postings and the
+        doc_count/total_len statistics do not keep the deleted facts.
+        """
+        if not self.aioredis_client:
+            return {"status": "error", "message": "Redis not available"}
+        await self._get_keyword_index().clear()
+        return await self.rebuild_keyword_index()
+
+    async def _iter_fact_contents(self, batch_size: int = 500):
+        """Yield (fact_id, content) for every stored fact, batched via pipeline."""
+        batch: List[str] = []
+        async for key in self.aioredis_client.scan_iter(match="fact:*", count=1000):
+            batch.append(key.decode("utf-8") if isinstance(key, bytes) else key)
+            if len(batch) >= batch_size:
+                async for item in self._fetch_fact_contents(batch):
+                    yield item
+                batch = []
+        if batch:
+            async for item in self._fetch_fact_contents(batch):
+                yield item
+
+    async def _fetch_fact_contents(self, keys: List[str]):
+        """Fetch content fields for a batch of fact keys, skipping non-hash keys."""
+        pipeline = self.aioredis_client.pipeline()
+        for key in keys:
+            pipeline.hget(key, "content")
+        contents = await pipeline.execute(raise_on_error=False)
+        for key, content in zip(keys, contents):
+            if not content or isinstance(content, Exception):
+                continue  # fact:origin:*, fact:versions:* and other side keys
+            if isinstance(content, bytes):
+                content = content.decode("utf-8")
+            yield key[len("fact:") :], content
+
+    async def rebuild_keyword_index(self) -> Dict[str, Any]:
+        """
+        Build the BM25 keyword index from all stored facts.
+
+        Safe to run while facts are being written: indexing is idempotent
+        per fact. Keyword search keeps using the SCAN fallback until the
+        build completes and marks the index ready.
+        """
+        if not self.aioredis_client:
+            return {"status": "error", "message": "Redis not available"}
+
+        start = time.perf_counter()
+        index = self._get_keyword_index()
+        indexed = 0
+        try:
+            async for fact_id, content in self._iter_fact_contents():
+                await index.index_document(fact_id, content)
+                indexed += 1
+            await index.mark_ready()
+        except Exception as e:
+            logger.error("Keyword index rebuild failed after %d facts: %s", indexed, e)
+            return {"status": "error", "message": str(e), "indexed": indexed}
+
+        elapsed = time.perf_counter() - start
+        logger.info("Keyword index rebuilt: %d facts in %.1fs", indexed, elapsed)
+        return {"status": "success", "indexed": indexed, "duration_s": elapsed}
+
+    async def ensure_keyword_index(self) -> None:
+        """Start a background keyword index build if none has completed yet."""
+        if await self._get_keyword_index().is_ready():
+            return
+        logger.info("Keyword index not built yet, building in background")
+        self._keyword_index_build_task = asyncio.create_task(
+            self.rebuild_keyword_index()
+        )
+
     def _process_rrf_results(
         self,
         results: List[Dict[str, Any]],
@@ -537,10 +657,17 @@ class SearchMixin:
         get_reranker()._apply_rerank_scores(results, scores)
 
     async def _rerank_results(
-        self, query: str, results: List[Dict[str, Any]], top_k: int = None
+        self,
+        query: str,
+        results: List[Dict[str, Any]],
+        top_k: int = None,
+        latency_budget: Optional[float] = DEFAULT_RERANK_BUDGET_S,
     ) -> List[Dict[str, Any]]:
-        """Rerank results using cross-encoder for improved relevance."""
-        return await get_reranker().rerank(query, results, top_k)
+        """Rerank results using cross-encoder for improved relevance.
+
+        Pairs not scored within latency_budget keep their original order.
+        """
+        return await get_reranker().rerank(query, results, top_k, latency_budget)
 
     @error_boundary(component="knowledge_base", function="enhanced_search_v2")
     async def enhanced_search_v2(
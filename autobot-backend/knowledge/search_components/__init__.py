@@ -10,6 +10,8 @@ Note: Package is named search_components to avoid conflict with search.py.
 
 - helpers: Utility functions for Redis hash operations
 - query_processor: Query preprocessing and expansion
+- filtered_search: Cardinality-planned where-filtered vector search
+- keyword_index: Persistent inverted index with BM25 scoring
 - keyword_search: Keyword-based search using Redis
 - hybrid_search: Hybrid search with Reciprocal Rank Fusion
 - reranking: Cross-encoder result reranking
@@ -19,6 +21,13 @@ Note: Package is named search_components to avoid conflict with search.py.
 """
 
 from .analytics import SearchAnalytics, get_analytics
+from .filtered_search import (
+    FilterCardinalityIndex,
+    FilteredSearcher,
+    get_filter_cardinality_index,
+    get_filtered_searcher,
+    invalidate_filter_cardinalities,
+)
 from .helpers import (
     build_search_result,
     decode_redis_hash,
@@ -26,9 +35,10 @@ from .helpers import (
     score_fact_by_terms,
 )
 from .hybrid_search import HybridSearcher
+from .keyword_index import KeywordIndex
 from .keyword_search import KeywordSearcher
 from .query_processor import QueryProcessor, get_query_processor
-from .reranking import ResultReranker, get_reranker
+from .reranking import RerankScoreCache, ResultReranker, get_reranker
 from .response_builder import ResponseBuilder, get_response_builder
 from .tag_filter import TagFilter
 
@@ -43,11 +53,18 @@ __all__ = [
     "get_query_processor",
     # Search classes
     "KeywordSearcher",
+    "KeywordIndex",
     "HybridSearcher",
     "ResultReranker",
     "get_reranker",
+    "RerankScoreCache",
     # Filtering
     "TagFilter",
+    "FilteredSearcher",
+    "get_filtered_searcher",
+    "FilterCardinalityIndex",
+    "get_filter_cardinality_index",
+    "invalidate_filter_cardinalities",
     # Analytics
     "SearchAnalytics",
     "get_analytics",
@@ -0,0 +1,311 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Filtered Vector Search Module
+
+Single-pass, filter-correct ChromaDB search for ``where``-constrained queries
+(permission and category filters, Issue #934).
+
+Previously a filter that matched fewer documents than ``n_results`` made the
+query fail and it was retried *without* the filter, returning documents the
+caller was not allowed to see. The planner here looks up the filter's
+cardinality first and picks a strategy:
+
+- empty: no document matches, no vector query at all
+- exact: the filtered subset is small; fetch its embeddings and rank them
+  exactly (brute force beats HNSW traversal on a few thousand vectors)
+- ann:   HNSW query with the filter and ``n_results`` clamped to the
+  cardinality, over-fetched adaptively to make up for chunks collapsed by
+  per-document deduplication
+
+Cardinalities are kept in a small in-process index keyed by the canonical
+filter, invalidated on knowledge base writes and expired after a short TTL
+to bound staleness from writers in other processes. Counting reads at most
+``exact_max + 1`` ids, so a large filtered subset is not materialized just
+to learn that it is too large for an exact scan.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+STRATEGY_EMPTY = "empty"
+STRATEGY_EXACT = "exact"
+STRATEGY_ANN = "ann"
+
+# Filtered subsets up to this size are ranked by exact scan
+EXACT_SCAN_MAX_DOCS = 2048
+
+# Bounds for the adaptive ANN over-fetch factor
+_MIN_OVERFETCH = 1.0
+_MAX_OVERFETCH = 4.0
+_OVERFETCH_SMOOTHING = 0.2
+
+
+class FilterCardinalityIndex:
+    """
+    Bounded LRU of where-filter -> matching document count.
+
+    For small subsets the matching ids are kept too, so an exact scan can
+    fetch them directly. Entries expire after ``ttl_seconds`` and the whole
+    index is dropped by invalidate() when the collection changes.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 30.0):
+        """Initialize index with capacity and entry lifetime."""
+        self._entries: "OrderedDict[str, Tuple[int, Optional[List[str]], float]]" = (
+            OrderedDict()
+        )
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def filter_key(collection_name: str, where: Dict[str, Any]) -> str:
+        """Canonical key for a filter on a collection."""
+        return collection_name + ":" + json.dumps(where, sort_keys=True, default=str)
+
+    def get(self, key: str) -> Optional[Tuple[int, Optional[List[str]]]]:
+        """Return (count, ids or None) if cached and fresh."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            count, ids, stored_at = entry
+            if time.monotonic() - stored_at > self._ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return count, ids
+
+    def put(self, key: str, count: int, ids: Optional[List[str]]) -> None:
+        """Cache a filter's cardinality."""
+        with self._lock:
+            self._entries[key] = (count, ids, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop all cardinalities (call after collection writes)."""
+        with self._lock:
+            self._entries.clear()
+
+
+_cardinality_index = FilterCardinalityIndex()
+
+
+def get_filter_cardinality_index() -> FilterCardinalityIndex:
+    """Get the process-wide filter cardinality index."""
+    return _cardinality_index
+
+
+def invalidate_filter_cardinalities() -> None:
+    """Drop cached where-filter counts after a vector store write."""
+    _cardinality_index.invalidate()
+
+
+def plan_strategy(count: int, exact_max: int = EXACT_SCAN_MAX_DOCS) -> str:
+    """Choose a search strategy from the filter cardinality."""
+    if count <= 0:
+        return STRATEGY_EMPTY
+    if count <= exact_max:
+        return STRATEGY_EXACT
+    return STRATEGY_ANN
+
+
+def _distances(space: str, query: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+    """Distances as ChromaDB reports them for the collection's space."""
+    if space == "cosine":
+        norms = np.linalg.norm(vectors, axis=1) * np.linalg.norm(query)
+        norms[norms == 0] = 1.0
+        return 1.0 - (vectors @ query) / norms
+    if space == "ip":
+        return 1.0 - vectors @ query
+    diff = vectors - query
+    return np.einsum("ij,ij->i", diff, diff)  # squared L2
+
+
+def _empty_result() -> Dict[str, Any]:
+    """Query-shaped result with no matches."""
+    return {"ids": [[]], "documents": [[]], "metadatas": [[]], "distances": [[]]}
+
+
+class FilteredSearcher:
+    """
+    Run where-filtered queries against a ChromaDB collection in one pass.
+
+    Blocking: call through asyncio.to_thread(). Strategy counts and the
+    over-fetch factor are shared by those threads and guarded by a lock.
+    """
+
+    def __init__(
+        self,
+        index: Optional[FilterCardinalityIndex] = None,
+        exact_max: int = EXACT_SCAN_MAX_DOCS,
+    ):
+        """Initialize searcher with a cardinality index and exact-scan limit."""
+        self._index = index or get_filter_cardinality_index()
+        self._exact_max = exact_max
+        self._overfetch = _MIN_OVERFETCH
+        self._strategy_counts = {STRATEGY_EMPTY: 0, STRATEGY_EXACT: 0, STRATEGY_ANN: 0}
+        self._lock = threading.Lock()
+
+    def cardinality(
+        self,
+        collection,
+        where: Dict[str, Any],
+        refresh: bool = False,
+        exact: bool = False,
+    ) -> Tuple[int, Optional[List[str]]]:
+        """
+        Number of documents matching ``where`` (and their ids if few).
+
+        Counts above ``exact_max`` are a lower bound (``exact_max + 1``)
+        unless ``exact`` is set, which also bypasses the cached value.
+        """
+        key = self._index.filter_key(collection.name, where)
+        cached = None if refresh or exact else self._index.get(key)
+        if cached is not None:
+            return cached
+
+        limit = None if exact else self._exact_max + 1
+        ids = collection.get(where=where, include=[], limit=limit)["ids"]
+        count = len(ids)
+        kept_ids = list(ids) if count <= self._exact_max else None
+        self._index.put(key, count, kept_ids)
+        return count, kept_ids
+
+    def query(
+        self,
+        collection,
+        query_embedding: List[float],
+        n_results: int,
+        where: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Filtered top-``n_results`` query in ChromaDB result format."""
+        count, ids = self.cardinality(collection, where)
+        strategy = plan_strategy(count, self._exact_max)
+        with self._lock:
+            self._strategy_counts[strategy] += 1
+        logger.debug("Filtered search: %d matching docs, strategy=%s", count, strategy)
+
+        if strategy == STRATEGY_EMPTY:
+            return _empty_result()
+        fetch = self.fetch_size(n_results, count)
+        if strategy == STRATEGY_EXACT:
+            return self._exact_scan(collection, query_embedding, fetch, ids, where)
+        if fetch == count:
+            # Clamped by what may be only a lower bound: count exactly
+            count, _ = self.cardinality(collection, where, exact=True)
+            fetch = self.fetch_size(n_results, count)
+        return self._ann_query(collection, query_embedding, fetch, where)
+
+    def fetch_size(self, n_results: int, count: int) -> int:
+        """Results to fetch: over-fetched for dedup, never above cardinality."""
+        with self._lock:
+            overfetch = self._overfetch
+        return min(count, max(n_results, int(round(n_results * overfetch))))
+
+    def _exact_scan(
+        self,
+        collection,
+        query_embedding: List[float],
+        n_results: int,
+        ids: Optional[List[str]],
+        where: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Rank the filtered subset by exact distance."""
+        include = ["embeddings", "documents", "metadatas"]
+        if ids is not None:
+            # Re-apply the filter: cached ids may have stopped matching it
+            data = collection.get(ids=ids, where=where, include=include)
+        else:
+            data = collection.get(where=where, include=include)
+
+        embeddings = data.get("embeddings")
+        if embeddings is None or len(embeddings) == 0:
+            return _empty_result()
+
+        space = (collection.metadata or {}).get("hnsw:space", "l2")
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        query = np.asarray(query_embedding, dtype=np.float32)
+        distances = _distances(space, query, vectors)
+
+        k = min(n_results, len(distances))
+        top = np.argpartition(distances, k - 1)[:k]
+        top = top[np.argsort(distances[top], kind="stable")]
+
+        return {
+            "ids": [[data["ids"][i] for i in top]],
+            "documents": [[data["documents"][i] for i in top]],
+            "metadatas": [[data["metadatas"][i] for i in top]],
+            "distances": [[float(distances[i]) for i in top]],
+        }
+
+    def _ann_query(
+        self,
+        collection,
+        query_embedding: List[float],
+        fetch: int,
+        where: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """HNSW query with the filter and a cardinality-clamped result count."""
+        try:
+            return collection.query(
+                query_embeddings=[query_embedding],
+                n_results=fetch,
+                where=where,
+                include=["documents", "metadatas", "distances"],
+            )
+        except ValueError:
+            # Stale cardinality (documents deleted since it was cached)
+            count, _ = self.cardinality(collection, where, exact=True)
+            if count <= 0:
+                return _empty_result()
+            return collection.query(
+                query_embeddings=[query_embedding],
+                n_results=min(fetch, count),
+                where=where,
+                include=["documents", "metadatas", "distances"],
+            )
+
+    def observe_dedup(self, fetched: int, unique: int) -> None:
+        """Adapt the over-fetch factor from how many results dedup collapsed.
+
+        Args:
+            fetched: Raw chunks returned by the filtered query
+            unique: Distinct documents among them (before top-k truncation)
+        """
+        if fetched <= 0:
+            return
+        target = min(_MAX_OVERFETCH, max(_MIN_OVERFETCH, fetched / max(unique, 1)))
+        with self._lock:
+            self._overfetch += _OVERFETCH_SMOOTHING * (target - self._overfetch)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Strategy usage and current over-fetch factor."""
+        with self._lock:
+            return {
+                "strategies": dict(self._strategy_counts),
+                "overfetch_factor": round(self._overfetch, 3),
+            }
+
+
+_filtered_searcher: Optional[FilteredSearcher] = None
+
+
+def get_filtered_searcher() -> FilteredSearcher:
+    """Get the process-wide filtered searcher."""
+    global _filtered_searcher
+    if _filtered_searcher is None:
+        _filtered_searcher = FilteredSearcher()
+    return _filtered_searcher
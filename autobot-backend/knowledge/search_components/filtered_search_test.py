@@ -0,0 +1,201 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Unit tests for cardinality-planned filtered vector search.
+
+Uses a minimal in-memory stand-in for a ChromaDB collection supporting
+equality where clauses, so strategy selection and filter correctness can
+be verified without a ChromaDB server.
+"""
+
+import threading
+
+from knowledge.search_components.filtered_search import (
+    STRATEGY_ANN,
+    STRATEGY_EMPTY,
+    STRATEGY_EXACT,
+    FilterCardinalityIndex,
+    FilteredSearcher,
+    plan_strategy,
+)
+
+
+class _FakeCollection:
+    """Equality-filtered collection with squared-L2 distances."""
+
+    def __init__(self, rows):
+        self.name = "kb"
+        self.metadata = {"hnsw:space": "l2"}
+        self.rows = rows  # id -> (embedding, document, metadata)
+        self.get_calls = 0
+        self.get_args = []
+        self.queries = []
+
+    def _match(self, where):
+        return [
+            i
+            for i, (_, _, meta) in self.rows.items()
+            if all(meta.get(k) == v for k, v in where.items())
+        ]
+
+    def get(self, ids=None, where=None, include=(), limit=None):
+        self.get_calls += 1
+        self.get_args.append({"ids": ids, "where": where, "limit": limit})
+        matched = self._match(where or {})
+        ids = [i for i in (ids if ids is not None else matched) if i in matched]
+        ids = ids[:limit] if limit is not None else ids
+        return {
+            "ids": ids,
+            "embeddings": [self.rows[i][0] for i in ids],
+            "documents": [self.rows[i][1] for i in ids],
+            "metadatas": [self.rows[i][2] for i in ids],
+        }
+
+    def query(self, query_embeddings, n_results, where, include):
+        self.queries.append(n_results)
+        matched = self._match(where)
+        if n_results > len(matched):
+            raise ValueError("n_results exceeds number of matching elements")
+        q = query_embeddings[0]
+        scored = sorted(
+            matched,
+            key=lambda i: sum((a - b) ** 2 for a, b in zip(self.rows[i][0], q)),
+        )[:n_results]
+        return {
+            "ids": [scored],
+            "documents": [[self.rows[i][1] for i in scored]],
+            "metadatas": [[self.rows[i][2] for i in scored]],
+            "distances": [
+                [sum((a - b) ** 2 for a, b in zip(self.rows[i][0], q)) for i in scored]
+            ],
+        }
+
+
+def _collection(n, category_of):
+    return _FakeCollection(
+        {
+            f"d{i}": ([float(i), 0.0], f"doc {i}", {"category": category_of(i)})
+            for i in range(n)
+        }
+    )
+
+
+def test_plan_strategy_thresholds():
+    assert plan_strategy(0, exact_max=10) == STRATEGY_EMPTY
+    assert plan_strategy(10, exact_max=10) == STRATEGY_EXACT
+    assert plan_strategy(11, exact_max=10) == STRATEGY_ANN
+
+
+def test_selective_filter_uses_exact_scan_and_stays_in_scope():
+    # Only 2 "private" docs: a top-5 query must not fail or leak other docs
+    coll = _collection(20, lambda i: "private" if i in (3, 17) else "public")
+    searcher = FilteredSearcher(FilterCardinalityIndex(), exact_max=8)
+
+    result = searcher.query(coll, [16.0, 0.0], 5, {"category": "private"})
+
+    assert result["ids"] == [["d17", "d3"]]
+    assert result["distances"][0] == [1.0, 169.0]
+    assert coll.queries == []  # no HNSW query issued
+    assert searcher.get_stats()["strategies"][STRATEGY_EXACT] == 1
+
+
+def test_empty_filter_short_circuits():
+    coll = _collection(5, lambda i: "public")
+    searcher = FilteredSearcher(FilterCardinalityIndex())
+
+    result = searcher.query(coll, [0.0, 0.0], 3, {"category": "missing"})
+
+    assert result["ids"] == [[]]
+    assert coll.queries == []
+
+
+def test_broad_filter_uses_ann_clamped_to_cardinality():
+    coll = _collection(30, lambda i: "even" if i % 2 == 0 else "odd")
+    searcher = FilteredSearcher(FilterCardinalityIndex(), exact_max=4)
+
+    result = searcher.query(coll, [0.0, 0.0], 20, {"category": "even"})
+
+    assert coll.queries == [15]
+    assert all(m["category"] == "even" for m in result["metadatas"][0])
+
+
+def test_stale_cardinality_is_refreshed_not_unfiltered():
+    coll = _collection(30, lambda i: "even" if i % 2 == 0 else "odd")
+    searcher = FilteredSearcher(FilterCardinalityIndex(), exact_max=4)
+    searcher.query(coll, [0.0, 0.0], 20, {"category": "even"})
+
+    # Documents deleted behind the cached count
+    for i in range(0, 20, 2):
+        del coll.rows[f"d{i}"]
+    result = searcher.query(coll, [0.0, 0.0], 20, {"category": "even"})
+
+    assert coll.queries[-1] == 5
+    assert {m["category"] for m in result["metadatas"][0]} == {"even"}
+
+
+def test_cardinality_is_cached_until_invalidated():
+    coll = _collection(10, lambda i: "public")
+    index = FilterCardinalityIndex()
+    searcher = FilteredSearcher(index)
+
+    searcher.cardinality(coll, {"category": "public"})
+    searcher.cardinality(coll, {"category": "public"})
+    assert coll.get_calls == 1
+
+    index.invalidate()
+    searcher.cardinality(coll, {"category": "public"})
+    assert coll.get_calls == 2
+
+
+def test_large_subset_count_reads_at_most_exact_max_plus_one():
+    coll = _collection(30, lambda i: "public")
+    searcher = FilteredSearcher(FilterCardinalityIndex(), exact_max=4)
+
+    assert searcher.cardinality(coll, {"category": "public"}) == (5, None)
+    assert coll.get_args[-1]["limit"] == 5
+    assert searcher.cardinality(coll, {"category": "public"}, exact=True)[0] == 30
+
+
+def test_exact_scan_reapplies_filter_to_cached_ids():
+    coll = _collection(10, lambda i: "private" if i < 3 else "public")
+    searcher = FilteredSearcher(FilterCardinalityIndex(), exact_max=8)
+    searcher.query(coll, [0.0, 0.0], 5, {"category": "private"})
+
+    # d0 is reclassified behind the cached id list
+    coll.rows["d0"][2]["category"] = "public"
+    result = searcher.query(coll, [0.0, 0.0], 5, {"category": "private"})
+
+    assert result["ids"] == [["d1", "d2"]]
+    assert coll.get_args[-1]["where"] == {"category": "private"}
+
+
+def test_overfetch_adapts_to_dedup_collapse():
+    searcher = FilteredSearcher(FilterCardinalityIndex())
+    assert searcher.fetch_size(10, 1000) == 10
+
+    for _ in range(20):
+        searcher.observe_dedup(fetched=30, unique=10)
+
+    assert 25 <= searcher.fetch_size(10, 1000) <= 30
+    assert searcher.fetch_size(10, 12) == 12
+
+
+def test_stats_are_consistent_across_threads():
+    searcher = FilteredSearcher(FilterCardinalityIndex())
+    coll = _FakeCollection({})
+
+    def worker():
+        for _ in range(200):
+            searcher.query(coll, [0.0, 0.0], 5, {"category": "none"})
+            searcher.observe_dedup(fetched=20, unique=10)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = searcher.get_stats()
+    assert stats["strategies"][STRATEGY_EMPTY] == 1600
+    assert 1.0 < stats["overfetch_factor"] <= 2.0
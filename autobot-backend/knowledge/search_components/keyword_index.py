@@ -0,0 +1,270 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Keyword Index Module
+
+Persistent inverted index with BM25 scoring for keyword search.
+
+Replaces the per-query ``SCAN fact:*`` + ``HGETALL`` walk in KeywordSearcher
+with postings lists maintained on every fact write, so a keyword lookup only
+reads the postings of the query terms and always covers the whole corpus.
+
+Redis layout (knowledge DB):
+- kb:kw:term:{term}  -> HASH fact_id -> term frequency (postings list)
+- kb:kw:doc:{fact_id} -> HASH term -> term frequency (forward index, for removal)
+- kb:kw:doclen       -> HASH fact_id -> document length in tokens
+- kb:kw:stats        -> HASH doc_count, total_len, ready
+"""
+
+import logging
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+from redis.exceptions import WatchError
+
+logger = logging.getLogger(__name__)
+
+_TERM_KEY_PREFIX = "kb:kw:term:"
+_DOC_KEY_PREFIX = "kb:kw:doc:"
+_DOCLEN_KEY = "kb:kw:doclen"
+_STATS_KEY = "kb:kw:stats"
+_KEY_PATTERN = "kb:kw:*"
+_CLEAR_BATCH_SIZE = 500
+
+# BM25 parameters (Robertson/Sparck Jones defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+_MIN_TOKEN_LEN = 2
+_MAX_TOKEN_LEN = 64
+
+# Very high-frequency terms carry no ranking signal but have postings lists
+# as large as the corpus, so they are neither indexed nor queried.
+_STOPWORDS = frozenset(
+    {
+        "a",
+        "an",
+        "and",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "for",
+        "from",
+        "in",
+        "is",
+        "it",
+        "of",
+        "on",
+        "or",
+        "that",
+        "the",
+        "this",
+        "to",
+        "was",
+        "with",
+    }
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase index terms (stopwords and 1-char tokens dropped)."""
+    if not text:
+        return []
+    return [
+        tok
+        for tok in _TOKEN_RE.findall(text.lower())
+        if _MIN_TOKEN_LEN <= len(tok) <= _MAX_TOKEN_LEN and tok not in _STOPWORDS
+    ]
+
+
+def bm25_idf(doc_count: int, doc_freq: int) -> float:
+    """BM25 inverse document frequency (non-negative variant)."""
+    return math.log(1.0 + (doc_count - doc_freq + 0.5) / (doc_freq + 0.5))
+
+
+def bm25_score(tf: int, doc_len: int, avg_doc_len: float, idf: float) -> float:
+    """BM25 contribution of a single term to a single document."""
+    norm = BM25_K1 * (1.0 - BM25_B + BM25_B * doc_len / max(avg_doc_len, 1.0))
+    return idf * (tf * (BM25_K1 + 1.0)) / (tf + norm)
+
+
+def _to_str(value: Any) -> str:
+    """Decode a Redis bytes value to str."""
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+class KeywordIndex:
+    """
+    Redis-backed inverted index for BM25 keyword search.
+
+    Write path: ``index_document`` / ``remove_document`` are called from
+    FactsMixin store/update/delete, so every fact write keeps the postings
+    current. Reads cost one pipelined round-trip for the query terms'
+    postings plus one for document lengths.
+    """
+
+    def __init__(self, redis_client=None):
+        """Initialize keyword index with async Redis client."""
+        self.redis_client = redis_client
+
+    async def is_ready(self) -> bool:
+        """Return True once a full build has populated the index."""
+        if not self.redis_client:
+            return False
+        try:
+            ready = await self.redis_client.hget(_STATS_KEY, "ready")
+            return _to_str(ready) == "1" if ready is not None else False
+        except Exception as e:
+            logger.debug("Keyword index readiness check failed: %s", e)
+            return False
+
+    async def mark_ready(self) -> None:
+        """Flag the index as complete so searches stop falling back to SCAN."""
+        await self.redis_client.hset(_STATS_KEY, "ready", "1")
+
+    async def clear(self) -> None:
+        """Drop every index key; the index is not ready until rebuilt."""
+        if not self.redis_client:
+            return
+        keys = [key async for key in self.redis_client.scan_iter(match=_KEY_PATTERN)]
+        for i in range(0, len(keys), _CLEAR_BATCH_SIZE):
+            await self.redis_client.delete(*keys[i : i + _CLEAR_BATCH_SIZE])
+
+    async def _read_forward_entry(self, reader, fact_id: str) -> Dict[str, int]:
+        """Read the indexed term frequencies of a fact (empty if not indexed)."""
+        raw = await reader.hgetall(_DOC_KEY_PREFIX + fact_id)
+        return {_to_str(k): int(v) for k, v in (raw or {}).items()}
+
+    def _queue_removal(self, pipe, fact_id: str, old_terms: Dict[str, int]) -> None:
+        """Queue commands removing a fact's postings onto a pipeline."""
+        for term in old_terms:
+            pipe.hdel(_TERM_KEY_PREFIX + term, fact_id)
+        pipe.delete(_DOC_KEY_PREFIX + fact_id)
+        pipe.hdel(_DOCLEN_KEY, fact_id)
+        pipe.hincrby(_STATS_KEY, "doc_count", -1)
+        pipe.hincrby(_STATS_KEY, "total_len", -sum(old_terms.values()))
+
+    async def _replace_document(self, fact_id: str, term_freqs: Counter) -> None:
+        """
+        Swap a fact's postings for term_freqs (empty: remove the fact).
+
+        The forward entry is read under WATCH and the update applied with
+        MULTI/EXEC, retrying if a concurrent write to the same fact got in
+        between, so doc_count and total_len are never double-counted.
+        """
+        doc_key = _DOC_KEY_PREFIX + fact_id
+        doc_len = sum(term_freqs.values())
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(doc_key)
+                    old_terms = await self._read_forward_entry(pipe, fact_id)
+                    if not old_terms and not term_freqs:
+                        await pipe.reset()
+                        return
+                    pipe.multi()
+                    if old_terms:
+                        self._queue_removal(pipe, fact_id, old_terms)
+                    if term_freqs:
+                        for term, tf in term_freqs.items():
+                            pipe.hset(_TERM_KEY_PREFIX + term, fact_id, tf)
+                        pipe.hset(doc_key, mapping=dict(term_freqs))
+                        pipe.hset(_DOCLEN_KEY, fact_id, doc_len)
+                        pipe.hincrby(_STATS_KEY, "doc_count", 1)
+                        pipe.hincrby(_STATS_KEY, "total_len", doc_len)
+                    await pipe.execute()
+                    return
+                except WatchError:
+                    logger.debug(
+                        "Concurrent keyword index write to %s, retrying", fact_id
+                    )
+
+    async def index_document(self, fact_id: str, content: str) -> None:
+        """Add or replace a fact's postings."""
+        if not self.redis_client or not fact_id:
+            return
+        await self._replace_document(fact_id, Counter(tokenize(content)))
+
+    async def remove_document(self, fact_id: str) -> None:
+        """Remove a fact's postings from the index."""
+        if not self.redis_client or not fact_id:
+            return
+        await self._replace_document(fact_id, Counter())
+
+    async def _fetch_postings(
+        self, terms: List[str]
+    ) -> Tuple[List[Dict[str, int]], int, float]:
+        """Fetch postings for all terms plus corpus stats in one round-trip."""
+        pipe = self.redis_client.pipeline()
+        for term in terms:
+            pipe.hgetall(_TERM_KEY_PREFIX + term)
+        pipe.hmget(_STATS_KEY, "doc_count", "total_len")
+        *raw_postings, (raw_count, raw_total) = await pipe.execute()
+
+        doc_count = int(raw_count or 0)
+        total_len = int(raw_total or 0)
+        avg_doc_len = (total_len / doc_count) if doc_count > 0 else 1.0
+
+        postings = [
+            {_to_str(fid): int(tf) for fid, tf in (raw or {}).items()}
+            for raw in raw_postings
+        ]
+        return postings, doc_count, avg_doc_len
+
+    async def _fetch_doc_lengths(self, fact_ids: List[str]) -> Dict[str, int]:
+        """Fetch token lengths of candidate documents."""
+        lengths = await self.redis_client.hmget(_DOCLEN_KEY, fact_ids)
+        return {fid: int(ln or 0) for fid, ln in zip(fact_ids, lengths)}
+
+    async def score(self, query: str) -> List[Tuple[str, float]]:
+        """
+        Rank indexed facts for a query by BM25.
+
+        Args:
+            query: Raw query text
+
+        Returns:
+            List of (fact_id, bm25_score) sorted by descending score
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self.redis_client:
+            return []
+
+        postings, doc_count, avg_doc_len = await self._fetch_postings(terms)
+        candidates = {fid for plist in postings for fid in plist}
+        if not candidates or doc_count <= 0:
+            return []
+
+        doc_lengths = await self._fetch_doc_lengths(list(candidates))
+
+        scores: Dict[str, float] = {}
+        for plist in postings:
+            if not plist:
+                continue
+            idf = bm25_idf(doc_count, len(plist))
+            for fid, tf in plist.items():
+                scores[fid] = scores.get(fid, 0.0) + bm25_score(
+                    tf, doc_lengths.get(fid, 0), avg_doc_len, idf
+                )
+
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Return index statistics for diagnostics."""
+        if not self.redis_client:
+            return {"ready": False, "doc_count": 0, "avg_doc_len": 0.0}
+        raw = await self.redis_client.hgetall(_STATS_KEY)
+        stats = {_to_str(k): _to_str(v) for k, v in (raw or {}).items()}
+        doc_count = int(stats.get("doc_count", 0) or 0)
+        total_len = int(stats.get("total_len", 0) or 0)
+        return {
+            "ready": stats.get("ready") == "1",
+            "doc_count": doc_count,
+            "avg_doc_len": (total_len / doc_count) if doc_count else 0.0,
+        }
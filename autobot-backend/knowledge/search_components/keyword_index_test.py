@@ -0,0 +1,263 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Unit tests for the persistent BM25 keyword index.
+
+Uses a minimal in-memory stand-in for the async Redis hash commands the
+index relies on, so postings maintenance and ranking can be verified
+without a Redis server.
+"""
+
+import fnmatch
+
+import pytest
+from knowledge.search_components.keyword_index import (
+    KeywordIndex,
+    bm25_idf,
+    bm25_score,
+    tokenize,
+)
+from knowledge.search_components.keyword_search import KeywordSearcher
+from redis.exceptions import WatchError
+
+
+class _FakePipeline:
+    """Queue calls and replay them against the fake client on execute().
+
+    After watch() and before multi() calls run immediately, as in redis-py.
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self._calls = []
+        self._watched = {}
+        self._immediate = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.reset()
+
+    async def watch(self, *keys):
+        self._watched = {k: self._client.versions.get(k, 0) for k in keys}
+        self._immediate = True
+
+    def multi(self):
+        self._immediate = False
+
+    async def reset(self):
+        self._calls = []
+        self._watched = {}
+        self._immediate = False
+
+    def __getattr__(self, name):
+        if self._immediate:
+            return getattr(self._client, name)
+
+        def queue(*args, **kwargs):
+            self._calls.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self, raise_on_error=True):
+        watched = self._watched
+        if any(self._client.versions.get(k, 0) != v for k, v in watched.items()):
+            await self.reset()
+            raise WatchError("watched key changed")
+        results = []
+        for name, args, kwargs in self._calls:
+            results.append(await getattr(self._client, name)(*args, **kwargs))
+        await self.reset()
+        return results
+
+
+class _FakeRedis:
+    """In-memory subset of redis.asyncio hash commands."""
+
+    def __init__(self):
+        self.data = {}
+        self.versions = {}
+
+    def _touch(self, key):
+        self.versions[key] = self.versions.get(key, 0) + 1
+
+    def pipeline(self, transaction=False):
+        return _FakePipeline(self)
+
+    async def hget(self, key, field):
+        return self.data.get(key, {}).get(field)
+
+    async def hset(self, key, field=None, value=None, mapping=None):
+        self._touch(key)
+        h = self.data.setdefault(key, {})
+        if mapping:
+            h.update({k: str(v) for k, v in mapping.items()})
+        if field is not None:
+            h[field] = str(value)
+
+    async def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    async def hmget(self, key, *fields):
+        if len(fields) == 1 and isinstance(fields[0], list):
+            fields = fields[0]
+        h = self.data.get(key, {})
+        return [h.get(f) for f in fields]
+
+    async def hdel(self, key, field):
+        self._touch(key)
+        self.data.get(key, {}).pop(field, None)
+
+    async def hincrby(self, key, field, amount):
+        self._touch(key)
+        h = self.data.setdefault(key, {})
+        h[field] = str(int(h.get(field, 0)) + amount)
+
+    async def delete(self, *keys):
+        for key in keys:
+            self._touch(key)
+            self.data.pop(key, None)
+
+    async def scan_iter(self, match):
+        for key in list(self.data):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+
+@pytest.fixture
+def redis():
+    return _FakeRedis()
+
+
+@pytest.fixture
+def index(redis):
+    return KeywordIndex(redis)
+
+
+async def _index_all(index, facts):
+    for fact_id, content in facts:
+        await index.index_document(fact_id, content)
+    await index.mark_ready()
+
+
+class TestTokenize:
+    def test_lowercases_and_drops_stopwords(self):
+        assert tokenize("The Redis CLUSTER is fast") == ["redis", "cluster", "fast"]
+
+    def test_drops_single_characters(self):
+        assert tokenize("a b cd") == ["cd"]
+
+    def test_empty(self):
+        assert tokenize("") == []
+
+
+class TestBM25:
+    def test_rare_terms_weigh_more(self):
+        assert bm25_idf(1000, 1) > bm25_idf(1000, 500)
+
+    def test_term_frequency_saturates(self):
+        low = bm25_score(1, 10, 10.0, 1.0)
+        high = bm25_score(10, 10, 10.0, 1.0)
+        assert high > low
+        assert high < 10 * low
+
+
+class TestKeywordIndex:
+    @pytest.mark.asyncio
+    async def test_index_and_score(self, index):
+        await index.index_document("f1", "redis cluster failover guide")
+        await index.index_document("f2", "python asyncio tutorial")
+        await index.index_document("f3", "redis persistence redis snapshots")
+
+        ranked = await index.score("redis")
+        ids = [fid for fid, _ in ranked]
+        assert set(ids) == {"f1", "f3"}
+        assert ids[0] == "f3"  # higher term frequency
+
+    @pytest.mark.asyncio
+    async def test_reindex_replaces_postings(self, index, redis):
+        await index.index_document("f1", "redis cluster")
+        await index.index_document("f1", "python asyncio")
+
+        assert await index.score("redis") == []
+        assert [fid for fid, _ in await index.score("asyncio")] == ["f1"]
+        assert redis.data["kb:kw:stats"]["doc_count"] == "1"
+
+    @pytest.mark.asyncio
+    async def test_remove_document(self, index, redis):
+        await index.index_document("f1", "redis cluster")
+        await index.remove_document("f1")
+
+        assert await index.score("redis") == []
+        assert redis.data["kb:kw:stats"]["doc_count"] == "0"
+        assert redis.data["kb:kw:stats"]["total_len"] == "0"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_write_is_retried(self, index, redis):
+        await index.index_document("f1", "redis cluster")
+        read_entry = index._read_forward_entry
+        raced = []
+
+        async def racing_read(reader, fact_id):
+            entry = await read_entry(reader, fact_id)
+            if not raced:
+                # Another writer reindexes f1 between the read and EXEC
+                raced.append(True)
+                await index.index_document("f1", "python asyncio tutorial")
+            return entry
+
+        index._read_forward_entry = racing_read
+        await index.index_document("f1", "redis failover")
+
+        assert len(raced) == 1
+        assert await index.score("asyncio") == []
+        assert redis.data["kb:kw:stats"]["doc_count"] == "1"
+        assert redis.data["kb:kw:stats"]["total_len"] == "2"
+
+    @pytest.mark.asyncio
+    async def test_ready_flag(self, index):
+        assert not await index.is_ready()
+        await _index_all(index, [("f1", "redis"), ("f2", "python")])
+        assert await index.is_ready()
+
+    @pytest.mark.asyncio
+    async def test_clear_drops_postings_and_stats(self, index, redis):
+        redis.data["fact:f1"] = {"content": "redis"}
+        await _index_all(index, [("f1", "redis"), ("f2", "python")])
+
+        await index.clear()
+
+        assert not await index.is_ready()
+        assert await index.score("redis") == []
+        assert list(redis.data) == ["fact:f1"]
+
+
+class TestKeywordSearcherIndexed:
+    @pytest.mark.asyncio
+    async def test_search_uses_index_and_filters_category(self, index, redis):
+        redis.data["fact:f1"] = {
+            "content": "redis cluster",
+            "metadata": '{"category": "infra"}',
+        }
+        redis.data["fact:f2"] = {
+            "content": "redis redis tuning",
+            "metadata": '{"category": "perf"}',
+        }
+        await _index_all(index, [("f1", "redis cluster"), ("f2", "redis redis tuning")])
+
+        searcher = KeywordSearcher(redis, index)
+        results = await searcher.search("redis", limit=5, category="infra")
+
+        assert [r["node_id"] for r in results] == ["f1"]
+        assert 0 < results[0]["score"] <= 1.0
+        assert "bm25_score" in results[0]
+
+    @pytest.mark.asyncio
+    async def test_stale_postings_are_skipped(self, index, redis):
+        await _index_all(index, [("gone", "redis")])
+
+        searcher = KeywordSearcher(redis, index)
+        assert await searcher.search("redis", limit=5) == []
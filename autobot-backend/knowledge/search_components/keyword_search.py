@@ -6,10 +6,14 @@ Keyword Search Module
 
 Issue #381: Extracted from search.py god class refactoring.
 Contains keyword-based search functionality using Redis.
+
+When the persistent keyword index (keyword_index.py) has been built, search
+ranks facts by BM25 over the query terms' postings; otherwise it falls back
+to the bounded SCAN-based term matching.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from .helpers import (
     build_search_result,
@@ -17,6 +21,7 @@ from .helpers import (
     matches_category,
     score_fact_by_terms,
 )
+from .keyword_index import KeywordIndex
 
 logger = logging.getLogger(__name__)
 
@@ -26,15 +31,20 @@ class KeywordSearcher:
     Performs keyword-based search using Redis.
 
     Features:
-    - Term matching against fact content
+    - BM25 ranking over a persistent inverted index
+    - Term matching against fact content (SCAN fallback)
     - Category filtering
     - Batch processing with Redis pipelines
     - Efficient cursor-based scanning
     """
 
-    def __init__(self, redis_client=None):
-        """Initialize keyword searcher with Redis client."""
+    # Facts fetched per round-trip when materializing ranked index hits
+    INDEX_FETCH_BATCH = 50
+
+    def __init__(self, redis_client=None, keyword_index: Optional[KeywordIndex] = None):
+        """Initialize keyword searcher with Redis client and optional index."""
         self.redis_client = redis_client
+        self.keyword_index = keyword_index
 
     async def process_keyword_batch(
         self, keys: list, query_terms: Set[str], category: Optional[str]
@@ -57,6 +67,54 @@ class KeywordSearcher:
                 results.append(build_search_result(decoded, key, score))
         return results
 
+    async def _materialize_ranked(
+        self,
+        ranked: List[Tuple[str, float]],
+        limit: int,
+        category: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        """Fetch fact hashes for ranked ids until limit results pass filters."""
+        results: List[Dict[str, Any]] = []
+        for start in range(0, len(ranked), self.INDEX_FETCH_BATCH):
+            batch = ranked[start : start + self.INDEX_FETCH_BATCH]
+            pipeline = self.redis_client.pipeline()
+            for fact_id, _ in batch:
+                pipeline.hgetall("fact:%s" % fact_id)
+            facts_data = await pipeline.execute()
+
+            for (fact_id, bm25), fact_data in zip(batch, facts_data):
+                if not fact_data:
+                    continue  # Stale posting for a fact deleted out-of-band
+                decoded = decode_redis_hash(fact_data)
+                if not matches_category(decoded, category):
+                    continue
+                result = build_search_result(decoded, "fact:%s" % fact_id, bm25)
+                result["bm25_score"] = bm25
+                results.append(result)
+                if len(results) >= limit:
+                    return results
+        return results
+
+    async def search_indexed(
+        self, query: str, limit: int, category: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank facts by BM25 using the persistent keyword index.
+
+        Scores are normalized to [0, 1] against the best hit so min_score
+        thresholds behave like the term-match scores of the SCAN path;
+        the raw value is kept as ``bm25_score``.
+        """
+        ranked = await self.keyword_index.score(query)
+        if not ranked:
+            return []
+
+        results = await self._materialize_ranked(ranked, limit, category)
+        top = ranked[0][1] or 1.0
+        for result in results:
+            result["score"] = result["bm25_score"] / top
+        return results
+
     async def search(
         self, query: str, limit: int, category: Optional[str] = None
     ) -> List[Dict[str, Any]]:
@@ -65,6 +123,9 @@ class KeywordSearcher:
             if not self.redis_client:
                 return []
 
+            if self.keyword_index and await self.keyword_index.is_ready():
+                return await self.search_indexed(query, limit, category)
+
             query_terms = set(query.lower().split())
             if not query_terms:
                 return []
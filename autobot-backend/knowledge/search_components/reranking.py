@@ -6,15 +6,76 @@ Result Reranking Module
 
 Issue #381: Extracted from search.py god class refactoring.
 Contains cross-encoder reranking functionality.
+
+Scoring runs on a dedicated worker thread. (query, document) pairs from
+concurrent queries are batched into a single predict() call, already-scored
+pairs are served from an LRU keyed by (query hash, doc id, doc version),
+and an optional latency budget returns a partially reranked list instead of
+blocking on a busy cross-encoder.
 """
 
 import asyncio
+import hashlib
 import logging
 import threading
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Pairs per cross-encoder predict() call
+_RERANK_BATCH_MAX_SIZE = 64
+# How long the first pair waits for others to join its batch
+_RERANK_BATCH_MAX_WAIT_S = 0.005
+# Default wait for scores on interactive search paths
+DEFAULT_RERANK_BUDGET_S = 1.0
+
+ScoreKey = Tuple[str, str, str]
+
+
+class RerankScoreCache:
+    """Bounded LRU of (query hash, doc id, doc version) -> cross-encoder score."""
+
+    def __init__(self, max_entries: int):
+        """Initialize cache with maximum entry count."""
+        self._scores: "OrderedDict[ScoreKey, float]" = OrderedDict()
+        self._max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: ScoreKey) -> Optional[float]:
+        """Return cached score and mark it recently used."""
+        score = self._scores.get(key)
+        if score is None:
+            self.misses += 1
+            return None
+        self._scores.move_to_end(key)
+        self.hits += 1
+        return score
+
+    def put(self, key: ScoreKey, score: float) -> None:
+        """Store a score, evicting the least recently used beyond capacity."""
+        self._scores[key] = score
+        self._scores.move_to_end(key)
+        while len(self._scores) > self._max_entries:
+            self._scores.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Number of cached scores."""
+        return len(self._scores)
+
+
+def _score_key(query_hash: str, result: Dict[str, Any]) -> ScoreKey:
+    """Cache key for a result; the content hash versions the document."""
+    metadata = result.get("metadata") or {}
+    doc_id = str(
+        metadata.get("fact_id") or result.get("doc_id") or result.get("node_id") or ""
+    )
+    content = result.get("content", "")
+    version = hashlib.sha256(content.encode("utf-8", "replace")).hexdigest()[:16]
+    return query_hash, doc_id, version
+
 
 class ResultReranker:
     """
@@ -25,9 +86,29 @@ class ResultReranker:
 
     MODEL_NAME = "cross-encoder/ms-marco-MiniLM-L-6-v2"
 
-    def __init__(self):
-        """Initialize reranker."""
+    def __init__(
+        self,
+        max_cache_entries: Optional[int] = None,
+        max_batch_size: int = _RERANK_BATCH_MAX_SIZE,
+        max_wait_seconds: float = _RERANK_BATCH_MAX_WAIT_S,
+    ):
+        """Initialize reranker with score cache and batching limits."""
+        if max_cache_entries is None:
+            from autobot_shared.ssot_config import config
+
+            max_cache_entries = config.cache.l1.rerank_score
+
         self._cross_encoder = None
+        self._scores = RerankScoreCache(max_cache_entries)
+        self._max_batch_size = max_batch_size
+        self._max_wait_seconds = max_wait_seconds
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Tuple[Tuple[str, str], ScoreKey, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_task: Optional[asyncio.Task] = None
+        self._batches = 0
+        self._pairs_scored = 0
+        self._partial_results = 0
 
     async def _ensure_cross_encoder(self):
         """Ensure cross-encoder model is loaded. Issue #281: Extracted helper."""
@@ -46,8 +127,122 @@ class ResultReranker:
             result["original_score"] = result.get("score", 0)
             result["score"] = result.get("rerank_score", 0)
 
+    def _apply_partial_scores(
+        self, results: List[Dict[str, Any]], scores: List[Optional[float]]
+    ) -> None:
+        """Rerank only the scored results among the positions they occupy.
+
+        Unscored results (budget exhausted) keep their original position and
+        score, so scores from different scales are never compared.
+        """
+        positions = [i for i, s in enumerate(scores) if s is not None]
+        scored = [results[i] for i in positions]
+        self._apply_rerank_scores(scored, [scores[i] for i in positions])
+        for position, result in zip(positions, scored):
+            results[position] = result
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Dedicated single worker: one predict() at a time, batches queue up."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="rerank"
+            )
+        return self._executor
+
+    def _enqueue(self, pair: Tuple[str, str], key: ScoreKey) -> asyncio.Future:
+        """Queue a pair for the next batch and return its score future."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((pair, key, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._flush_handle is None and self._batch_task is None:
+            self._flush_handle = loop.call_later(self._max_wait_seconds, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        """Start a batch unless one is running (it flushes again when done)."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._batch_task is not None or not self._pending:
+            return
+
+        batch = self._pending[: self._max_batch_size]
+        self._pending = self._pending[self._max_batch_size :]
+        self._batch_task = asyncio.ensure_future(self._run_batch(batch))
+
+    async def _run_batch(
+        self, batch: List[Tuple[Tuple[str, str], ScoreKey, asyncio.Future]]
+    ) -> None:
+        """Score one batch on the worker thread and resolve its futures."""
+        unique: Dict[ScoreKey, Tuple[str, str]] = {}
+        for pair, key, _ in batch:
+            unique.setdefault(key, pair)
+        keys = list(unique)
+
+        try:
+            loop = asyncio.get_running_loop()
+            raw = await loop.run_in_executor(
+                self._get_executor(),
+                self._cross_encoder.predict,
+                [unique[k] for k in keys],
+            )
+            by_key = {k: float(s) for k, s in zip(keys, raw)}
+            for key, score in by_key.items():
+                self._scores.put(key, score)
+            self._batches += 1
+            self._pairs_scored += len(keys)
+            for _, key, future in batch:
+                if not future.done():
+                    future.set_result(by_key[key])
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            self._batch_task = None
+            if self._pending:
+                self._flush()
+
+    async def _score_results(
+        self,
+        query: str,
+        results: List[Dict[str, Any]],
+        latency_budget: Optional[float],
+    ) -> List[Optional[float]]:
+        """Cached or freshly computed scores; None where the budget ran out."""
+        query_hash = hashlib.sha256(query.encode("utf-8", "replace")).hexdigest()[:16]
+        keys = [_score_key(query_hash, r) for r in results]
+        scores: List[Optional[float]] = [self._scores.get(k) for k in keys]
+
+        futures: Dict[ScoreKey, asyncio.Future] = {}
+        for i, key in enumerate(keys):
+            if scores[i] is None and key not in futures:
+                futures[key] = self._enqueue(
+                    (query, results[i].get("content", "")), key
+                )
+        if not futures:
+            return scores
+
+        await asyncio.wait(set(futures.values()), timeout=latency_budget)
+        for i, key in enumerate(keys):
+            future = futures.get(key)
+            if scores[i] is None and future.done() and not future.exception():
+                scores[i] = future.result()
+        for future in futures.values():
+            if not future.done():
+                # Late scores still land in the cache; silence unretrieved errors
+                future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        return scores
+
     async def rerank(
-        self, query: str, results: List[Dict[str, Any]], top_k: Optional[int] = None
+        self,
+        query: str,
+        results: List[Dict[str, Any]],
+        top_k: Optional[int] = None,
+        latency_budget: Optional[float] = None,
     ) -> List[Dict[str, Any]]:
         """
         Rerank results using cross-encoder for improved relevance.
@@ -58,24 +253,33 @@ class ResultReranker:
             query: Search query
             results: Search results to rerank
             top_k: Optional limit on returned results
+            latency_budget: Seconds to wait for scores; results not scored in
+                time keep their original order (None waits for all)
 
         Returns:
             Reranked results list
         """
         try:
-            try:
-                from sentence_transformers import CrossEncoder  # noqa: F401
-            except ImportError:
-                logger.warning("CrossEncoder not available, skipping reranking")
-                return results
-
             if not results:
                 return results
 
-            cross_encoder = await self._ensure_cross_encoder()
-            pairs = [(query, r.get("content", "")) for r in results]
-            scores = await asyncio.to_thread(cross_encoder.predict, pairs)
-            self._apply_rerank_scores(results, scores)
+            if self._cross_encoder is None:
+                try:
+                    from sentence_transformers import CrossEncoder  # noqa: F401
+                except ImportError:
+                    logger.warning("CrossEncoder not available, skipping reranking")
+                    return results
+                await self._ensure_cross_encoder()
+
+            scores = await self._score_results(query, results, latency_budget)
+            if all(s is not None for s in scores):
+                self._apply_rerank_scores(results, scores)
+            elif any(s is not None for s in scores):
+                self._partial_results += 1
+                self._apply_partial_scores(results, scores)
+            else:
+                self._partial_results += 1
+                logger.debug("Rerank budget exhausted before any score was ready")
 
             return results[:top_k] if top_k else results
 
@@ -83,6 +287,18 @@ class ResultReranker:
             logger.error("Reranking failed: %s", e)
             return results
 
+    def get_stats(self) -> Dict[str, Any]:
+        """Score cache and batching statistics."""
+        return {
+            "cache_size": len(self._scores),
+            "cache_hits": self._scores.hits,
+            "cache_misses": self._scores.misses,
+            "batches": self._batches,
+            "pairs_scored": self._pairs_scored,
+            "avg_batch_size": round(self._pairs_scored / max(self._batches, 1), 2),
+            "partial_results": self._partial_results,
+        }
+
 
 # Module-level instance for convenience (thread-safe, Issue #613)
 _reranker = None
@@ -0,0 +1,114 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Unit tests for batched cross-encoder reranking with score cache.
+
+Uses a stand-in cross-encoder whose predict() scores a pair by content
+length and records every batch it receives.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from knowledge.search_components.reranking import RerankScoreCache, ResultReranker
+
+
+class _FakeCrossEncoder:
+    def __init__(self, gate=None):
+        self.batches = []
+        self._gate = gate
+
+    def predict(self, pairs):
+        if self._gate is not None:
+            self._gate.wait(timeout=5)
+        self.batches.append(list(pairs))
+        return [float(len(doc)) for _, doc in pairs]
+
+
+def _results(*contents):
+    return [
+        {"content": c, "score": 0.5, "metadata": {"fact_id": f"f{i}"}}
+        for i, c in enumerate(contents)
+    ]
+
+
+def _reranker(cross_encoder, **kwargs):
+    reranker = ResultReranker(max_cache_entries=100, **kwargs)
+    reranker._cross_encoder = cross_encoder
+    return reranker
+
+
+def test_score_cache_evicts_least_recently_used():
+    cache = RerankScoreCache(max_entries=2)
+    cache.put(("q", "a", "v"), 1.0)
+    cache.put(("q", "b", "v"), 2.0)
+    cache.get(("q", "a", "v"))
+    cache.put(("q", "c", "v"), 3.0)
+
+    assert cache.get(("q", "b", "v")) is None
+    assert cache.get(("q", "a", "v")) == 1.0
+
+
+@pytest.mark.asyncio
+async def test_rerank_orders_by_cross_encoder_score():
+    encoder = _FakeCrossEncoder()
+    reranker = _reranker(encoder)
+
+    results = await reranker.rerank("q", _results("bb", "dddd", "a"))
+
+    assert [r["content"] for r in results] == ["dddd", "bb", "a"]
+    assert results[0]["original_score"] == 0.5
+    assert results[0]["score"] == 4.0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queries_share_batches_and_cache():
+    encoder = _FakeCrossEncoder()
+    reranker = _reranker(encoder, max_wait_seconds=0.01)
+
+    await asyncio.gather(
+        reranker.rerank("q1", _results("aa", "bbb")),
+        reranker.rerank("q2", _results("aa", "c")),
+    )
+    assert len(encoder.batches) == 1
+    assert len(encoder.batches[0]) == 4
+
+    # Same (query, doc, version) pairs are served from the cache
+    await reranker.rerank("q1", _results("aa", "bbb"))
+    assert len(encoder.batches) == 1
+
+    # Edited content is a new version and is rescored
+    await reranker.rerank("q1", _results("aa", "bbbb"))
+    assert encoder.batches[-1] == [("q1", "bbbb")]
+
+
+@pytest.mark.asyncio
+async def test_latency_budget_returns_partial_rerank():
+    gate = threading.Event()
+    encoder = _FakeCrossEncoder(gate)
+    reranker = _reranker(encoder)
+
+    # Warm the cache for one document only
+    gate.set()
+    await reranker.rerank("q", _results("x"))
+    gate.clear()
+
+    results = await reranker.rerank(
+        "q", _results("x", "yyyy", "zz"), latency_budget=0.05
+    )
+
+    # Only the cached doc is scored; the rest keep order and original score
+    assert [r["content"] for r in results] == ["x", "yyyy", "zz"]
+    assert results[0]["score"] == 1.0
+    assert results[1]["score"] == 0.5
+    assert reranker.get_stats()["partial_results"] == 1
+
+    # The late batch still completes and fills the cache for next time
+    gate.set()
+    await asyncio.sleep(0.1)
+    assert reranker.get_stats()["pairs_scored"] == 3
+    results = await reranker.rerank("q", _results("x", "yyyy", "zz"))
+    assert [r["content"] for r in results] == ["yyyy", "zz", "x"]
+    assert len(encoder.batches) == 2
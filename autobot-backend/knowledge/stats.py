@@ -21,6 +21,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Days of per-date fact counts included in detailed stats
+RECENT_ACTIVITY_DAYS = 30
+# Top values per facet dimension included in detailed stats
+FACET_SUMMARY_LIMIT = 20
+
 
 class StatsMixin:
     """
@@ -201,9 +206,11 @@ class StatsMixin:
         fact_drift = actual_facts - stored_facts
         vector_drift = actual_vectors - stored_vectors
         return {
-            "status": "consistent"
-            if fact_drift == 0 and vector_drift == 0
-            else "drift_detected",
+            "status": (
+                "consistent"
+                if fact_drift == 0 and vector_drift == 0
+                else "drift_detected"
+            ),
             "stored_facts": stored_facts,
             "actual_facts": actual_facts,
             "fact_drift": fact_drift,
@@ -244,6 +251,7 @@ class StatsMixin:
             else:
                 logger.info("Stats counters are consistent with actual data")
 
+            result["facets"] = await self._verify_facet_consistency(auto_correct)
             return result
 
         except Exception as e:
@@ -376,6 +384,13 @@ class StatsMixin:
         stats["total_chunks"] = vector_count
         stats["db_size"] = await self._get_redis_memory_size()
 
+        # O(1) read of materialized category counters; sample until built
+        facets = await self.get_facet_counts(("category",))
+        if facets is not None:
+            stats["categories"] = list(facets["category"]) or ["general"]
+            stats["category_counts"] = facets["category"]
+            return
+
         fact_keys_sample = await self._sample_fact_keys(limit=10)
         stats["categories"] = await self._get_fact_categories(fact_keys_sample)
 
@@ -434,6 +449,10 @@ class StatsMixin:
             Dict with recent_activity data, or empty dict on error
         """
         try:
+            facets = await self.get_facet_counts()
+            if facets is not None:
+                return await self._build_facet_activity_stats(facets)
+
             fact_keys = await self._scan_redis_keys_async("fact:*")
             if not fact_keys:
                 return {}
@@ -449,6 +468,37 @@ class StatsMixin:
             logger.warning("Could not get recent activity: %s", e)
             return {}
 
+    async def _build_facet_activity_stats(
+        self, facets: Dict[str, Dict[str, int]]
+    ) -> Dict[str, Any]:
+        """Build recent activity stats from facet counters without a full scan.
+
+        Args:
+            facets: Facet counts per dimension from get_facet_counts()
+
+        Returns:
+            Dict with recent_activity and facets (top values per dimension)
+        """
+        total_facts = await self._get_stat("total_facts")
+        if not total_facts:
+            return {}
+
+        fact_keys = await self._sample_fact_keys(limit=10)
+        recent_facts = await self._sample_fact_timestamps(fact_keys)
+        by_date = sorted(facets.get("date", {}).items())[-RECENT_ACTIVITY_DAYS:]
+        return {
+            "recent_activity": {
+                "total_facts": total_facts,
+                "sample_timestamps": recent_facts[:5],
+                "facts_by_date": dict(by_date),
+            },
+            "facets": {
+                dimension: dict(list(counts.items())[:FACET_SUMMARY_LIMIT])
+                for dimension, counts in facets.items()
+                if dimension != "date"
+            },
+        }
+
     async def _sample_fact_timestamps(self, fact_keys: List[str]) -> List[str]:
         """Sample timestamps from fact keys (Issue #315: extracted).
 
@@ -991,6 +1041,15 @@ class StatsMixin:
             "recommendations": recommendations,
         }
 
+    # Method references needed from other mixins
+    async def get_facet_counts(self, dimensions: Optional[tuple] = None):
+        """Read facet counters - implemented in facets mixin."""
+        raise NotImplementedError("Should be implemented in composed class")
+
+    async def _verify_facet_consistency(self, auto_correct: bool = True) -> dict:
+        """Verify facet counters - implemented in facets mixin."""
+        raise NotImplementedError("Should be implemented in composed class")
+
     # Method reference needed by get_detailed_stats
     async def _scan_redis_keys_async(self, pattern: str):
         """
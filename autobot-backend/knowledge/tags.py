@@ -59,10 +59,12 @@ class TagsMixin:
         return True, metadata
 
     async def _save_fact_metadata(self, fact_id: str, metadata: dict) -> None:
-        """Save fact metadata to Redis (Issue #398: extracted)."""
-        fact_key = f"fact:{fact_id}"
-        await asyncio.to_thread(
-            self.redis_client.hset, fact_key, "metadata", json.dumps(metadata)
+        """Save fact metadata to Redis (Issue #398: extracted).
+
+        Tag facet counters are updated in the same transaction.
+        """
+        await self._write_fact_with_facets(
+            f"fact:{fact_id}", metadata, mapping={"metadata": json.dumps(metadata)}
         )
 
     async def add_tags_to_fact(self, fact_id: str, tags: List[str]) -> Dict[str, Any]:
@@ -194,7 +196,20 @@ class TagsMixin:
             Dict with tags and counts
         """
         try:
-            # Scan for all tag keys
+            # Read materialized tag counters when available
+            facets = await self.get_facet_counts(("tag",))
+            if facets is not None:
+                tags_info = [
+                    {"tag": tag, "fact_count": count}
+                    for tag, count in facets["tag"].items()
+                ]
+                return {
+                    "status": "success",
+                    "total_tags": len(tags_info),
+                    "tags": tags_info,
+                }
+
+            # Fallback: scan for all tag keys
             tag_keys = await self._scan_redis_keys_async("tag:*")
 
             # Issue #370: Fetch all tag counts in parallel
@@ -329,9 +344,7 @@ class TagsMixin:
         tags.discard(old_tag)
         tags.add(new_tag)
         metadata["tags"] = list(tags)
-        await asyncio.to_thread(
-            self.redis_client.hset, fact_key, "metadata", json.dumps(metadata)
-        )
+        await self._save_fact_metadata(fact_id, metadata)
         return True
 
     def _validate_rename_tags(
@@ -435,9 +448,7 @@ class TagsMixin:
 
         tags.discard(tag)
         metadata["tags"] = list(tags)
-        await asyncio.to_thread(
-            self.redis_client.hset, fact_key, "metadata", json.dumps(metadata)
-        )
+        await self._save_fact_metadata(fact_id, metadata)
         return True
 
     async def delete_tag_globally(self, tag: str) -> Dict[str, Any]:
@@ -510,9 +521,7 @@ class TagsMixin:
                     tags.discard(source_tag)
                 tags.add(target_tag)
                 metadata["tags"] = list(tags)
-                await asyncio.to_thread(
-                    self.redis_client.hset, fact_key, "metadata", json.dumps(metadata)
-                )
+                await self._save_fact_metadata(fact_id, metadata)
                 updated_count += 1
         return updated_count
 
@@ -892,9 +901,11 @@ class TagsMixin:
                 "success": True,
                 "tag": tag,
                 "deleted": deleted > 0,
-                "message": "Tag style reset to defaults"
-                if deleted
-                else "No custom style existed",
+                "message": (
+                    "Tag style reset to defaults"
+                    if deleted
+                    else "No custom style existed"
+                ),
             }
 
         except Exception as e:
@@ -913,3 +924,16 @@ class TagsMixin:
     async def _scan_redis_keys_async(self, pattern: str):
         """Scan Redis keys - implemented in base class."""
         raise NotImplementedError("Should be implemented in composed class")
+
+    async def _write_fact_with_facets(
+        self,
+        fact_key: str,
+        after: Optional[Dict[str, Any]],
+        mapping: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Write fact and facet counters - implemented in facets mixin."""
+        raise NotImplementedError("Should be implemented in composed class")
+
+    async def get_facet_counts(self, dimensions: Optional[tuple] = None):
+        """Read facet counters - implemented in facets mixin."""
+        raise NotImplementedError("Should be implemented in composed class")
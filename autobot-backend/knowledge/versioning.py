@@ -17,7 +17,7 @@ import asyncio
 import json
 import logging
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 if TYPE_CHECKING:
     import aioredis
@@ -218,14 +218,16 @@ class VersioningMixin:
         exists = await asyncio.to_thread(self.redis_client.exists, fact_key)
         if not exists:
             return False
-        await asyncio.to_thread(
-            self.redis_client.hset,
+        target_metadata = target_version.get("metadata", {})
+        await self._write_fact_with_facets(
             fact_key,
+            target_metadata,
             mapping={
                 "content": target_version["content"],
-                "metadata": json.dumps(target_version.get("metadata", {})),
+                "metadata": json.dumps(target_metadata),
             },
         )
+        await self._index_fact_keywords(fact_id, target_version["content"])
         return True
 
     async def revert_to_version(
@@ -375,6 +377,19 @@ class VersioningMixin:
             logger.error("Failed to delete version history for %s: %s", fact_id, e)
             return {"status": "error", "message": str(e)}
 
+    async def _index_fact_keywords(self, fact_id: str, content: str) -> None:
+        """Update keyword index. Implemented in search mixin."""
+        raise NotImplementedError("Should be implemented in composed class")
+
+    async def _write_fact_with_facets(
+        self,
+        fact_key: str,
+        after: Optional[Dict[str, Any]],
+        mapping: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Write fact and facet counters. Implemented in facets mixin."""
+        raise NotImplementedError("Should be implemented in composed class")
+
     def ensure_initialized(self):
         """Ensure the knowledge base is initialized. Implemented in composed class."""
         raise NotImplementedError("Should be implemented in composed class")
@@ -6,17 +6,19 @@ LLM Response Cache - Dual-tier L1/L2 caching for LLM responses.
 
 Restored from archived async_llm_interface.py as part of Issue #551.
 Provides significant performance improvements:
-- L1: In-memory LRU cache (fastest, 100 items default)
+- L1: In-memory LRU cache (fastest, byte-budgeted, O(1) hit/evict)
 - L2: Redis cache with TTL (persistence across restarts)
 - 3-5x faster cache lookups for repeated queries
+- Single-flight: concurrent misses for one key share a single LLM call
 """
 
 import asyncio
 import json
 import logging
 import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
 
 import xxhash
 
@@ -25,6 +27,12 @@ from autobot_shared.ssot_config import config
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Fixed per-entry overhead added to the response size (dataclass, dict slot,
+# metadata) so many tiny responses still count against the byte budget.
+_ENTRY_OVERHEAD_BYTES = 256
+
 
 @dataclass
 class CachedResponse:
@@ -40,6 +48,10 @@ class CachedResponse:
         if self.metadata is None:
             self.metadata = {}
 
+    def estimated_size(self) -> int:
+        """Approximate in-memory size in bytes used for L1 budgeting."""
+        return len(self.content.encode("utf-8")) + _ENTRY_OVERHEAD_BYTES
+
 
 class LLMResponseCache:
     """
@@ -57,7 +69,12 @@ class LLMResponseCache:
 
     Issue: #743 - Memory Optimization (Phase 3.3)
     Reads default L1 size from config.cache.l1.llm_response
+    Reads default L1 byte budget from config.cache.l1.llm_response_bytes
     Reads default L2 TTL from config.cache.l2.llm_response
+
+    L1 is an OrderedDict in recency order, so hits (move_to_end) and
+    evictions (popitem) are O(1). It is guarded by a short threading lock
+    that is never held across an await; L2 Redis lookups run outside it.
     """
 
     def __init__(
@@ -65,6 +82,7 @@ class LLMResponseCache:
         memory_cache_max_size: int = None,
         redis_ttl: int = None,
         redis_database: str = "main",
+        memory_cache_max_bytes: int = None,
     ):
         """
         Initialize the dual-tier cache.
@@ -73,16 +91,25 @@ class LLMResponseCache:
             memory_cache_max_size: Max L1 items (default from SSOT config.cache.l1.llm_response)
             redis_ttl: L2 TTL seconds (default from SSOT config.cache.l2.llm_response)
             redis_database: Redis database name for L2 cache
+            memory_cache_max_bytes: L1 byte budget (default from SSOT
+                config.cache.l1.llm_response_bytes)
         """
-        # L1 In-memory cache
-        self._memory_cache: Dict[str, CachedResponse] = {}
-        self._memory_cache_access: List[str] = []  # LRU tracking
+        # L1 In-memory cache: key -> (response, size_bytes), oldest first
+        self._memory_cache: "OrderedDict[str, Tuple[CachedResponse, int]]" = (
+            OrderedDict()
+        )
+        self._memory_cache_bytes = 0
         # Issue #743: Read from SSOT config, allow explicit override
         self._memory_cache_max_size = (
             memory_cache_max_size
             if memory_cache_max_size is not None
             else config.cache.l1.llm_response
         )
+        self._memory_cache_max_bytes = (
+            memory_cache_max_bytes
+            if memory_cache_max_bytes is not None
+            else config.cache.l1.llm_response_bytes
+        )
 
         # L2 Redis cache configuration
         # Issue #743: Read from SSOT config, allow explicit override
@@ -98,14 +125,22 @@ class LLMResponseCache:
             "misses": 0,
             "total_requests": 0,
             "l1_evictions": 0,
+            "coalesced": 0,
         }
 
-        # Lock for thread safety
-        self._lock = asyncio.Lock()
+        # Guards L1 bookkeeping only; every critical section is O(1)
+        self._lock = threading.Lock()
+
+        # Single-flight: cache_key -> future of the in-progress computation
+        self._inflight: Dict[str, asyncio.Future] = {}
 
         logger.info(
-            f"LLM Response Cache initialized: L1={memory_cache_max_size} items, "
-            f"L2 TTL={redis_ttl}s, Redis DB={redis_database}"
+            "LLM Response Cache initialized: L1=%d items/%d bytes, L2 TTL=%ss, "
+            "Redis DB=%s",
+            self._memory_cache_max_size,
+            self._memory_cache_max_bytes,
+            self._redis_ttl,
+            redis_database,
         )
 
     @property
@@ -120,9 +155,14 @@ class LLMResponseCache:
 
     @property
     def max_size(self) -> int:
-        """Maximum capacity of L1 cache."""
+        """Maximum L1 item count (0 = bounded by bytes only)."""
         return self._memory_cache_max_size
 
+    @property
+    def size_bytes(self) -> int:
+        """Current estimated L1 size in bytes."""
+        return self._memory_cache_bytes
+
     def generate_cache_key(
         self,
         messages: List[Dict[str, str]],
@@ -200,7 +240,7 @@ class LLMResponseCache:
             return None
 
         response = self._parse_cached_data(cached_data)
-        await self._store_memory_cache(cache_key, response)
+        self._store_memory_cache_sync(cache_key, response)
         self._metrics["l2_hits"] += 1
         logger.debug(f"L2 Redis cache hit: {cache_key[:24]}...")
         return response
@@ -215,15 +255,17 @@ class LLMResponseCache:
         Returns:
             CachedResponse if found, None if cache miss
         """
-        async with self._lock:
+        with self._lock:
             self._metrics["total_requests"] += 1
-            if cache_key in self._memory_cache:
-                self._memory_cache_access.remove(cache_key)
-                self._memory_cache_access.append(cache_key)
+            entry = self._memory_cache.get(cache_key)
+            if entry is not None:
+                self._memory_cache.move_to_end(cache_key)
                 self._metrics["l1_hits"] += 1
                 logger.debug(f"L1 memory cache hit: {cache_key[:24]}...")
-                return self._memory_cache[cache_key]
+                return entry[0]
 
+        # L2 lookup runs outside the lock so a slow Redis call never
+        # blocks L1 hits for other keys
         try:
             result = await self._check_l2_cache(cache_key)
             if result:
@@ -245,36 +287,107 @@ class LLMResponseCache:
             Actual number of items evicted
         """
         evicted = 0
-        for _ in range(min(count, len(self._memory_cache))):
-            if self._memory_cache_access:
-                oldest_key = self._memory_cache_access.pop(0)
-                if oldest_key in self._memory_cache:
-                    del self._memory_cache[oldest_key]
-                    evicted += 1
-                    self._metrics["l1_evictions"] += 1
+        with self._lock:
+            for _ in range(min(count, len(self._memory_cache))):
+                self._evict_oldest_locked()
+                evicted += 1
         return evicted
 
-    async def _store_memory_cache(
+    def _evict_oldest_locked(self) -> None:
+        """Drop the least recently used L1 entry (caller holds the lock)."""
+        oldest_key, (_, size) = self._memory_cache.popitem(last=False)
+        self._memory_cache_bytes -= size
+        self._metrics["l1_evictions"] += 1
+        logger.debug(f"L1 cache eviction: {oldest_key[:24]}...")
+
+    def _over_budget_locked(self) -> bool:
+        """Return True while L1 exceeds its byte budget or optional item cap."""
+        if self._memory_cache_bytes > self._memory_cache_max_bytes:
+            return True
+        return (
+            self._memory_cache_max_size > 0
+            and len(self._memory_cache) > self._memory_cache_max_size
+        )
+
+    def _store_memory_cache_sync(
         self, cache_key: str, response: CachedResponse
     ) -> None:
         """
-        Store response in L1 memory cache with LRU eviction.
+        Store response in L1 memory cache with byte-budgeted LRU eviction.
+
+        Responses larger than the whole budget are not kept in L1.
 
         Args:
             cache_key: Cache key
             response: Response to cache
         """
-        async with self._lock:
-            # LRU eviction if cache is full
-            if len(self._memory_cache) >= self._memory_cache_max_size:
-                oldest_key = self._memory_cache_access.pop(0)
-                del self._memory_cache[oldest_key]
-                self._metrics["l1_evictions"] += 1
-                logger.debug(f"L1 cache eviction: {oldest_key[:24]}...")
-
-            self._memory_cache[cache_key] = response
-            if cache_key not in self._memory_cache_access:
-                self._memory_cache_access.append(cache_key)
+        size = response.estimated_size()
+        with self._lock:
+            previous = self._memory_cache.pop(cache_key, None)
+            if previous is not None:
+                self._memory_cache_bytes -= previous[1]
+            if size > self._memory_cache_max_bytes:
+                return
+
+            self._memory_cache[cache_key] = (response, size)
+            self._memory_cache_bytes += size
+            while self._over_budget_locked():
+                self._evict_oldest_locked()
+
+    async def _store_memory_cache(
+        self, cache_key: str, response: CachedResponse
+    ) -> None:
+        """Async wrapper kept for callers awaiting the L1 store."""
+        self._store_memory_cache_sync(cache_key, response)
+
+    async def get_or_compute(
+        self, cache_key: str, compute: Callable[[], Awaitable[T]]
+    ) -> Tuple[T, bool]:
+        """
+        Run ``compute`` once for concurrent callers missing the same key.
+
+        The first caller (leader) runs ``compute``; callers arriving while it
+        is in flight await the leader's result instead of issuing their own
+        LLM request. If the leader is cancelled, a waiting caller retries and
+        becomes the new leader. Leader exceptions propagate to all waiters.
+
+        Args:
+            cache_key: Cache key from generate_cache_key()
+            compute: Coroutine factory producing the result on a miss
+
+        Returns:
+            Tuple of (result, shared) where shared is True for waiters
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            future = self._inflight.get(cache_key)
+            if future is None or future.get_loop() is not loop:
+                break
+            self._metrics["coalesced"] += 1
+            try:
+                return await asyncio.shield(future), True
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise  # this waiter was cancelled, not the leader
+
+        future = loop.create_future()
+        self._inflight[cache_key] = future
+        try:
+            result = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unobserved failure does not log a warning
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            if self._inflight.get(cache_key) is future:
+                del self._inflight[cache_key]
 
     async def set(
         self, cache_key: str, response: CachedResponse, skip_redis: bool = False
@@ -337,6 +450,8 @@ class LLMResponseCache:
             "name": self.name,
             "size": len(self._memory_cache),
             "max_size": self._memory_cache_max_size,
+            "size_bytes": self._memory_cache_bytes,
+            "max_bytes": self._memory_cache_max_bytes,
             "hits": total_hits,
             "misses": self._metrics["misses"],
             "hit_rate": hit_rate,
@@ -365,12 +480,14 @@ class LLMResponseCache:
             "total_hit_rate": round(total_hit_rate, 2),
             "l1_cache_size": len(self._memory_cache),
             "l1_max_size": self._memory_cache_max_size,
+            "l1_cache_bytes": self._memory_cache_bytes,
+            "l1_max_bytes": self._memory_cache_max_bytes,
+            "inflight": len(self._inflight),
         }
 
     def clear(self) -> None:
         """Clear L1 memory cache (CacheProtocol compliance)."""
-        self._memory_cache.clear()
-        self._memory_cache_access.clear()
+        self.clear_l1()
         logger.info("L1 cache cleared")
 
     def clear_l1(self) -> int:
@@ -380,9 +497,10 @@ class LLMResponseCache:
         Returns:
             Number of entries cleared
         """
-        count = len(self._memory_cache)
-        self._memory_cache.clear()
-        self._memory_cache_access.clear()
+        with self._lock:
+            count = len(self._memory_cache)
+            self._memory_cache.clear()
+            self._memory_cache_bytes = 0
         logger.info(f"L1 cache cleared: {count} entries removed")
         return count
 
@@ -0,0 +1,154 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Unit tests for LLMResponseCache L1 bookkeeping and single-flight.
+
+L2 is disabled by patching the Redis getter so only in-memory behaviour is
+exercised.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from llm_interface_pkg.cache import (
+    _ENTRY_OVERHEAD_BYTES,
+    CachedResponse,
+    LLMResponseCache,
+)
+
+from autobot_shared.ssot_config import config
+
+
+@pytest.fixture(autouse=True)
+def no_redis():
+    with patch(
+        "llm_interface_pkg.cache.get_redis_client", AsyncMock(return_value=None)
+    ):
+        yield
+
+
+def _resp(text: str) -> CachedResponse:
+    return CachedResponse(content=text, model="m")
+
+
+def _cache(max_bytes: int) -> LLMResponseCache:
+    return LLMResponseCache(redis_ttl=60, memory_cache_max_bytes=max_bytes)
+
+
+class TestL1Budget:
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_by_bytes(self):
+        entry = 100 + _ENTRY_OVERHEAD_BYTES
+        cache = _cache(max_bytes=2 * entry)
+        await cache.set("a", _resp("x" * 100), skip_redis=True)
+        await cache.set("b", _resp("y" * 100), skip_redis=True)
+        assert await cache.get("a") is not None  # a becomes most recent
+
+        await cache.set("c", _resp("z" * 100), skip_redis=True)
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") is not None
+        assert cache.size_bytes == 2 * entry
+
+    @pytest.mark.asyncio
+    async def test_oversized_response_not_kept(self):
+        cache = _cache(max_bytes=512)
+        await cache.set("big", _resp("x" * 4096), skip_redis=True)
+        assert cache.size == 0
+        assert cache.size_bytes == 0
+
+    @pytest.mark.asyncio
+    async def test_overwrite_adjusts_bytes(self):
+        cache = _cache(max_bytes=10_000)
+        await cache.set("k", _resp("x" * 100), skip_redis=True)
+        await cache.set("k", _resp("x" * 10), skip_redis=True)
+        assert cache.size == 1
+        assert cache.size_bytes == 10 + _ENTRY_OVERHEAD_BYTES
+
+    def test_item_cap_defaults_to_config(self):
+        cache = _cache(max_bytes=10_000)
+        assert cache.max_size == config.cache.l1.llm_response > 0
+
+        capped = LLMResponseCache(
+            memory_cache_max_size=2, redis_ttl=60, memory_cache_max_bytes=10_000
+        )
+        for key in ("a", "b", "c"):
+            capped._store_memory_cache_sync(key, _resp(key))
+        assert capped.size == 2
+
+    def test_evict_and_clear(self):
+        cache = _cache(max_bytes=10_000)
+        cache._store_memory_cache_sync("a", _resp("1"))
+        cache._store_memory_cache_sync("b", _resp("2"))
+        assert cache.evict(1) == 1
+        assert cache.size == 1
+        assert cache.clear_l1() == 1
+        assert cache.size_bytes == 0
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_call(self):
+        cache = _cache(max_bytes=10_000)
+        calls = 0
+        release = asyncio.Event()
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "answer"
+
+        tasks = [
+            asyncio.create_task(cache.get_or_compute("k", compute)) for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert calls == 1
+        assert [r for r, _ in results] == ["answer"] * 5
+        assert sum(1 for _, shared in results if not shared) == 1
+        assert cache.get_metrics()["coalesced"] == 4
+        assert cache.get_metrics()["inflight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_leader_error_propagates(self):
+        cache = _cache(max_bytes=10_000)
+        release = asyncio.Event()
+
+        async def failing():
+            await release.wait()
+            raise RuntimeError("boom")
+
+        tasks = [
+            asyncio.create_task(cache.get_or_compute("k", failing)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_waiter_takes_over_when_leader_cancelled(self):
+        cache = _cache(max_bytes=10_000)
+        started = asyncio.Event()
+
+        async def slow():
+            started.set()
+            await asyncio.sleep(10)
+            return "slow"
+
+        async def fast():
+            return "fast"
+
+        leader = asyncio.create_task(cache.get_or_compute("k", slow))
+        await started.wait()
+        waiter = asyncio.create_task(cache.get_or_compute("k", fast))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await waiter == ("fast", False)
@@ -929,20 +929,51 @@ class LLMInterface:
             if cached_response:
                 return cached_response
 
-        request = self._build_llm_request(
-            messages, llm_type, provider, model_name, request_id, **kwargs
+        async def _compute() -> LLMResponse:
+            request = self._build_llm_request(
+                messages, llm_type, provider, model_name, request_id, **kwargs
+            )
+            response = await self._execute_with_fallback(request, provider)
+            return await self._finalize_response(
+                response,
+                messages,
+                model_name,
+                provider,
+                cache_key,
+                request_id,
+                start_time,
+                kwargs.get("session_id"),
+            )
+
+        if not cache_key:
+            return await _compute()
+
+        # Concurrent misses for the same key share one LLM call
+        response, shared = await self._response_cache.get_or_compute(
+            cache_key, _compute
         )
-        response = await self._execute_with_fallback(request, provider)
+        if not shared:
+            return response
+        return self._build_coalesced_response(response, request_id, start_time)
 
-        return await self._finalize_response(
-            response,
-            messages,
-            model_name,
-            provider,
-            cache_key,
-            request_id,
-            start_time,
-            kwargs.get("session_id"),
+    def _build_coalesced_response(
+        self, response: LLMResponse, request_id: str, start_time: float
+    ) -> LLMResponse:
+        """
+        Copy a response produced by a concurrent identical request.
+
+        A failed leader's error is passed through as-is, not presented as a
+        cache hit.
+        """
+        return LLMResponse(
+            content=response.content,
+            model=response.model,
+            provider=response.provider,
+            processing_time=time.time() - start_time,
+            request_id=request_id,
+            error=response.error,
+            cached=not response.error,
+            metadata={**(response.metadata or {}), "coalesced": True},
         )
 
     # Main chat completion method
@@ -0,0 +1,258 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Embedding Throughput Benchmark — NPU worker vs Ollama fallback.
+
+Embeds the same corpus through each bulk embedding path and reports
+texts/second, so batch sizes and in-flight limits can be tuned against
+real hardware:
+
+- npu: NPUClient.generate_embeddings in fixed-size batches
+- ollama_batch: OllamaBatchEmbedder (multi-input /api/embed, adaptive batches)
+- ollama_single: one /api/embeddings request per text (the old fallback),
+  as a baseline
+
+Usage (CLI):
+    cd autobot-backend
+    python -m services.embedding_benchmark --texts 2000 --output results.json
+    python -m services.embedding_benchmark --corpus chunks.txt --paths ollama_batch
+
+Usage (programmatic):
+    from services.embedding_benchmark import run_benchmark
+    results = await run_benchmark(texts)
+"""
+
+import asyncio
+import json
+import logging
+import random
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+import aiohttp
+from services.npu_client import get_npu_client
+from services.ollama_embeddings import (
+    AdaptiveBatchSizer,
+    OllamaBatchEmbedder,
+    default_ollama_url,
+    estimate_tokens,
+)
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_PATHS = ("npu", "ollama_batch", "ollama_single")
+DEFAULT_NPU_BATCH_SIZE = 64
+SINGLE_MAX_CONCURRENT = 5
+
+_WORDS = (
+    "vector index redis knowledge chunk embedding worker latency batch query "
+    "service config deploy model token cache fallback request node graph"
+).split()
+
+
+@dataclass
+class PathResult:
+    """Throughput of one embedding path."""
+
+    path: str
+    texts: int
+    embedded: int
+    seconds: float
+    texts_per_second: float
+    est_tokens_per_second: float
+    skipped: bool = False
+    error: Optional[str] = None
+    details: Dict[str, Any] = field(default_factory=dict)
+
+
+def synthetic_corpus(count: int, seed: int = 7) -> List[str]:
+    """Texts of mixed length (10-400 words) resembling knowledge chunks."""
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(_WORDS) for _ in range(rng.randint(10, 400)))
+        for _ in range(count)
+    ]
+
+
+def _result(
+    path: str, texts: Sequence[str], embedded: int, seconds: float, **details
+) -> PathResult:
+    tokens = sum(map(estimate_tokens, texts))
+    return PathResult(
+        path=path,
+        texts=len(texts),
+        embedded=embedded,
+        seconds=round(seconds, 3),
+        texts_per_second=round(len(texts) / seconds, 1) if seconds else 0.0,
+        est_tokens_per_second=round(tokens / seconds, 1) if seconds else 0.0,
+        details=details,
+    )
+
+
+async def _bench_npu(
+    texts: Sequence[str], model: str, batch_size: int = DEFAULT_NPU_BATCH_SIZE
+) -> PathResult:
+    """Fixed-size batches through the NPU worker."""
+    client = get_npu_client()
+    if not await client.is_available(force_check=True):
+        return PathResult("npu", len(texts), 0, 0.0, 0.0, 0.0, skipped=True)
+
+    embedded = 0
+    started = time.perf_counter()
+    for i in range(0, len(texts), batch_size):
+        batch = list(texts[i : i + batch_size])
+        result = await client.generate_embeddings(batch, model, use_cache=False)
+        if result is not None:
+            embedded += len(result.embeddings)
+    seconds = time.perf_counter() - started
+    return _result("npu", texts, embedded, seconds, batch_size=batch_size)
+
+
+async def _bench_ollama_batch(
+    texts: Sequence[str], model: str, max_in_flight: int
+) -> PathResult:
+    """Adaptive multi-input batches through Ollama."""
+    embedder = OllamaBatchEmbedder(
+        max_in_flight=max_in_flight, sizer=AdaptiveBatchSizer()
+    )
+    started = time.perf_counter()
+    rows = await embedder.embed(texts, model)
+    seconds = time.perf_counter() - started
+    embedded = sum(1 for row in rows if row is not None)
+    return _result("ollama_batch", texts, embedded, seconds, **embedder.get_stats())
+
+
+async def _bench_ollama_single(texts: Sequence[str], model: str) -> PathResult:
+    """One /api/embeddings request per text (previous fallback behaviour)."""
+    url = f"{default_ollama_url()}/api/embeddings"
+    semaphore = asyncio.Semaphore(SINGLE_MAX_CONCURRENT)
+
+    async def embed_one(session: aiohttp.ClientSession, text: str) -> bool:
+        async with semaphore:
+            async with session.post(
+                url, json={"model": model, "prompt": text}
+            ) as response:
+                return response.status == 200 and bool(
+                    (await response.json()).get("embedding")
+                )
+
+    started = time.perf_counter()
+    async with aiohttp.ClientSession() as session:
+        results = await asyncio.gather(
+            *[embed_one(session, text) for text in texts], return_exceptions=True
+        )
+    seconds = time.perf_counter() - started
+    embedded = sum(1 for r in results if r is True)
+    return _result(
+        "ollama_single", texts, embedded, seconds, max_concurrent=SINGLE_MAX_CONCURRENT
+    )
+
+
+async def run_benchmark(
+    texts: Sequence[str],
+    model: str = "nomic-embed-text",
+    paths: Sequence[str] = BENCHMARK_PATHS,
+    max_in_flight: int = 3,
+    npu_batch_size: int = DEFAULT_NPU_BATCH_SIZE,
+) -> Dict[str, Any]:
+    """
+    Embed texts through each requested path and report throughput.
+
+    A path whose backend is unreachable is reported with its error instead
+    of failing the whole run.
+    """
+    runners = {
+        "npu": lambda: _bench_npu(texts, model, npu_batch_size),
+        "ollama_batch": lambda: _bench_ollama_batch(texts, model, max_in_flight),
+        "ollama_single": lambda: _bench_ollama_single(texts, model),
+    }
+    results: List[PathResult] = []
+    for path in paths:
+        logger.info("Benchmarking %s with %d texts", path, len(texts))
+        try:
+            results.append(await runners[path]())
+        except Exception as e:
+            logger.warning("Benchmark path %s failed: %s", path, e)
+            results.append(PathResult(path, len(texts), 0, 0.0, 0.0, 0.0, error=str(e)))
+
+    return {
+        "model": model,
+        "texts": len(texts),
+        "est_tokens": sum(map(estimate_tokens, texts)),
+        "results": [asdict(r) for r in results],
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Embedding throughput benchmark")
+    parser.add_argument(
+        "--texts",
+        type=int,
+        default=1000,
+        help="Synthetic corpus size (ignored with --corpus)",
+    )
+    parser.add_argument(
+        "--corpus",
+        default="",
+        help="Text file with one document per line",
+    )
+    parser.add_argument(
+        "--model",
+        default="nomic-embed-text",
+        help="Embedding model",
+    )
+    parser.add_argument(
+        "--paths",
+        default=",".join(BENCHMARK_PATHS),
+        help=f"Comma-separated subset of {','.join(BENCHMARK_PATHS)}",
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=3,
+        help="Ollama batches in flight",
+    )
+    parser.add_argument(
+        "--npu-batch-size",
+        type=int,
+        default=DEFAULT_NPU_BATCH_SIZE,
+        help="Texts per NPU worker request",
+    )
+    parser.add_argument(
+        "--output",
+        default="",
+        help="Output JSON file path",
+    )
+
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if args.corpus:
+        with open(args.corpus, encoding="utf-8") as f:
+            corpus = [line.strip() for line in f if line.strip()]
+    else:
+        corpus = synthetic_corpus(args.texts)
+
+    async def _main():
+        results = await run_benchmark(
+            corpus,
+            model=args.model,
+            paths=[p.strip() for p in args.paths.split(",") if p.strip()],
+            max_in_flight=args.max_in_flight,
+            npu_batch_size=args.npu_batch_size,
+        )
+        await get_npu_client().close()
+        output = json.dumps(results, indent=2)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.write(output)
+            logger.info("Results written to %s", args.output)
+        else:
+            logger.info(output)
+
+    asyncio.run(_main())
@@ -327,10 +327,56 @@ class GraphRAGService:
         expanded_results = self._process_graph_traversal_results(
             start_points, all_related_results, max_depth
         )
+        await self._rank_by_pagerank(expanded_results, entity_matches)
 
         logger.info("Graph expansion yielded %s results", len(expanded_results))
         return expanded_results[:max_results]
 
+    async def _rank_by_pagerank(
+        self,
+        results: List[SearchResult],
+        entity_matches: List[EntityMatch],
+    ) -> None:
+        """
+        Order graph results by hybrid score blended with personalized
+        PageRank around matched entities (weighted by graph_weight).
+
+        Only active when the memory graph keeps an in-process adjacency
+        snapshot; otherwise traversal order is kept.
+
+        Args:
+            results: Graph expansion results, reordered in place
+            entity_matches: Entities extracted from RAG results (PPR seeds)
+        """
+        if not results or getattr(self.graph, "adjacency_ready", False) is not True:
+            return
+
+        seeds = {
+            match.entity["id"]: match.relevance_score
+            for match in entity_matches[:3]
+            if match.entity.get("id")
+        }
+        if not seeds:
+            return
+
+        ranked = await self.graph.personalized_pagerank(
+            seeds, top_k=max(len(results) * 4, 100)
+        )
+        scores = dict(ranked)
+        top_score = max(scores.values(), default=0.0) or 1.0
+        for result in results:
+            result.metadata["pagerank"] = scores.get(
+                result.metadata.get("entity_id"), 0.0
+            )
+
+        def blended(result: SearchResult) -> float:
+            pagerank = result.metadata["pagerank"] / top_score
+            return (
+                1.0 - self.graph_weight
+            ) * result.hybrid_score + self.graph_weight * pagerank
+
+        results.sort(key=blended, reverse=True)
+
     async def _fetch_related_entities_parallel(
         self,
         start_points: List[Tuple[str, float]],
@@ -401,7 +447,7 @@ class GraphRAGService:
                     item["relation"],
                     item["direction"],
                     base_score,
-                    max_depth,
+                    item.get("depth", max_depth),
                 )
                 if result:
                     expanded_results.append(result)
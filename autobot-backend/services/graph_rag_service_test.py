@@ -374,6 +374,36 @@ async def test_expand_via_graph_multiple_starting_points(
 # ============================================================================
 
 
+async def test_rank_by_pagerank_blends_hybrid_score(
+    graph_rag_service, mock_memory_graph
+):
+    """PageRank reorders graph results without ignoring their hybrid scores."""
+
+    def result(entity_id, hybrid_score):
+        return SearchResult(
+            content=entity_id,
+            metadata={"entity_id": entity_id},
+            semantic_score=0.0,
+            keyword_score=0.0,
+            hybrid_score=hybrid_score,
+            relevance_rank=0,
+            source_path=f"graph:{entity_id}",
+            chunk_index=0,
+        )
+
+    mock_memory_graph.adjacency_ready = True
+    mock_memory_graph.personalized_pagerank = AsyncMock(
+        return_value=[("weak", 0.2), ("strong", 0.19), ("close", 0.1)]
+    )
+    results = [result("weak", 0.1), result("strong", 0.9), result("close", 0.8)]
+    seed = EntityMatch(entity={"id": "seed"}, relevance_score=1.0, graph_distance=0)
+
+    await graph_rag_service._rank_by_pagerank(results, [seed])
+
+    assert [r.content for r in results] == ["strong", "close", "weak"]
+    assert results[0].metadata["pagerank"] == 0.19
+
+
 @pytest.mark.asyncio
 async def test_deduplicate_and_rank(graph_rag_service):
     """Test deduplication removes duplicate content and ranks by score."""
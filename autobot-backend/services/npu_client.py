@@ -14,16 +14,23 @@ Usage:
     client = get_npu_client()
     if await client.is_available():
         embeddings = await client.generate_embeddings(texts)
+
+Batch embeddings are requested as raw little-endian float32 (see
+encode_embeddings) and returned as (n, dim) NumPy arrays; workers that only
+speak JSON are still understood.
 """
 
 import asyncio
 import logging
 import os
+import struct
 import threading
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 import aiohttp
+import numpy as np
+from services.ollama_embeddings import get_ollama_batch_embedder
 
 from autobot_shared.ssot_config import get_config
 
@@ -43,6 +50,40 @@ BATCH_TIMEOUT = 60.0
 # Cache for health status
 HEALTH_CHECK_CACHE_TTL = 30  # seconds
 
+# Binary embedding responses: 8-byte header (rows, dims as little-endian
+# uint32) followed by rows * dims little-endian float32 values. Response
+# metadata travels in X-Embedding-* headers.
+EMBEDDING_BINARY_MEDIA_TYPE = "application/x-autobot-embeddings-f32"
+EMBEDDING_ACCEPT_HEADER = f"{EMBEDDING_BINARY_MEDIA_TYPE}, application/json;q=0.5"
+_EMBEDDING_HEADER = struct.Struct("<II")
+
+
+def encode_embeddings(embeddings: Sequence[Sequence[float]]) -> bytes:
+    """Pack embeddings in the binary float32 wire format."""
+    matrix = np.asarray(embeddings, dtype="<f4")
+    if matrix.ndim != 2:
+        matrix = matrix.reshape(len(matrix), -1 if matrix.size else 0)
+    return _EMBEDDING_HEADER.pack(*matrix.shape) + matrix.tobytes()
+
+
+def decode_embeddings(payload: bytes) -> np.ndarray:
+    """Unpack the binary wire format into an (n, dim) float32 array.
+
+    Raises:
+        ValueError: If the payload size does not match its header
+    """
+    rows, dims = _EMBEDDING_HEADER.unpack_from(payload)
+    expected = _EMBEDDING_HEADER.size + rows * dims * 4
+    if len(payload) != expected:
+        raise ValueError(
+            f"Embedding payload is {len(payload)} bytes, expected {expected}"
+        )
+    matrix = np.frombuffer(
+        payload, dtype="<f4", count=rows * dims, offset=_EMBEDDING_HEADER.size
+    )
+    # One memcpy into a native, writable array (frombuffer views are read-only)
+    return matrix.reshape(rows, dims).astype(np.float32)
+
 
 @dataclass
 class NPUDeviceInfo:
@@ -59,9 +100,9 @@ class NPUDeviceInfo:
 
 @dataclass
 class EmbeddingResult:
-    """Result of embedding generation"""
+    """Result of embedding generation (embeddings is an (n, dim) float32 array)"""
 
-    embeddings: List[List[float]]
+    embeddings: np.ndarray
     model_used: str
     processing_time_ms: float
     device: str
@@ -188,18 +229,16 @@ class NPUClient:
                 f"{self.base_url}/embedding/generate",
                 json=texts,
                 params={"model_name": model_name, "use_cache": str(use_cache).lower()},
+                headers={"Accept": EMBEDDING_ACCEPT_HEADER},
                 timeout=aiohttp.ClientTimeout(total=BATCH_TIMEOUT),
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    return EmbeddingResult(
-                        embeddings=data.get("embeddings", []),
-                        model_used=data.get("model_used", model_name),
-                        processing_time_ms=data.get("processing_time_ms", 0),
-                        device=data.get("device", "UNKNOWN"),
-                        real_inference=data.get("real_inference", False),
-                        texts_processed=data.get("texts_processed", len(texts)),
-                        from_npu_worker=True,
+                    if response.content_type == EMBEDDING_BINARY_MEDIA_TYPE:
+                        return self._binary_embedding_result(
+                            await response.read(), response.headers, texts, model_name
+                        )
+                    return self._json_embedding_result(
+                        await response.json(), texts, model_name
                     )
                 else:
                     logger.warning(f"NPU worker returned status {response.status}")
@@ -208,6 +247,41 @@ class NPUClient:
 
         return None
 
+    @staticmethod
+    def _binary_embedding_result(
+        payload: bytes, headers: Any, texts: List[str], model_name: str
+    ) -> EmbeddingResult:
+        """Build an EmbeddingResult from a binary float32 response."""
+        return EmbeddingResult(
+            embeddings=decode_embeddings(payload),
+            model_used=headers.get("X-Embedding-Model", model_name),
+            processing_time_ms=float(headers.get("X-Processing-Time-Ms", 0)),
+            device=headers.get("X-Embedding-Device", "UNKNOWN"),
+            real_inference=headers.get("X-Real-Inference", "false") == "true",
+            texts_processed=int(headers.get("X-Texts-Processed", len(texts))),
+            from_npu_worker=True,
+        )
+
+    @staticmethod
+    def _json_embedding_result(
+        data: Dict[str, Any], texts: List[str], model_name: str
+    ) -> EmbeddingResult:
+        """Build an EmbeddingResult from a JSON response (older workers)."""
+        embeddings = np.asarray(data.get("embeddings", []), dtype=np.float32)
+        if embeddings.ndim != 2:
+            embeddings = embeddings.reshape(
+                len(embeddings), -1 if embeddings.size else 0
+            )
+        return EmbeddingResult(
+            embeddings=embeddings,
+            model_used=data.get("model_used", model_name),
+            processing_time_ms=data.get("processing_time_ms", 0),
+            device=data.get("device", "UNKNOWN"),
+            real_inference=data.get("real_inference", False),
+            texts_processed=data.get("texts_processed", len(texts)),
+            from_npu_worker=True,
+        )
+
     async def generate_embedding(
         self, text: str, model_name: str = "nomic-embed-text"
     ) -> Optional[List[float]]:
@@ -222,8 +296,8 @@ class NPUClient:
             Embedding vector if successful, None if failed
         """
         result = await self.generate_embeddings([text], model_name)
-        if result and result.embeddings:
-            return result.embeddings[0]
+        if result and len(result.embeddings):
+            return result.embeddings[0].tolist()
         return None
 
     async def get_stats(self) -> Optional[Dict[str, Any]]:
@@ -322,13 +396,24 @@ async def generate_embedding_with_fallback(
 
 
 async def generate_embeddings_batch_with_fallback(
-    texts: List[str], model_name: str = "nomic-embed-text", max_concurrent: int = 5
-) -> List[Optional[List[float]]]:
+    texts: List[str],
+    model_name: str = "nomic-embed-text",
+    max_concurrent: Optional[int] = None,
+) -> Sequence[Optional[Sequence[float]]]:
     """
     Generate embeddings for multiple texts with fallback.
 
-    Uses NPU worker for batch processing if available,
-    otherwise falls back to parallel Ollama requests.
+    Uses NPU worker for batch processing if available (returning an (n, dim)
+    float32 array), otherwise falls back to Ollama's multi-input embed
+    endpoint with adaptive batch sizes (see services.ollama_embeddings).
+
+    Args:
+        texts: Texts to embed
+        model_name: Model name
+        max_concurrent: Ollama batches in flight (default: embedder setting)
+
+    Returns:
+        One vector per text; None where the Ollama fallback failed
     """
     if not texts:
         return []
@@ -342,15 +427,7 @@ async def generate_embeddings_batch_with_fallback(
             logger.info(f"Generated {len(texts)} embeddings via NPU worker")
             return result.embeddings
 
-    # Fallback to parallel Ollama requests
-    semaphore = asyncio.Semaphore(max_concurrent)
-
-    async def generate_one(text: str) -> Optional[List[float]]:
-        async with semaphore:
-            return await generate_embedding_with_fallback(text, model_name)
-
-    tasks = [generate_one(text) for text in texts]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    # Convert exceptions to None
-    return [r if isinstance(r, list) else None for r in results]
+    # Fallback to batched Ollama requests
+    return await get_ollama_batch_embedder().embed(
+        texts, model_name, max_in_flight=max_concurrent
+    )
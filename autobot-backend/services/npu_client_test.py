@@ -0,0 +1,61 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Unit tests for the NPU client embedding wire format
+
+Tests cover:
+- Binary float32 encode/decode round trip and size validation
+- EmbeddingResult construction from binary and JSON responses
+"""
+
+import numpy as np
+import pytest
+from services.npu_client import NPUClient, decode_embeddings, encode_embeddings
+
+
+def test_binary_round_trip_is_float32():
+    embeddings = [[0.5, -1.25, 3.0], [1.0, 2.0, 4.0]]
+    decoded = decode_embeddings(encode_embeddings(embeddings))
+
+    assert decoded.dtype == np.float32
+    assert decoded.shape == (2, 3)
+    assert decoded.tolist() == embeddings
+    # Writable copy, not a read-only view of the response body
+    decoded[0, 0] = 0.0
+
+
+def test_truncated_payload_is_rejected():
+    payload = encode_embeddings([[1.0, 2.0]])
+    with pytest.raises(ValueError):
+        decode_embeddings(payload[:-1])
+
+
+def test_binary_result_reads_metadata_headers():
+    headers = {
+        "X-Embedding-Model": "nomic-embed-text",
+        "X-Processing-Time-Ms": "12.500",
+        "X-Texts-Processed": "1",
+        "X-Embedding-Device": "NPU",
+        "X-Real-Inference": "true",
+    }
+    result = NPUClient._binary_embedding_result(
+        encode_embeddings([[1.0, 2.0]]), headers, ["a"], "fallback-model"
+    )
+
+    assert result.embeddings.shape == (1, 2)
+    assert result.processing_time_ms == 12.5
+    assert result.device == "NPU"
+    assert result.real_inference is True
+
+
+def test_json_result_is_converted_to_array():
+    result = NPUClient._json_embedding_result(
+        {"embeddings": [[1.0, 2.0], [3.0, 4.0]], "device": "CPU"}, ["a", "b"], "m"
+    )
+    assert result.embeddings.dtype == np.float32
+    assert result.embeddings.shape == (2, 2)
+    assert result.model_used == "m"
+
+    empty = NPUClient._json_embedding_result({}, ["a"], "m")
+    assert len(empty.embeddings) == 0
@@ -0,0 +1,374 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Ollama Batch Embedding Client
+
+Fallback embedding path for when the NPU worker is unavailable. Sends many
+texts per request to Ollama's multi-input /api/embed endpoint instead of one
+/api/embeddings request per text:
+
+- Batches are filled up to a token budget sized from observed latency
+  (AdaptiveBatchSizer), so short texts share large batches and long texts
+  small ones
+- A few batches are kept in flight at once
+- A batch Ollama rejects as bad input (HTTP 400) is split in halves, so one
+  bad text does not fail its neighbours; other errors fail the whole batch
+- Ollama versions without /api/embed fall back to per-text /api/embeddings
+
+Usage:
+    from services.ollama_embeddings import get_ollama_batch_embedder
+
+    embedder = get_ollama_batch_embedder()
+    embeddings = await embedder.embed(texts, model_name="nomic-embed-text")
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import aiohttp
+import numpy as np
+
+from autobot_shared.ssot_config import get_config
+
+logger = logging.getLogger(__name__)
+
+_ssot = get_config()
+
+# Batch sizing
+DEFAULT_TARGET_LATENCY_S = 2.0
+INITIAL_TOKEN_BUDGET = 2048
+MIN_TOKEN_BUDGET = 64
+MAX_TOKEN_BUDGET = 65536
+MAX_BATCH_TEXTS = 256
+LATENCY_EWMA_ALPHA = 0.3
+
+# Concurrency and timeouts
+DEFAULT_MAX_IN_FLIGHT = 3
+BATCH_TIMEOUT = 120.0
+LEGACY_MAX_CONCURRENT = 5
+
+
+def default_ollama_url() -> str:
+    """Ollama base URL from SSOT config with environment override."""
+    host = os.getenv("AUTOBOT_OLLAMA_HOST", _ssot.vm.ollama)
+    port = os.getenv("AUTOBOT_OLLAMA_PORT", str(_ssot.port.ollama))
+    return f"http://{host}:{port}"
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token)."""
+    return max(1, len(text) // 4)
+
+
+class OllamaEmbedError(Exception):
+    """Ollama rejected an embedding request (non-200 response)."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"Ollama returned {status}: {message}")
+        self.status = status
+        self.endpoint_missing = status == 404 and "page not found" in message
+        self.input_rejected = status == 400
+
+
+class AdaptiveBatchSizer:
+    """
+    Choose per-batch token budgets from observed embedding latency.
+
+    Keeps an EWMA of seconds per token and sizes the next batch to take about
+    target_latency_s, changing the budget by at most a factor of two per
+    observation. Failed batches halve the budget.
+    """
+
+    def __init__(
+        self,
+        target_latency_s: float = DEFAULT_TARGET_LATENCY_S,
+        initial_tokens: int = INITIAL_TOKEN_BUDGET,
+        min_tokens: int = MIN_TOKEN_BUDGET,
+        max_tokens: int = MAX_TOKEN_BUDGET,
+        max_batch_texts: int = MAX_BATCH_TEXTS,
+    ):
+        """Initialize sizer with latency target and budget bounds."""
+        self.target_latency_s = target_latency_s
+        self.token_budget = initial_tokens
+        self.min_tokens = min_tokens
+        self.max_tokens = max_tokens
+        self.max_batch_texts = max_batch_texts
+        self.seconds_per_token: Optional[float] = None
+
+    def record(self, tokens: int, latency_s: float) -> None:
+        """Update the budget from one completed batch."""
+        if tokens <= 0 or latency_s <= 0:
+            return
+        sample = latency_s / tokens
+        if self.seconds_per_token is None:
+            self.seconds_per_token = sample
+        else:
+            self.seconds_per_token = (
+                LATENCY_EWMA_ALPHA * sample
+                + (1 - LATENCY_EWMA_ALPHA) * self.seconds_per_token
+            )
+        ideal = self.target_latency_s / self.seconds_per_token
+        bounded = min(max(ideal, self.token_budget / 2), self.token_budget * 2)
+        self.token_budget = int(min(max(bounded, self.min_tokens), self.max_tokens))
+
+    def record_failure(self) -> None:
+        """Halve the budget after a failed batch."""
+        self.token_budget = max(self.min_tokens, self.token_budget // 2)
+
+    def next_batch_end(self, texts: Sequence[str], start: int) -> int:
+        """Index one past the last text of the batch starting at start.
+
+        A batch always holds at least one text, even if it alone exceeds
+        the budget.
+        """
+        end = start
+        tokens = 0
+        limit = min(len(texts), start + self.max_batch_texts)
+        while end < limit:
+            tokens += estimate_tokens(texts[end])
+            if tokens > self.token_budget and end > start:
+                break
+            end += 1
+        return end
+
+
+class OllamaBatchEmbedder:
+    """
+    Batch embedding client for Ollama's multi-input /api/embed endpoint.
+
+    The batch sizer is shared across calls, so the learned budget carries
+    over between bulk vectorization runs.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        sizer: Optional[AdaptiveBatchSizer] = None,
+    ):
+        """Initialize embedder for an Ollama instance."""
+        self.base_url = (base_url or default_ollama_url()).rstrip("/")
+        self.max_in_flight = max_in_flight
+        self.sizer = sizer or AdaptiveBatchSizer()
+        self._batch_endpoint_supported = True
+        self._stats = {
+            "texts": 0,
+            "batches": 0,
+            "failed_batches": 0,
+            "split_batches": 0,
+            "tokens": 0,
+            "busy_seconds": 0.0,
+        }
+
+    def _open_session(self) -> aiohttp.ClientSession:
+        """HTTP session for one embed() call."""
+        return aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=BATCH_TIMEOUT))
+
+    async def embed(
+        self,
+        texts: Sequence[str],
+        model_name: str = "nomic-embed-text",
+        max_in_flight: Optional[int] = None,
+        options: Optional[Dict[str, Any]] = None,
+        keep_alive: Optional[Any] = None,
+    ) -> List[Optional[np.ndarray]]:
+        """
+        Embed texts in adaptive batches.
+
+        Args:
+            texts: Texts to embed
+            model_name: Ollama embedding model
+            max_in_flight: Concurrent batches (default: self.max_in_flight)
+            options: Ollama model options (e.g. {"num_ctx": 2048})
+            keep_alive: How long Ollama keeps the model loaded (e.g. "5m")
+
+        Returns:
+            One float32 vector per text, or None where embedding failed
+        """
+        results: List[Optional[np.ndarray]] = [None] * len(texts)
+        if not texts:
+            return results
+
+        # Request fields shared by every batch besides model and input
+        request: Dict[str, Any] = {}
+        if options:
+            request["options"] = options
+        if keep_alive is not None:
+            request["keep_alive"] = keep_alive
+
+        semaphore = asyncio.Semaphore(max_in_flight or self.max_in_flight)
+        tasks = []
+        async with self._open_session() as session:
+            start = 0
+            while start < len(texts):
+                # Size each batch only when a slot frees up, so it uses the
+                # budget learned from the batches that finished before it
+                await semaphore.acquire()
+                end = self.sizer.next_batch_end(texts, start)
+                tasks.append(
+                    asyncio.create_task(
+                        self._run_batch(
+                            session, texts, start, end, model_name, request, results
+                        )
+                    )
+                )
+                tasks[-1].add_done_callback(lambda _: semaphore.release())
+                start = end
+            await asyncio.gather(*tasks)
+        return results
+
+    async def _run_batch(
+        self,
+        session: aiohttp.ClientSession,
+        texts: Sequence[str],
+        start: int,
+        end: int,
+        model_name: str,
+        request: Dict[str, Any],
+        results: List[Optional[np.ndarray]],
+    ) -> None:
+        """Embed texts[start:end] into results[start:end]."""
+        try:
+            results[start:end] = await self._embed_with_split(
+                session, list(texts[start:end]), model_name, request
+            )
+        except Exception as e:
+            self._stats["failed_batches"] += 1
+            self.sizer.record_failure()
+            logger.warning(
+                "Ollama batch embedding of %d texts failed: %s", end - start, e
+            )
+
+    async def _embed_with_split(
+        self,
+        session: aiohttp.ClientSession,
+        batch: List[str],
+        model_name: str,
+        request: Dict[str, Any],
+    ) -> List[Optional[np.ndarray]]:
+        """Embed a batch, splitting it in halves when Ollama rejects its input.
+
+        Only HTTP 400 is treated as a bad text; any other error (model not
+        found, server error, timeout) would fail every half as well, so it
+        fails the whole batch instead.
+        """
+        if not self._batch_endpoint_supported:
+            return await self._embed_legacy(session, batch, model_name, request)
+        try:
+            return list(await self._embed_batch(session, batch, model_name, request))
+        except OllamaEmbedError as e:
+            if e.endpoint_missing:
+                logger.info("Ollama has no /api/embed, using per-text requests")
+                self._batch_endpoint_supported = False
+                return await self._embed_legacy(session, batch, model_name, request)
+            if not e.input_rejected:
+                raise
+            self.sizer.record_failure()
+            if len(batch) == 1:
+                logger.warning("Ollama could not embed text: %s", e)
+                return [None]
+            self._stats["split_batches"] += 1
+            mid = len(batch) // 2
+            return await self._embed_with_split(
+                session, batch[:mid], model_name, request
+            ) + await self._embed_with_split(session, batch[mid:], model_name, request)
+
+    async def _embed_batch(
+        self,
+        session: aiohttp.ClientSession,
+        batch: List[str],
+        model_name: str,
+        request: Dict[str, Any],
+    ) -> np.ndarray:
+        """One /api/embed request; feeds its latency to the sizer."""
+        started = time.perf_counter()
+        data = await self._post_embed(session, batch, model_name, request)
+        latency = time.perf_counter() - started
+
+        embeddings = np.asarray(data.get("embeddings", []), dtype=np.float32)
+        if len(embeddings) != len(batch):
+            raise OllamaEmbedError(
+                200, f"{len(embeddings)} embeddings for {len(batch)} inputs"
+            )
+
+        tokens = data.get("prompt_eval_count") or sum(map(estimate_tokens, batch))
+        self.sizer.record(tokens, latency)
+        self._stats["texts"] += len(batch)
+        self._stats["batches"] += 1
+        self._stats["tokens"] += tokens
+        self._stats["busy_seconds"] += latency
+        return embeddings
+
+    async def _post_embed(
+        self,
+        session: aiohttp.ClientSession,
+        batch: List[str],
+        model_name: str,
+        request: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """POST a multi-input request to /api/embed."""
+        payload = {"model": model_name, "input": batch, **request}
+        async with session.post(f"{self.base_url}/api/embed", json=payload) as resp:
+            if resp.status != 200:
+                raise OllamaEmbedError(resp.status, (await resp.text())[:200])
+            return await resp.json()
+
+    async def _embed_legacy(
+        self,
+        session: aiohttp.ClientSession,
+        batch: List[str],
+        model_name: str,
+        request: Dict[str, Any],
+    ) -> List[Optional[np.ndarray]]:
+        """Per-text /api/embeddings requests for older Ollama versions."""
+        semaphore = asyncio.Semaphore(LEGACY_MAX_CONCURRENT)
+
+        async def embed_one(text: str) -> Optional[np.ndarray]:
+            payload = {"model": model_name, "prompt": text, **request}
+            async with semaphore:
+                try:
+                    async with session.post(
+                        f"{self.base_url}/api/embeddings", json=payload
+                    ) as resp:
+                        if resp.status == 200:
+                            embedding = (await resp.json()).get("embedding")
+                            if embedding:
+                                return np.asarray(embedding, dtype=np.float32)
+                except Exception as e:
+                    logger.debug("Ollama legacy embedding failed: %s", e)
+            return None
+
+        embeddings = await asyncio.gather(*[embed_one(text) for text in batch])
+        self._stats["texts"] += len(batch)
+        return list(embeddings)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Batching statistics for observability."""
+        stats = dict(self._stats)
+        batches = stats["batches"]
+        stats["avg_batch_size"] = round(stats["texts"] / batches, 2) if batches else 0.0
+        stats["token_budget"] = self.sizer.token_budget
+        stats["batch_endpoint_supported"] = self._batch_endpoint_supported
+        return stats
+
+
+# Embedders per Ollama base URL; the learned batch budget is kept per instance
+_embedders: Dict[str, OllamaBatchEmbedder] = {}
+_embedders_lock = threading.Lock()
+
+
+def get_ollama_batch_embedder(base_url: Optional[str] = None) -> OllamaBatchEmbedder:
+    """Get or create the batch embedder for an Ollama instance (thread-safe)."""
+    url = (base_url or default_ollama_url()).rstrip("/")
+    embedder = _embedders.get(url)
+    if embedder is None:
+        with _embedders_lock:
+            embedder = _embedders.get(url)
+            if embedder is None:
+                embedder = _embedders[url] = OllamaBatchEmbedder(url)
+    return embedder
@@ -0,0 +1,179 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Unit tests for the Ollama batch embedding fallback
+
+Tests cover:
+- Adaptive token budgets from observed latency
+- Token-budgeted batch formation
+- Multi-input batching with bounded batches in flight
+- Splitting batches rejected with HTTP 400 and failing on other errors
+- Per-text fallback for old Ollama versions
+"""
+
+import asyncio
+
+import numpy as np
+from services.ollama_embeddings import (
+    AdaptiveBatchSizer,
+    OllamaBatchEmbedder,
+    OllamaEmbedError,
+)
+
+
+class _Session:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _Embedder(OllamaBatchEmbedder):
+    """Embedder whose /api/embed calls are served in memory."""
+
+    def __init__(self, reject=(), delay=0.0, **kwargs):
+        super().__init__(base_url="http://ollama:11434", **kwargs)
+        self.reject = set(reject)
+        self.delay = delay
+        self.batches = []
+        self.requests = []
+        self.in_flight = 0
+        self.max_seen_in_flight = 0
+
+    def _open_session(self):
+        return _Session()
+
+    async def _post_embed(self, session, batch, model_name, request):
+        self.batches.append(list(batch))
+        self.requests.append(request)
+        self.in_flight += 1
+        self.max_seen_in_flight = max(self.max_seen_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if self.reject & set(batch):
+            raise OllamaEmbedError(400, "input too long")
+        return {"embeddings": [[float(len(t)), 1.0] for t in batch]}
+
+
+class TestAdaptiveBatchSizer:
+    """Tests for AdaptiveBatchSizer."""
+
+    def test_fast_batches_grow_budget_at_most_twofold(self):
+        sizer = AdaptiveBatchSizer(target_latency_s=1.0, initial_tokens=1000)
+        sizer.record(tokens=1000, latency_s=0.01)
+        assert sizer.token_budget == 2000
+
+    def test_slow_batches_shrink_budget(self):
+        sizer = AdaptiveBatchSizer(target_latency_s=1.0, initial_tokens=1000)
+        sizer.record(tokens=1000, latency_s=1.5)
+        assert sizer.token_budget == 666
+        sizer.record_failure()
+        assert sizer.token_budget == 333
+
+    def test_budget_converges_to_latency_target(self):
+        sizer = AdaptiveBatchSizer(target_latency_s=1.0, initial_tokens=100)
+        for _ in range(20):
+            sizer.record(sizer.token_budget, sizer.token_budget * 0.0005)
+        assert sizer.token_budget == 2000
+
+    def test_batches_respect_token_budget_and_text_cap(self):
+        sizer = AdaptiveBatchSizer(initial_tokens=10, max_batch_texts=3)
+        texts = ["x" * 16, "x" * 16, "x" * 16, "x" * 400]
+        # 4 tokens each: two fit in a budget of 10
+        assert sizer.next_batch_end(texts, 0) == 2
+        # An oversized text still forms a batch of one
+        assert sizer.next_batch_end(texts, 3) == 4
+
+        sizer.token_budget = 1000
+        assert sizer.next_batch_end(texts, 0) == 3
+
+
+class TestOllamaBatchEmbedder:
+    """Tests for OllamaBatchEmbedder."""
+
+    async def test_texts_share_multi_input_requests(self):
+        embedder = _Embedder()
+        texts = [f"text {i}" for i in range(50)]
+        results = await embedder.embed(texts)
+
+        assert len(embedder.batches) == 1
+        assert [r[0] for r in results] == [float(len(t)) for t in texts]
+        assert results[0].dtype == np.float32
+
+    async def test_batches_in_flight_are_bounded(self):
+        embedder = _Embedder(
+            delay=0.01, sizer=AdaptiveBatchSizer(initial_tokens=2, max_batch_texts=2)
+        )
+        results = await embedder.embed(["abcd"] * 12, max_in_flight=2)
+
+        assert all(r is not None for r in results)
+        assert embedder.max_seen_in_flight == 2
+
+    async def test_rejected_batch_is_split_around_bad_text(self):
+        embedder = _Embedder(reject={"bad"})
+        results = await embedder.embed(["a", "b", "bad", "c"])
+
+        assert results[2] is None
+        assert [r[0] for i, r in enumerate(results) if i != 2] == [1.0, 1.0, 1.0]
+        assert embedder.get_stats()["split_batches"] >= 1
+
+    async def test_non_input_errors_fail_the_whole_batch_unsplit(self):
+        embedder = _Embedder()
+        calls = []
+
+        async def model_missing(session, batch, model_name, request):
+            calls.append(list(batch))
+            raise OllamaEmbedError(404, 'model "nomic-embed-text" not found')
+
+        embedder._post_embed = model_missing
+        results = await embedder.embed(["a", "b", "c", "d"])
+
+        assert results == [None] * 4
+        assert calls == [["a", "b", "c", "d"]]
+        assert embedder.get_stats()["split_batches"] == 0
+        assert embedder.get_stats()["failed_batches"] == 1
+
+    async def test_options_and_keep_alive_are_sent_with_every_batch(self):
+        embedder = _Embedder(sizer=AdaptiveBatchSizer(max_batch_texts=1))
+        await embedder.embed(["a", "b"], options={"num_ctx": 2048}, keep_alive="5m")
+
+        assert (
+            embedder.requests
+            == [{"options": {"num_ctx": 2048}, "keep_alive": "5m"}] * 2
+        )
+
+    async def test_missing_endpoint_falls_back_to_per_text_requests(self):
+        embedder = _Embedder()
+        legacy_calls = []
+
+        async def missing(session, batch, model_name, request):
+            raise OllamaEmbedError(404, "404 page not found")
+
+        async def legacy(session, batch, model_name, request):
+            legacy_calls.append(list(batch))
+            return [np.ones(2, dtype=np.float32) for _ in batch]
+
+        embedder._post_embed = missing
+        embedder._embed_legacy = legacy
+        results = await embedder.embed(["a", "b"])
+        await embedder.embed(["c"])
+
+        assert len(results) == 2 and results[0] is not None
+        assert legacy_calls == [["a", "b"], ["c"]]
+        assert embedder.get_stats()["batch_endpoint_supported"] is False
+
+    async def test_connection_failure_fails_only_that_batch(self):
+        embedder = _Embedder()
+
+        async def down(session, batch, model_name, request):
+            raise ConnectionError("refused")
+
+        embedder._post_embed = down
+        results = await embedder.embed(["a", "b"])
+
+        assert results == [None, None]
+        assert embedder.get_stats()["failed_batches"] == 1
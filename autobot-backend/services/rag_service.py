@@ -190,9 +190,9 @@ class RAGService:
     ) -> Optional[Tuple[List[SearchResult], RAGMetrics]]:
         """Check topic retrieval cache for related chunks. Issue #1376."""
         try:
-            from knowledge.facts import _generate_embedding_with_npu_fallback
+            from knowledge.facts import _generate_query_embedding_batched
 
-            embedding = await _generate_embedding_with_npu_fallback(query)
+            embedding = await _generate_query_embedding_batched(query)
             if embedding is None:
                 return None
             topic_cache = await get_topic_retrieval_cache()
@@ -428,9 +428,9 @@ class SemanticQueryCache:
     async def _embed(text: str) -> Optional[List[float]]:
         """Generate embedding for a query string."""
         try:
-            from knowledge.facts import _generate_embedding_with_npu_fallback
+            from knowledge.facts import _generate_query_embedding_batched
 
-            return await _generate_embedding_with_npu_fallback(text)
+            return await _generate_query_embedding_batched(text)
         except Exception as exc:
             logger.warning("Embedding generation failed: %s", exc)
             return None
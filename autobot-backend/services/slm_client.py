@@ -27,7 +27,7 @@ import os
 import ssl
 import time
 from dataclasses import dataclass
-from typing import Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import aiohttp
 import websockets
@@ -90,10 +90,23 @@ class ServiceDiscoveryCache:
         Returns:
             Cached URL or None if not found/expired
         """
+        data = self.get_data(service_name)
+        return data.get("url") if data else None
+
+    def get_data(self, service_name: str) -> Optional[dict]:
+        """
+        Get cached discovery data for service.
+
+        Args:
+            service_name: Service identifier
+
+        Returns:
+            Cached discovery dict or None if not found/expired
+        """
         entry = self._cache.get(service_name)
         if entry and not entry.is_expired():
             logger.debug("Service discovery cache hit for %s", service_name)
-            return entry.config.get("url")
+            return entry.config
         elif entry:
             logger.debug("Service discovery cache expired for %s", service_name)
             del self._cache[service_name]
@@ -686,6 +699,49 @@ async def _fetch_from_slm(service_name: str) -> Optional[str]:
     return None
 
 
+async def _fetch_instances_from_slm(
+    service_name: str,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Fetch all instances of a service from SLM discovery API.
+
+    Args:
+        service_name: Service identifier
+
+    Returns:
+        List of {"url", "healthy"} dicts or None on failure
+    """
+    client = get_slm_client()
+    if not client:
+        logger.debug("SLM client not initialized, cannot discover %s", service_name)
+        return None
+
+    try:
+        session = await client._get_session()
+        url = f"{client.slm_url}/api/discover/{service_name}/all"
+
+        async with session.get(url) as response:
+            if response.status == 200:
+                data = await response.json()
+                return [
+                    {"url": instance["url"], "healthy": bool(instance.get("healthy"))}
+                    for instance in data.get("instances", [])
+                    if instance.get("url")
+                ]
+            elif response.status == 404:
+                logger.debug("Service %s not found in SLM", service_name)
+            else:
+                logger.warning(
+                    "SLM instance discovery failed for %s: HTTP %d",
+                    service_name,
+                    response.status,
+                )
+    except Exception as e:
+        logger.warning("Error discovering %s instances from SLM: %s", service_name, e)
+
+    return None
+
+
 def _get_env_fallback(service_name: str) -> Optional[str]:
     """
     Get service URL from environment variable.
@@ -746,3 +802,27 @@ async def discover_service(service_name: str) -> str:
     raise ServiceNotConfiguredError(
         f"Service '{service_name}' not found in SLM or environment"
     )
+
+
+async def discover_service_instances(service_name: str) -> List[Dict[str, Any]]:
+    """
+    Discover every registered instance of a service (cached, 60s TTL).
+
+    Used where requests must stick to one instance, e.g. chat sessions
+    pinned to the Ollama instance holding their KV cache.
+
+    Args:
+        service_name: Service identifier
+
+    Returns:
+        List of {"url", "healthy"} dicts; empty when SLM is unavailable
+    """
+    cache_key = f"{service_name}/all"
+    cached = _discovery_cache.get_data(cache_key)
+    if cached:
+        return cached["instances"]
+
+    instances = await _fetch_instances_from_slm(service_name)
+    if instances:
+        _discovery_cache.set(cache_key, {"instances": instances})
+    return instances or []
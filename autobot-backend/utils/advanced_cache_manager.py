@@ -24,6 +24,149 @@ logger = logging.getLogger(__name__)
 # Issue #380: Module-level tuple for user data types
 _USER_DATA_TYPES = ("user_preferences", "user_history")
 
+# Access index scripts. Each data type keeps a ZSET of cache key -> last
+# access (ms), a HASH of cache key -> entry bytes, a byte counter and a HASH
+# of cache key -> reverse predicate sets it belongs to (Issue #1378), all
+# updated atomically with the entry so eviction never scans the keyspace.
+# Index keys are always passed as a block: zset, sizes, total, preds.
+# Shared removal helper: drop a member from the index, byte count and
+# predicate sets.
+_LUA_UNINDEX = """
+local function unindex(idx, member)
+    redis.call('ZREM', idx[1], member)
+    local size = tonumber(redis.call('HGET', idx[2], member) or '0')
+    if size > 0 then
+        redis.call('HDEL', idx[2], member)
+        redis.call('DECRBY', idx[3], size)
+    end
+    local sets = redis.call('HGET', idx[4], member)
+    if sets then
+        for set_key in string.gmatch(sets, '[^\\n]+') do
+            redis.call('SREM', set_key, member)
+        end
+        redis.call('HDEL', idx[4], member)
+    end
+end
+"""
+
+# KEYS: entry, zset, sizes, total, preds
+# ARGV: now_ms, ttl, max_size, payload, stale_cutoff_ms, stale_limit,
+#       newline-joined predicate set keys
+# Returns the number of entries evicted to respect max_size.
+_LUA_SET_ENTRY = (
+    _LUA_UNINDEX
+    + """
+local idx = {KEYS[2], KEYS[3], KEYS[4], KEYS[5]}
+unindex(idx, KEYS[1])
+redis.call('SETEX', KEYS[1], ARGV[2], ARGV[4])
+local size = string.len(ARGV[4])
+redis.call('HSET', KEYS[3], KEYS[1], size)
+redis.call('INCRBY', KEYS[4], size)
+redis.call('ZADD', KEYS[2], ARGV[1], KEYS[1])
+
+if ARGV[7] ~= '' then
+    local ttl = tonumber(ARGV[2])
+    for set_key in string.gmatch(ARGV[7], '[^\\n]+') do
+        redis.call('SADD', set_key, KEYS[1])
+        if redis.call('TTL', set_key) < ttl then
+            redis.call('EXPIRE', set_key, ttl)
+        end
+    end
+    redis.call('HSET', KEYS[5], KEYS[1], ARGV[7])
+end
+
+local stale = redis.call(
+    'ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[5], 'LIMIT', 0, tonumber(ARGV[6]))
+for _, member in ipairs(stale) do
+    if redis.call('EXISTS', member) == 0 then
+        unindex(idx, member)
+    end
+end
+
+local evicted = 0
+local max_size = tonumber(ARGV[3])
+if max_size > 0 then
+    local excess = redis.call('ZCARD', KEYS[2]) - max_size
+    if excess > 0 then
+        for _, member in ipairs(redis.call('ZRANGE', KEYS[2], 0, excess - 1)) do
+            redis.call('DEL', member)
+            unindex(idx, member)
+            evicted = evicted + 1
+        end
+    end
+end
+return evicted
+"""
+)
+
+# KEYS: entry, zset, sizes, total, preds, stats
+# ARGV: now_ms, now_s
+# Returns the entry (or nil) after touching its access time and stats.
+_LUA_GET_ENTRY = (
+    _LUA_UNINDEX
+    + """
+local value = redis.call('GET', KEYS[1])
+if value then
+    redis.call('ZADD', KEYS[2], ARGV[1], KEYS[1])
+    local size = string.len(value)
+    if redis.call('HSETNX', KEYS[3], KEYS[1], size) == 1 then
+        redis.call('INCRBY', KEYS[4], size)
+    end
+    redis.call('HINCRBY', KEYS[6], 'hits', 1)
+else
+    unindex({KEYS[2], KEYS[3], KEYS[4], KEYS[5]}, KEYS[1])
+    redis.call('HINCRBY', KEYS[6], 'misses', 1)
+end
+redis.call('HSET', KEYS[6], 'last_access', ARGV[2])
+redis.call('EXPIRE', KEYS[6], 86400)
+return value
+"""
+)
+
+# KEYS: zset, sizes, total, preds
+# ARGV: mode ("prefix" | "keys" | "trim" | "sets"), then a key prefix,
+# explicit keys, max_size or predicate set keys respectively.
+# Returns the number of entries deleted.
+_LUA_REMOVE_ENTRIES = (
+    _LUA_UNINDEX
+    + """
+local members
+if ARGV[1] == 'prefix' then
+    members = {}
+    local prefix = ARGV[2]
+    for _, member in ipairs(redis.call('ZRANGE', KEYS[1], 0, -1)) do
+        if string.sub(member, 1, #prefix) == prefix then
+            table.insert(members, member)
+        end
+    end
+elseif ARGV[1] == 'trim' then
+    local excess = redis.call('ZCARD', KEYS[1]) - tonumber(ARGV[2])
+    if excess <= 0 then
+        return 0
+    end
+    members = redis.call('ZRANGE', KEYS[1], 0, excess - 1)
+elseif ARGV[1] == 'sets' then
+    members = redis.call('SUNION', unpack(ARGV, 2))
+else
+    members = {unpack(ARGV, 2)}
+end
+
+local deleted = 0
+for _, member in ipairs(members) do
+    deleted = deleted + redis.call('DEL', member)
+    unindex(KEYS, member)
+end
+return deleted
+"""
+)
+
+# Stale index members examined per write (bounds per-write script cost)
+_STALE_INDEX_SCAN_LIMIT = 32
+_GLOB_CHARS = frozenset("*?[")
+# Explicit keys per removal script call; Lua's unpack() of ARGV fails on
+# calls with more than about 8000 arguments
+_REMOVE_KEYS_CHUNK_SIZE = 500
+
 
 def _extract_request_from_call(args: tuple, kwargs: dict) -> Any:
     """
@@ -117,7 +260,14 @@ class AdvancedCacheManager:
         self.sync_redis_client = get_redis_client(async_client=False)
         self.cache_prefix = "autobot:cache:"
         self.stats_prefix = "autobot:cache:stats:"
+        self.index_prefix = "autobot:cache:index:"
+        self.predicate_prefix = "autobot:cache:pred:"
         self._redis_client_initialized = False
+        self._scripts: Dict[str, Any] = {}
+        # Data types whose pre-index entries were already swept by invalidate()
+        # and invalidate_by_predicates() respectively
+        self._legacy_swept: set = set()
+        self._legacy_predicates_swept: set = set()
 
         # Lock for thread-safe async Redis client initialization
         self._lock = asyncio.Lock()
@@ -194,6 +344,25 @@ class AdvancedCacheManager:
         """Generate statistics key"""
         return f"{self.stats_prefix}{data_type}"
 
+    def _make_index_keys(self, data_type: str) -> List[str]:
+        """Access index keys: [zset, sizes hash, byte counter, predicates hash]."""
+        base = f"{self.index_prefix}{data_type}"
+        return [base, f"{base}:sizes", f"{base}:bytes", f"{base}:preds"]
+
+    def _make_predicate_key(
+        self, data_type: str, predicate_type: str, key: str, value: str
+    ) -> str:
+        """Reverse index set of cache keys tagged with one predicate (#1378)."""
+        return f"{self.predicate_prefix}{data_type}:{predicate_type}:{key}:{value}"
+
+    def _script(self, name: str, source: str):
+        """Register a Lua script once per client (EVALSHA with reload)."""
+        script = self._scripts.get(name)
+        if script is None:
+            script = self.redis_client.register_script(source)
+            self._scripts[name] = script
+        return script
+
     async def get(
         self, data_type: str, key: str, user_id: Optional[str] = None
     ) -> Optional[Any]:
@@ -204,18 +373,22 @@ class AdvancedCacheManager:
 
         try:
             cache_key = self._make_cache_key(data_type, key, user_id)
-            cached_data = await self.redis_client.get(cache_key)
+            now = time.time()
+            # One round trip: read, touch the access index, record hit/miss
+            cached_data = await self._script("get", _LUA_GET_ENTRY)(
+                keys=[
+                    cache_key,
+                    *self._make_index_keys(data_type),
+                    self._make_stats_key(data_type),
+                ],
+                args=[int(now * 1000), int(now)],
+            )
 
             if cached_data:
-                # Update hit statistics
-                await self._update_stats(data_type, hit=True)
-
                 data = json.loads(cached_data)
                 logger.debug("Cache HIT for %s:%s", data_type, key)
                 return data
             else:
-                # Update miss statistics
-                await self._update_stats(data_type, hit=False)
                 logger.debug("Cache MISS for %s:%s", data_type, key)
                 return None
 
@@ -235,6 +408,8 @@ class AdvancedCacheManager:
         """Set cached data with automatic configuration.
 
         Issue #1378: Added predicates for predicate-bounded invalidation.
+        The entry is added to a reverse index set per predicate so that
+        invalidate_by_predicates() never has to read cached entries.
         """
         await self._ensure_redis_client()
         if not self.redis_client:
@@ -259,8 +434,29 @@ class AdvancedCacheManager:
                 cache_entry["predicates"] = predicates
 
             serialized_data = json.dumps(cache_entry, default=str)
-            await self.redis_client.setex(cache_key, ttl, serialized_data)
+            now_ms = int(time.time() * 1000)
+            # Members idle longer than any TTL in use may have expired
+            stale_cutoff = now_ms - max(ttl, config.ttl) * 1000
+            predicate_keys = self._predicate_set_keys(data_type, predicates or [])
+            evicted = await self._script("set", _LUA_SET_ENTRY)(
+                keys=[cache_key, *self._make_index_keys(data_type)],
+                args=[
+                    now_ms,
+                    ttl,
+                    config.max_size or 0,
+                    serialized_data,
+                    stale_cutoff,
+                    _STALE_INDEX_SCAN_LIMIT,
+                    "\n".join(predicate_keys),
+                ],
+            )
 
+            if evicted:
+                logger.info(
+                    "LRU eviction: Removed %d old entries from %s cache",
+                    evicted,
+                    data_type,
+                )
             logger.debug("Cache SET for %s:%s (TTL: %ds)", data_type, key, ttl)
             return True
 
@@ -306,7 +502,11 @@ class AdvancedCacheManager:
     async def invalidate(
         self, data_type: str, key: str = "*", user_id: Optional[str] = None
     ) -> int:
-        """Invalidate cache entries by pattern"""
+        """Invalidate cache entries by pattern.
+
+        Entries are found through the data type's access index instead of
+        KEYS; glob patterns other than a trailing ``*`` fall back to SCAN.
+        """
         await self._ensure_redis_client()
         if not self.redis_client:
             return 0
@@ -319,22 +519,67 @@ class AdvancedCacheManager:
                 else:
                     pattern = f"{self.cache_prefix}{data_type}:*"
             else:
-                cache_key = self._make_cache_key(data_type, key, user_id)
-                pattern = cache_key
+                pattern = self._make_cache_key(data_type, key, user_id)
 
-            keys = await self.redis_client.keys(pattern)
-            if keys:
-                deleted_count = await self.redis_client.delete(*keys)
+            deleted_count = await self._remove_matching_entries(data_type, pattern)
+            if deleted_count:
                 logger.info(
                     "Cache INVALIDATE: %d keys deleted for %s", deleted_count, data_type
                 )
-                return deleted_count
-            return 0
+            return deleted_count
 
         except Exception as e:
             logger.error("Error invalidating cache for %s: %s", data_type, e)
             return 0
 
+    async def _remove_matching_entries(self, data_type: str, pattern: str) -> int:
+        """Delete entries matching a key pattern and drop them from the index.
+
+        Args:
+            data_type: Data type whose access index is updated
+            pattern: Exact cache key or Redis glob pattern
+
+        Returns:
+            Number of keys deleted
+        """
+        if _GLOB_CHARS.isdisjoint(pattern):
+            return await self._remove_keys(data_type, [pattern])
+
+        deleted = 0
+        prefix = pattern[:-1]
+        legacy_sweep = pattern.endswith("*") and _GLOB_CHARS.isdisjoint(prefix)
+        if legacy_sweep:
+            deleted = await self._script("remove", _LUA_REMOVE_ENTRIES)(
+                keys=self._make_index_keys(data_type), args=["prefix", prefix]
+            )
+            if data_type in self._legacy_swept:
+                return deleted
+
+        # Entries written before the index (swept once per process) and
+        # patterns the index cannot answer are found with SCAN
+        matched: List[str] = []
+        async for key in self.redis_client.scan_iter(match=pattern):
+            matched.append(key)
+            if len(matched) >= _REMOVE_KEYS_CHUNK_SIZE:
+                deleted += await self._remove_keys(data_type, matched)
+                matched = []
+        deleted += await self._remove_keys(data_type, matched)
+        if legacy_sweep:
+            self._legacy_swept.add(data_type)
+        return deleted
+
+    async def _remove_keys(self, data_type: str, keys: List[str]) -> int:
+        """Delete explicit cache keys and unindex them, in bounded chunks."""
+        remove = self._script("remove", _LUA_REMOVE_ENTRIES)
+        index_keys = self._make_index_keys(data_type)
+        deleted = 0
+        for start in range(0, len(keys), _REMOVE_KEYS_CHUNK_SIZE):
+            deleted += await remove(
+                keys=index_keys,
+                args=["keys", *keys[start : start + _REMOVE_KEYS_CHUNK_SIZE]],
+            )
+        return deleted
+
     async def invalidate_by_predicates(
         self,
         data_type: str,
@@ -342,80 +587,131 @@ class AdvancedCacheManager:
     ) -> int:
         """Invalidate only cache entries matching predicate filters. Issue #1378.
 
-        Scans entries of the given data_type and deletes only those whose
-        stored predicates overlap with the supplied invalidation predicates.
+        Uses the reverse predicate index written by set(): the affected
+        entries are the union of the exact-value and wildcard-value sets of
+        each invalidation predicate, deleted in one script call. Removed
+        counts and latency are recorded in the data type's stats.
         """
         await self._ensure_redis_client()
         if not self.redis_client or not predicates:
             return 0
+        start = time.perf_counter()
         try:
-            from services.predicate_cache_invalidation import (
-                CachePredicate,
-                PredicateSet,
-                PredicateType,
+            set_keys = self._predicate_set_keys(data_type, predicates, wildcards=True)
+            if not set_keys:
+                return 0
+            deleted = await self._script("remove", _LUA_REMOVE_ENTRIES)(
+                keys=self._make_index_keys(data_type),
+                args=["sets", *set_keys],
             )
-
-            inv_preds = [
-                CachePredicate(
-                    predicate_type=PredicateType(p["type"]),
-                    key=p["key"],
-                    value=p["value"],
-                )
-                for p in predicates
-            ]
-            pattern = f"{self.cache_prefix}{data_type}:*"
-            keys_to_delete = []
-            async for key in self.redis_client.scan_iter(match=pattern):
-                raw = await self.redis_client.get(key)
-                if not raw:
-                    continue
-                entry = json.loads(raw if isinstance(raw, str) else raw.decode("utf-8"))
-                entry_preds = entry.get("predicates", [])
-                if not entry_preds:
-                    continue
-                pset = PredicateSet.from_dict(entry_preds)
-                if pset.matches_any(inv_preds):
-                    keys_to_delete.append(key)
-
-            if keys_to_delete:
-                deleted = await self.redis_client.delete(*keys_to_delete)
-                logger.info(
-                    "Predicate INVALIDATE: %d/%d entries for %s",
-                    deleted,
-                    len(keys_to_delete),
-                    data_type,
-                )
-                return deleted
-            return 0
+            if data_type not in self._legacy_predicates_swept:
+                # Entries written before the reverse index existed; marked
+                # swept only once the sweep succeeded, so failures retry
+                deleted += await self._sweep_unindexed_predicates(data_type, predicates)
+                self._legacy_predicates_swept.add(data_type)
+
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            await self._record_predicate_invalidation(data_type, deleted, elapsed_ms)
+            logger.info(
+                "Predicate INVALIDATE: %d entries for %s in %.1fms",
+                deleted,
+                data_type,
+                elapsed_ms,
+            )
+            return deleted
         except Exception as e:
             logger.error("Predicate invalidation error for %s: %s", data_type, e)
             return 0
 
-    async def _update_stats(self, data_type: str, hit: bool):
-        """Update cache statistics"""
-        await self._ensure_redis_client()
-        if not self.redis_client:
-            return
+    def _predicate_set_keys(
+        self,
+        data_type: str,
+        predicates: List[Dict[str, str]],
+        wildcards: bool = False,
+    ) -> List[str]:
+        """Reverse index keys for predicate dicts, skipping incomplete ones.
 
-        try:
-            stats_key = self._make_stats_key(data_type)
-            current_time = int(time.time())
+        Args:
+            data_type: Data type the entries belong to
+            predicates: Dicts with "type", "key" and "value"
+            wildcards: Also include the "*" value set, which stored entries
+                use to match any value (see CachePredicate.matches)
+
+        Returns:
+            Sorted, de-duplicated list of set keys
+        """
+        set_keys = set()
+        for p in predicates:
+            if not all(field in p for field in ("type", "key", "value")):
+                continue
+            values = (p["value"], "*") if wildcards else (p["value"],)
+            for value in values:
+                set_keys.add(
+                    self._make_predicate_key(data_type, p["type"], p["key"], value)
+                )
+        return sorted(set_keys)
 
-            # Use Redis pipeline for atomic updates
-            pipe = self.redis_client.pipeline()
+    async def _sweep_unindexed_predicates(
+        self, data_type: str, predicates: List[Dict[str, str]]
+    ) -> int:
+        """Scan-and-match fallback for entries missing from the reverse index.
 
-            if hit:
-                pipe.hincrby(stats_key, "hits", 1)
-            else:
-                pipe.hincrby(stats_key, "misses", 1)
+        Runs once per data type and process, so entries cached before the
+        index was introduced cannot survive an invalidation.
+        """
+        from services.predicate_cache_invalidation import (
+            CachePredicate,
+            PredicateSet,
+            PredicateType,
+        )
 
-            pipe.hset(stats_key, "last_access", current_time)
-            pipe.expire(stats_key, 86400)  # Stats expire after 24 hours
+        inv_preds = [
+            CachePredicate(
+                predicate_type=PredicateType(p["type"]),
+                key=p["key"],
+                value=p["value"],
+            )
+            for p in predicates
+        ]
+        pattern = f"{self.cache_prefix}{data_type}:*"
+        keys_to_delete = []
+        async for key in self.redis_client.scan_iter(match=pattern):
+            raw = await self.redis_client.get(key)
+            if not raw:
+                continue
+            entry = json.loads(raw if isinstance(raw, str) else raw.decode("utf-8"))
+            entry_preds = entry.get("predicates", [])
+            if not entry_preds:
+                continue
+            pset = PredicateSet.from_dict(entry_preds)
+            if pset.matches_any(inv_preds):
+                keys_to_delete.append(key)
 
-            await pipe.execute()
+        return await self._remove_keys(data_type, keys_to_delete)
 
+    async def _record_predicate_invalidation(
+        self, data_type: str, removed: int, elapsed_ms: float
+    ) -> None:
+        """Add one predicate invalidation to the data type's stats hash."""
+        try:
+            stats_key = self._make_stats_key(data_type)
+            async with self.redis_client.pipeline() as pipe:
+                await pipe.hincrby(stats_key, "predicate_invalidations", 1)
+                await pipe.hincrby(stats_key, "predicate_entries_removed", removed)
+                await pipe.hincrbyfloat(
+                    stats_key, "predicate_invalidation_ms", elapsed_ms
+                )
+                await pipe.hset(
+                    stats_key,
+                    mapping={
+                        "predicate_last_removed": removed,
+                        "predicate_last_ms": f"{elapsed_ms:.3f}",
+                    },
+                )
+                await pipe.expire(stats_key, 86400)
+                await pipe.execute()
         except Exception as e:
-            logger.error("Error updating cache stats for %s: %s", data_type, e)
+            logger.error("Error recording predicate stats for %s: %s", data_type, e)
 
     async def _get_single_type_stats(self, data_type: str) -> Dict[str, Any]:
         """Get stats for a specific data type (Issue #315: extracted).
@@ -427,7 +723,12 @@ class AdvancedCacheManager:
             Stats dict for the data type
         """
         stats_key = self._make_stats_key(data_type)
-        stats = await self.redis_client.hgetall(stats_key)
+        zset_key, _, bytes_key, _ = self._make_index_keys(data_type)
+        async with self.redis_client.pipeline() as pipe:
+            await pipe.hgetall(stats_key)
+            await pipe.zcard(zset_key)
+            await pipe.get(bytes_key)
+            stats, entries, total_bytes = await pipe.execute()
 
         hits = int(stats.get("hits", 0))
         misses = int(stats.get("misses", 0))
@@ -440,6 +741,24 @@ class AdvancedCacheManager:
             "misses": misses,
             "hit_rate": f"{hit_rate:.1f}%",
             "last_access": stats.get("last_access"),
+            "entries": int(entries or 0),
+            "bytes": int(total_bytes or 0),
+            "predicate_invalidation": self._predicate_invalidation_stats(stats),
+        }
+
+    @staticmethod
+    def _predicate_invalidation_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Predicate invalidation metrics from a stats hash (Issue #1378)."""
+        count = int(stats.get("predicate_invalidations", 0))
+        removed = int(stats.get("predicate_entries_removed", 0))
+        total_ms = float(stats.get("predicate_invalidation_ms", 0))
+        return {
+            "invalidations": count,
+            "entries_removed": removed,
+            "avg_entries_removed": round(removed / count, 2) if count else 0,
+            "avg_ms": round(total_ms / count, 3) if count else 0,
+            "last_entries_removed": int(stats.get("predicate_last_removed", 0)),
+            "last_ms": float(stats.get("predicate_last_ms", 0)),
         }
 
     async def _aggregate_stats(self, stats_keys: List[str]) -> tuple:
@@ -468,6 +787,29 @@ class AdvancedCacheManager:
 
         return total_hits, total_misses
 
+    async def _aggregate_index_sizes(self, data_types) -> tuple:
+        """Sum entry and byte counts from the access indexes.
+
+        Args:
+            data_types: Data types to include
+
+        Returns:
+            Tuple of (total_entries, total_bytes)
+        """
+        if not data_types:
+            return 0, 0
+
+        async with self.redis_client.pipeline() as pipe:
+            for data_type in data_types:
+                zset_key, _, bytes_key, _ = self._make_index_keys(data_type)
+                await pipe.zcard(zset_key)
+                await pipe.get(bytes_key)
+            results = await pipe.execute()
+
+        total_entries = sum(int(n or 0) for n in results[0::2])
+        total_bytes = sum(int(n or 0) for n in results[1::2])
+        return total_entries, total_bytes
+
     async def _get_redis_memory_usage(self) -> str:
         """Get Redis memory usage safely (Issue #315: extracted).
 
@@ -486,8 +828,16 @@ class AdvancedCacheManager:
         Returns:
             Global stats dict
         """
-        cache_keys = await self.redis_client.keys(f"{self.cache_prefix}*")
-        stats_keys = await self.redis_client.keys(f"{self.stats_prefix}*")
+        stats_pattern = f"{self.stats_prefix}*"
+        stats_keys = [
+            key async for key in self.redis_client.scan_iter(match=stats_pattern)
+        ]
+        data_types = set(self.cache_configs)
+        data_types.update(
+            (k if isinstance(k, str) else k.decode())[len(self.stats_prefix) :]
+            for k in stats_keys
+        )
+        total_entries, total_bytes = await self._aggregate_index_sizes(data_types)
 
         total_hits, total_misses = await self._aggregate_stats(stats_keys)
         total_requests = total_hits + total_misses
@@ -499,7 +849,8 @@ class AdvancedCacheManager:
 
         return {
             "status": "enabled",
-            "total_cache_keys": len(cache_keys),
+            "total_cache_keys": total_entries,
+            "total_cache_bytes": total_bytes,
             "total_hits": total_hits,
             "total_misses": total_misses,
             "global_hit_rate": f"{global_hit_rate:.1f}%",
@@ -599,112 +950,43 @@ class AdvancedCacheManager:
         )
 
         if success:
-            # Manage cache size for knowledge queries
-            await self._manage_cache_size("knowledge_queries")
+            # max_size is enforced by set() as part of the write
             logger.debug(
                 "Cached %d knowledge results for query: '%s'", len(results), query
             )
 
         return success
 
-    async def _collect_cache_keys(self, pattern: str) -> List[str]:
-        """Collect all cache keys matching pattern (Issue #315: extracted).
-
-        Args:
-            pattern: Redis key pattern to match
-
-        Returns:
-            List of matching keys
-        """
-        all_keys = []
-        async for key in self.redis_client.scan_iter(match=pattern):
-            all_keys.append(key)
-        return all_keys
-
-    async def _get_keys_with_timestamps(self, keys: List[str]) -> List[tuple]:
-        """Get keys with their timestamps for LRU sorting (Issue #315: extracted).
-
-        Args:
-            keys: List of Redis keys to fetch
-
-        Returns:
-            List of (timestamp, key) tuples
-        """
-        if not keys:
-            return []
-
-        keys_with_time = []
-        all_cached_data = await self.redis_client.mget(keys)
-
-        for key, cached_data in zip(keys, all_cached_data):
-            if not cached_data:
-                continue
-            try:
-                entry = json.loads(cached_data)
-                timestamp = entry.get("timestamp", 0)
-                keys_with_time.append((timestamp, key))
-            except Exception:  # nosec B112 - intentional skip on parse errors
-                continue
-
-        return keys_with_time
-
-    async def _evict_excess_keys(
-        self, keys_with_time: List[tuple], max_size: int, data_type: str
-    ) -> int:
-        """Evict excess keys using LRU policy (Issue #315: extracted).
-
-        Args:
-            keys_with_time: List of (timestamp, key) tuples
-            max_size: Maximum allowed cache size
-            data_type: Data type for logging
-
-        Returns:
-            Number of keys deleted
-        """
-        if len(keys_with_time) <= max_size:
-            return 0
-
-        # Sort by timestamp (oldest first) and remove excess
-        keys_with_time.sort()
-        excess_count = len(keys_with_time) - max_size + 100  # Buffer
-        keys_to_remove = [key for _, key in keys_with_time[:excess_count]]
-
-        if not keys_to_remove:
-            return 0
-
-        deleted_count = await self.redis_client.delete(*keys_to_remove)
-        logger.info(
-            "LRU eviction: Removed %d old entries from %s cache",
-            deleted_count,
-            data_type,
-        )
-        return deleted_count
-
-    async def _manage_cache_size(self, data_type: str):
-        """Manage cache size using LRU eviction.
+    async def _manage_cache_size(self, data_type: str) -> int:
+        """Trim a data type to its max_size using the access index.
 
-        Issue #315: Refactored to use helper methods for reduced nesting.
-        Implements max_size limits from CacheConfig.
+        set() already evicts as part of each write; this is for callers that
+        lower max_size at runtime. Cost is O(log n + evicted).
         """
         await self._ensure_redis_client()
         if not self.redis_client:
-            return
+            return 0
 
         try:
             config = self.cache_configs.get(data_type)
             if not config or not config.max_size:
-                return  # No size limit configured
-
-            # Collect and process cache entries
-            pattern = f"{self.cache_prefix}{data_type}:*"
-            all_keys = await self._collect_cache_keys(pattern)
-            keys_with_time = await self._get_keys_with_timestamps(all_keys)
+                return 0  # No size limit configured
 
-            # Evict excess entries
-            await self._evict_excess_keys(keys_with_time, config.max_size, data_type)
+            deleted_count = await self._script("remove", _LUA_REMOVE_ENTRIES)(
+                keys=self._make_index_keys(data_type),
+                args=["trim", config.max_size],
+            )
+            if deleted_count:
+                logger.info(
+                    "LRU eviction: Removed %d old entries from %s cache",
+                    deleted_count,
+                    data_type,
+                )
+            return deleted_count
 
         except Exception as e:
             logger.error("Error managing cache size for %s: %s", data_type, e)
+            return 0
 
     # =========================================================================
     # BACKWARD COMPATIBILITY METHODS (from backend/utils/cache_manager.py)
@@ -0,0 +1,313 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Unit tests for the AdvancedCacheManager access index
+
+Tests the following functionality:
+- get/set go through the index scripts in a single round trip
+- max_size eviction happens inside the write script, without scans
+- invalidation uses the index instead of KEYS
+- stats are read from the index counters
+- predicate invalidation goes through the reverse predicate index
+- large removals are sent to the script in bounded chunks (fakeredis[lua])
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from utils import advanced_cache_manager as acm
+from utils.advanced_cache_manager import AdvancedCacheManager
+
+
+class _Pipeline:
+    def __init__(self, results):
+        self._results = results
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        async def record(*args, **kwargs):
+            self.calls.append((name, args))
+
+        return record
+
+    async def execute(self):
+        return self._results
+
+
+def _make_manager(pipeline_results=None, scan_keys=()):
+    with patch.object(acm, "get_redis_client", return_value=None):
+        manager = AdvancedCacheManager()
+
+    scripts = {
+        acm._LUA_GET_ENTRY: AsyncMock(name="get"),
+        acm._LUA_SET_ENTRY: AsyncMock(name="set", return_value=0),
+        acm._LUA_REMOVE_ENTRIES: AsyncMock(name="remove", return_value=0),
+    }
+
+    async def scan_iter(match=None, count=None):
+        for key in scan_keys:
+            yield key
+
+    redis = MagicMock()
+    redis.register_script.side_effect = lambda source: scripts[source]
+    redis.scan_iter = MagicMock(side_effect=scan_iter)
+    redis.pipeline.return_value = _Pipeline(pipeline_results or [])
+    redis.info = AsyncMock(return_value={"used_memory_human": "1M"})
+    manager.redis_client = redis
+    manager._redis_client_initialized = True
+    return manager, scripts
+
+
+INDEX_KEYS = [
+    "autobot:cache:index:knowledge_queries",
+    "autobot:cache:index:knowledge_queries:sizes",
+    "autobot:cache:index:knowledge_queries:bytes",
+    "autobot:cache:index:knowledge_queries:preds",
+]
+
+
+@pytest.mark.asyncio
+async def test_set_writes_entry_and_evicts_in_one_script_call():
+    manager, scripts = _make_manager()
+    scripts[acm._LUA_SET_ENTRY].return_value = 2
+
+    assert await manager.set("knowledge_queries", "kb_query:abc", [1, 2]) is True
+
+    call = scripts[acm._LUA_SET_ENTRY].await_args
+    entry_key = "autobot:cache:knowledge_queries:kb_query:abc"
+    assert call.kwargs["keys"] == [entry_key, *INDEX_KEYS]
+    now_ms, ttl, max_size, payload, stale_cutoff, _, pred_keys = call.kwargs["args"]
+    assert (ttl, max_size) == (300, 1000)
+    assert stale_cutoff == now_ms - 300 * 1000
+    assert json.loads(payload)["data"] == [1, 2]
+    assert pred_keys == ""
+    manager.redis_client.scan_iter.assert_not_called()
+    manager.redis_client.mget.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cache_knowledge_results_does_not_scan_for_eviction():
+    manager, scripts = _make_manager()
+
+    for i in range(3):
+        await manager.cache_knowledge_results(f"query {i}", 5, [{"id": i}])
+
+    assert scripts[acm._LUA_SET_ENTRY].await_count == 3
+    manager.redis_client.scan_iter.assert_not_called()
+    manager.redis_client.mget.assert_not_called()
+    # Scripts are registered once and reused
+    assert manager.redis_client.register_script.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_touches_index_and_records_stats():
+    manager, scripts = _make_manager()
+    scripts[acm._LUA_GET_ENTRY].return_value = json.dumps({"data": "cached"})
+
+    result = await manager.get("user_history", "recent", user_id="u1")
+
+    assert result["data"] == "cached"
+    keys = scripts[acm._LUA_GET_ENTRY].await_args.kwargs["keys"]
+    assert keys[0] == "autobot:cache:user_history:user:u1:recent"
+    assert keys[1] == "autobot:cache:index:user_history"
+    assert keys[-1] == "autobot:cache:stats:user_history"
+    manager.redis_client.pipeline.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_exact_key_uses_index_script():
+    manager, scripts = _make_manager()
+    scripts[acm._LUA_REMOVE_ENTRIES].return_value = 1
+
+    assert await manager.invalidate("templates", "t1") == 1
+
+    scripts[acm._LUA_REMOVE_ENTRIES].assert_awaited_once_with(
+        keys=[
+            "autobot:cache:index:templates",
+            "autobot:cache:index:templates:sizes",
+            "autobot:cache:index:templates:bytes",
+            "autobot:cache:index:templates:preds",
+        ],
+        args=["keys", "autobot:cache:templates:t1"],
+    )
+    manager.redis_client.keys.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_wildcard_sweeps_unindexed_keys_once():
+    legacy = "autobot:cache:user_history:user:u1:old"
+    manager, scripts = _make_manager(scan_keys=[legacy])
+    remove = scripts[acm._LUA_REMOVE_ENTRIES]
+    remove.return_value = 1
+
+    assert await manager.invalidate("user_history", "*", user_id="u1") == 2
+    assert remove.await_args_list[0].kwargs["args"] == [
+        "prefix",
+        "autobot:cache:user_history:user:u1:",
+    ]
+    assert remove.await_args_list[1].kwargs["args"] == ["keys", legacy]
+
+    assert await manager.invalidate("user_history", "*", user_id="u1") == 1
+    assert manager.redis_client.scan_iter.call_count == 1
+    manager.redis_client.keys.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_manage_cache_size_trims_through_index():
+    manager, scripts = _make_manager()
+    scripts[acm._LUA_REMOVE_ENTRIES].return_value = 4
+
+    assert await manager._manage_cache_size("knowledge_queries") == 4
+    assert await manager._manage_cache_size("templates") == 0
+
+    scripts[acm._LUA_REMOVE_ENTRIES].assert_awaited_once_with(
+        keys=INDEX_KEYS, args=["trim", 1000]
+    )
+
+
+@pytest.mark.asyncio
+async def test_single_type_stats_include_index_counters():
+    manager, _ = _make_manager(
+        pipeline_results=[{"hits": "3", "misses": "1"}, 7, "512"]
+    )
+
+    stats = await manager.get_stats("knowledge_queries")
+
+    assert stats["hits"] == 3
+    assert stats["predicate_invalidation"]["invalidations"] == 0
+    assert stats["hit_rate"] == "75.0%"
+    assert (stats["entries"], stats["bytes"]) == (7, 512)
+
+
+YEAR_2024 = {"type": "temporal", "key": "year", "value": "2024"}
+PRED_PREFIX = "autobot:cache:pred:knowledge_queries"
+
+
+@pytest.mark.asyncio
+async def test_set_registers_entry_in_predicate_sets():
+    manager, scripts = _make_manager()
+    category = {"type": "categorical", "key": "category", "value": "docs"}
+
+    await manager.set(
+        "knowledge_queries",
+        "kb_query:abc",
+        [],
+        predicates=[YEAR_2024, category, YEAR_2024, {"type": "entity"}],
+    )
+
+    pred_keys = scripts[acm._LUA_SET_ENTRY].await_args.kwargs["args"][-1]
+    assert pred_keys.split("\n") == [
+        f"{PRED_PREFIX}:categorical:category:docs",
+        f"{PRED_PREFIX}:temporal:year:2024",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_by_predicates_unions_exact_and_wildcard_sets():
+    manager, scripts = _make_manager(
+        pipeline_results=[
+            {
+                "predicate_invalidations": "2",
+                "predicate_entries_removed": "6",
+                "predicate_invalidation_ms": "3.0",
+                "predicate_last_removed": "5",
+                "predicate_last_ms": "2.5",
+            },
+            0,
+            None,
+        ]
+    )
+    remove = scripts[acm._LUA_REMOVE_ENTRIES]
+    remove.return_value = 5
+    manager._legacy_predicates_swept.add("knowledge_queries")
+
+    removed = await manager.invalidate_by_predicates("knowledge_queries", [YEAR_2024])
+
+    assert removed == 5
+    remove.assert_awaited_once_with(
+        keys=INDEX_KEYS,
+        args=[
+            "sets",
+            f"{PRED_PREFIX}:temporal:year:*",
+            f"{PRED_PREFIX}:temporal:year:2024",
+        ],
+    )
+    manager.redis_client.scan_iter.assert_not_called()
+    manager.redis_client.get.assert_not_called()
+
+    metrics = (await manager.get_stats("knowledge_queries"))["predicate_invalidation"]
+    assert metrics["avg_entries_removed"] == 3
+    assert metrics["avg_ms"] == 1.5
+    assert metrics["last_entries_removed"] == 5
+
+
+@pytest.mark.asyncio
+async def test_invalidate_by_predicates_sweeps_legacy_entries_once():
+    legacy = "autobot:cache:knowledge_queries:kb_query:old"
+    manager, scripts = _make_manager(scan_keys=[legacy])
+    manager.redis_client.get = AsyncMock(
+        return_value=json.dumps({"data": [], "predicates": [YEAR_2024]})
+    )
+    remove = scripts[acm._LUA_REMOVE_ENTRIES]
+    remove.return_value = 1
+
+    assert await manager.invalidate_by_predicates("knowledge_queries", [YEAR_2024]) == 2
+    assert remove.await_args_list[1].kwargs["args"] == ["keys", legacy]
+
+    assert await manager.invalidate_by_predicates("knowledge_queries", [YEAR_2024]) == 1
+    assert manager.redis_client.scan_iter.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_legacy_predicate_sweep_is_retried():
+    legacy = "autobot:cache:knowledge_queries:kb_query:old"
+    manager, scripts = _make_manager(scan_keys=[legacy])
+    entry = json.dumps({"data": [], "predicates": [YEAR_2024]})
+    manager.redis_client.get = AsyncMock(side_effect=[ConnectionError(), entry])
+    remove = scripts[acm._LUA_REMOVE_ENTRIES]
+    remove.return_value = 1
+
+    assert await manager.invalidate_by_predicates("knowledge_queries", [YEAR_2024]) == 0
+    assert await manager.invalidate_by_predicates("knowledge_queries", [YEAR_2024]) == 2
+    assert remove.await_args_list[-1].kwargs["args"] == ["keys", legacy]
+    assert manager.redis_client.scan_iter.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_large_legacy_sweep_is_removed_in_chunks():
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    count = acm._REMOVE_KEYS_CHUNK_SIZE * 2 + 7
+    for i in range(count):
+        await redis.set(f"autobot:cache:user_history:user:u1:k{i}", "{}")
+    await redis.set("autobot:cache:user_history:user:u2:k0", "{}")
+
+    argv_sizes = []
+    evalsha = redis.evalsha
+
+    async def recording_evalsha(sha, numkeys, *keys_and_args):
+        argv_sizes.append(len(keys_and_args) - numkeys)
+        return await evalsha(sha, numkeys, *keys_and_args)
+
+    redis.evalsha = recording_evalsha
+    with patch.object(acm, "get_redis_client", return_value=None):
+        manager = AdvancedCacheManager()
+    manager.redis_client = redis
+    manager._redis_client_initialized = True
+
+    assert await manager.invalidate("user_history", "*", user_id="u1") == count
+    assert await redis.keys("autobot:cache:user_history:*") == [
+        "autobot:cache:user_history:user:u2:k0"
+    ]
+    # "keys" plus at most one chunk of keys per call
+    chunk = acm._REMOVE_KEYS_CHUNK_SIZE
+    assert [n for n in argv_sizes if n > 2] == [chunk + 1, chunk + 1, 8]
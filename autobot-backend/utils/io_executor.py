@@ -16,6 +16,7 @@ Thread Pools:
 - _LOG_IO_EXECUTOR: For log reading/writing operations (logs.py)
 - _FILE_IO_EXECUTOR: For file browser operations (files.py, filesystem_mcp.py)
 - _ANALYTICS_EXECUTOR: For heavy analytics operations (report, patterns, duplicates)
+- _LOG_SEARCH_EXECUTOR: For parallel per-file log search (utils/log_search.py)
 
 These pools ensure that user-facing operations (viewing logs, browsing files)
 remain responsive even during heavy background processing.
@@ -171,6 +172,48 @@ async def run_in_analytics_executor(func: Callable[..., T], *args: Any) -> T:
     return await loop.run_in_executor(executor, func, *args)
 
 
+# =============================================================================
+# Log Search Thread Pool
+# =============================================================================
+# Dedicated thread pool for indexed log search, so one search fans out across
+# files without occupying the 2-worker log I/O pool used by the log viewer.
+_LOG_SEARCH_EXECUTOR: ThreadPoolExecutor | None = None
+_LOG_SEARCH_EXECUTOR_MAX_WORKERS = 4  # One file per worker
+_LOG_SEARCH_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_log_search_executor() -> ThreadPoolExecutor:
+    """Get or create the dedicated log search thread pool (thread-safe)."""
+    global _LOG_SEARCH_EXECUTOR
+    if _LOG_SEARCH_EXECUTOR is None:
+        with _LOG_SEARCH_EXECUTOR_LOCK:
+            if _LOG_SEARCH_EXECUTOR is None:
+                _LOG_SEARCH_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=_LOG_SEARCH_EXECUTOR_MAX_WORKERS,
+                    thread_name_prefix="log_search_",
+                )
+                logger.info(
+                    "Created dedicated log search thread pool (%d workers)",
+                    _LOG_SEARCH_EXECUTOR_MAX_WORKERS,
+                )
+    return _LOG_SEARCH_EXECUTOR
+
+
+async def run_in_log_search_executor(func: Callable[..., T], *args: Any) -> T:
+    """Run a function in the dedicated log search thread pool.
+
+    Args:
+        func: Function to run
+        *args: Arguments to pass to the function
+
+    Returns:
+        Result of the function call
+    """
+    loop = asyncio.get_running_loop()
+    executor = _get_log_search_executor()
+    return await loop.run_in_executor(executor, func, *args)
+
+
 # =============================================================================
 # Cleanup
 # =============================================================================
@@ -180,6 +223,7 @@ def shutdown_executors():
     Should be called during application shutdown to cleanly terminate threads.
     """
     global _LOG_IO_EXECUTOR, _FILE_IO_EXECUTOR, _ANALYTICS_EXECUTOR
+    global _LOG_SEARCH_EXECUTOR
 
     if _LOG_IO_EXECUTOR is not None:
         _LOG_IO_EXECUTOR.shutdown(wait=False)
@@ -195,3 +239,8 @@ def shutdown_executors():
         _ANALYTICS_EXECUTOR.shutdown(wait=False)
         logger.info("Analytics thread pool shutdown initiated")
         _ANALYTICS_EXECUTOR = None
+
+    if _LOG_SEARCH_EXECUTOR is not None:
+        _LOG_SEARCH_EXECUTOR.shutdown(wait=False)
+        logger.info("Log search thread pool shutdown initiated")
+        _LOG_SEARCH_EXECUTOR = None
@@ -0,0 +1,244 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Seekable Log File Reader
+
+Reads windows of lines from large, append-only log files without loading
+them into memory:
+
+- Tails are read by scanning backwards from EOF in fixed-size blocks until
+  enough newlines have been seen, so cost depends on the lines requested,
+  not on file size.
+- Offset reads use a sparse line index (one checkpoint per block of the
+  file, at a line start) that is extended incrementally as the file grows
+  and rebuilt when the file is rotated or truncated. Seeking to line N
+  reads at most one block before the requested lines.
+
+All functions are blocking; call them through
+utils.io_executor.run_in_log_executor from async code.
+"""
+
+import bisect
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+# Bytes read per backward/forward step
+_BLOCK_SIZE = 64 * 1024
+
+# Bytes between sparse index checkpoints
+_INDEX_SPACING = 256 * 1024
+
+# Tails deeper than this many lines are served through the line index
+_TAIL_SCAN_MAX_LINES = 10_000
+
+# Line indexes kept in memory (one per recently viewed file)
+_MAX_CACHED_INDEXES = 64
+
+
+def _decode_line(raw: bytes) -> str:
+    """Decode one log line, tolerating invalid UTF-8."""
+    return raw.rstrip(b"\r\n").decode("utf-8", errors="replace")
+
+
+def read_tail_lines(
+    file_path: PathLike, count: int, skip: int = 0, end: Optional[int] = None
+) -> Tuple[List[str], int]:
+    """Read the last ``count`` lines before the final ``skip`` lines.
+
+    Scans backwards from EOF in blocks, so memory and latency scale with
+    the requested window only.
+
+    Args:
+        file_path: Log file to read
+        count: Number of lines to return
+        skip: Number of trailing lines to leave out
+        end: Treat this byte offset as EOF (default: the current file size)
+
+    Returns:
+        Tuple of (lines in file order, byte offset of the EOF that was read)
+    """
+    with open(file_path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell() if end is None else min(end, f.tell())
+        if count <= 0 or end == 0:
+            return [], end
+
+        wanted = count + skip
+        # A trailing newline terminates the last line rather than starting one
+        f.seek(end - 1)
+        ignore_final_newline = f.read(1) == b"\n"
+
+        chunks: List[bytes] = []
+        newlines = -1 if ignore_final_newline else 0
+        position = end
+        while position > 0 and newlines < wanted:
+            step = min(_BLOCK_SIZE, position)
+            position -= step
+            f.seek(position)
+            chunk = f.read(step)
+            newlines += chunk.count(b"\n")
+            chunks.append(chunk)
+
+    data = b"".join(reversed(chunks))
+    if ignore_final_newline:
+        data = data[:-1]
+    raw_lines = data.split(b"\n")
+    if position > 0:
+        raw_lines = raw_lines[1:]  # First piece may be a partial line
+
+    stop = len(raw_lines) - skip
+    if stop <= 0:
+        return [], end
+    selected = raw_lines[max(0, stop - count) : stop]
+    return [_decode_line(line) for line in selected], end
+
+
+class LineOffsetIndex:
+    """
+    Sparse line-number -> byte-offset index for one append-only file.
+
+    Checkpoints are (line number, byte offset of that line's start) pairs
+    taken roughly every ``spacing`` bytes. refresh() only scans bytes
+    appended since the previous call. Thread-safe.
+    """
+
+    def __init__(self, file_path: PathLike, spacing: int = _INDEX_SPACING):
+        """Initialize an empty index for ``file_path``."""
+        self._path = Path(file_path)
+        self._spacing = spacing
+        self._lock = threading.Lock()
+        self._reset(None)
+
+    def _reset(self, identity: Optional[Tuple[int, int]]) -> None:
+        """Forget all checkpoints (new, rotated or truncated file)."""
+        self._identity = identity
+        self._lines: List[int] = [0]
+        self._offsets: List[int] = [0]
+        self._scanned = 0  # Bytes indexed so far
+        self._newlines = 0  # Newlines in the indexed bytes
+        self._ends_with_newline = True
+
+    def refresh(self) -> int:
+        """Index newly appended data and return the file's line count.
+
+        A final line without a trailing newline is counted.
+        """
+        with self._lock, open(self._path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            identity = (stat.st_dev, stat.st_ino)
+            if identity != self._identity or stat.st_size < self._scanned:
+                self._reset(identity)
+            self._extend(f, stat.st_size)
+            return self._line_count()
+
+    def _extend(self, f, size: int) -> None:
+        """Scan [scanned, size) counting newlines and adding checkpoints."""
+        f.seek(self._scanned)
+        while self._scanned < size:
+            chunk = f.read(min(_BLOCK_SIZE, size - self._scanned))
+            if not chunk:
+                break
+            chunk_start = self._scanned
+            self._scanned += len(chunk)
+            self._newlines += chunk.count(b"\n")
+            self._ends_with_newline = chunk.endswith(b"\n")
+
+            if self._scanned - self._offsets[-1] < self._spacing:
+                continue
+            last_newline = chunk.rfind(b"\n")
+            if last_newline >= 0:
+                self._lines.append(self._newlines)
+                self._offsets.append(chunk_start + last_newline + 1)
+
+    def _line_count(self) -> int:
+        """Complete lines plus a trailing partial line, if any."""
+        if self._scanned == 0:
+            return 0
+        return self._newlines + (0 if self._ends_with_newline else 1)
+
+    def read_lines(self, start: int, count: int) -> Tuple[List[str], int]:
+        """Read ``count`` lines starting at line ``start`` (0-based).
+
+        Returns:
+            Tuple of (lines, total line count)
+        """
+        total = self.refresh()
+        start = max(0, start)
+        if count <= 0 or start >= total:
+            return [], total
+
+        with self._lock:
+            slot = bisect.bisect_right(self._lines, start) - 1
+            line_no, offset = self._lines[slot], self._offsets[slot]
+
+        lines: List[str] = []
+        with open(self._path, "rb") as f:
+            f.seek(offset)
+            for raw in f:
+                if line_no >= start:
+                    lines.append(_decode_line(raw))
+                    if len(lines) >= count:
+                        break
+                line_no += 1
+        return lines, total
+
+    @property
+    def checkpoints(self) -> int:
+        """Number of checkpoints held (for diagnostics)."""
+        return len(self._offsets)
+
+
+_line_indexes: "OrderedDict[str, LineOffsetIndex]" = OrderedDict()
+_line_indexes_lock = threading.Lock()
+
+
+def get_line_index(file_path: PathLike) -> LineOffsetIndex:
+    """Get the shared line index for a file (LRU bounded, thread-safe)."""
+    key = str(Path(file_path).resolve())
+    with _line_indexes_lock:
+        index = _line_indexes.get(key)
+        if index is None:
+            index = LineOffsetIndex(key)
+            _line_indexes[key] = index
+            while len(_line_indexes) > _MAX_CACHED_INDEXES:
+                _line_indexes.popitem(last=False)
+        else:
+            _line_indexes.move_to_end(key)
+        return index
+
+
+def read_log_window(
+    file_path: PathLike, lines: int, offset: int, tail: bool
+) -> Tuple[List[str], int]:
+    """Read a page of lines with the same semantics as the log viewer API.
+
+    Args:
+        file_path: Log file to read
+        lines: Number of lines to read
+        offset: Line offset (from the end when ``tail`` is set)
+        tail: If True, read from end of file
+
+    Returns:
+        Tuple of (selected_lines, total_lines)
+    """
+    index = get_line_index(file_path)
+    if not tail:
+        return index.read_lines(offset, lines)
+
+    if lines + offset <= _TAIL_SCAN_MAX_LINES:
+        selected, _ = read_tail_lines(file_path, lines, offset)
+        return selected, index.refresh()
+
+    total = index.refresh()
+    start = max(0, total - lines - offset)
+    selected, total = index.read_lines(start, max(0, total - offset - start))
+    return selected, total
@@ -0,0 +1,97 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Unit tests for the seekable log reader
+
+Tests the following functionality:
+- Backward tail reads match splitlines() semantics
+- Sparse line index pagination across checkpoints
+- Incremental extension, truncation and rotation
+"""
+
+import pytest
+from utils import log_reader
+from utils.log_reader import LineOffsetIndex, read_log_window, read_tail_lines
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    """Force many blocks/checkpoints on small test files."""
+    monkeypatch.setattr(log_reader, "_BLOCK_SIZE", 16)
+
+
+def _write_lines(path, count, trailing_newline=True):
+    text = "\n".join(f"line {i:04d}" for i in range(count))
+    path.write_text(text + ("\n" if trailing_newline else ""))
+    return text.splitlines()
+
+
+@pytest.mark.parametrize("trailing_newline", [True, False])
+def test_tail_matches_splitlines(tmp_path, small_blocks, trailing_newline):
+    log = tmp_path / "app.log"
+    expected = _write_lines(log, 200, trailing_newline)
+
+    for count, skip in [(1, 0), (10, 0), (10, 5), (250, 0), (5, 198), (5, 300)]:
+        lines, end = read_tail_lines(log, count, skip)
+        stop = len(expected) - skip
+        assert lines == (expected[max(0, stop - count) : stop] if stop > 0 else [])
+        assert end == log.stat().st_size
+
+
+def test_tail_of_empty_file(tmp_path):
+    log = tmp_path / "empty.log"
+    log.write_text("")
+    assert read_tail_lines(log, 10) == ([], 0)
+
+
+def test_index_pages_across_checkpoints(tmp_path, small_blocks):
+    log = tmp_path / "app.log"
+    expected = _write_lines(log, 500)
+    index = LineOffsetIndex(log, spacing=64)
+
+    assert index.refresh() == 500
+    assert index.checkpoints > 10
+    for start in (0, 1, 37, 255, 499):
+        lines, total = index.read_lines(start, 7)
+        assert lines == expected[start : start + 7]
+        assert total == 500
+    assert index.read_lines(500, 5) == ([], 500)
+
+
+def test_index_extends_incrementally_and_resets_on_truncate(tmp_path, small_blocks):
+    log = tmp_path / "app.log"
+    log.write_text("a\nb\npartial")
+    index = LineOffsetIndex(log, spacing=8)
+    assert index.refresh() == 3
+
+    with open(log, "a") as f:
+        f.write(" line\nc\n")
+    assert index.read_lines(2, 5) == (["partial line", "c"], 4)
+
+    log.write_text("fresh\n")
+    assert index.read_lines(0, 5) == (["fresh"], 1)
+
+
+def test_index_resets_on_rotation(tmp_path):
+    log = tmp_path / "app.log"
+    _write_lines(log, 50)
+    index = LineOffsetIndex(log)
+    assert index.refresh() == 50
+
+    rotated = tmp_path / "app.log.1"
+    log.rename(rotated)
+    _write_lines(log, 60)
+    assert index.refresh() == 60
+
+
+def test_read_log_window_tail_and_offset(tmp_path, small_blocks, monkeypatch):
+    log = tmp_path / "app.log"
+    expected = _write_lines(log, 300)
+
+    assert read_log_window(log, 10, 0, tail=False) == (expected[:10], 300)
+    assert read_log_window(log, 10, 20, tail=True) == (expected[270:280], 300)
+
+    # Deep tails go through the line index
+    monkeypatch.setattr(log_reader, "_TAIL_SCAN_MAX_LINES", 5)
+    assert read_log_window(log, 10, 20, tail=True) == (expected[270:280], 300)
@@ -0,0 +1,494 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Indexed Log Search
+
+Per-file search indexes for the log viewer. Each file is split into
+line-aligned blocks of about 1 MiB, and for every block the index keeps:
+
+- its lowercase word-character trigrams, as one column of a packed
+  (trigram x block) bit matrix; trigrams over [a-z0-9_] are encoded as
+  base-38 numbers and extracted with numpy, so indexing runs at memory speed
+- the min/max line timestamp ("YYYY-MM-DD HH:MM:SS", compared as text)
+- which log levels occur in it
+
+Indexes are built on first use and extended incrementally as files grow;
+rotation or truncation triggers a rebuild. A query ANDs the bitmaps of the
+trigrams its matches must contain, drops blocks outside the time range or
+without the requested level, and scans only the surviving blocks with a
+compiled bytes regex. Files are searched in parallel on the log search
+executor and results are yielded per file as each one finishes.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncIterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from utils.io_executor import run_in_log_search_executor
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+# Target bytes per indexed block (blocks always end on a newline)
+_BLOCK_SIZE = 1024 * 1024
+
+# Search indexes kept in memory (one per recently searched file)
+_MAX_CACHED_INDEXES = 32
+
+_LINE_TIMESTAMP_RE = re.compile(rb"^(\d{4}-\d{2}-\d{2})[ T](\d{2}:\d{2}:\d{2})", re.M)
+
+# Level filter value -> lowercase keyword of the line's level field
+_LEVEL_KEYWORDS = {
+    "CRITICAL": b"critical",
+    "ERROR": b"error",
+    "WARNING": b"warn",
+    "WARN": b"warn",
+    "INFO": b"info",
+    "DEBUG": b"debug",
+}
+# Level field of a line: the first level name appearing as a whole word
+_LINE_LEVEL_RE = re.compile(rb"\b(critical|error|warning|warn|info|debug)\b")
+_LEVEL_BITS = {
+    keyword: 1 << i for i, keyword in enumerate(sorted(set(_LEVEL_KEYWORDS.values())))
+}
+
+
+# Word characters [0-9_a-z] -> symbols 1..37; 0 marks any other byte.
+# A trigram is the base-38 number of its three symbols, so codes containing
+# a 0 digit are not word trigrams and are masked out by _VALID_CODES.
+_SYMBOLS = np.zeros(256, dtype=np.uint8)
+for _code, _char in enumerate(b"0123456789_abcdefghijklmnopqrstuvwxyz", start=1):
+    _SYMBOLS[_char] = _code
+_TRIGRAM_SPACE = 38**3
+_VALID_CODES = (
+    (np.arange(_TRIGRAM_SPACE) // (38 * 38) > 0)
+    & (np.arange(_TRIGRAM_SPACE) // 38 % 38 > 0)
+    & (np.arange(_TRIGRAM_SPACE) % 38 > 0)
+)
+
+# Line prefix "YYYY-MM-DD HH:MM:SS" (or with "T"): digit and separator columns
+_TS_LENGTH = 19
+_TS_DIGIT_COLUMNS = np.array([0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18])
+_TS_SEPARATORS = ((4, ord("-")), (7, ord("-")), (13, ord(":")), (16, ord(":")))
+_TS_WEIGHTS = 10 ** np.arange(len(_TS_DIGIT_COLUMNS) - 1, -1, -1, dtype=np.int64)
+
+
+def _trigram_codes(lower: bytes) -> np.ndarray:
+    """Distinct trigram codes of the word runs in lowercase ``lower``."""
+    if len(lower) < 3:
+        return np.empty(0, dtype=np.intp)
+    symbols = _SYMBOLS.take(np.frombuffer(lower, dtype=np.uint8)).astype(np.uint16)
+    # In-place uint16 arithmetic; the largest code (38**3 - 1) fits
+    codes = symbols[:-2] * np.uint16(38)
+    codes += symbols[1:-1]
+    codes *= np.uint16(38)
+    codes += symbols[2:]
+    present = np.bincount(codes, minlength=_TRIGRAM_SPACE) > 0
+    return np.flatnonzero(present & _VALID_CODES)
+
+
+def _timestamp_range(data: bytes) -> Tuple[Optional[bytes], Optional[bytes]]:
+    """Earliest and latest line-leading timestamp in ``data``, if any."""
+    raw = np.frombuffer(data, dtype=np.uint8)
+    starts = np.flatnonzero(raw == ord("\n")) + 1
+    starts = np.concatenate(([0], starts))
+    starts = starts[starts + _TS_LENGTH <= raw.size]
+    if not starts.size:
+        return None, None
+
+    heads = raw[starts[:, None] + np.arange(_TS_LENGTH)]
+    valid = (heads[:, 10] == ord(" ")) | (heads[:, 10] == ord("T"))
+    for column, char in _TS_SEPARATORS:
+        valid &= heads[:, column] == char
+    digits = heads[:, _TS_DIGIT_COLUMNS] - ord("0")  # Non-digits wrap past 9
+    valid &= (digits <= 9).all(axis=1)
+    if not valid.any():
+        return None, None
+
+    values = digits[valid].astype(np.int64) @ _TS_WEIGHTS
+    return _format_timestamp(values.min()), _format_timestamp(values.max())
+
+
+def _format_timestamp(value: int) -> bytes:
+    """14-digit YYYYMMDDHHMMSS number -> b"YYYY-MM-DD HH:MM:SS"."""
+    d = f"{int(value):014d}"
+    return f"{d[:4]}-{d[4:6]}-{d[6:8]} {d[8:10]}:{d[10:12]}:{d[12:]}".encode()
+
+
+# Upper bound for the fields an end time leaves out ("2025-01-01" -> end of day)
+_END_OF_PERIOD = "9999-12-31 23:59:59"
+
+
+def _normalize_time(value: Optional[str], end: bool = False) -> Optional[bytes]:
+    """Turn an ISO-ish timestamp into the index's comparable form.
+
+    A partial end time ("2025-01-01", "2025-01-01 10") covers the whole
+    period it names.
+    """
+    if not value:
+        return None
+    value = value.strip().replace("T", " ")[:_TS_LENGTH]
+    if end:
+        value += _END_OF_PERIOD[len(value) :]
+    return value.encode("ascii", errors="ignore") or None
+
+
+def _line_level(lower_line: bytes) -> Optional[bytes]:
+    """Level keyword of a lowercase line's level field, if it has one."""
+    match = _LINE_LEVEL_RE.search(lower_line)
+    if match is None:
+        return None
+    return _LEVEL_KEYWORDS[match.group(1).decode().upper()]
+
+
+def _regex_literals(pattern: str) -> List[str]:
+    """Literal runs every match of ``pattern`` must contain.
+
+    Only top-level literal sequences are used; anything under alternation,
+    repetition or groups is treated as unknown. Returns [] when the
+    pattern cannot be analysed.
+    """
+    try:
+        import re._parser as sre_parse
+    except ImportError:  # Python < 3.11
+        import sre_parse
+
+    try:
+        parsed = sre_parse.parse(pattern)
+    except Exception:
+        return []
+
+    runs: List[str] = []
+    current: List[str] = []
+    for op, arg in parsed:
+        if op is sre_parse.LITERAL:
+            current.append(chr(arg))
+            continue
+        if current:
+            runs.append("".join(current))
+            current = []
+    if current:
+        runs.append("".join(current))
+    return runs
+
+
+@dataclass
+class LogSearchQuery:
+    """A log search request: text or regex plus optional level/time filters."""
+
+    text: str
+    regex: bool = False
+    case_sensitive: bool = False
+    level: Optional[str] = None
+    start_time: Optional[str] = None
+    end_time: Optional[str] = None
+    _compiled: Optional["re.Pattern[bytes]"] = field(
+        default=None, repr=False, compare=False
+    )
+
+    def compile(self) -> "re.Pattern[bytes]":
+        """Bytes regex for the query; raises re.error for invalid patterns.
+
+        Case-insensitive plain-text queries compile to a lowercase literal
+        that is matched against lowercased blocks (see scans_lowercase),
+        which is much faster than an IGNORECASE regex.
+        """
+        if self._compiled is None:
+            if self.regex:
+                flags = re.M if self.case_sensitive else re.M | re.IGNORECASE
+                pattern = self.text.encode("utf-8")
+            else:
+                flags = re.M
+                pattern = re.escape(self.text.encode("utf-8"))
+                if self.scans_lowercase:
+                    pattern = pattern.lower()
+            self._compiled = re.compile(pattern, flags)
+        return self._compiled
+
+    @property
+    def scans_lowercase(self) -> bool:
+        """Whether blocks are lowercased before matching."""
+        return not self.regex and not self.case_sensitive
+
+    def required_trigrams(self) -> np.ndarray:
+        """Trigram codes any matching line must contain."""
+        literals = _regex_literals(self.text) if self.regex else [self.text]
+        text = b" ".join(literal.encode("utf-8").lower() for literal in literals)
+        return _trigram_codes(text)
+
+    @property
+    def level_keyword(self) -> Optional[bytes]:
+        """Lowercase keyword for the level filter, if any."""
+        if not self.level:
+            return None
+        return _LEVEL_KEYWORDS.get(self.level.upper(), self.level.lower().encode())
+
+    @property
+    def time_range(self) -> Tuple[Optional[bytes], Optional[bytes]]:
+        """Normalized (start, end) timestamps."""
+        start = _normalize_time(self.start_time)
+        return start, _normalize_time(self.end_time, end=True)
+
+
+@dataclass
+class _Block:
+    """Metadata for one indexed block."""
+
+    start: int
+    end: int
+    first_line: int
+    levels: int
+    min_time: Optional[bytes]
+    max_time: Optional[bytes]
+
+
+class LogSearchIndex:
+    """
+    Block-level search index for one append-only log file.
+
+    refresh() indexes bytes appended since the previous call; search()
+    refreshes, prunes blocks and scans the rest. Thread-safe.
+    """
+
+    def __init__(self, file_path: PathLike, block_size: int = _BLOCK_SIZE):
+        """Initialize an empty index for ``file_path``."""
+        self._path = Path(file_path)
+        self._block_size = block_size
+        self._lock = threading.Lock()
+        self._reset(None)
+
+    def _reset(self, identity: Optional[Tuple[int, int]]) -> None:
+        """Forget all blocks (new, rotated or truncated file)."""
+        self._identity = identity
+        self._blocks: List[_Block] = []
+        # Packed bit matrix: row = trigram code, bit j of the row = block j
+        self._postings = np.zeros((_TRIGRAM_SPACE, 8), dtype=np.uint8)
+        self._indexed = 0  # Byte offset where the unindexed tail starts
+        self._lines = 0  # Lines before self._indexed
+
+    def refresh(self) -> Tuple[List[_Block], int, int, int]:
+        """Index appended data.
+
+        Returns:
+            Tuple of (blocks, indexed end offset, lines before it, file size)
+        """
+        with self._lock, open(self._path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            identity = (stat.st_dev, stat.st_ino)
+            if identity != self._identity or stat.st_size < self._indexed:
+                self._reset(identity)
+            self._extend(f, stat.st_size)
+            return list(self._blocks), self._indexed, self._lines, stat.st_size
+
+    def _extend(self, f, size: int) -> None:
+        """Index complete lines in [indexed, size) block by block."""
+        f.seek(self._indexed)
+        pending = b""
+        while self._indexed + len(pending) < size:
+            remaining = size - self._indexed - len(pending)
+            chunk = f.read(min(self._block_size, remaining))
+            if not chunk:
+                break  # Truncated while indexing; next refresh resets
+            pending += chunk
+            cut = pending.rfind(b"\n")
+            if cut < 0:
+                continue  # A single line longer than a block
+            data, pending = pending[: cut + 1], pending[cut + 1 :]
+            self._add_block(data)
+
+    def _add_block(self, data: bytes) -> None:
+        """Record one line-aligned block."""
+        block_id = len(self._blocks)
+        lower = data.lower()
+
+        levels = 0
+        for keyword, bit in _LEVEL_BITS.items():
+            if keyword in lower:
+                levels |= bit
+
+        min_time, max_time = _timestamp_range(data)
+        self._blocks.append(
+            _Block(
+                start=self._indexed,
+                end=self._indexed + len(data),
+                first_line=self._lines,
+                levels=levels,
+                min_time=min_time,
+                max_time=max_time,
+            )
+        )
+
+        byte_index = block_id >> 3
+        if byte_index >= self._postings.shape[1]:
+            grown = np.zeros(
+                (_TRIGRAM_SPACE, self._postings.shape[1] * 2), dtype=np.uint8
+            )
+            grown[:, : self._postings.shape[1]] = self._postings
+            self._postings = grown
+        self._postings[_trigram_codes(lower), byte_index] |= np.uint8(
+            1 << (block_id & 7)
+        )
+
+        self._indexed += len(data)
+        self._lines += data.count(b"\n")
+
+    def _candidate_ids(self, query: LogSearchQuery, block_count: int) -> List[int]:
+        """Block ids that may contain matches, by trigram postings."""
+        codes = query.required_trigrams()
+        if not codes.size:
+            return list(range(block_count))
+
+        with self._lock:
+            rows = self._postings[codes]  # Fancy indexing copies
+        mask = np.bitwise_and.reduce(rows, axis=0)
+        bits = np.unpackbits(mask, bitorder="little")[:block_count]
+        return np.flatnonzero(bits).tolist()
+
+    def search(self, query: LogSearchQuery, max_results: int) -> List[Tuple[int, str]]:
+        """Matching lines as (1-based line number, content) in file order."""
+        blocks, indexed, lines, size = self.refresh()
+        start_time, end_time = query.time_range
+        level_bit = _LEVEL_BITS.get(query.level_keyword or b"", 0)
+
+        spans: List[Tuple[int, int, int]] = []
+        for block_id in self._candidate_ids(query, len(blocks)):
+            block = blocks[block_id]
+            if level_bit and not block.levels & level_bit:
+                continue
+            if block.min_time is not None:
+                if end_time and block.min_time > end_time:
+                    continue
+                if start_time and block.max_time < start_time:
+                    continue
+            elif start_time or end_time:
+                continue  # No timestamped lines to satisfy a time filter
+            spans.append((block.start, block.end, block.first_line))
+        if indexed < size:
+            spans.append((indexed, size, lines))  # Unindexed tail
+
+        results: List[Tuple[int, str]] = []
+        with open(self._path, "rb") as f:
+            for start, end, first_line in spans:
+                f.seek(start)
+                data = f.read(end - start)
+                _scan_block(data, first_line, query, results, max_results)
+                if len(results) >= max_results:
+                    break
+        return results
+
+
+def _scan_block(
+    data: bytes,
+    first_line: int,
+    query: LogSearchQuery,
+    results: List[Tuple[int, str]],
+    max_results: int,
+) -> None:
+    """Append matching lines of ``data`` to ``results`` (one hit per line)."""
+    pattern = query.compile()
+    haystack = data.lower() if query.scans_lowercase else data
+    level_keyword = query.level_keyword
+    start_time, end_time = query.time_range
+
+    line_no = first_line
+    counted_to = 0
+    position = 0
+    while position < len(data) and len(results) < max_results:
+        match = pattern.search(haystack, position)
+        if match is None:
+            return
+        line_start = data.rfind(b"\n", 0, match.start()) + 1
+        line_end = data.find(b"\n", match.start())
+        if line_end < 0:
+            line_end = len(data)
+        position = line_end + 1
+
+        line = data[line_start:line_end]
+        if level_keyword and _line_level(line.lower()) != level_keyword:
+            continue
+        if start_time or end_time:
+            stamp = _LINE_TIMESTAMP_RE.match(line)
+            if stamp is None:
+                continue
+            moment = stamp.group(1) + b" " + stamp.group(2)
+            if start_time and moment < start_time:
+                continue
+            if end_time and moment > end_time:
+                continue
+
+        line_no += data.count(b"\n", counted_to, line_start)
+        counted_to = line_start
+        content = line.rstrip(b"\r").decode("utf-8", errors="replace")
+        results.append((line_no + 1, content))
+
+
+_search_indexes: "OrderedDict[str, LogSearchIndex]" = OrderedDict()
+_search_indexes_lock = threading.Lock()
+
+
+def get_search_index(file_path: PathLike) -> LogSearchIndex:
+    """Get the shared search index for a file (LRU bounded, thread-safe)."""
+    key = str(Path(file_path).resolve())
+    with _search_indexes_lock:
+        index = _search_indexes.get(key)
+        if index is None:
+            index = LogSearchIndex(key)
+            _search_indexes[key] = index
+            while len(_search_indexes) > _MAX_CACHED_INDEXES:
+                _search_indexes.popitem(last=False)
+        else:
+            _search_indexes.move_to_end(key)
+        return index
+
+
+def search_log_file(
+    file_path: PathLike, query: LogSearchQuery, max_results: int
+) -> List[Tuple[int, str]]:
+    """Search one file through its shared index (blocking)."""
+    return get_search_index(file_path).search(query, max_results)
+
+
+async def search_log_files(
+    files: Sequence[Path], query: LogSearchQuery, max_results: int
+) -> AsyncIterator[Tuple[Path, List[Tuple[int, str]]]]:
+    """Search files in parallel, yielding (file, hits) as each completes.
+
+    At most ``max_results`` hits are yielded in total; remaining searches
+    are cancelled once the limit is reached. Unreadable files are skipped.
+    """
+    query.compile()  # Surface invalid patterns before fanning out
+
+    async def search_one(file_path: Path):
+        try:
+            hits = await run_in_log_search_executor(
+                search_log_file, file_path, query, max_results
+            )
+        except OSError as e:
+            logger.error("Failed to search log file %s: %s", file_path, e)
+            hits = []
+        return file_path, hits
+
+    tasks = [asyncio.ensure_future(search_one(fp)) for fp in files]
+    remaining = max_results
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            file_path, hits = await next_done
+            if not hits:
+                continue
+            hits = hits[:remaining]
+            remaining -= len(hits)
+            yield file_path, hits
+            if remaining <= 0:
+                return
+    finally:
+        for task in tasks:
+            task.cancel()
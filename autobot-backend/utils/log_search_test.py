@@ -0,0 +1,164 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Unit tests for indexed log search
+
+Tests the following functionality:
+- Trigram, level and time pruning of blocks
+- Literal and regex matching with correct line numbers
+- Incremental indexing of appended data and truncation
+- Parallel multi-file search with a global result limit
+"""
+
+import pytest
+from utils.log_search import (
+    LogSearchIndex,
+    LogSearchQuery,
+    _normalize_time,
+    _regex_literals,
+    _timestamp_range,
+    search_log_files,
+)
+
+
+def _write_log(path, hours=4, lines_per_hour=50):
+    lines = []
+    for hour in range(hours):
+        for i in range(lines_per_hour):
+            level = "ERROR" if i % 10 == 0 else "INFO"
+            lines.append(
+                f"2025-01-01 {hour:02d}:{i:02d}:00,000 [svc] {level}: "
+                f"request r{hour}x{i} done"
+            )
+    path.write_text("\n".join(lines) + "\n")
+    return lines
+
+
+def test_regex_literals_only_uses_mandatory_runs():
+    assert _regex_literals(r"timeout after \d+ms") == ["timeout after ", "ms"]
+    assert _regex_literals("error|warning") == []
+    assert _regex_literals("(unclosed") == []
+
+
+def test_timestamp_range_handles_both_separators():
+    data = (
+        b"2025-01-01T10:00:00 a\n"
+        b"no timestamp here\n"
+        b"2025-01-01 09:30:00 b\n"
+        b"2025-01-01 23:59:59 c\n"
+    )
+    assert _timestamp_range(data) == (b"2025-01-01 09:30:00", b"2025-01-01 23:59:59")
+    assert _timestamp_range(b"plain\n") == (None, None)
+
+
+def test_literal_search_returns_line_numbers(tmp_path):
+    log = tmp_path / "app.log"
+    lines = _write_log(log)
+    index = LogSearchIndex(log, block_size=512)
+
+    hits = index.search(LogSearchQuery("R2X17 done"), 10)
+
+    assert hits == [(2 * 50 + 17 + 1, lines[2 * 50 + 17])]
+    assert index.search(LogSearchQuery("R2X17", case_sensitive=True), 10) == []
+    assert index.search(LogSearchQuery("missingtoken"), 10) == []
+
+
+def test_trigram_pruning_skips_blocks(tmp_path, monkeypatch):
+    log = tmp_path / "app.log"
+    _write_log(log)
+    index = LogSearchIndex(log, block_size=512)
+    index.refresh()
+
+    scanned = []
+    original = LogSearchIndex._candidate_ids
+
+    def spy(self, query, block_count):
+        ids = original(self, query, block_count)
+        scanned.append((len(ids), block_count))
+        return ids
+
+    monkeypatch.setattr(LogSearchIndex, "_candidate_ids", spy)
+    index.search(LogSearchQuery("r3x49"), 10)
+
+    candidates, total = scanned[0]
+    assert total > 10
+    assert candidates <= 2
+
+
+def test_regex_level_and_time_filters(tmp_path):
+    log = tmp_path / "app.log"
+    lines = _write_log(log)
+    index = LogSearchIndex(log, block_size=512)
+
+    query = LogSearchQuery(
+        r"request r\d+x\d+ done",
+        regex=True,
+        level="error",
+        start_time="2025-01-01T01:00:00",
+        end_time="2025-01-01T01:59:59",
+    )
+    hits = index.search(query, 100)
+
+    assert [content for _, content in hits] == [
+        line for line in lines[50:100] if "ERROR" in line
+    ]
+
+
+def test_level_filter_uses_level_field(tmp_path):
+    log = tmp_path / "app.log"
+    log.write_text(
+        "2025-01-01 00:00:00,000 [svc] INFO: retrying after error\n"
+        "2025-01-01 00:00:01,000 [error_handler] ERROR: retry failed\n"
+        "2025-01-01 00:00:02,000 [svc] WARNING: retry slow\n"
+    )
+    index = LogSearchIndex(log)
+
+    hits = index.search(LogSearchQuery("retry", level="ERROR"), 10)
+    assert [line for line, _ in hits] == [2]
+    hits = index.search(LogSearchQuery("retry", level="warn"), 10)
+    assert [line for line, _ in hits] == [3]
+
+
+def test_date_only_end_time_covers_whole_day(tmp_path):
+    log = tmp_path / "app.log"
+    lines = _write_log(log)
+    index = LogSearchIndex(log, block_size=512)
+
+    query = LogSearchQuery("done", start_time="2025-01-01", end_time="2025-01-01")
+    assert len(index.search(query, 1000)) == len(lines)
+    assert _normalize_time("2025-01-01", end=True) == b"2025-01-01 23:59:59"
+    assert _normalize_time("2025-01-01T10", end=True) == b"2025-01-01 10:59:59"
+
+
+def test_appended_and_truncated_data_is_searchable(tmp_path):
+    log = tmp_path / "app.log"
+    _write_log(log, hours=1)
+    index = LogSearchIndex(log, block_size=256)
+    index.refresh()
+
+    with open(log, "a") as f:
+        f.write("2025-01-02 00:00:00,000 [svc] INFO: fresh entry\npartial tail")
+    assert index.search(LogSearchQuery("fresh entry"), 5)[0][0] == 51
+    assert index.search(LogSearchQuery("partial tail"), 5) == [(52, "partial tail")]
+
+    log.write_text("new file\n")
+    assert index.search(LogSearchQuery("new"), 5) == [(1, "new file")]
+
+
+@pytest.mark.asyncio
+async def test_search_log_files_caps_results_across_files(tmp_path):
+    files = []
+    for name in ("a.log", "b.log", "c.log"):
+        path = tmp_path / name
+        _write_log(path, hours=1)
+        files.append(path)
+
+    collected = []
+    async for file_path, hits in search_log_files(
+        files, LogSearchQuery("error"), max_results=12
+    ):
+        collected.extend((file_path.name, line) for line, _ in hits)
+
+    assert len(collected) == 12
+    assert {name for name, _ in collected} <= {"a.log", "b.log", "c.log"}
@@ -0,0 +1,465 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Shared Log Tail Hub
+
+Fans out appended log lines to any number of live viewers (the
+/api/logs/tail websocket) from a single tailer per file:
+
+- One asyncio task per followed file, woken by filesystem events
+  (watchdog/inotify on the file's directory) with a polling fallback when
+  watchdog is unavailable. A slow safety poll runs even with events, in
+  case an event is missed.
+- Reads are rate-limited to one per ``frame_interval`` and only complete
+  lines are consumed, so lines are batched into frames and a partially
+  written line is never split across frames.
+- Rotation (inode change) drains the old file before switching to the new
+  one; truncation restarts from offset 0.
+- Each subscriber has a bounded frame queue. When a viewer falls behind,
+  its oldest frames are dropped and the number of dropped lines is reported
+  with the next frame, so a slow client never stalls the tailer or other
+  viewers.
+
+CPU cost therefore depends on the write rate of the file, not on how many
+viewers are connected. Blocking reads run on the log I/O executor.
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from utils.io_executor import run_in_log_executor
+from utils.log_reader import PathLike, read_tail_lines
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between reads of one file (frame batching window)
+FRAME_INTERVAL = 0.1
+
+# Seconds between polls when filesystem events are unavailable
+POLL_INTERVAL = 0.5
+
+# Seconds between safety polls when filesystem events are available
+EVENT_SAFETY_POLL_INTERVAL = 5.0
+
+# Lines per frame sent to a subscriber
+MAX_FRAME_LINES = 500
+
+# Frames buffered per subscriber before the oldest are dropped
+SUBSCRIBER_QUEUE_FRAMES = 64
+
+# Bytes read per tailer step; a larger burst continues on the next step
+_MAX_READ_BYTES = 4 * 1024 * 1024
+
+# A line longer than this without a newline is emitted as-is
+_MAX_PARTIAL_BYTES = 1024 * 1024
+
+
+@dataclass
+class TailFrame:
+    """A batch of lines for one subscriber."""
+
+    lines: List[str]
+    dropped: int = 0  # Lines dropped for this subscriber since the last frame
+
+
+class TailSubscription:
+    """One viewer's bounded view of a shared tailer."""
+
+    def __init__(self, backlog: List[str], max_frames: int):
+        """Initialize with the initial backlog lines and queue bound."""
+        self.backlog = backlog
+        self._queue: "asyncio.Queue[Optional[List[str]]]" = asyncio.Queue(
+            maxsize=max_frames
+        )
+        self._dropped = 0
+        self.total_dropped = 0
+
+    def _offer(self, lines: List[str]) -> None:
+        """Enqueue a frame, dropping this subscriber's oldest on overflow."""
+        if self._queue.full():
+            oldest = self._queue.get_nowait()
+            if oldest:
+                self._dropped += len(oldest)
+                self.total_dropped += len(oldest)
+        self._queue.put_nowait(lines)
+
+    def _close(self) -> None:
+        """Signal end of stream (tailer stopped)."""
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+    async def next_frame(self) -> Optional[TailFrame]:
+        """Wait for the next frame; None once the tailer has stopped."""
+        lines = await self._queue.get()
+        if lines is None:
+            return None
+        dropped, self._dropped = self._dropped, 0
+        return TailFrame(lines=lines, dropped=dropped)
+
+    async def frames(self) -> AsyncIterator[TailFrame]:
+        """Iterate frames until the tailer stops."""
+        while True:
+            frame = await self.next_frame()
+            if frame is None:
+                return
+            yield frame
+
+
+class _FileTailer:
+    """Follows one file and broadcasts complete lines to its subscribers."""
+
+    def __init__(self, path: Path, poll_interval: float, frame_interval: float):
+        """Initialize an unstarted tailer for ``path``."""
+        self.path = path
+        self._poll_interval = poll_interval
+        self._frame_interval = frame_interval
+        self.subscribers: Set[TailSubscription] = set()
+        self.read_lock = asyncio.Lock()
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._fh = None
+        self._identity: Optional[Tuple[int, int]] = None
+        self.offset = 0  # Always at a line start
+
+    # -- blocking helpers (log executor) -----------------------------------
+
+    def _open_at_last_line_start(self) -> None:
+        """Open the file positioned after its last complete line."""
+        self._fh = open(self.path, "rb")
+        stat = os.fstat(self._fh.fileno())
+        self._identity = (stat.st_dev, stat.st_ino)
+        size = stat.st_size
+        self.offset = size
+        if size:
+            start = max(0, size - _MAX_PARTIAL_BYTES)
+            self._fh.seek(start)
+            tail = self._fh.read(size - start)
+            last_newline = tail.rfind(b"\n")
+            if last_newline >= 0:
+                self.offset = start + last_newline + 1
+
+    def _read_complete_lines(self, final: bool = False) -> Tuple[List[str], bool]:
+        """Read complete lines from the open handle.
+
+        Returns:
+            Tuple of (lines, more data pending)
+        """
+        self._fh.seek(self.offset)
+        data = self._fh.read(_MAX_READ_BYTES)
+        if not data:
+            return [], False
+        more = len(data) == _MAX_READ_BYTES
+        cut = data.rfind(b"\n") + 1
+        if cut == 0 and (final or len(data) >= _MAX_PARTIAL_BYTES):
+            cut = len(data)
+        if cut == 0:
+            return [], False
+        self.offset += cut
+        lines = [
+            line.rstrip(b"\r").decode("utf-8", errors="replace")
+            for line in data[:cut].rstrip(b"\n").split(b"\n")
+        ]
+        return lines, more
+
+    def _read_appended(self) -> Tuple[List[str], bool]:
+        """Read lines appended since the last step, following rotation."""
+        lines: List[str] = []
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return lines, False  # Rotated away; new file not created yet
+
+        if self._fh is None or (stat.st_dev, stat.st_ino) != self._identity:
+            # Rotated: drain what was written to the old file, then switch.
+            # If the new file cannot be opened yet, the next step retries.
+            if self._fh is not None:
+                while True:
+                    drained, more = self._read_complete_lines(final=True)
+                    lines.extend(drained)
+                    if not more:
+                        break
+                self._close_file()
+            try:
+                self._fh = open(self.path, "rb")
+            except OSError as e:
+                logger.debug("Cannot reopen rotated log %s: %s", self.path, e)
+                return lines, False
+            fstat = os.fstat(self._fh.fileno())
+            self._identity = (fstat.st_dev, fstat.st_ino)
+            self.offset = 0
+        elif stat.st_size < self.offset:
+            logger.debug("Log file truncated, restarting tail: %s", self.path)
+            self.offset = 0
+
+        appended, more = self._read_complete_lines()
+        lines.extend(appended)
+        return lines, more
+
+    def _close_file(self) -> None:
+        """Close the followed file handle."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    # -- async side ---------------------------------------------------------
+
+    async def start(self) -> None:
+        """Open the file and start the follow task."""
+        await run_in_log_executor(self._open_at_last_line_start)
+        self._task = asyncio.create_task(self._run())
+
+    def set_poll_interval(self, seconds: float) -> None:
+        """Change the fallback poll interval (slower when events work)."""
+        self._poll_interval = seconds
+
+    def wake(self) -> None:
+        """Request a read (called on filesystem events)."""
+        self._wake.set()
+
+    async def read_backlog(self, count: int) -> List[str]:
+        """Last ``count`` complete lines before the tailer's offset.
+
+        Caller must hold ``read_lock`` so no lines are lost or duplicated
+        between the backlog and the first frame.
+        """
+        lines, _ = await run_in_log_executor(
+            read_tail_lines, self.path, count, 0, self.offset
+        )
+        return lines
+
+    def _broadcast(self, lines: List[str]) -> None:
+        """Send lines to every subscriber in frames of MAX_FRAME_LINES."""
+        for start in range(0, len(lines), MAX_FRAME_LINES):
+            frame = lines[start : start + MAX_FRAME_LINES]
+            for subscriber in self.subscribers:
+                subscriber._offer(frame)
+
+    async def step(self) -> bool:
+        """Read and broadcast appended lines; True if more data is pending."""
+        async with self.read_lock:
+            lines, more = await run_in_log_executor(self._read_appended)
+            if lines:
+                self._broadcast(lines)
+            return more
+
+    async def _run(self) -> None:
+        """Follow loop: wait for an event or poll timeout, then read."""
+        try:
+            while True:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wake.wait(), self._poll_interval)
+                self._wake.clear()
+                try:
+                    if await self.step():
+                        self._wake.set()
+                except OSError as e:
+                    logger.warning("Log tail read failed for %s: %s", self.path, e)
+                await asyncio.sleep(self._frame_interval)
+        finally:
+            for subscriber in self.subscribers:
+                subscriber._close()
+            await run_in_log_executor(self._close_file)
+
+    async def stop(self) -> None:
+        """Cancel the follow task and close the file."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+
+class _DirectoryWatcher:
+    """Routes watchdog events for watched directories to tailers."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, observer, handler_cls):
+        """Wrap a started watchdog observer."""
+        self._loop = loop
+        self._observer = observer
+        self._handler_cls = handler_cls
+        self._watches: Dict[Path, object] = {}
+        self._tailers: Dict[Path, _FileTailer] = {}
+
+    def add(self, tailer: _FileTailer) -> bool:
+        """Watch the tailer's directory; False if the watch failed."""
+        directory = tailer.path.parent
+        if directory not in self._watches:
+            try:
+                self._watches[directory] = self._observer.schedule(
+                    self._handler_cls(self), str(directory), recursive=False
+                )
+            except OSError as e:
+                logger.warning("Cannot watch %s (%s), polling instead", directory, e)
+                return False
+        self._tailers[tailer.path] = tailer
+        return True
+
+    def remove(self, tailer: _FileTailer) -> None:
+        """Forget a tailer and drop its directory watch if unused."""
+        self._tailers.pop(tailer.path, None)
+        directory = tailer.path.parent
+        if directory in self._watches and not any(
+            path.parent == directory for path in self._tailers
+        ):
+            self._observer.unschedule(self._watches.pop(directory))
+
+    def dispatch(self, raw_path) -> None:
+        """Called from the observer thread for each event path."""
+        tailer = self._tailers.get(Path(os.fsdecode(raw_path)))
+        if tailer is not None:
+            self._loop.call_soon_threadsafe(tailer.wake)
+
+    def stop(self) -> None:
+        """Stop the observer thread."""
+        self._observer.stop()
+        self._observer.join(timeout=1)
+
+
+def _create_directory_watcher(loop) -> Optional[_DirectoryWatcher]:
+    """Start a watchdog observer for tail events; None if unavailable."""
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        logger.info("watchdog not installed, log tails will poll")
+        return None
+
+    class _Handler(FileSystemEventHandler):
+        def __init__(self, watcher: _DirectoryWatcher):
+            super().__init__()
+            self._watcher = watcher
+
+        def on_any_event(self, event) -> None:
+            if event.is_directory:
+                return
+            for attr in ("src_path", "dest_path"):
+                path = getattr(event, attr, None)
+                if path:
+                    self._watcher.dispatch(path)
+
+    observer = Observer()
+    try:
+        observer.start()
+    except OSError as e:
+        logger.warning("Filesystem events unavailable (%s), log tails will poll", e)
+        return None
+    return _DirectoryWatcher(loop, observer, _Handler)
+
+
+class LogTailHub:
+    """
+    Shares one tailer per log file among all subscribers.
+
+    Tailers start with the first subscriber and stop with the last one.
+    Must be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        use_events: bool = True,
+        poll_interval: float = POLL_INTERVAL,
+        frame_interval: float = FRAME_INTERVAL,
+        max_frames: int = SUBSCRIBER_QUEUE_FRAMES,
+    ):
+        """Initialize the hub; the watchdog observer starts lazily."""
+        self._use_events = use_events
+        self._poll_interval = poll_interval
+        self._frame_interval = frame_interval
+        self._max_frames = max_frames
+        self._tailers: Dict[Path, _FileTailer] = {}
+        self._lock = asyncio.Lock()
+        self._watcher: Optional[_DirectoryWatcher] = None
+        self._watcher_checked = False
+
+    def _get_watcher(self) -> Optional[_DirectoryWatcher]:
+        """Create the shared directory watcher on first use."""
+        if self._use_events and not self._watcher_checked:
+            self._watcher_checked = True
+            self._watcher = _create_directory_watcher(asyncio.get_running_loop())
+        return self._watcher
+
+    async def _acquire(self, path: Path) -> _FileTailer:
+        """Get or start the tailer for ``path`` (hub lock held)."""
+        tailer = self._tailers.get(path)
+        if tailer is not None:
+            return tailer
+
+        watcher = self._get_watcher()
+        tailer = _FileTailer(path, self._poll_interval, self._frame_interval)
+        if watcher is not None and watcher.add(tailer):
+            tailer.set_poll_interval(
+                max(self._poll_interval, EVENT_SAFETY_POLL_INTERVAL)
+            )
+        await tailer.start()
+        self._tailers[path] = tailer
+        return tailer
+
+    async def _release(self, path: Path, subscription: TailSubscription) -> None:
+        """Detach a subscriber and stop the tailer if it was the last one."""
+        async with self._lock:
+            tailer = self._tailers.get(path)
+            if tailer is None:
+                return
+            tailer.subscribers.discard(subscription)
+            if tailer.subscribers:
+                return
+            del self._tailers[path]
+            if self._watcher is not None:
+                self._watcher.remove(tailer)
+        await tailer.stop()
+
+    @contextlib.asynccontextmanager
+    async def subscribe(
+        self, file_path: PathLike, backlog: int = 50
+    ) -> AsyncIterator[TailSubscription]:
+        """Follow ``file_path``, starting with its last ``backlog`` lines.
+
+        Frames delivered after the backlog continue exactly where the
+        backlog ends.
+        """
+        path = Path(file_path).resolve()
+        async with self._lock:
+            tailer = await self._acquire(path)
+            async with tailer.read_lock:
+                lines = await tailer.read_backlog(backlog) if backlog > 0 else []
+                subscription = TailSubscription(lines, self._max_frames)
+                tailer.subscribers.add(subscription)
+        try:
+            yield subscription
+        finally:
+            await self._release(path, subscription)
+
+    def stats(self) -> Dict[str, int]:
+        """Tailer and subscriber counts per followed file (diagnostics)."""
+        return {str(path): len(t.subscribers) for path, t in self._tailers.items()}
+
+    async def close(self) -> None:
+        """Stop all tailers and the watchdog observer."""
+        async with self._lock:
+            tailers = list(self._tailers.values())
+            self._tailers.clear()
+        for tailer in tailers:
+            await tailer.stop()
+        if self._watcher is not None:
+            await run_in_log_executor(self._watcher.stop)
+            self._watcher = None
+            self._watcher_checked = False
+
+
+_hub: Optional[LogTailHub] = None
+
+
+def get_log_tail_hub() -> LogTailHub:
+    """Get the process-wide log tail hub."""
+    global _hub
+    if _hub is None:
+        _hub = LogTailHub()
+    return _hub
@@ -0,0 +1,125 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Unit tests for the shared log tail hub
+
+Tests the following functionality:
+- Backlog and live frames join without gaps or duplicates
+- One tailer shared by all subscribers, stopped with the last one
+- Rotation, truncation and partial-line handling
+- Drop-oldest lag policy for slow subscribers
+"""
+
+import asyncio
+
+import pytest
+from utils import log_tail_hub
+from utils.log_tail_hub import LogTailHub
+
+
+@pytest.fixture
+async def hub():
+    tail_hub = LogTailHub(use_events=False, poll_interval=0.01, frame_interval=0.0)
+    yield tail_hub
+    await tail_hub.close()
+
+
+def _append(path, text):
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(text)
+
+
+async def _collect(subscription, count, timeout=2.0):
+    lines = []
+
+    async def _read():
+        while len(lines) < count:
+            frame = await subscription.next_frame()
+            lines.extend(frame.lines)
+
+    await asyncio.wait_for(_read(), timeout)
+    return lines
+
+
+async def test_backlog_then_live_lines(tmp_path, hub):
+    log = tmp_path / "app.log"
+    log.write_text("".join(f"old {i}\n" for i in range(100)) + "partial")
+
+    async with hub.subscribe(log, backlog=3) as sub:
+        assert sub.backlog == ["old 97", "old 98", "old 99"]
+        _append(log, " line\nnew 1\n")
+        assert await _collect(sub, 2) == ["partial line", "new 1"]
+
+
+async def test_subscribers_share_one_tailer(tmp_path, hub):
+    log = tmp_path / "app.log"
+    log.write_text("start\n")
+
+    async with hub.subscribe(log) as first, hub.subscribe(log) as second:
+        assert hub.stats() == {str(log.resolve()): 2}
+        _append(log, "a\nb\n")
+        assert await _collect(first, 2) == ["a", "b"]
+        assert await _collect(second, 2) == ["a", "b"]
+
+    assert hub.stats() == {}
+
+
+async def test_rotation_and_truncation(tmp_path, hub):
+    log = tmp_path / "app.log"
+    log.write_text("")
+
+    async with hub.subscribe(log, backlog=0) as sub:
+        _append(log, "before rotate\n")
+        assert await _collect(sub, 1) == ["before rotate"]
+
+        log.rename(tmp_path / "app.log.1")
+        log.write_text("after rotate\n")
+        assert await _collect(sub, 1) == ["after rotate"]
+
+        log.write_text("")
+        await asyncio.sleep(0.05)
+        _append(log, "after truncate\n")
+        assert await _collect(sub, 1) == ["after truncate"]
+
+
+async def test_failed_reopen_after_rotation_is_retried(tmp_path, hub, monkeypatch):
+    log = tmp_path / "app.log"
+    log.write_text("")
+    failures = []
+
+    def flaky_open(path, mode="r", *args, **kwargs):
+        if not failures:
+            failures.append(path)
+            raise PermissionError("not yet readable")
+        return open(path, mode, *args, **kwargs)
+
+    async with hub.subscribe(log, backlog=0) as sub:
+        monkeypatch.setattr(log_tail_hub, "open", flaky_open, raising=False)
+        _append(log, "before rotate\n")
+        log.rename(tmp_path / "app.log.1")
+        log.write_text("after rotate\n")
+
+        assert await _collect(sub, 2) == ["before rotate", "after rotate"]
+        assert failures
+
+
+async def test_slow_subscriber_drops_oldest_frames(tmp_path):
+    log = tmp_path / "app.log"
+    log.write_text("")
+    tail_hub = LogTailHub(
+        use_events=False, poll_interval=0.01, frame_interval=0.0, max_frames=2
+    )
+    try:
+        async with tail_hub.subscribe(log, backlog=0) as slow:
+            for i in range(5):
+                _append(log, f"line {i}\n")
+                await asyncio.sleep(0.05)
+
+            first = await slow.next_frame()
+            second = await slow.next_frame()
+            assert first.dropped == 3
+            assert first.lines + second.lines == ["line 3", "line 4"]
+            assert slow.total_dropped == 3
+    finally:
+        await tail_hub.close()
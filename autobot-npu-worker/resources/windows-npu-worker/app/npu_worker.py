@@ -17,6 +17,7 @@ import asyncio
 import hashlib
 import logging
 import os
+import struct
 import sys
 import time
 import uuid
@@ -41,7 +42,7 @@ from typing import Any, Dict, List, Optional
 import numpy as np
 import uvicorn
 import yaml
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from pydantic import BaseModel
 
 # =============================================================================
@@ -998,6 +999,21 @@ def get_model_manager() -> OpenVINOModelManager:
     return _model_manager
 
 
+# Binary embedding responses (must match services/npu_client.py in the
+# backend): 8-byte header (rows, dims as little-endian uint32) followed by
+# rows * dims little-endian float32 values.
+EMBEDDING_BINARY_MEDIA_TYPE = "application/x-autobot-embeddings-f32"
+_EMBEDDING_HEADER = struct.Struct("<II")
+
+
+def encode_embeddings(embeddings: List[List[float]]) -> bytes:
+    """Pack embeddings in the binary float32 wire format."""
+    matrix = np.asarray(embeddings, dtype="<f4")
+    if matrix.ndim != 2:
+        matrix = matrix.reshape(len(matrix), -1 if matrix.size else 0)
+    return _EMBEDDING_HEADER.pack(*matrix.shape) + matrix.tobytes()
+
+
 # Pydantic models
 class NPUTaskRequest(BaseModel):
     """NPU task request model"""
@@ -1366,11 +1382,16 @@ class WindowsNPUWorker:
         @self.app.post("/embedding/generate")
         async def generate_embeddings(
             texts: List[str],
+            request: Request,
             model_name: str = "nomic-embed-text",
             use_cache: bool = True,
             optimization_level: str = "balanced",
         ):
-            """Generate embeddings with NPU acceleration"""
+            """Generate embeddings with NPU acceleration
+
+            Clients accepting EMBEDDING_BINARY_MEDIA_TYPE get raw float32
+            instead of JSON float lists.
+            """
             try:
                 start_time = time.time()
                 embeddings = await self.generate_npu_embeddings(
@@ -1385,6 +1406,19 @@ class WindowsNPUWorker:
                 )
                 real_inference = model_info.get("real_inference", False)
 
+                if EMBEDDING_BINARY_MEDIA_TYPE in request.headers.get("accept", ""):
+                    return Response(
+                        content=encode_embeddings(embeddings),
+                        media_type=EMBEDDING_BINARY_MEDIA_TYPE,
+                        headers={
+                            "X-Embedding-Model": model_name,
+                            "X-Processing-Time-Ms": f"{processing_time:.3f}",
+                            "X-Texts-Processed": str(len(texts)),
+                            "X-Embedding-Device": device,
+                            "X-Real-Inference": str(bool(real_inference)).lower(),
+                        },
+                    )
+
                 return {
                     "embeddings": embeddings,
                     "model_used": model_name,
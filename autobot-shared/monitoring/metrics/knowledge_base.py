@@ -16,6 +16,8 @@ Covers:
 - Cache hit/miss rates
 """
 
+from typing import List
+
 from prometheus_client import Counter, Gauge, Histogram
 
 from .base import BaseMetricsRecorder
@@ -97,6 +99,20 @@ class KnowledgeBaseMetricsRecorder(BaseMetricsRecorder):
             registry=self.registry,
         )
 
+        self.embedding_batch_size = Histogram(
+            "autobot_knowledge_embedding_batch_size",
+            "Query embedding requests coalesced into one backend call",
+            buckets=[1, 2, 4, 8, 16, 32, 64],
+            registry=self.registry,
+        )
+
+        self.embedding_queue_wait = Histogram(
+            "autobot_knowledge_embedding_queue_wait_seconds",
+            "Time a query embedding request waited for its batch to be sent",
+            buckets=[0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1],
+            registry=self.registry,
+        )
+
     def _init_search_metrics(self) -> None:
         """Initialize search-related metrics.
 
@@ -171,6 +187,13 @@ class KnowledgeBaseMetricsRecorder(BaseMetricsRecorder):
             registry=self.registry,
         )
 
+        self.cache_bytes_saved = Counter(
+            "autobot_knowledge_cache_bytes_saved_total",
+            "Input bytes served from cache instead of being recomputed",
+            ["cache_type"],
+            registry=self.registry,
+        )
+
         self.cache_size_items = Gauge(
             "autobot_knowledge_cache_size_items",
             "Number of items in cache",
@@ -223,6 +246,14 @@ class KnowledgeBaseMetricsRecorder(BaseMetricsRecorder):
         if latency_seconds > 0:
             self.embedding_latency.labels(model=model).observe(latency_seconds)
 
+    def record_embedding_batch(
+        self, batch_size: int, queue_wait_seconds: List[float]
+    ) -> None:
+        """Record a coalesced embedding batch and each request's queue wait."""
+        self.embedding_batch_size.observe(batch_size)
+        for wait in queue_wait_seconds:
+            self.embedding_queue_wait.observe(wait)
+
     def set_embedding_dimensions(self, dimensions: int, model: str) -> None:
         """Set embedding dimensions for a model."""
         self.embedding_dimensions.labels(model=model).set(dimensions)
@@ -273,13 +304,17 @@ class KnowledgeBaseMetricsRecorder(BaseMetricsRecorder):
     # Cache Methods
     # =========================================================================
 
-    def record_cache_hit(self, cache_type: str) -> None:
-        """Record a cache hit."""
-        self.cache_hits.labels(cache_type=cache_type).inc()
+    def record_cache_hit(self, cache_type: str, count: int = 1) -> None:
+        """Record cache hits."""
+        self.cache_hits.labels(cache_type=cache_type).inc(count)
+
+    def record_cache_miss(self, cache_type: str, count: int = 1) -> None:
+        """Record cache misses."""
+        self.cache_misses.labels(cache_type=cache_type).inc(count)
 
-    def record_cache_miss(self, cache_type: str) -> None:
-        """Record a cache miss."""
-        self.cache_misses.labels(cache_type=cache_type).inc()
+    def record_cache_bytes_saved(self, cache_type: str, size_bytes: int) -> None:
+        """Record input bytes served from cache."""
+        self.cache_bytes_saved.labels(cache_type=cache_type).inc(size_bytes)
 
     def set_cache_size(self, size: int, cache_type: str) -> None:
         """Set cache size in items."""
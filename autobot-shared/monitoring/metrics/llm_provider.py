@@ -104,6 +104,22 @@ class LLMProviderMetricsRecorder(BaseMetricsRecorder):
             registry=self.registry,
         )
 
+        self.prefill_tokens = Histogram(
+            "autobot_llm_prefill_tokens",
+            "Prompt tokens evaluated per turn (KV cache misses)",
+            ["provider", "model", "layout"],
+            buckets=[0, 16, 64, 256, 512, 1024, 2048, 4096, 8192, 16384],
+            registry=self.registry,
+        )
+
+        self.prefill_seconds = Histogram(
+            "autobot_llm_prefill_seconds",
+            "Prompt evaluation (prefill) time per turn",
+            ["provider", "model", "layout"],
+            buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0],
+            registry=self.registry,
+        )
+
     def _init_cost_metrics(self) -> None:
         """Initialize cost tracking metrics.
 
@@ -260,6 +276,27 @@ class LLMProviderMetricsRecorder(BaseMetricsRecorder):
             provider=provider, model=model, token_type="output"
         ).observe(output_tokens)
 
+    def record_prefill(
+        self,
+        provider: str,
+        model: str,
+        layout: str,
+        prefill_tokens: int,
+        prefill_seconds: float,
+        time_to_first_token_seconds: float,
+    ) -> None:
+        """Record per-turn prompt prefill cost and time to first token."""
+        self.prefill_tokens.labels(
+            provider=provider, model=model, layout=layout
+        ).observe(prefill_tokens)
+        self.prefill_seconds.labels(
+            provider=provider, model=model, layout=layout
+        ).observe(prefill_seconds)
+        if time_to_first_token_seconds > 0:
+            self.time_to_first_token.labels(provider=provider, model=model).observe(
+                time_to_first_token_seconds
+            )
+
     def set_context_window_usage(
         self, provider: str, model: str, usage_percent: float
     ) -> None:
@@ -15,7 +15,7 @@ Refactoring History:
 """
 
 import threading
-from typing import Optional
+from typing import List, Optional
 
 from prometheus_client import (
     CollectorRegistry,
@@ -521,6 +521,12 @@ class PrometheusMetricsManager:
             operation, model, latency_seconds
         )
 
+    def record_embedding_batch(
+        self, batch_size: int, queue_wait_seconds: List[float]
+    ) -> None:
+        """Record a coalesced query embedding batch."""
+        self._knowledge_base.record_embedding_batch(batch_size, queue_wait_seconds)
+
     def record_knowledge_search(
         self,
         search_type: str,
@@ -533,13 +539,19 @@ class PrometheusMetricsManager:
             search_type, collection, latency_seconds, results_count
         )
 
-    def record_knowledge_cache_hit(self, cache_type: str) -> None:
-        """Record a knowledge base cache hit."""
-        self._knowledge_base.record_cache_hit(cache_type)
+    def record_knowledge_cache_hit(self, cache_type: str, count: int = 1) -> None:
+        """Record knowledge base cache hits."""
+        self._knowledge_base.record_cache_hit(cache_type, count)
 
-    def record_knowledge_cache_miss(self, cache_type: str) -> None:
-        """Record a knowledge base cache miss."""
-        self._knowledge_base.record_cache_miss(cache_type)
+    def record_knowledge_cache_miss(self, cache_type: str, count: int = 1) -> None:
+        """Record knowledge base cache misses."""
+        self._knowledge_base.record_cache_miss(cache_type, count)
+
+    def record_knowledge_cache_bytes_saved(
+        self, cache_type: str, size_bytes: int
+    ) -> None:
+        """Record input bytes served from a knowledge base cache."""
+        self._knowledge_base.record_cache_bytes_saved(cache_type, size_bytes)
 
     # =========================================================================
     # LLM Provider Metrics (Issue #470: Delegates to LLMProviderMetricsRecorder)
@@ -572,6 +584,25 @@ class PrometheusMetricsManager:
         """Record token usage for an LLM request."""
         self._llm_provider.record_tokens(provider, model, input_tokens, output_tokens)
 
+    def record_llm_prefill(
+        self,
+        provider: str,
+        model: str,
+        layout: str,
+        prefill_tokens: int,
+        prefill_seconds: float,
+        time_to_first_token_seconds: float,
+    ) -> None:
+        """Record prompt prefill tokens/time and TTFT for a chat turn."""
+        self._llm_provider.record_prefill(
+            provider,
+            model,
+            layout,
+            prefill_tokens,
+            prefill_seconds,
+            time_to_first_token_seconds,
+        )
+
     def record_llm_cost(
         self,
         provider: str,
@@ -586,6 +586,11 @@ class CacheL1Config(BaseSettings):
         alias="AUTOBOT_CACHE_L1_LLM_RESPONSE",
         description="Max items in LLM response cache",
     )
+    llm_response_bytes: int = Field(
+        default=16 * 1024 * 1024,
+        alias="AUTOBOT_CACHE_L1_LLM_RESPONSE_BYTES",
+        description="Byte budget for LLM response cache (sum of response sizes)",
+    )
     ast: int = Field(
         default=1000, alias="AUTOBOT_CACHE_L1_AST", description="Max items in AST cache"
     )
@@ -604,6 +609,11 @@ class CacheL1Config(BaseSettings):
         alias="AUTOBOT_CACHE_L1_SEMANTIC_MAX_SIZE",
         description="Max entries in semantic query cache ChromaDB collection",
     )
+    rerank_score: int = Field(
+        default=20000,
+        alias="AUTOBOT_CACHE_L1_RERANK_SCORE",
+        description="Max (query, document) cross-encoder scores cached",
+    )
 
 
 class CacheL2Config(BaseSettings):
@@ -653,6 +663,11 @@ class CacheL2Config(BaseSettings):
         alias="AUTOBOT_CACHE_L2_SEMANTIC",
         description="TTL for semantic query cache responses in seconds (1 hour)",
     )
+    embedding: int = Field(
+        default=30 * 24 * 3600,
+        alias="AUTOBOT_CACHE_L2_EMBEDDING",
+        description="TTL for persisted embeddings in seconds (30 days)",
+    )
     semantic_cache_threshold: float = Field(
         default=0.95,
         alias="AUTOBOT_CACHE_SEMANTIC_THRESHOLD",
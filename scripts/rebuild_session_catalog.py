@@ -0,0 +1,54 @@
+# AutoBot - AI-Powered Automation Platform
+# Copyright (c) 2025 mrveiss
+# Author: mrveiss
+"""
+Rebuild the Redis chat session catalog from the chats directory.
+
+The catalog (chat:catalog:* keys) backs paginated session listing and is
+kept up to date by session create/save/rename/delete. Run this after
+restoring chat files from backup, editing them by hand, or whenever the
+listing and the directory disagree.
+
+This script:
+1. Scans all session files in the chats directory
+2. Recovers chat sessions for orphaned terminal files
+3. Upserts every session into the catalog and removes stale entries
+4. Marks the catalog ready so listing is served from Redis
+
+Usage:
+    cd autobot-backend
+    python ../scripts/rebuild_session_catalog.py
+"""
+
+import asyncio
+import logging
+import os
+import sys
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+async def rebuild_catalog() -> int:
+    """Rebuild the session catalog; returns a process exit code."""
+    from chat_history import ChatHistoryManager
+
+    manager = ChatHistoryManager()
+    if not manager.redis_client:
+        logger.error("Redis is not enabled or unreachable; nothing to rebuild")
+        return 1
+
+    sessions = await manager.rebuild_session_catalog()
+    logger.info("Session catalog rebuilt with %d sessions", len(sessions))
+    return 0
+
+
+if __name__ == "__main__":
+    # Add backend to path
+    backend_dir = os.path.join(os.path.dirname(__file__), "..", "autobot-backend")
+    sys.path.insert(0, os.path.abspath(backend_dir))
+
+    sys.exit(asyncio.run(rebuild_catalog()))